@@ -0,0 +1,78 @@
+import os
+
+_text_cache = {}
+
+
+def read_text_asset(path: str) -> tuple[str, ...]:
+    """
+    Read the lines of a text file, from the process-wide asset cache once it has been read.
+
+    A file is read from disk the first time it is asked for, and again only when reload_assets finds that it has
+    changed, so asking for a file already read costs one dictionary lookup and no system call. The cached lines are a
+    tuple shared by every session, so no session can change what another one reads.
+
+    :param path: a string naming a text file
+    :precondition: the file must hold Unicode text
+    :postcondition: remove the trailing whitespace of each line
+    :postcondition: remember the lines of the file until reload_assets or clear_assets is called
+    :return: the lines of the file as a tuple of strings
+    :raises FileNotFoundError: if the file was not read before and there is no file at path
+
+    >>> read_text_asset('intro.txt') is read_text_asset('intro.txt')
+    True
+    """
+    cached = _text_cache.get(path)
+    if cached is None:
+        cached = _text_cache[path] = read_lines(path)
+    return cached[1]
+
+
+def read_lines(path: str) -> tuple[tuple[int, int], tuple[str, ...]]:
+    """
+    Read the lines of a text file together with the version of the file they were read from.
+
+    :param path: a string naming a text file
+    :precondition: the file must hold Unicode text
+    :return: a tuple of the file's modification time in nanoseconds and size, and of its lines without their
+    trailing whitespace
+    :raises FileNotFoundError: if there is no file at path
+    """
+    status = os.stat(path)
+    with open(path, 'r') as file:
+        lines = tuple(line.rstrip() for line in file)
+    return (status.st_mtime_ns, status.st_size), lines
+
+
+def reload_assets() -> None:
+    """
+    Check every cached asset for changes, reading again the files that changed and forgetting the files removed.
+
+    This is the only place the files of cached assets are looked at again, so it costs one stat call per asset and
+    is meant to be called when the assets are expected to have changed, not on every lookup.
+
+    :postcondition: read again every cached file whose modification time or size has changed
+    :postcondition: forget every cached file that no longer exists
+
+    >>> lines = read_text_asset('intro.txt')
+    >>> reload_assets()
+    >>> read_text_asset('intro.txt') is lines
+    True
+    """
+    for path, (version, _) in list(_text_cache.items()):
+        try:
+            status = os.stat(path)
+            if (status.st_mtime_ns, status.st_size) != version:
+                _text_cache[path] = read_lines(path)
+        except FileNotFoundError:
+            _text_cache.pop(path, None)
+
+
+def clear_assets() -> None:
+    """
+    Forget every cached asset, so that each one is read from disk again the next time it is asked for.
+
+    >>> clear_assets()
+    >>> len(_text_cache)
+    0
+    """
+    _text_cache.clear()
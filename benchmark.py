@@ -0,0 +1,178 @@
+import asyncio
+import io
+import os
+import random
+import sys
+
+from console import BufferedOutput
+from server import make_server_state, start_server
+from simulation import greedy_policy, play_headless
+
+SERVER_ANSWERS = {
+    "What's your name? : ": 'benchmark',
+    "Enter the number of your choice: ": '1',
+    "to quit): ": 'q',
+    "Press any key to continue...": ''
+}
+
+
+class CountingFile(io.FileIO):
+    """
+    A raw binary file that counts its writes, each of which is one write system call, and the bytes written.
+    """
+
+    def __init__(self, path: str = os.devnull):
+        """
+        Open the file for writing.
+
+        :param path: a string naming the file to write to
+        """
+        super().__init__(path, 'w')
+        self.writes = 0
+        self.bytes = 0
+
+    def write(self, data) -> int:
+        """
+        Write the data with one system call and count it.
+        """
+        self.writes += 1
+        self.bytes += len(data)
+        return super().write(data)
+
+
+def terminal_stream(raw: CountingFile) -> io.TextIOWrapper:
+    """
+    Wrap a raw file the way Python wraps standard output when it is a terminal.
+
+    :param raw: a CountingFile
+    :postcondition: write through to raw at the end of every line, as an interactive standard output does
+    :return: a line-buffered text stream writing to raw
+    """
+    return io.TextIOWrapper(raw, encoding='utf-8', line_buffering=True)
+
+
+def prompting_policy(policy, prompts: list[str]):
+    """
+    Make a policy wait for its prompts the way input() does before it answers.
+
+    :param policy: a function that takes a topic, a session dictionary, and a memory dictionary and returns an answer
+    :param prompts: a list that every topic answered is appended to
+    :postcondition: flush standard output before every answer, as input() does before it waits
+    :return: a policy with the same answers
+    """
+    def answer(topic, session, memory):
+        sys.stdout.flush()
+        prompts.append(topic)
+        return policy(topic, session, memory)
+
+    return answer
+
+
+def measure_headless(buffered: bool, playthroughs: int = 20, seed: int = 0) -> dict:
+    """
+    Count the write system calls of headless playthroughs that print to a real file.
+
+    :param buffered: True to print through a BufferedOutput, False to print line by line like a terminal
+    :param playthroughs: a positive integer number of playthroughs
+    :param seed: an integer seeding the playthroughs
+    :postcondition: play the same playthroughs for the same seed, whether buffered or not
+    :return: a dictionary with "Writes", "Turns", "Prompts", and "Bytes" as keys
+    """
+    raw = CountingFile()
+    stream = terminal_stream(raw)
+    output = BufferedOutput(stream) if buffered else stream
+    turns, prompts = 0, []
+    for index in range(playthroughs):
+        turns += play_headless(prompting_policy(greedy_policy, prompts), seed * playthroughs + index,
+                               output=output)['Turns']
+        output.flush()
+    raw.close()
+    return {"Writes": raw.writes, "Turns": turns, "Prompts": len(prompts), "Bytes": raw.bytes}
+
+
+def answer_prompt(text: str) -> str | None:
+    """
+    Pick an answer for the prompt a server sent last, the way a player pressing keys at random would.
+
+    :param text: the text received from the server so far
+    :return: an answer as a string, or None if text does not end with a prompt yet
+
+    >>> answer_prompt("Hi, there! What's your name? : ")
+    'benchmark'
+    >>> answer_prompt("You moved one step up.\\r\\n") is None
+    True
+    """
+    for ending, answer in SERVER_ANSWERS.items():
+        if text.endswith(ending):
+            return answer
+    if text.endswith("(W/A/S/D): ") or text.endswith(" direction: "):
+        return random.choice('wasd')
+    if text.endswith("Guess a letter: "):
+        return random.choice('etaoinshrdlu')
+    return None
+
+
+async def play_over_server(port: int, prompts: int) -> int:
+    """
+    Connect to a game server and answer its prompts until the game ends or enough prompts were answered.
+
+    :param port: the loopback port of the server
+    :param prompts: a positive integer number of prompts to answer
+    :return: the number of prompts answered
+    """
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    received, answered = '', 0
+    while answered < prompts:
+        data = await reader.read(65536)
+        if not data:
+            break
+        received = (received + data.decode(errors='replace'))[-200:]
+        answer = answer_prompt(received)
+        if answer is not None:
+            writer.write(f'{answer}\r\n'.encode())
+            received, answered = '', answered + 1
+    writer.close()
+    return answered
+
+
+async def measure_server(players: int = 10, prompts: int = 200, seed: int = 0) -> dict:
+    """
+    Count what sessions print and what the server sends for players connected over loopback.
+
+    :param players: a positive integer number of players connected at once
+    :param prompts: a positive integer number of prompts each player answers
+    :param seed: an integer seeding the players' answers
+    :return: a dictionary with "Writes", "Sends", and "Prompts" as keys
+    """
+    random.seed(seed)
+    state = make_server_state(clock_mode='virtual', idle_timeout=30, save_directory=None,
+                              recording_directory=None)
+    server = await start_server(state)
+    port = server.sockets[0].getsockname()[1]
+    answered = await asyncio.gather(*(play_over_server(port, prompts) for _ in range(players)))
+    while state["Sessions"]:
+        await asyncio.sleep(0.01)
+    server.close()
+    await server.wait_closed()
+    return {"Writes": state["Writes"], "Sends": state["Sends"], "Prompts": sum(answered)}
+
+
+def main():
+    """
+    Drive the program.
+    """
+    terminal = sys.stdout
+    line_by_line = measure_headless(buffered=False)
+    buffered = measure_headless(buffered=True)
+    server = asyncio.run(measure_server())
+    sys.stdout = terminal
+    for label, result in (("printed line by line", line_by_line), ("buffered per turn   ", buffered)):
+        print(f"Headless, {label}: {result['Writes'] / result['Turns']:6.1f} writes per turn, "
+              f"{result['Writes'] / result['Prompts']:5.1f} per prompt ({result['Writes']} writes, "
+              f"{result['Bytes']} bytes)")
+    print(f"Server, printed by sessions   : {server['Writes'] / server['Prompts']:6.1f} writes per prompt")
+    print(f"Server, sent to the network   : {server['Sends'] / server['Prompts']:6.1f} sends per prompt")
+
+
+if __name__ == '__main__':
+    main()
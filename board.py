@@ -0,0 +1,289 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+from make_board_each_level import make_level_grid
+
+PLAYER = '🐶'
+WALL = '#'
+
+
+@dataclass(slots=True)
+class Board:
+    """
+    A board stored as one byte per cell, with a bitmap of the cells that can be walked on.
+
+    The player is kept in its own field instead of being written into the cells, and the board is turned into text
+    only when it is shown. Indexing a Board by row returns a view that behaves like a row of the list-of-lists grids
+    from make_board_lv1, make_board_lv2, and make_board_lv3, so every function written for those grids works with a
+    Board unchanged, including writing '🐶' into a cell to move the player there.
+
+    >>> board = Board.from_lists([['#', '#', '#'], ['#', '.', '!'], ['#', '#', '#']])
+    >>> board[1][1] = '🐶'
+    >>> board.player, board[1][1], board[1][2], board.is_passable(1, 2), board.is_passable(0, 1)
+    ((1, 1), '🐶', '!', True, False)
+    """
+    height: int
+    width: int
+    cells: bytearray
+    passable: bytearray
+    player: tuple[int, int] | None = None
+
+    @classmethod
+    def from_lists(cls, grid: list[list[str]]) -> 'Board':
+        """
+        Create a board from a list-of-lists grid.
+
+        :param grid: a list of lists of one-character strings
+        :precondition: every row of grid must have the same length
+        :precondition: every cell must be '🐶' or a single ASCII character
+        :postcondition: keep the last '🐶' found as the player's position and store the cell under it as '.'
+        :return: a Board holding the same cells
+        :raises ValueError: if a cell is neither '🐶' nor a single ASCII character
+
+        >>> board = Board.from_lists([['#', '#'], ['🐶', '.']])
+        >>> board.height, board.width, board.player, bytes(board.cells)
+        (2, 2, (1, 0), b'##..')
+        """
+        height, width = len(grid), len(grid[0]) if grid else 0
+        board = cls(height, width, bytearray(b'.' * (height * width)), bytearray(-(-height * width // 8)))
+        for row_index, row in enumerate(grid):
+            for col_index, cell in enumerate(row):
+                board.set_cell(row_index, col_index, cell)
+        return board
+
+    def __getitem__(self, row: int) -> 'BoardRow':
+        """
+        Return a view of one row of the board.
+
+        :raises IndexError: if row is outside the board
+        """
+        if not 0 <= row < self.height:
+            raise IndexError("Board row out of range.")
+        return BoardRow(self, row)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __iter__(self):
+        return (BoardRow(self, row) for row in range(self.height))
+
+    def is_passable(self, row: int, col: int) -> bool:
+        """
+        Check whether a cell can be walked on.
+
+        :param row: a row index inside the board
+        :param col: a column index inside the board
+        :return: True if the cell is not a wall
+
+        >>> Board.from_lists([['#', '.']]).is_passable(0, 1)
+        True
+        """
+        index = row * self.width + col
+        return bool(self.passable[index >> 3] >> (index & 7) & 1)
+
+    def move_player(self, row: int, col: int) -> str | None:
+        """
+        Move the player onto a cell if it can be walked on.
+
+        Only the player's position changes, so no cell is written and no text is built.
+
+        :param row: a row index inside the board
+        :param col: a column index inside the board
+        :postcondition: leave the player where it is if the cell is a wall
+        :return: the cell the player now stands on, or None if the cell is a wall
+
+        >>> board = Board.from_lists([['#', '🐶', '!']])
+        >>> board.move_player(0, 0), board.move_player(0, 2), board.player
+        (None, '!', (0, 2))
+        """
+        index = row * self.width + col
+        if not self.passable[index >> 3] >> (index & 7) & 1:
+            return None
+        self.player = (row, col)
+        return chr(self.cells[index])
+
+    def get_cell(self, row: int, col: int) -> str:
+        """
+        Read a cell as it is shown, with the player drawn on top.
+
+        :raises IndexError: if the cell is outside the board
+        """
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError("Board cell out of range.")
+        if self.player == (row, col):
+            return PLAYER
+        return chr(self.cells[row * self.width + col])
+
+    def set_cell(self, row: int, col: int, value: str) -> None:
+        """
+        Write a cell the way a list-of-lists grid would be written.
+
+        Writing '🐶' moves the player to the cell and leaves the cell under it as it was. Writing anything else over
+        the player removes the player from the board, as overwriting '🐶' in a grid would.
+
+        :raises IndexError: if the cell is outside the board
+        :raises ValueError: if value is neither '🐶' nor a single ASCII character
+        """
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError("Board cell out of range.")
+        if value == PLAYER:
+            self.player = (row, col)
+            return
+        if len(value) != 1 or not value.isascii():
+            raise ValueError(f"A board cell must hold one ASCII character or '{PLAYER}', not {value!r}.")
+        if self.player == (row, col):
+            self.player = None
+        index = row * self.width + col
+        self.cells[index] = ord(value)
+        if value == WALL:
+            self.passable[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+        else:
+            self.passable[index >> 3] |= 1 << (index & 7)
+
+    def render_row(self, row: int) -> str:
+        """
+        Turn one row into the text display_grid prints for it.
+
+        >>> board = Board.from_lists([['#', '🐶', '!']])
+        >>> board.render_row(0)
+        '# 🐶 !'
+        """
+        return ' '.join(BoardRow(self, row))
+
+    def render(self) -> str:
+        """
+        Turn the whole board into the text display_grid prints for it, one line per row.
+
+        The cells are decoded once for the whole board rather than once per row.
+
+        >>> print(Board.from_lists([['#', '🐶'], ['.', '!']]).render())
+        # 🐶
+        . !
+        """
+        text, width = self.cells.decode('ascii'), self.width
+        rows = [' '.join(text[start:start + width]) for start in range(0, len(text), width)]
+        if self.player is not None:
+            row, col = self.player
+            rows[row] = rows[row][:2 * col] + PLAYER + rows[row][2 * col + 1:]
+        return '\n'.join(rows)
+
+    def freeze(self) -> 'BoardTemplate':
+        """
+        Take an immutable snapshot of the board's cells, without the player.
+
+        >>> template = Board.from_lists([['#', '🐶', '!']]).freeze()
+        >>> template.cells
+        b'#.!'
+        """
+        return BoardTemplate(self.height, self.width, bytes(self.cells), bytes(self.passable))
+
+    def to_lists(self) -> list[list[str]]:
+        """
+        Convert the board back to a list-of-lists grid.
+
+        >>> Board.from_lists([['#', '🐶'], ['.', '!']]).to_lists()
+        [['#', '🐶'], ['.', '!']]
+        """
+        return [list(row) for row in self]
+
+
+class BoardRow:
+    """
+    A view of one row of a Board, shaped like a row of a list-of-lists grid.
+    """
+    __slots__ = ('board', 'row')
+
+    def __init__(self, board: Board, row: int):
+        """
+        Initialize the view.
+
+        :param board: the Board the view reads and writes
+        :param row: the index of the row
+        """
+        self.board = board
+        self.row = row
+
+    def __getitem__(self, col: int) -> str:
+        """
+        Read a cell of the row.
+        """
+        return self.board.get_cell(self.row, col)
+
+    def __setitem__(self, col: int, value: str) -> None:
+        """
+        Write a cell of the row.
+        """
+        self.board.set_cell(self.row, col, value)
+
+    def __len__(self) -> int:
+        return self.board.width
+
+    def __iter__(self):
+        start = self.row * self.board.width
+        cells = list(self.board.cells[start:start + self.board.width].decode('ascii'))
+        if self.board.player is not None and self.board.player[0] == self.row:
+            cells[self.board.player[1]] = PLAYER
+        return iter(cells)
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+@dataclass(frozen=True, slots=True)
+class BoardTemplate:
+    """
+    An immutable board layout that new boards are copied from.
+    """
+    height: int
+    width: int
+    cells: bytes
+    passable: bytes
+
+    def instantiate(self) -> Board:
+        """
+        Create a new board with the template's layout and no player.
+
+        Only two buffers are copied, however large the board is.
+
+        >>> template = Board.from_lists([['#', '.']]).freeze()
+        >>> board = template.instantiate()
+        >>> board[0][1] = '#'
+        >>> template.instantiate()[0][1]
+        '.'
+        """
+        return Board(self.height, self.width, bytearray(self.cells), bytearray(self.passable))
+
+
+@lru_cache(maxsize=None)
+def level_template(level: int) -> BoardTemplate:
+    """
+    Get the layout of a level, building it only the first time it is asked for.
+
+    :param level: a positive integer
+    :precondition: level must be a key of the "Boards" of the content pack
+    :postcondition: build the level with make_level_grid once per process
+    :return: the BoardTemplate of the level
+
+    >>> level_template(2) is level_template(2)
+    True
+    """
+    return Board.from_lists(make_level_grid(level)).freeze()
+
+
+def make_level_board(level: int) -> Board:
+    """
+    Create a new board for a level from its cached layout.
+
+    :param level: a positive integer
+    :precondition: level must be a key of the "Boards" of the content pack
+    :postcondition: leave the level's template unchanged
+    :return: a new Board with the level's layout and no player
+
+    >>> board = make_level_board(1)
+    >>> board[7][1], board.player
+    ('!', None)
+    """
+    return level_template(level).instantiate()
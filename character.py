@@ -0,0 +1,229 @@
+from collections.abc import MutableMapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+ITEMS = ('Key', 'HP Potion', 'Kibble')
+ITEM_INDEX = {item: index for index, item in enumerate(ITEMS)}
+STAT_FIELDS = {
+    "HP": 'hp',
+    "Current HP": 'current_hp',
+    "Level": 'level',
+    "Exp": 'exp',
+    "Max Exp": None,
+    "Heart": 'heart',
+    "Max Heart": 'max_heart',
+    "Hunger": 'hunger',
+    "Max Hunger": 'max_hunger'
+}
+SKILL_FIELDS = {"Basic Attack": 'basic_attack', "Current Skills": 'current_skills'}
+VIEW_SLOTS = {"Stat": 'stat_view', "Skill": 'skill_view', "Inventory": 'inventory_view'}
+
+
+@dataclass(slots=True)
+class Character:
+    """
+    A character stored in fixed slots instead of nested dictionaries.
+
+    Stats and skills are plain attributes, and the inventory is a list of counters indexed like ITEMS. Indexing a
+    Character with 'Stat', 'Skill', or 'Inventory' returns a view that behaves like the matching part of the
+    dictionary from make_character, so every function written for character dictionaries works with it unchanged.
+
+    >>> haru = Character(basic_attack=28, current_skills={'Bark': {'Damage': 25, 'Description': 'A loud bark'}})
+    >>> haru['Stat']['Current HP'] -= 40
+    >>> haru['Inventory']['Kibble'] += 2
+    >>> haru.current_hp, haru.inventory
+    (210, [0, 0, 2])
+    >>> haru['Stat']['Max Exp']['Level 2']
+    1300
+    """
+    hp: int = 250
+    current_hp: int = 250
+    level: int = 1
+    exp: int = 0
+    heart: int = 10
+    max_heart: int = 10
+    hunger: int = 10
+    max_hunger: int = 10
+    basic_attack: int = 0
+    current_skills: dict = field(default_factory=dict)
+    inventory: list[int] = field(default_factory=lambda: [0] * len(ITEMS))
+    stat_view: 'StatSection | None' = field(default=None, init=False, repr=False, compare=False)
+    skill_view: 'SkillSection | None' = field(default=None, init=False, repr=False, compare=False)
+    inventory_view: 'InventorySection | None' = field(default=None, init=False, repr=False, compare=False)
+
+    def __getitem__(self, section: str):
+        """
+        Return a dictionary-like view of one part of the character.
+
+        Each view is made the first time its part is asked for and kept in a slot of its own, so reading
+        character['Stat'] over and over creates no objects, and a character whose views are never asked for carries
+        only three empty slots for them.
+
+        :param section: a string, one of 'Stat', 'Skill', or 'Inventory'
+        :return: a view that reads and writes the character's slots
+        :raises KeyError: if section is not one of the parts of a character
+
+        >>> haru = Character(basic_attack=28)
+        >>> dict(haru['Skill'])
+        {'Basic Attack': 28, 'Current Skills': {}}
+        >>> haru['Stat'] is haru['Stat']
+        True
+        """
+        slot = VIEW_SLOTS[section]
+        view = getattr(self, slot)
+        if view is None:
+            view = SECTIONS[section](self)
+            setattr(self, slot, view)
+        return view
+
+    def to_dict(self) -> dict:
+        """
+        Convert the character to a character dictionary like the one make_character returns.
+
+        :return: a new character dictionary holding the same stats, skills, and items
+
+        >>> Character(basic_attack=28).to_dict()['Inventory']
+        {'Key': 0, 'HP Potion': 0, 'Kibble': 0}
+        """
+        stat = dict(StatSection(self))
+        stat["Max Exp"] = dict(max_exp())
+        return {
+            "Stat": stat,
+            "Skill": {"Basic Attack": self.basic_attack, "Current Skills": self.current_skills},
+            "Inventory": dict(InventorySection(self))
+        }
+
+    @classmethod
+    def from_dict(cls, character: dict) -> 'Character':
+        """
+        Create a character from a character dictionary.
+
+        :param character: a well-formed character dictionary
+        :precondition: character must be shaped like the dictionary make_character returns
+        :postcondition: share the dictionary of current skills with the given character
+        :return: a Character holding the same stats, skills, and items
+
+        >>> haru = Character.from_dict({'Stat': {'HP': 300, 'Current HP': 120, 'Level': 2, 'Exp': 40, 'Heart': 9,
+        ...     'Max Heart': 10, 'Hunger': 4, 'Max Hunger': 10}, 'Skill': {'Basic Attack': 30,
+        ...     'Current Skills': {}}, 'Inventory': {'Key': 1, 'HP Potion': 2, 'Kibble': 0}})
+        >>> haru.current_hp, haru.level, haru.inventory
+        (120, 2, [1, 2, 0])
+        """
+        stat = character['Stat']
+        return cls(**{name: stat[key] for key, name in STAT_FIELDS.items() if name is not None},
+                   basic_attack=character['Skill']['Basic Attack'],
+                   current_skills=character['Skill']['Current Skills'],
+                   inventory=[character['Inventory'][item] for item in ITEMS])
+
+
+def max_exp() -> MappingProxyType:
+    """
+    Get the Exp each level of the loaded content pack asks for.
+
+    content is imported here rather than at the top, since the content pack is checked against the fields of a
+    character defined in this module.
+
+    :return: a read-only mapping from 'Level 1', 'Level 2', and so on to the Exp that clears the level
+
+    >>> max_exp()['Level 3']
+    1500
+    """
+    from content import load_content
+    return MappingProxyType(load_content()["Max Exp"])
+
+
+class Section(MutableMapping):
+    """
+    A dictionary-like view of one part of a Character.
+    """
+    __slots__ = ('character',)
+    keys_in_order = ()
+
+    def __init__(self, character: Character):
+        """
+        Initialize the view.
+
+        :param character: the Character the view reads and writes
+        """
+        self.character = character
+
+    def __iter__(self):
+        return iter(self.keys_in_order)
+
+    def __len__(self) -> int:
+        return len(self.keys_in_order)
+
+    def __delitem__(self, key: str):
+        raise TypeError(f"'{key}' cannot be removed from a character.")
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class StatSection(Section):
+    """
+    A view of a Character's stats, shaped like character['Stat'].
+    """
+    __slots__ = ()
+    keys_in_order = tuple(STAT_FIELDS)
+
+    def __getitem__(self, key: str):
+        """
+        Read a stat from the character.
+        """
+        name = STAT_FIELDS[key]
+        return max_exp() if name is None else getattr(self.character, name)
+
+    def __setitem__(self, key: str, value):
+        """
+        Change a stat of the character.
+
+        :raises TypeError: if key is 'Max Exp'
+        """
+        name = STAT_FIELDS[key]
+        if name is None:
+            raise TypeError("'Max Exp' comes from the content pack and cannot be changed.")
+        setattr(self.character, name, value)
+
+
+class SkillSection(Section):
+    """
+    A view of a Character's skills, shaped like character['Skill'].
+    """
+    __slots__ = ()
+    keys_in_order = tuple(SKILL_FIELDS)
+
+    def __getitem__(self, key: str):
+        """
+        Read the basic attack or the current skills of the character.
+        """
+        return getattr(self.character, SKILL_FIELDS[key])
+
+    def __setitem__(self, key: str, value):
+        """
+        Replace the basic attack or the current skills of the character.
+        """
+        setattr(self.character, SKILL_FIELDS[key], value)
+
+
+class InventorySection(Section):
+    """
+    A view of a Character's items, shaped like character['Inventory'].
+    """
+    __slots__ = ()
+    keys_in_order = ITEMS
+
+    def __getitem__(self, key: str) -> int:
+        """
+        Count one kind of item the character carries.
+        """
+        return self.character.inventory[ITEM_INDEX[key]]
+
+    def __setitem__(self, key: str, value: int):
+        """
+        Change how many of one kind of item the character carries.
+        """
+        self.character.inventory[ITEM_INDEX[key]] = value
+
+
+SECTIONS = {"Stat": StatSection, "Skill": SkillSection, "Inventory": InventorySection}
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+CLOCK_MODES = ('real', 'scaled', 'virtual')
+
+
+def make_clock(mode: str = 'real', speed: float = 1) -> dict:
+    """
+    Create a clock that decides how long the game's pauses really take.
+
+    A 'real' clock waits for every pause in full, a 'scaled' clock waits for it divided by speed, and a 'virtual'
+    clock never waits at all. All three keep count of the game time that has passed.
+
+    :param mode: a string, one of 'real', 'scaled', or 'virtual'
+    :param speed: a positive number telling how many times faster than real time a 'scaled' clock runs
+    :precondition: speed must be a positive number when mode is 'scaled'
+    :postcondition: ignore speed unless mode is 'scaled'
+    :return: a clock dictionary with "Mode", "Speed", and "Game Time" as keys
+    :raises ValueError: if mode is not one of the clock modes, or speed is not positive for a 'scaled' clock
+
+    >>> make_clock()
+    {'Mode': 'real', 'Speed': 1, 'Game Time': 0}
+    >>> make_clock('scaled', 10)
+    {'Mode': 'scaled', 'Speed': 10, 'Game Time': 0}
+    >>> make_clock('fast')
+    Traceback (most recent call last):
+        ...
+    ValueError: Unknown clock mode 'fast'. Choose one of real, scaled, virtual.
+    """
+    if mode not in CLOCK_MODES:
+        raise ValueError(f"Unknown clock mode '{mode}'. Choose one of {', '.join(CLOCK_MODES)}.")
+    if mode == 'scaled' and speed <= 0:
+        raise ValueError("A scaled clock needs a positive speed.")
+    return {"Mode": mode, "Speed": speed if mode == 'scaled' else 1, "Game Time": 0}
+
+
+def wait(clock: dict, seconds: float) -> None:
+    """
+    Let the given number of seconds of game time pass on a clock.
+
+    :param clock: a clock dictionary
+    :param seconds: a non-negative number of seconds of game time
+    :precondition: clock must be a dictionary created by make_clock
+    :postcondition: add seconds to the clock's game time
+    :postcondition: block for seconds divided by the clock's speed, unless the clock is virtual
+
+    >>> virtual_clock = make_clock('virtual')
+    >>> wait(virtual_clock, 20)
+    >>> wait(virtual_clock, 1.5)
+    >>> virtual_clock['Game Time']
+    21.5
+    """
+    clock['Game Time'] += seconds
+    if clock['Mode'] != 'virtual':
+        time.sleep(seconds / clock['Speed'])
+
+
+
+async def wait_async(clock: dict, seconds: float) -> None:
+    """
+    Let the given number of seconds of game time pass on a clock without blocking the thread.
+
+    The wait is awaited on the running event loop, so the thread is free to run other sessions until it is over.
+
+    :param clock: a clock dictionary
+    :param seconds: a non-negative number of seconds of game time
+    :precondition: clock must be a dictionary created by make_clock
+    :precondition: must be awaited on an event loop
+    :postcondition: add seconds to the clock's game time
+    :postcondition: suspend for seconds divided by the clock's speed, or only yield to the event loop if the clock is
+    virtual
+
+    >>> virtual_clock = make_clock('virtual')
+    >>> asyncio.run(wait_async(virtual_clock, 5))
+    >>> virtual_clock['Game Time']
+    5
+    """
+    clock['Game Time'] += seconds
+    await asyncio.sleep(0 if clock['Mode'] == 'virtual' else seconds / clock['Speed'])
@@ -0,0 +1,388 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from inspect import isawaitable
+
+from clock import make_clock, wait, wait_async
+
+_prompt_handler = ContextVar('prompt_handler', default=None)
+_clock = ContextVar('clock', default=None)
+_output = ContextVar('output', default=None)
+_answers = ContextVar('answers', default=None)
+_on_event_loop = ContextVar('on_event_loop', default=False)
+_headless_stdout = {'Sessions': 0, 'Original': None}
+_headless_stdout_lock = threading.Lock()
+
+
+async def ask(prompt: str, topic: str) -> str:
+    """
+    Ask the player of the current session a question and return their answer.
+
+    At a terminal the prompt goes to input(). Inside a headless or remote session, the prompt is answered by the
+    session's prompt handler instead, which is told what kind of question is being asked through the topic. A remote
+    session's handler answers with an awaitable, so the session is suspended on the event loop until the player
+    answers.
+
+    :param prompt: a string shown to the player
+    :param topic: a string naming the kind of question, such as 'menu', 'direction', 'battle', or 'guess'
+    :precondition: prompt must be a string
+    :precondition: topic must be a non-empty string
+    :postcondition: get one answer for the prompt from the player or from the prompt handler
+    :postcondition: add the topic and the answer to the list of answers being recorded, if there is one
+    :return: the answer as a string
+
+    >>> with headless(lambda prompt, topic: topic.upper()):
+    ...     answer = run_sync(ask('Guess a letter: ', 'guess'))
+    >>> answer
+    'GUESS'
+    """
+    handler = _prompt_handler.get()
+    answer = input(prompt) if handler is None else handler(prompt, topic)
+    if isawaitable(answer):
+        answer = await answer
+    answers = _answers.get()
+    if answers is not None:
+        answers.append([topic, answer])
+    return answer
+
+
+def run_sync(coroutine):
+    """
+    Run a coroutine of the game to its end on the current thread, without an event loop.
+
+    At a terminal and in headless sessions, ask() and pause() never suspend, so a whole turn, minigame, or game runs
+    straight through as one call. Only remote sessions wait on an event loop, and they are awaited there instead.
+
+    :param coroutine: a coroutine object, such as game.take_turn(session)
+    :precondition: the coroutine must not be awaited anywhere else
+    :postcondition: run the coroutine until it returns
+    :return: what the coroutine returned
+    :raises RuntimeError: if the coroutine suspends, which only happens when it waits on an event loop
+
+    >>> with headless(lambda prompt, topic: 'w'):
+    ...     answer = run_sync(ask('Enter the direction you wish to travel (W/A/S/D): ', 'direction'))
+    >>> answer
+    'w'
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError("The game waited on an event loop. Await it in a remote session instead.")
+
+
+@contextmanager
+def record(answers: list):
+    """
+    Run the enclosed code with every answer given to ask() added to a list.
+
+    :param answers: a list that a [topic, answer] pair is appended to for every ask()
+    :postcondition: stop recording when the block ends
+
+    >>> recorded = []
+    >>> with headless(lambda prompt, topic: 'w'), record(recorded):
+    ...     answer = run_sync(ask('Enter the direction you wish to travel (W/A/S/D): ', 'direction'))
+    >>> recorded
+    [['direction', 'w']]
+    """
+    token = _answers.set(answers)
+    try:
+        yield answers
+    finally:
+        _answers.reset(token)
+
+
+async def pause(seconds: float) -> None:
+    """
+    Suspend the current session for the given number of seconds of game time.
+
+    The session's clock decides how long that really takes. Without a clock, the pause lasts as long as it says. A
+    remote session is suspended on the event loop for the pause, so it holds no thread while it waits.
+
+    :param seconds: a non-negative number of seconds
+    :precondition: seconds must be a non-negative integer or float
+    :postcondition: flush what was printed, so the player sees it before the pause
+    :postcondition: let the time pass on the session's clock, or sleep for it if the session has no clock
+
+    >>> virtual_clock = make_clock('virtual')
+    >>> with use_clock(virtual_clock):
+    ...     run_sync(pause(100))
+    >>> virtual_clock['Game Time']
+    100
+    """
+    sys.stdout.flush()
+    clock = _clock.get()
+    if clock is None:
+        time.sleep(seconds)
+    elif _on_event_loop.get():
+        await wait_async(clock, seconds)
+    else:
+        wait(clock, seconds)
+
+
+@contextmanager
+def use_clock(clock: dict):
+    """
+    Run the enclosed code with every pause() measured by the given clock.
+
+    :param clock: a clock dictionary
+    :precondition: clock must be a dictionary created by clock.make_clock
+    :postcondition: restore the previous clock when the block ends
+
+    >>> scaled_clock = make_clock('scaled', 1000)
+    >>> with use_clock(scaled_clock):
+    ...     run_sync(pause(3))
+    >>> scaled_clock['Game Time']
+    3
+    """
+    token = _clock.set(clock)
+    try:
+        yield clock
+    finally:
+        _clock.reset(token)
+
+
+class NullOutput:
+    """
+    A writable text stream that throws away everything written to it.
+    """
+
+    def write(self, text: str) -> int:
+        """
+        Discard the text.
+
+        >>> NullOutput().write('hello')
+        5
+        """
+        return len(text)
+
+    def flush(self) -> None:
+        """
+        Do nothing, as nothing is ever buffered.
+        """
+
+
+class BufferedOutput:
+    """
+    A writable text stream that holds everything written to it until it is flushed, then passes it on in one write.
+
+    ask() and pause() flush standard output before they wait, so with a BufferedOutput as sys.stdout, all the text of
+    a turn reaches the player in a single write just before the next prompt.
+    """
+
+    def __init__(self, stream):
+        """
+        Initialize the stream.
+
+        :param stream: a writable text stream that receives the text on every flush
+        """
+        self.stream = stream
+        self.pending = []
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, text: str) -> int:
+        """
+        Keep the text until the next flush.
+
+        >>> output = BufferedOutput(sys.__stdout__)
+        >>> output.write('hello'), output.pending
+        (5, ['hello'])
+        """
+        self.pending.append(text)
+        self.writes += 1
+        return len(text)
+
+    def flush(self) -> None:
+        """
+        Pass all the text kept since the last flush on in one write.
+
+        >>> output = BufferedOutput(sys.stdout)
+        >>> for word in ['Haru', ' and ', 'Baekgu\\n']:
+        ...     _ = output.write(word)
+        >>> output.flush()
+        Haru and Baekgu
+        >>> output.writes, output.flushes
+        (3, 1)
+        """
+        if self.pending:
+            text = ''.join(self.pending)
+            self.pending.clear()
+            self.flushes += 1
+            self.send(text)
+
+    def send(self, text: str) -> None:
+        """
+        Write the text to the underlying stream and flush it.
+        """
+        self.stream.write(text)
+        self.stream.flush()
+
+
+@contextmanager
+def buffered_output():
+    """
+    Run the enclosed code with everything printed held back until the next prompt, pause, or the end of the block.
+
+    :postcondition: send everything printed inside the block to the original standard output
+    :postcondition: restore the original standard output when the block ends
+
+    >>> with buffered_output() as output:
+    ...     print('You moved one step up.')
+    ...     print('Everything seems quiet.')
+    You moved one step up.
+    Everything seems quiet.
+    >>> output.writes, output.flushes
+    (4, 1)
+    """
+    original_stdout = sys.stdout
+    output = BufferedOutput(original_stdout)
+    sys.stdout = output
+    try:
+        yield output
+    finally:
+        output.flush()
+        sys.stdout = original_stdout
+
+
+@contextmanager
+def headless(prompt_handler, clock: dict | None = None, output=None):
+    """
+    Run the enclosed code without a terminal.
+
+    Inside the block, every ask() is answered by prompt_handler, every pause() is measured by a virtual clock unless
+    another clock is given, and everything printed is discarded unless another output is given. While a single
+    headless block runs, its output is sys.stdout itself, so a print costs no more than a write to that output. Once
+    a second block starts, on this thread or another, sys.stdout becomes a SessionOutput until the last block ends, so
+    blocks running at once each print to their own output. A process that already has a SessionOutput as sys.stdout,
+    such as a server, keeps it.
+
+    :param prompt_handler: a function that takes a prompt and a topic as strings and returns an answer as a string
+    :param clock: a clock dictionary, or None to use a new virtual clock
+    :param output: a writable text stream, or None to discard everything printed
+    :precondition: prompt_handler must be callable with two string arguments
+    :precondition: clock must be a dictionary created by clock.make_clock or None
+    :precondition: output must have write and flush methods or be None
+    :postcondition: restore the terminal prompts, clock, and output when the block ends
+    :postcondition: restore sys.stdout when the last headless block running ends
+
+    >>> with headless(lambda prompt, topic: 'q'):
+    ...     print('nobody sees this')
+    ...     answer = run_sync(ask('Which item would you like to use? ', 'item'))
+    >>> answer
+    'q'
+    """
+    handler_token = _prompt_handler.set(prompt_handler)
+    clock_token = _clock.set(clock or make_clock('virtual'))
+    output = NullOutput() if output is None else output
+    output_token = _output.set(output)
+    with _headless_stdout_lock:
+        if not _headless_stdout['Sessions']:
+            _headless_stdout['Original'] = sys.stdout
+            if not isinstance(sys.stdout, SessionOutput):
+                sys.stdout = output
+        elif not isinstance(sys.stdout, SessionOutput):
+            sys.stdout = SessionOutput(_headless_stdout['Original'])
+        _headless_stdout['Sessions'] += 1
+    try:
+        yield
+    finally:
+        with _headless_stdout_lock:
+            _headless_stdout['Sessions'] -= 1
+            if not _headless_stdout['Sessions']:
+                sys.stdout = _headless_stdout['Original']
+                _headless_stdout['Original'] = None
+        _output.reset(output_token)
+        _clock.reset(clock_token)
+        _prompt_handler.reset(handler_token)
+
+
+class SessionOutput:
+    """
+    A writable text stream that sends everything written to it to the output of the current session.
+
+    Installed as sys.stdout, it lets sessions running side by side in one process print to their own players.
+    Outside any session, the text goes to the terminal stream it was created with.
+    """
+
+    def __init__(self, terminal):
+        """
+        Initialize the stream.
+
+        :param terminal: a writable text stream used outside any session
+        """
+        self.terminal = terminal
+
+    def current(self):
+        """
+        Find the stream the current session prints to.
+
+        :return: the current session's output stream, or the terminal stream outside any session
+
+        >>> SessionOutput(sys.__stdout__).current() is sys.__stdout__
+        True
+        """
+        output = _output.get()
+        return self.terminal if output is None else output
+
+    def write(self, text: str) -> int:
+        """
+        Write the text to the current session's output.
+
+        >>> with remote(lambda prompt, topic: '', NullOutput(), make_clock('virtual')):
+        ...     written = SessionOutput(sys.__stdout__).write('hello')
+        >>> written
+        5
+        """
+        return self.current().write(text)
+
+    def flush(self) -> None:
+        """
+        Flush the current session's output.
+        """
+        self.current().flush()
+
+
+@contextmanager
+def remote(prompt_handler, output, clock: dict):
+    """
+    Run the enclosed code as a session played from somewhere other than this terminal, on an event loop.
+
+    Inside the block, every ask() is answered by awaiting prompt_handler, every pause() is awaited on the event loop
+    for as long as clock says, and everything printed goes to output, as long as sys.stdout is a SessionOutput.
+    Unlike headless(), nothing global is changed, so many remote sessions can run at once as tasks of one event loop,
+    none of them holding a thread while it waits for its player or its clock.
+
+    :param prompt_handler: an async function that takes a prompt and a topic as strings and returns an answer as a
+    string
+    :param output: a writable text stream for the session
+    :param clock: a clock dictionary
+    :precondition: prompt_handler must be callable with two string arguments
+    :precondition: output must have write and flush methods
+    :precondition: clock must be a dictionary created by clock.make_clock
+    :precondition: the game must be awaited inside the block, in a task of an event loop
+    :postcondition: restore the previous prompts, clock, and output when the block ends
+
+    >>> import asyncio
+    >>> async def answer(prompt, topic):
+    ...     return 'w'
+    >>> async def play():
+    ...     with remote(answer, NullOutput(), make_clock('virtual')):
+    ...         return await ask('Enter the direction you wish to travel (W/A/S/D): ', 'direction')
+    >>> asyncio.run(play())
+    'w'
+    """
+    handler_token = _prompt_handler.set(prompt_handler)
+    clock_token = _clock.set(clock)
+    output_token = _output.set(output)
+    loop_token = _on_event_loop.set(True)
+    try:
+        yield
+    finally:
+        _on_event_loop.reset(loop_token)
+        _output.reset(output_token)
+        _clock.reset(clock_token)
+        _prompt_handler.reset(handler_token)
@@ -0,0 +1,406 @@
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+
+from character import ITEMS, SKILL_FIELDS, STAT_FIELDS
+
+CONTENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'content.json')
+CACHE_MAGIC = b'BKGC'
+CACHE_VERSION = 2
+BOARD_CELLS = frozenset('#.!')
+DROP_KEYS = {
+    "Skill": tuple(key for key in SKILL_FIELDS if key != "Current Skills"),
+    "Stat": tuple(key for key, name in STAT_FIELDS.items() if name is not None),
+    "Inventory": ITEMS
+}
+DROP_SECTIONS = tuple(DROP_KEYS)
+ENEMY_STATS = ('HP Range', 'Basic Attack', 'Skill Damage')
+ENEMY_FIELDS = {"Name": str, "Icon": str, "Description": str, "Level": int, "Tier": str, "Skill Name": str,
+                "Character Level": int, "Boss": bool}
+LEVEL_FIELDS = {"Max Exp": int, "HP Gain": int, "Description": str}
+DROP_FIELDS = {"Name": str, "Chance": (int, float), "Section": str, "Key": str, "Amount": int, "Description": str}
+
+_content_cache = {}
+
+
+def check_fields(entry, fields: dict, where: str) -> None:
+    """
+    Check that an entry of a content pack has every field it needs, each of the right type.
+
+    :param entry: an object read from a content pack
+    :param fields: a dictionary mapping field names to a type or a tuple of types
+    :param where: a string naming the entry in error messages
+    :raises ValueError: if entry is not a dictionary or a field is missing or of the wrong type
+
+    >>> check_fields({"Name": 'Bark'}, {"Name": str}, 'Skills.Level 1[0]')
+    >>> check_fields({"Name": 3}, {"Name": str}, 'Skills.Level 1[0]')
+    Traceback (most recent call last):
+    ...
+    ValueError: Skills.Level 1[0].Name: expected str, found int
+    """
+    if not isinstance(entry, dict):
+        raise ValueError(f"{where}: expected an object, found {type(entry).__name__}")
+    for field, kind in fields.items():
+        if field not in entry:
+            raise ValueError(f"{where}: missing {field}")
+        value = entry[field]
+        if not isinstance(value, kind) or (kind is not bool and isinstance(value, bool)):
+            expected = kind.__name__ if isinstance(kind, type) else ' or '.join(each.__name__ for each in kind)
+            raise ValueError(f"{where}.{field}: expected {expected}, found {type(value).__name__}")
+
+
+def check_range(value, where: str) -> None:
+    """
+    Check that a value of a content pack is a range of non-negative whole numbers.
+
+    :param value: an object read from a content pack
+    :param where: a string naming the value in error messages
+    :raises ValueError: if value is not a list of two non-negative integers, the lower one first
+
+    >>> check_range([20, 30], 'Rewards.Exp')
+    >>> check_range([30, 20], 'Rewards.Exp')
+    Traceback (most recent call last):
+    ...
+    ValueError: Rewards.Exp: expected two whole numbers, low then high, found [30, 20]
+    """
+    if (not isinstance(value, list) or len(value) != 2
+            or not all(isinstance(number, int) and not isinstance(number, bool) and number >= 0 for number in value)
+            or value[0] > value[1]):
+        raise ValueError(f"{where}: expected two whole numbers, low then high, found {value!r}")
+
+
+def validate_board(rows, where: str) -> None:
+    """
+    Check that a board of a content pack can be played.
+
+    The goal is looked for with the breadth-first search of pathfinding.distance_field. board and pathfinding are
+    imported here rather than at the top, since the boards they build are read from the content pack.
+
+    :param rows: an object read from a content pack
+    :param where: a string naming the board in error messages
+    :raises ValueError: if rows is not a list of at least three strings of the same length, if a row holds anything
+    but '#', '.', and '!', if the board does not have exactly one goal '!', if the cell in row 1 and column 1,
+    where the character starts, is not '.', if a cell on the edge of the board is not a wall '#', or if the goal
+    cannot be reached from the start
+
+    >>> validate_board(['####', '#.!#', '####'], 'Boards.4')
+    >>> validate_board(['####', '#.!.', '####'], 'Boards.4')
+    Traceback (most recent call last):
+    ...
+    ValueError: Boards.4[1]: the edge of the board must be walls '#'
+    >>> validate_board(['#####', '#.#!#', '#####'], 'Boards.4')
+    Traceback (most recent call last):
+    ...
+    ValueError: Boards.4: the goal '!' cannot be reached from row 1 and column 1
+    >>> validate_board(['###', '#.#', '##'], 'Boards.4')
+    Traceback (most recent call last):
+    ...
+    ValueError: Boards.4[2]: expected 3 cells, found 2
+    >>> validate_board(['###', '#.#', '###'], 'Boards.4')
+    Traceback (most recent call last):
+    ...
+    ValueError: Boards.4: expected one goal '!', found 0
+    """
+    if not isinstance(rows, list) or len(rows) < 3 or not all(isinstance(row, str) for row in rows):
+        raise ValueError(f"{where}: expected a list of at least three rows of text")
+    width = len(rows[0])
+    for number, row in enumerate(rows):
+        if len(row) != width:
+            raise ValueError(f"{where}[{number}]: expected {width} cells, found {len(row)}")
+        unknown = set(row) - BOARD_CELLS
+        if unknown:
+            raise ValueError(f"{where}[{number}]: unknown cells {''.join(sorted(unknown))!r}")
+    goals = sum(row.count('!') for row in rows)
+    if goals != 1:
+        raise ValueError(f"{where}: expected one goal '!', found {goals}")
+    if width < 3 or rows[1][1] != '.':
+        raise ValueError(f"{where}: the character starts in row 1 and column 1, which must be '.'")
+    for number, row in enumerate(rows):
+        if row[0] != '#' or row[-1] != '#' or (number in (0, len(rows) - 1) and row.count('#') != width):
+            raise ValueError(f"{where}[{number}]: the edge of the board must be walls '#'")
+    from board import Board
+    from pathfinding import distance_field, find_goal
+    template = Board.from_lists([list(row) for row in rows]).freeze()
+    if distance_field(template, find_goal(template)).steps_to_goal(1, 1) < 0:
+        raise ValueError(f"{where}: the goal '!' cannot be reached from row 1 and column 1")
+
+
+def validate_content(pack) -> None:
+    """
+    Check that a content pack holds everything the game needs, in the form it needs it.
+
+    The levels are numbered from 1 up without gaps, and the game is played through them in that order. Every level
+    must have its skills, its board, and enemies to fight, and every drop must raise a number the character has, so
+    that a pack that passes cannot make the game fail later.
+
+    :param pack: an object read from a content pack file
+    :raises ValueError: naming the first part of the pack that is missing or malformed
+
+    >>> validate_content({"Version": 1})
+    Traceback (most recent call last):
+    ...
+    ValueError: content pack: missing Skills
+    """
+    check_fields(pack, {"Version": int, "Skills": dict, "Enemy Stats": dict, "Enemies": list, "Boards": dict,
+                        "Levels": dict, "Hangman Words": list, "Rewards": dict}, 'content pack')
+    for level, skills in pack["Skills"].items():
+        if not isinstance(skills, list) or not skills:
+            raise ValueError(f"Skills.{level}: expected a non-empty list of skills")
+        for number, skill in enumerate(skills):
+            check_fields(skill, {"Name": str, "Damage": list, "Description": str}, f"Skills.{level}[{number}]")
+            check_range(skill["Damage"], f"Skills.{level}[{number}].Damage")
+        if len({skill["Name"] for skill in skills}) != len(skills):
+            raise ValueError(f"Skills.{level}: skill names must be distinct")
+    check_fields(pack["Enemy Stats"], dict.fromkeys(ENEMY_STATS, dict), 'Enemy Stats')
+    tiers = set(pack["Enemy Stats"]["HP Range"])
+    for stat in ENEMY_STATS:
+        if set(pack["Enemy Stats"][stat]) != tiers:
+            raise ValueError(f"Enemy Stats.{stat}: expected the tiers {sorted(tiers)}")
+        for tier, value in pack["Enemy Stats"][stat].items():
+            check_range(value, f"Enemy Stats.{stat}.{tier}")
+    for number, enemy in enumerate(pack["Enemies"]):
+        check_fields(enemy, ENEMY_FIELDS, f"Enemies[{number}]")
+        if enemy["Tier"] not in tiers:
+            raise ValueError(f"Enemies[{number}].Tier: unknown tier {enemy['Tier']!r}")
+        if enemy["Character Level"] < 1:
+            raise ValueError(f"Enemies[{number}].Character Level: expected a positive level")
+    for level, rows in pack["Boards"].items():
+        if not level.isdecimal() or int(level) < 1:
+            raise ValueError(f"Boards.{level}: expected a positive level number")
+        validate_board(rows, f"Boards.{level}")
+    if not pack["Levels"]:
+        raise ValueError("Levels: expected at least one level")
+    for number, level in enumerate(pack["Levels"], 1):
+        if level != str(number):
+            raise ValueError(f"Levels.{level}: expected level {number}, since levels are numbered 1, 2, 3, and so on")
+        check_fields(pack["Levels"][level], LEVEL_FIELDS, f"Levels.{level}")
+        if pack["Levels"][level]["Max Exp"] < 0 or pack["Levels"][level]["HP Gain"] < 0:
+            raise ValueError(f"Levels.{level}: expected Max Exp and HP Gain that are not negative")
+        if f"Level {level}" not in pack["Skills"]:
+            raise ValueError(f"Skills: missing Level {level}")
+        if level not in pack["Boards"]:
+            raise ValueError(f"Boards: missing {level}")
+        if not any(enemy["Character Level"] == number and not enemy["Boss"] for enemy in pack["Enemies"]):
+            raise ValueError(f"Enemies: no enemy for character level {level}")
+    for level in pack["Boards"]:
+        if level not in pack["Levels"]:
+            raise ValueError(f"Boards.{level}: no level {level} in Levels")
+    if len(pack["Hangman Words"]) != 3:
+        raise ValueError("Hangman Words: expected three lists of words, for levels 3, 2, and 1 in that order")
+    for number, words in enumerate(pack["Hangman Words"]):
+        if (not isinstance(words, list) or not words
+                or not all(isinstance(word, str) and word.isascii() and word.isalpha() and word.islower()
+                           for word in words)):
+            raise ValueError(f"Hangman Words[{number}]: expected a non-empty list of lowercase words")
+    check_fields(pack["Rewards"], {"Exp": list, "Drops": list}, 'Rewards')
+    check_range(pack["Rewards"]["Exp"], 'Rewards.Exp')
+    for number, drop in enumerate(pack["Rewards"]["Drops"]):
+        check_fields(drop, DROP_FIELDS, f"Rewards.Drops[{number}]")
+        if not 0 <= drop["Chance"] <= 1:
+            raise ValueError(f"Rewards.Drops[{number}].Chance: expected a chance from 0 to 1")
+        if drop["Section"] not in DROP_KEYS:
+            raise ValueError(f"Rewards.Drops[{number}].Section: expected one of {', '.join(DROP_SECTIONS)}")
+        if drop["Key"] not in DROP_KEYS[drop["Section"]]:
+            raise ValueError(f"Rewards.Drops[{number}].Key: expected one of {', '.join(DROP_KEYS[drop['Section']])}")
+
+
+def compile_content(pack: dict) -> dict:
+    """
+    Turn a valid content pack into the form the game reads it in.
+
+    :param pack: a dictionary that passes validate_content
+    :postcondition: leave pack unchanged
+    :return: a dictionary with the keys of the pack, where ranges are tuples, board and level numbers are integers,
+    board rows are tuples of strings, and lists are tuples, and with "Max Exp" mapping 'Level 1', 'Level 2', and so on
+    to the Exp each level asks for
+
+    >>> compiled = compile_content({"Version": 1, "Skills": {}, "Enemy Stats": {"HP Range": {"Boss": [500, 600]}},
+    ...                             "Enemies": [], "Boards": {"1": ['###']},
+    ...                             "Levels": {"1": {"Max Exp": 1000, "HP Gain": 250, "Description": 'A garage'}},
+    ...                             "Hangman Words": [['book']], "Rewards": {"Exp": [200, 400], "Drops": []}})
+    >>> compiled['Boards'], compiled['Max Exp']
+    ({1: ('###',)}, {'Level 1': 1000})
+    """
+    return {
+        "Version": pack["Version"],
+        "Skills": {level: tuple(skill | {"Damage": tuple(skill["Damage"])} for skill in skills)
+                   for level, skills in pack["Skills"].items()},
+        "Enemy Stats": {stat: {tier: tuple(value) for tier, value in tiers.items()}
+                        for stat, tiers in pack["Enemy Stats"].items()},
+        "Enemies": tuple(dict(enemy) for enemy in pack["Enemies"]),
+        "Boards": {int(level): tuple(rows) for level, rows in pack["Boards"].items()},
+        "Levels": {int(level): dict(entry) for level, entry in pack["Levels"].items()},
+        "Max Exp": {f"Level {level}": entry["Max Exp"] for level, entry in pack["Levels"].items()},
+        "Hangman Words": tuple(tuple(words) for words in pack["Hangman Words"]),
+        "Rewards": {"Exp": tuple(pack["Rewards"]["Exp"]),
+                    "Drops": tuple(dict(drop) for drop in pack["Rewards"]["Drops"])}
+    }
+
+
+def read_cache(cache_path: str, digest: bytes) -> dict | None:
+    """
+    Read compiled content from a cache file, if the file was made from the content pack with the given hash.
+
+    :param cache_path: a string naming a cache file
+    :param digest: the SHA-256 hash of the content pack file as bytes
+    :return: the compiled content as a dictionary, or None if there is no usable cache for the pack
+    """
+    header = CACHE_MAGIC + bytes((CACHE_VERSION, marshal.version)) + digest
+    try:
+        with open(cache_path, 'rb') as file:
+            data = file.read()
+    except OSError:
+        return None
+    if not data.startswith(header):
+        return None
+    try:
+        compiled = marshal.loads(data[len(header):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return compiled if isinstance(compiled, dict) else None
+
+
+def write_cache(cache_path: str, digest: bytes, compiled: dict) -> None:
+    """
+    Write compiled content to a cache file, so that the next load of the same content pack does not parse it.
+
+    :param cache_path: a string naming a cache file
+    :param digest: the SHA-256 hash of the content pack file as bytes
+    :param compiled: a dictionary made by compile_content
+    :postcondition: replace the cache file in one step, so that no reader sees half of it
+    :postcondition: leave things as they are if the cache file cannot be written, since the cache only saves time
+    :postcondition: write through a temporary file of its own, so that threads writing the cache at the same time
+    never write into each other's temporary file
+    """
+    try:
+        file = tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(os.path.abspath(cache_path)), suffix='.tmp',
+                                           delete=False)
+    except OSError:
+        return
+    try:
+        with file:
+            file.write(CACHE_MAGIC + bytes((CACHE_VERSION, marshal.version)) + digest + marshal.dumps(compiled))
+        os.replace(file.name, cache_path)
+    except OSError:
+        try:
+            os.remove(file.name)
+        except OSError:
+            pass
+
+
+def load_content(path: str = CONTENT_PATH, cache_path: str | None = None) -> dict:
+    """
+    Load a content pack, from the process-wide content cache once it has been loaded.
+
+    The pack is parsed and validated only when its compiled cache file is missing or was made from other content;
+    otherwise loading it costs one read of each file, one hash, and one unmarshal. Once loaded, asking for the pack
+    again costs one dictionary lookup and no system call, until reload_content finds that its file has changed. The
+    compiled content is shared by every session, so it must not be changed.
+
+    :param path: a string naming a JSON content pack file
+    :param cache_path: a string naming the cache file of the pack, or None to keep it next to the pack
+    :precondition: the file must hold UTF-8 JSON text
+    :postcondition: write the cache file if it is missing or out of date
+    :postcondition: remember the content until reload_content or clear_content is called
+    :return: the compiled content as a dictionary made by compile_content
+    :raises FileNotFoundError: if the pack was not loaded before and there is no file at path
+    :raises ValueError: if the pack is not valid JSON or fails validate_content
+
+    >>> load_content() is load_content()
+    True
+    >>> load_content()['Boards'][1][7]
+    '#!..##.###'
+    """
+    cached = _content_cache.get(path)
+    if cached is None:
+        cached = _content_cache[path] = read_content(path, cache_path)
+    return cached[1]
+
+
+def read_content(path: str, cache_path: str | None) -> tuple[tuple[int, int], dict, str | None]:
+    """
+    Read a content pack from its compiled cache file, or compile it if the cache file cannot be used.
+
+    :param path: a string naming a JSON content pack file
+    :param cache_path: a string naming the cache file of the pack, or None to keep it next to the pack
+    :precondition: the file must hold UTF-8 JSON text
+    :postcondition: write the cache file if it is missing or out of date
+    :return: a tuple of the pack file's modification time in nanoseconds and size, the compiled content, and
+    cache_path
+    :raises FileNotFoundError: if there is no file at path
+    :raises ValueError: if the pack is not valid JSON or fails validate_content
+    """
+    status = os.stat(path)
+    with open(path, 'rb') as file:
+        data = file.read()
+    digest = hashlib.sha256(data).digest()
+    cache_file = os.path.abspath(path) + '.cache' if cache_path is None else cache_path
+    compiled = read_cache(cache_file, digest)
+    if compiled is None:
+        pack = json.loads(data.decode('utf-8'))
+        validate_content(pack)
+        compiled = compile_content(pack)
+        write_cache(cache_file, digest, compiled)
+    return (status.st_mtime_ns, status.st_size), compiled, cache_path
+
+
+def reload_content() -> None:
+    """
+    Check every loaded content pack for changes, and load again the packs whose files changed.
+
+    This is the only place the files of loaded packs are looked at again, so it costs one stat call per pack and is
+    meant to be called when a pack is expected to have changed, not on every lookup. When a pack changed, the level
+    layouts, goals, and distance fields built from it are forgotten too, so the next board is built from the new
+    pack. board and pathfinding are imported here rather than at the top, since they read their boards from the pack.
+
+    :postcondition: load again every pack whose file's modification time or size has changed
+    :postcondition: forget every pack whose file no longer exists
+    :postcondition: clear the caches of board.level_template, pathfinding.level_goal, and
+    pathfinding.level_distances if any pack changed
+    :raises ValueError: if a changed pack is not valid JSON or fails validate_content, keeping the pack loaded before
+
+    >>> content = load_content()
+    >>> reload_content()
+    >>> load_content() is content
+    True
+    """
+    changed = False
+    for path, (version, _, cache_path) in list(_content_cache.items()):
+        try:
+            status = os.stat(path)
+            if (status.st_mtime_ns, status.st_size) != version:
+                _content_cache[path] = read_content(path, cache_path)
+                changed = True
+        except FileNotFoundError:
+            _content_cache.pop(path, None)
+            changed = True
+    if changed:
+        from board import level_template
+        from pathfinding import level_distances, level_goal
+        for cached in (level_template, level_goal, level_distances):
+            cached.cache_clear()
+
+
+def final_level() -> int:
+    """
+    Find the last level of the loaded content pack, the one where the boss is fought.
+
+    :return: the number of the last level as a positive integer
+
+    >>> final_level()
+    3
+    """
+    return len(load_content()["Levels"])
+
+
+def clear_content() -> None:
+    """
+    Forget every loaded content pack, so that each one is loaded from its files again the next time it is asked for.
+
+    >>> clear_content()
+    >>> len(_content_cache)
+    0
+    """
+    _content_cache.clear()
@@ -1,15 +1,30 @@
+import os
+import sys
+
 from make_board_each_level import *
 from minigames.hangman import *
 from minigames.matching_direction_game import *
 from minigames.battle import battle
 from helpers import is_alive, display_skills, display_inventory, display_stats, get_item_choice
+from assets import read_text_asset
+from content import final_level, load_content
+from console import ask, buffered_output, pause, record, run_sync
+from character import Character, max_exp
+from board import Board, make_level_board
+from pathfinding import find_player, level_distances, level_goal
+from renderer import make_renderer, use_renderer
+from player_registry import register_player, shared_registry
+from snapshot import SAVE_DIRECTORY, dump_session, read_snapshot, save_path, write_snapshot
+from rng import current_rng, make_rng, use_rng
+from recording import RECORDING_DIRECTORY, make_recording, mark_turn, new_seed, recording_path, write_recording
 
 
 def configure_skills() -> dict[str, dict[str, dict[str, str | int]]]:
     """
     Configure skills for each character level, including skill name, damage, and description.
 
-    Skill damage values are randomly assigned within the specified range.
+    The skills of every level, and the ranges their damage values are randomly picked from, come from the content
+    pack, so a level's skills can be changed without changing the code.
 
     :postcondition: return a dictionary containing skill information for different character levels
     :return: a dictionary with keys as character levels and values as dictionaries of skills
@@ -29,37 +44,12 @@ def configure_skills() -> dict[str, dict[str, dict[str, str | int]]]:
                                'Description': 'A powerful tail swing that knocks '
                                               'the enemy off balance'}}}
     """
-    return {
-        "Level 1": {
-            "Bark": {
-                "Damage": random.randint(20, 30),
-                "Description": "A loud bark that stuns the enemy"
-            }
-        },
-        "Level 2": {
-            "Scratch": {
-                "Damage": random.randint(40, 50),
-                "Description": "A swift paw swipe leaving deep marks"
-            },
-            "Digging": {
-                "Damage": random.randint(40, 50),
-                "Description": "Kick up dirt to blind the enemy"
-            },
-        },
-        "Level 3": {
-            "Tail Whip": {
-                "Damage": random.randint(51, 60),
-                "Description": "A powerful tail swing that knocks the enemy off balance"
-            },
-            "Bite": {
-                "Damage": random.randint(51, 60),
-                "Description": "A strong bite with a headshake"
-            },
-        }
-    }
+    return {level: {skill["Name"]: {"Damage": current_rng().randint(*skill["Damage"]),
+                                    "Description": skill["Description"]} for skill in skills}
+            for level, skills in load_content()["Skills"].items()}
 
 
-def go_to_sleep(character: dict, total_time: int) -> None:
+async def go_to_sleep(character: dict, total_time: int) -> None:
     """
     Make the character sleep for the specified duration.
 
@@ -74,7 +64,7 @@ def go_to_sleep(character: dict, total_time: int) -> None:
 
     >>> skill_set = configure_skills()
     >>> character_with_low_hunger = {"Stat": { "Hunger": 1, "Max Hunger": 10}}
-    >>> go_to_sleep(character_with_low_hunger, 10)
+    >>> run_sync(go_to_sleep(character_with_low_hunger, 10))
     <BLANKLINE>
     💤 You are going to sleep for 10 second(s) to regain energy.
     1 sec
@@ -91,7 +81,7 @@ def go_to_sleep(character: dict, total_time: int) -> None:
     >>> print(character_with_low_hunger)
     {'Stat': {'Hunger': 10, 'Max Hunger': 10}}
     >>> character_with_full_hunger = {"Stat": { "Hunger": 10, "Max Hunger": 10}}
-    >>> go_to_sleep(character_with_full_hunger, 1)
+    >>> run_sync(go_to_sleep(character_with_full_hunger, 1))
     <BLANKLINE>
     💤 You are going to sleep for 1 second(s) to regain energy.
     1 sec
@@ -101,7 +91,7 @@ def go_to_sleep(character: dict, total_time: int) -> None:
     """
     print(f"\n💤 You are going to sleep for %d second(s) to regain energy." % total_time)
     for count in range(1, total_time + 1):
-        time.sleep(1)
+        await pause(1)
         print("%d sec" % count)
     character['Stat']['Hunger'] = 10
     print("You feel well-rested! Your Hunger has been fully restored.")
@@ -111,7 +101,8 @@ def make_character(skill_set: dict) -> dict:
     """
     Create a character with initial stats, skills, and inventory.
 
-    Basic stats include HP, Level, Exp, Hearts, and Hunger. The character is also equipped with basic and
+    Basic stats include HP, Level, Exp, Hearts, and Hunger. The character starts with the HP Gain of Level 1 and
+    needs the Max Exp of each level of the content pack to clear it. The character is also equipped with basic and
     level-specific skills and an empty inventory.
 
     :param skill_set: a dictionary containing skills for different character levels
@@ -142,24 +133,22 @@ def make_character(skill_set: dict) -> dict:
     inventory_items = ['Key', 'HP Potion', 'Kibble']
     inventory = {item: 0 for item in inventory_items}
 
+    hp = load_content()["Levels"][1]["HP Gain"]
+
     return {
         "Stat": {
-            "HP": 250,
-            "Current HP": 250,
+            "HP": hp,
+            "Current HP": hp,
             "Level": 1,
             "Exp": 0,
-            "Max Exp": {
-                "Level 1": 1000,
-                "Level 2": 1300,
-                "Level 3": 1500
-            },
+            "Max Exp": dict(max_exp()),
             "Heart": 10,
             "Max Heart": 10,
             "Hunger": 10,
             "Max Hunger": 10
         },
         "Skill": {
-            "Basic Attack": random.randint(10, 30),
+            "Basic Attack": current_rng().randint(10, 30),
             "Current Skills": {
                 **skill_set["Level 1"],
             }
@@ -193,23 +182,54 @@ def make_character_location(grid: list[list[str]]) -> tuple[tuple[int, int], str
     return first_location, prev_cell_content
 
 
-def get_user_choice(character: dict, grid: list) -> tuple[str, dict]:
+def auto_travel(character: dict, grid: list) -> str | None:
+    """
+    Find the next step of a shortest walk from the character to the goal of its level.
+
+    The step is read from the level's cached distance field, so it costs the same however far away the goal is.
+
+    :param character: a well-formed character dictionary
+    :param grid: a list representing the grid of the character's level, or a Board
+    :precondition: character must be a dictionary containing a key "Stat" which includes "Level"
+    :precondition: grid must be the board of the character's level with the character on it
+    :postcondition: tell the player how far away the goal is, or why no step can be taken
+    :return: one of 'w', 'a', 's', 'd', or None if the character is already at the goal or cannot reach it
+
+    >>> board = make_level_board(1)
+    >>> board[7][2] = '🐶'
+    >>> auto_travel({"Stat": {"Level": 1}}, board)
+    🧭 The goal is 1 step(s) away. You head left.
+    'a'
+    """
+    location = find_player(grid)
+    field = level_distances(character['Stat']['Level'])
+    direction = None if location is None else field.next_direction(*location)
+    if direction is None:
+        print("🧭 You are already at the goal." if location and field.steps_to_goal(*location) == 0
+              else "🧭 You can't find a way to the goal from here.")
+        return None
+    direction_names = {'w': 'up', 'a': 'left', 's': 'down', 'd': 'right'}
+    print(f"🧭 The goal is {field.steps_to_goal(*location)} step(s) away. You head {direction_names[direction]}.")
+    return direction
+
+
+async def get_user_choice(character: dict, grid: list) -> tuple[str, dict]:
     """
     Get the player's choice of which action they want to perform.
 
     Actions include moving around, checking inventory, viewing stats, viewing skills, going to sleep,
-    and reading how-to-play instructions.
+    reading how-to-play instructions, and taking the next step towards the goal of the level.
 
     :param character: a well-formed character dictionary
     :param grid: a list representing the grid
     :precondition: character must be a dictionary containing a key "Stat", "Skill", and "Inventory"
     :postcondition: perform the action based on user's decision
     """
-    types_input = ['1', '2', '3', '4', '5', '6']
+    types_input = ['1', '2', '3', '4', '5', '6', '7']
 
     while True:
         display_grid(grid)
-        user_choice = input(
+        user_choice = await ask(
             "\nWhat would you like to do?\n"
             "--------------------------------------------------------\n"
             " 1: 🐕 Directions  - Move around\n"
@@ -218,8 +238,9 @@ def get_user_choice(character: dict, grid: list) -> tuple[str, dict]:
             " 4: ⚔️ Skills      - View your skills you have\n"
             " 5: 💤 Sleep       - Rest to regain energy\n"
             " 6: ℹ️ Help        - Read about How to play\n"
+            " 7: 🧭 Auto-travel - Take a step towards the goal\n"
             "--------------------------------------------------------\n"
-            "Enter the number of your choice: "
+            "Enter the number of your choice: ", 'menu'
         )
 
         if user_choice == '1':
@@ -229,8 +250,8 @@ def get_user_choice(character: dict, grid: list) -> tuple[str, dict]:
             for count, element in enumerate(movement_keys):
                 print(f"{element.upper()} : {movement_directions[count]}")
             while True:
-                direction_input = input("\nEnter the direction you wish to travel "
-                                        f"({'/'.join(movement_keys).upper()}): ").strip().lower()
+                direction_input = (await ask("\nEnter the direction you wish to travel "
+                                             f"({'/'.join(movement_keys).upper()}): ", 'direction')).strip().lower()
                 if direction_input in movement_keys:
                     return direction_input, character
                 else:
@@ -238,7 +259,7 @@ def get_user_choice(character: dict, grid: list) -> tuple[str, dict]:
         elif user_choice == '2':
             while True:
                 display_inventory(character)
-                have_break = get_item_choice(character)
+                have_break = await get_item_choice(character)
                 if have_break:
                     break
         elif user_choice == '3':
@@ -246,19 +267,25 @@ def get_user_choice(character: dict, grid: list) -> tuple[str, dict]:
         elif user_choice == '4':
             display_skills(character)
         elif user_choice == '5':
-            go_to_sleep(character, 10)
+            await go_to_sleep(character, 10)
         elif user_choice == '6':
             for line in load_text('intro.txt'):
                 print(line)
+        elif user_choice == '7':
+            direction = auto_travel(character, grid)
+            if direction is not None:
+                return direction, character
         elif user_choice not in types_input:
-            print("❌ Invalid input. Please enter a valid choice (1-6).\n")
+            print("❌ Invalid input. Please enter a valid choice (1-7).\n")
 
 
 def move_character_valid_move(grid, position, direction, prev_cell_content, character):
     """
     Move character based on the player's choice of direction after move validation.
 
-    :param grid: a list of lists representing the map grid
+    On a Board, the wall check reads the board's passability bitmap and only the player's position is moved.
+
+    :param grid: a Board, or a list of lists representing the map grid
     :param position: a tuple (row, col) indicating the current location of the character
     :param direction: a string indicating the direction of movement ('w', 'a', 's', 'd')
     :param prev_cell_content: the content of the previous cell before the character moved
@@ -307,6 +334,13 @@ def move_character_valid_move(grid, position, direction, prev_cell_content, char
     else:
         print("❌ Invalid input.")
 
+    if isinstance(grid, Board):
+        new_prev_cell_content = grid.move_player(new_row, new_col)
+        if new_prev_cell_content is not None:
+            character["Stat"]["Hunger"] -= 1
+            return (new_row, new_col), new_prev_cell_content, character, valid_check
+        print("❌ You can't move that way.")
+        return (row, col), prev_cell_content, character, False
     if grid[new_row][new_col] != '#':
         grid[row][col] = prev_cell_content
         new_prev_cell_content = grid[new_row][new_col]
@@ -319,7 +353,7 @@ def move_character_valid_move(grid, position, direction, prev_cell_content, char
         return (row, col), prev_cell_content, character, valid_check
 
 
-def check_character_hunger(character: dict) -> dict:
+async def check_character_hunger(character: dict) -> dict:
     """
     Force the character to go to sleep when Hunger level reaches 0.
 
@@ -331,7 +365,7 @@ def check_character_hunger(character: dict) -> dict:
     :return: a character dictionary with updated Hunger level
 
     >>> starving_character = {"Stat": {"Hunger": 0, "Max Hunger": 10}}
-    >>> check_character_hunger(starving_character) # doctest: +ELLIPSIS
+    >>> run_sync(check_character_hunger(starving_character)) # doctest: +ELLIPSIS
     ⚠️⚠️⚠️ Oops! You have run out of energy. It's a nap time, Baekgu ⚠️⚠️⚠️
     <BLANKLINE>
     💤 You are going to sleep for 20 second(s) to regain energy.
@@ -344,82 +378,85 @@ def check_character_hunger(character: dict) -> dict:
     You feel well-rested! Your Hunger has been fully restored.
     {'Stat': {'Hunger': 10, 'Max Hunger': 10}}
     >>> less_hungry_character = {"Stat": {"Hunger": 2, "Max Hunger": 10}}
-    >>> check_character_hunger(less_hungry_character)
+    >>> run_sync(check_character_hunger(less_hungry_character))
     {'Stat': {'Hunger': 2, 'Max Hunger': 10}}
     >>> full_character = {"Stat": {"Hunger": 10, "Max Hunger": 10}}
-    >>> check_character_hunger(full_character)
+    >>> run_sync(check_character_hunger(full_character))
     {'Stat': {'Hunger': 10, 'Max Hunger': 10}}
     """
     if character["Stat"]['Hunger'] == 0:
         print("⚠️⚠️⚠️ Oops! You have run out of energy. It's a nap time, Baekgu ⚠️⚠️⚠️")
-        go_to_sleep(character, 20)
+        await go_to_sleep(character, 20)
     return character
 
 
-def check_character_1_level_location_exp(first_location: tuple, character: dict) -> bool:
+def ordinal(number: int) -> str:
     """
-    Evaluate the character's location, level, exp,and key to move next map.
+    Write a positive integer as an ordinal number.
 
-    :param first_location: the location of the character
-    :param character: a dictionary including character's Stat as key
-    :precondition: first_location must be (7, 1)
-    :precondition: character must have 'Inventory' with 'Key', 'Stat' with 'Level', 'Exp', and 'Max Exp' keys
-    :postcondition: move the character to Level 2 if conditions are satisfied
-    :return: True if the character satisfies all conditions
+    :param number: a positive integer
+    :return: the number followed by 'st', 'nd', 'rd', or 'th' as a string
 
-    >>> character_true = {'Inventory': {'Key': 1}, 'Stat': {'Level': 1, 'Exp': 1350, 'Max Exp': {'Level 1': 1350}}}
-    >>> check_character_1_level_location_exp((7, 1), character_true)
-    ⬆️⬆️⬆️ Level UP ⬆️⬆️⬆️
-    1st Level clear! You are moving to Level 2.
-    True
+    >>> ordinal(1), ordinal(2), ordinal(3), ordinal(4), ordinal(11), ordinal(22)
+    ('1st', '2nd', '3rd', '4th', '11th', '22nd')
     """
-    if (first_location == (7, 1) and character['Inventory']['Key'] >= 1 and character['Stat']['Level'] == 1 and
-            character['Stat']['Exp'] >= character['Stat']['Max Exp']['Level 1']):
-        print("⬆️⬆️⬆️ Level UP ⬆️⬆️⬆️\n"
-              "1st Level clear! You are moving to Level 2.")
-        return True
+    suffixes = {1: 'st', 2: 'nd', 3: 'rd'}
+    suffix = 'th' if number % 100 in (11, 12, 13) else suffixes.get(number % 10, 'th')
+    return f'{number}{suffix}'
 
 
-def check_character_2_level_location_exp(first_location: tuple[int, int], character: dict) -> bool:
+def check_level_goal(first_location: tuple[int, int], character: dict) -> bool:
     """
-    Evaluate the character's location, level, exp,and key to move next map.
+    Evaluate the character's location, level, exp, and key to move to the next map.
+
+    The goal of a level is the '!' on its board, and every level but the last of the content pack is cleared by
+    reaching it with a key and the Exp the level asks for.
 
-    :param first_location: the location of the character 
+    :param first_location: the location of the character
     :param character: a dictionary including character's Stat as key
-    :precondition: first_location must be (4, 8)
     :precondition: character must have 'Inventory' with 'Key', 'Stat' with 'Level', 'Exp', and 'Max Exp' keys
-    :postcondition: move the character to Level 3 if conditions are satisfied
+    :postcondition: announce that the character moves to the next level if conditions are satisfied
     :return: True if the character satisfies all conditions
 
+    >>> character_true = {'Inventory': {'Key': 1}, 'Stat': {'Level': 1, 'Exp': 1350, 'Max Exp': {'Level 1': 1350}}}
+    >>> check_level_goal((7, 1), character_true)
+    ⬆️⬆️⬆️ Level UP ⬆️⬆️⬆️
+    1st Level clear! You are moving to Level 2.
+    True
     >>> character_true = {'Inventory': {'Key': 3}, 'Stat': {'Level': 2, 'Exp': 1350, 'Max Exp': {'Level 2': 1300}}}
-    >>> check_character_2_level_location_exp((4, 8), character_true)
+    >>> check_level_goal((4, 8), character_true)
     ⬆️⬆️⬆️ Level UP ⬆️⬆️⬆️
     2nd Level clear! You are moving to Level 3.
     True
     """
-    if (first_location == (4, 8) and character['Inventory']['Key'] >= 1 and character['Stat']['Level'] == 2 and
-            character['Stat']['Exp'] >= character['Stat']['Max Exp']['Level 2']):
+    level = character['Stat']['Level']
+    if (level < final_level() and first_location == level_goal(level) and character['Inventory']['Key'] >= 1 and
+            character['Stat']['Exp'] >= character['Stat']['Max Exp'][f'Level {level}']):
         print("⬆️⬆️⬆️ Level UP ⬆️⬆️⬆️\n"
-              "2nd Level clear! You are moving to Level 3.")
+              f"{ordinal(level)} Level clear! You are moving to Level {level + 1}.")
         return True
 
 
-def check_character_3_level_location_for_final(first_location: tuple[int, int], character: dict) -> bool:
+async def check_final_goal(first_location: tuple[int, int], character: dict) -> bool:
     """
     Evaluate the character's location, level, and Exp to encounter final boss.
 
-    :param first_location: the location of the character 
+    The boss waits on the '!' of the last level of the content pack.
+
+    :param first_location: the location of the character
     :param character: a dictionary including character's Stat as key
-    :precondition: first_location must be (4, 4)
     :precondition: character must have 'Stat' key with 'Level' and 'Exp' keys, and 'Max Exp' key
     :postcondtion: print to fight the boss if the character is at the right location, level, and Exp level
-    :return: a boolean indicating whether the character has won the battle against
+    :return: a boolean indicating whether the character has won the battle against the boss, or None if there was
+    no battle
 
+    >>> run_sync(check_final_goal((4, 4), {'Stat': {'Level': 2, 'Exp': 1500, 'Max Exp': {'Level 2': 1300}}}))
     """
-    if first_location == (4, 4) and character['Stat']['Level'] == 3 and character['Stat']['Exp'] >= \
-            character['Stat']['Max Exp']['Level 3']:
+    level = character['Stat']['Level']
+    if (level == final_level() and first_location == level_goal(level) and
+            character['Stat']['Exp'] >= character['Stat']['Max Exp'][f'Level {level}']):
         print('You are going to fight the boss to save Haru. Good luck!')
-        character, has_won = battle(character, True)
+        character, has_won = await battle(character, True)
         return has_won
 
 
@@ -439,7 +476,7 @@ def check_probability(rate: float) -> bool:
     >>> check_probability(1) # doctest: +SKIP
     True
     """
-    return random.random() <= rate
+    return current_rng().random() <= rate
 
 
 def get_reward(character: dict) -> dict:
@@ -447,7 +484,8 @@ def get_reward(character: dict) -> dict:
     Give rewards to the player based on drop rates.
 
     Experience points (Exp) are always given, and additional items will drop based on their specific drop rates.
-    Each reward either increases character stats permanently or is added to the character's inventory.
+    Each reward either increases character stats permanently or is added to the character's inventory. The drops,
+    their rates, and their effects come from the content pack and are rolled in the order the pack lists them.
 
     :param character: a well-formed character dictionary
     :precondition: character must be a dictionary containing "Stat", "Inventory", "Skill" keys, with "Stat" including
@@ -467,39 +505,20 @@ def get_reward(character: dict) -> dict:
     {'Stat': {'Level': 1, 'Exp': 232, 'Hunger': 3, 'Max Exp': {'Level 1': 1000, 'Level 2': 1300, 'Level 3': 1500}},
     'Inventory': {'HP Potion': 1, 'Key': 1, 'Kibble': 0}}
     """
-    exp = random.randint(200, 400)
+    rewards = load_content()["Rewards"]
+    exp = current_rng().randint(*rewards["Exp"])
     character['Stat']['Exp'] += exp
-    max_exp = character['Stat']['Max Exp']['Level 1'] if character['Stat']['Level'] == 1 else (
-        character)['Stat']['Max Exp']['Level 2']
+    level_exp = character['Stat']['Max Exp'][f"Level {character['Stat']['Level']}"]
     print("🏆 Reward Earned 🏆\n"
-          f"{' - Exp +%d':<20}({character['Stat']['Exp']}/{max_exp})" % exp)
-    if check_probability(0.1):
-        print(f"{' - Bone +1':<20} Permanently increases Basic Attack damage by +30")
-        character['Skill']['Basic Attack'] += 30
-    if check_probability(0.3):
-        print(f"{' - HP Potion +1':<20} Fully restores current HP (saved to inventory)")
-        try:
-            character['Inventory']['HP Potion'] += 1
-        except KeyError:
-            character['Inventory']['HP Potion'] = 1
-    if check_probability(0.1):
-        print(f"{' - Paw Boots +1':<20} Permanently increases maximum HP by +100")
-        character['Stat']['HP'] += 100
-    if check_probability(0.3):
-        print(f"{' - Kibble +1':<20} Increases Hunger by +1 (saved to inventory)")
-        try:
-            character['Inventory']['Kibble'] += 1
-        except KeyError:
-            character['Inventory']['Kibble'] = 1
-    if check_probability(0.3):
-        print(f"{' - Bowl Collar':<20} Increases Hunger by +1 now")
-        character['Stat']['Hunger'] += 1
-    if check_probability(0.5):
-        print(f"{' - Key +1':<20} Used to move to the next level (saved to inventory)")
-        try:
-            character['Inventory']['Key'] += 1
-        except KeyError:
-            character['Inventory']['Key'] = 1
+          f"{' - Exp +%d':<20}({character['Stat']['Exp']}/{level_exp})" % exp)
+    for drop in rewards["Drops"]:
+        if check_probability(drop["Chance"]):
+            print(f"{' - ' + drop['Name']:<20} {drop['Description']}")
+            section, key = character[drop["Section"]], drop["Key"]
+            if drop["Section"] == 'Inventory':
+                section[key] = section.get(key, 0) + drop["Amount"]
+            else:
+                section[key] += drop["Amount"]
     return character
 
 
@@ -507,7 +526,8 @@ def load_text(file: str) -> list:
     """
     Load a list of lines of text read from a text file.
 
-    Whitespaces at the end of each line will be removed.
+    Whitespaces at the end of each line will be removed. The file is only read again once it has changed, so showing
+    the same text over and over costs no file reads.
 
     :param file: a string representing a path to a text file
     :precondition: file must be a valid path to a text file containing Unicode characters or an empty file
@@ -525,15 +545,13 @@ def load_text(file: str) -> list:
     []
     """
     try:
-        with open(file, 'r') as file:
-            texts = file.readlines()
-        return [text.rstrip() for text in texts]
+        return list(read_text_asset(file))
     except FileNotFoundError:
         print(f"Error: The file {file} was not found.")
         return []
 
 
-def introduce_game(user_name: str) -> None:
+async def introduce_game(user_name: str) -> None:
     """
     Provide an introduction to the game, including a personalized greeting and how-to-play instructions.
 
@@ -543,19 +561,19 @@ def introduce_game(user_name: str) -> None:
     :precondition: user_name must be a non-empty string registered in the game
     :postcondition: print an introductory story with a personalized greeting and explaination on how to play the game
 
-    >>> introduce_game('Heather') # doctest: +ELLIPSIS
+    >>> run_sync(introduce_game('Heather')) # doctest: +ELLIPSIS
     Welcome to Baekgu, Heather!
     You are Baekgu, a loyal white Jindo dog with a brave heart and a strong bond with your family.
     Life has always been happy, full of love and play, until today—something is terribly wrong.
     ...
     Time to save Haru, Baekgu!
-    >>> introduce_game('Young Bin') # doctest: +ELLIPSIS
+    >>> run_sync(introduce_game('Young Bin')) # doctest: +ELLIPSIS
     Welcome to Baekgu, Young Bin!
     You are Baekgu, a loyal white Jindo dog with a brave heart and a strong bond with your family.
     Life has always been happy, full of love and play, until today—something is terribly wrong.
     ...
     Time to save Haru, Baekgu!
-    >>> introduce_game('   ') # doctest: +ELLIPSIS
+    >>> run_sync(introduce_game('   ')) # doctest: +ELLIPSIS
     Welcome to Baekgu,    !
     You are Baekgu, a loyal white Jindo dog with a brave heart and a strong bond with your family.
     Life has always been happy, full of love and play, until today—something is terribly wrong.
@@ -567,22 +585,22 @@ def introduce_game(user_name: str) -> None:
     if not texts:
         return
     print(f"Welcome to Baekgu, {user_name}!")
-    time.sleep(1)
+    await pause(1)
     for line in texts:
         print(line)
-        time.sleep(3)
+        await pause(3)
 
 
 def check_user(user_name: str) -> bool:
     """
     Check if a user is registered in the game.
 
-    If the user is not found in the players list, they are added to the list. If the user already exists, they are
+    If the user is not found in the player registry, they are added to it. If the user already exists, they are
     notified as a returning player.
 
     :param user_name: a string representing a player's name
     :precondition: user_name must be a non-empty string
-    :postcondition: add the name of the new user to a file
+    :postcondition: add the name of the new user to the player registry
     :postcondition: print an informative message if the user is already registered
     :return: a boolean indicating if the user is a returning player (True) or a new player (False)
 
@@ -596,31 +614,25 @@ def check_user(user_name: str) -> bool:
     You're already a player! Welcome back,      !
     True
     """
-    try:
-        with open("players.txt") as players:
-            player_list = players.readlines()
-    except FileNotFoundError:
-        with open("players.txt", "w") as players:
-            players.write(f'{user_name}')
-            print("✅ New user is created!")
-            return False
-    else:
-        if f'{user_name}\n' in player_list or user_name in player_list:
-            print("You're already a player! Welcome back, %s!" % user_name)
-            return True
-        else:
-            print("✅ New user is created!")
-            with open("players.txt", "a") as players:
-                players.write(f'\n{user_name}')
-                return False
+    registry, lock = shared_registry()
+    with lock:
+        is_new_player = register_player(registry, user_name)
+    if is_new_player:
+        print("✅ New user is created!")
+        return False
+    print("You're already a player! Welcome back, %s!" % user_name)
+    return True
 
 
 def describe_map_based_on_level(character: dict) -> None:
     """
     Display a description of the current map based on the character's level.
 
+    Each level's description comes from the content pack.
+
     :param character: a well-formed character dictionary
     :precondition: character must be a dictionary containing a "Level" key representing the current character level
+    :precondition: the level must be one of the "Levels" of the content pack
     :postcondition: print a map description based on the current character's level
 
     >>> level_1_character = {"Stat": { "Level": 1}}
@@ -638,17 +650,7 @@ def describe_map_based_on_level(character: dict) -> None:
     The attic is filled with forgotten toys and old memories. Someone seems to be standing guard,
     ready to protect these treasures. Proceed with caution.
     """
-    if character['Stat']['Level'] == 1:
-        print("\n🕸️ UNDERGROUND - THE GARAGE 🕸️\n"
-              "A dark space is filled with stacked boxes, tools, and the smell of dust. It is dead quiet, \n"
-              "but you know you are not alone. You can sense some sneaky creatures watching your every move.")
-    elif character['Stat']['Level'] == 2:
-        print("\n🏠 GROUND FLOOR - LIVING ROOM 🏠\n"
-              "The once lively living room now feels quiet. Stay alert for obstacles that will try to keep you away.")
-    else:
-        print("\n🚪 UPPER FLOOR - THE ATTIC 🚪\n"
-              "The attic is filled with forgotten toys and old memories. Someone seems to be standing guard,\n"
-              "ready to protect these treasures. Proceed with caution.")
+    print("\n" + load_content()["Levels"][character['Stat']['Level']]["Description"])
 
 
 def level_up(character: dict, hp: int, level: int, skill_set: dict) -> None:
@@ -716,94 +718,196 @@ def level_up(character: dict, hp: int, level: int, skill_set: dict) -> None:
           f"You earned two new skills ({','.join(skill_set[f'Level {level}'].keys())}). (max HP +{hp})\n")
 
 
-def game():
+def make_session() -> dict:
     """
-    Drive the game.
-    """
-    grid = make_board_lv1()
-    user_name = input("Hi, there! What's your name? : ")
+    Set up a new playthrough at the start of Level 1.
 
-    if not check_user(user_name):
-        introduce_game(user_name)
+    A session holds everything that changes while the game is played: the board, where the character stands on it,
+    what was on that cell before the character stepped on it, the skills rolled for every level, and the character.
+    The board is copied from the cached Level 1 layout, and the character is a slotted Character. Both are far
+    smaller than the lists and dictionaries they replace and can be used in their place everywhere.
 
+    :postcondition: create a Level 1 Board with the character placed at its first location
+    :postcondition: roll a new skill set and create a Character with it
+    :return: a session dictionary with "Grid", "Location", "Previous Cell", "Skill Set", "Character", and
+    "Achieved Goal" as keys
+
+    >>> session = make_session()
+    >>> session['Location'], session['Previous Cell'], session['Achieved Goal']
+    ((1, 1), '.', False)
+    >>> session['Grid'][1][1]
+    '🐶'
+    >>> session['Character']['Stat']['Level']
+    1
+    """
+    grid = make_level_board(1)
     first_location, prev_cell_content = make_character_location(grid)
     skill_set = configure_skills()
-    character = make_character(skill_set)
-
-    describe_map_based_on_level(character)
-    achieved_goal = False
-    while is_alive(character) and not achieved_goal:
-
-        if character["Stat"]['Hunger'] == 1:
-            print('🚨🚨🚨 You only have 1 Hunger! You must sleep now. 🚨🚨🚨')
-
-        direction, character = get_user_choice(character, grid)
-        (new_row, new_col), prev_cell_content, character, valid_checking = (
-            move_character_valid_move(grid, first_location, direction, prev_cell_content, character))
-        first_location = (new_row, new_col)
-        if not valid_checking:
-            continue
-        check_character_hunger(character)
-        there_is_a_challenger = check_probability(0.25)
-        if there_is_a_challenger:
-            game_list = ['battle', 'hangman', 'memory game']
-            challenge = random.choice(game_list)
-            if challenge == 'battle':
-                print("You are going to battle! Prepare yourself.")
-                character, has_won = battle(character)
-                if has_won:
-                    get_reward(character)
-            elif challenge == 'hangman':
-                print("You are about to play Hangman!\n\n"
-                      "📖 How to Play 📖\n"
-                      "Try to guess the secret word, one letter at a time. You have limited tries. "
-                      "Remember: every key counts as a guess, so be careful. Good luck!")
-                input("Press any key to continue...")
-                level = check_character_level_hangman(character)
-                has_won, character = hangman(level, character)
-                if has_won:
-                    print("Congratulations! You have won!")
-                    get_reward(character)
-            elif challenge == 'memory game':
-                print("You are about to play Memory Game!\n\n"
-                      "📖 How to Play 📖\n"
-                      "You'll be shown a sequence of letters. You have 5 seconds to memorize it. Then, enter each "
-                      "letter one at a time in the correct order. Good luck!")
-                input("Press any key to continue...")
-                level_matching_game = check_character_level_matching_game(character)
-                has_won, character = play_game(level_matching_game, character)
-                if has_won:
-                    print("Congratulations! You have won!")
-                    get_reward(character)
-
-        goal_lv1 = check_character_1_level_location_exp(first_location, character)
-        if goal_lv1:
-            grid = make_board_lv2()
-            first_location, prev_cell_content = make_character_location(grid)
-            level_up(character, 200, 2, skill_set)
-            describe_map_based_on_level(character)
+    return {
+        "Grid": grid,
+        "Location": first_location,
+        "Previous Cell": prev_cell_content,
+        "Skill Set": skill_set,
+        "Character": Character.from_dict(make_character(skill_set)),
+        "Achieved Goal": False
+    }
 
-        goal_lv2 = check_character_2_level_location_exp(first_location, character)
-        if goal_lv2:
-            grid = make_board_lv3()
-            first_location, prev_cell_content = make_character_location(grid)
-            level_up(character, 250, 3, skill_set)
-            describe_map_based_on_level(character)
-        final_goal = check_character_3_level_location_for_final(first_location, character)
-        if final_goal is not None:
-            if final_goal:
-                print("🎉 Victory! You defeated the boss, but soon realized it was all a misunderstanding "
-                      "with Majestic Fluffy BunBun. With Haru safe, it's time to return home.")
-                achieved_goal = True
+
+async def take_turn(session: dict) -> str | None:
+    """
+    Play one turn of the game.
+
+    The player chooses what to do until they pick a direction. After a valid move, the character may face a
+    challenger, and the goal of the current level is checked.
+
+    :param session: a session dictionary
+    :precondition: session must be a dictionary created by make_session
+    :postcondition: move the character on the board if the move is valid and update the session with the new
+    location, board, and character
+    :postcondition: level the character up and move it to the next board when the level goal is satisfied
+    :postcondition: set "Achieved Goal" to True when the final boss is defeated
+    :postcondition: play hangman with minigames.evil_hangman if the session's "Hangman Mode" is 'evil', importing it
+    only then, since it needs numpy and the rest of the game does not
+    :return: the challenge faced during the turn as a string ('battle', 'hangman' or 'memory game'), or None if there
+    was no challenger
+    """
+    grid, first_location, prev_cell_content = session['Grid'], session['Location'], session['Previous Cell']
+    character, skill_set = session['Character'], session['Skill Set']
+
+    if character["Stat"]['Hunger'] == 1:
+        print('🚨🚨🚨 You only have 1 Hunger! You must sleep now. 🚨🚨🚨')
+
+    direction, character = await get_user_choice(character, grid)
+    (new_row, new_col), prev_cell_content, character, valid_checking = (
+        move_character_valid_move(grid, first_location, direction, prev_cell_content, character))
+    first_location = (new_row, new_col)
+    if not valid_checking:
+        return None
+    await check_character_hunger(character)
+    challenge = None
+    there_is_a_challenger = check_probability(0.25)
+    if there_is_a_challenger:
+        game_list = ['battle', 'hangman', 'memory game']
+        challenge = current_rng().choice(game_list)
+        if challenge == 'battle':
+            print("You are going to battle! Prepare yourself.")
+            character, has_won = await battle(character)
+            if has_won:
+                get_reward(character)
+        elif challenge == 'hangman':
+            print("You are about to play Hangman!\n\n"
+                  "📖 How to Play 📖\n"
+                  "Try to guess the secret word, one letter at a time. You have limited tries. "
+                  "Remember: every key counts as a guess, so be careful. Good luck!")
+            await ask("Press any key to continue...", 'continue')
+            level = check_character_level_hangman(character)
+            if session.get('Hangman Mode') == 'evil':
+                from minigames.evil_hangman import evil_hangman
+                has_won, character = await evil_hangman(level, character)
             else:
-                print("😞 Oh no! You weren't strong enough to defeat the boss this time. Train harder and grow "
-                      "stronger! Returning to checkpoint - the start of Level 3. Keep going, you can do this!\n"
-                      "(Exp reset to 0)")
-                character['Stat']['Exp'] = 0
-                grid = make_board_lv3()
-                first_location, prev_cell_content = make_character_location(grid)
-
-    if achieved_goal:
+                has_won, character = await hangman(level, character)
+            if has_won:
+                print("Congratulations! You have won!")
+                get_reward(character)
+        elif challenge == 'memory game':
+            print("You are about to play Memory Game!\n\n"
+                  "📖 How to Play 📖\n"
+                  "You'll be shown a sequence of letters. You have 5 seconds to memorize it. Then, enter each "
+                  "letter one at a time in the correct order. Good luck!")
+            await ask("Press any key to continue...", 'continue')
+            level_matching_game = check_character_level_matching_game(character)
+            has_won, character = await play_game(level_matching_game, character)
+            if has_won:
+                print("Congratulations! You have won!")
+                get_reward(character)
+
+    if check_level_goal(first_location, character):
+        level = character['Stat']['Level'] + 1
+        grid = make_level_board(level)
+        first_location, prev_cell_content = make_character_location(grid)
+        level_up(character, load_content()["Levels"][level]["HP Gain"], level, skill_set)
+        describe_map_based_on_level(character)
+    final_goal = await check_final_goal(first_location, character)
+    if final_goal is not None:
+        if final_goal:
+            print("🎉 Victory! You defeated the boss, but soon realized it was all a misunderstanding "
+                  "with Majestic Fluffy BunBun. With Haru safe, it's time to return home.")
+            session['Achieved Goal'] = True
+        else:
+            print("😞 Oh no! You weren't strong enough to defeat the boss this time. Train harder and grow "
+                  "stronger! Returning to checkpoint - the start of Level %d. Keep going, you can do this!\n"
+                  "(Exp reset to 0)" % character['Stat']['Level'])
+            character['Stat']['Exp'] = 0
+            grid = make_level_board(character['Stat']['Level'])
+            first_location, prev_cell_content = make_character_location(grid)
+
+    session['Grid'], session['Location'], session['Previous Cell'] = grid, first_location, prev_cell_content
+    session['Character'] = character
+    return challenge
+
+
+async def game(save_directory: str | None = None, recording_directory: str | None = None,
+               hangman_mode: str = 'classic'):
+    """
+    Drive the game.
+
+    The session draws its random numbers from a generator of its own, so that sessions played side by side never
+    change each other's dice. Once the session is ready, the generator is seeded with a new seed, so that the session
+    can be replayed from its seed and the answers given to its prompts. The game is a coroutine: at a terminal it is
+    run to its end with console.run_sync, and a server awaits one game per player on its event loop.
+
+    :param save_directory: a string naming the directory to keep unfinished games in, or None to never save
+    :param recording_directory: a string naming the directory to record the session in, or None to never record
+    :param hangman_mode: 'classic' to play hangman for a fixed word, or 'evil' to play it against a word that keeps
+    changing to dodge the guesses
+    :postcondition: resume the player's unfinished game if one was saved in save_directory
+    :postcondition: start a new game if the save cannot be read, keeping the save beside it with '.bak' added to its
+    name
+    :postcondition: if the game is interrupted, save it as it was at the end of the last complete turn
+    :postcondition: remove the player's save once the game is over
+    :postcondition: record every complete turn in recording_directory, whether the game ends or is interrupted
+    """
+    user_name = await ask("Hi, there! What's your name? : ", 'name')
+
+    if not check_user(user_name):
+        await introduce_game(user_name)
+
+    path = None if save_directory is None else save_path(save_directory, user_name)
+    try:
+        session = None if path is None else read_snapshot(path)
+    except ValueError:
+        os.replace(path, path + '.bak')
+        print("⚠️ Your saved adventure could not be read, so a new one begins. "
+              "(The old save was kept as a backup.)")
+        session = None
+    if session is None:
+        with use_rng(make_rng()):
+            session = make_session()
+    else:
+        print("💾 Welcome back! Your adventure continues right where you left off.")
+    session['Hangman Mode'] = hangman_mode
+    describe_map_based_on_level(session['Character'])
+    snapshot = dump_session(session)
+    seed = new_seed()
+    recording, answers = make_recording(snapshot, seed, hangman_mode), []
+    try:
+        with use_rng(make_rng(seed)), record(answers):
+            while is_alive(session['Character']) and not session['Achieved Goal']:
+                await take_turn(session)
+                snapshot = dump_session(session)
+                mark_turn(recording, answers, snapshot)
+    except BaseException:
+        if path is not None:
+            write_snapshot(path, snapshot)
+        raise
+    else:
+        if path is not None and os.path.exists(path):
+            os.remove(path)
+    finally:
+        if recording_directory is not None:
+            write_recording(recording_path(recording_directory, user_name, seed), recording)
+
+    if session['Achieved Goal']:
         print("Congratulations! You made it home safely with Haru. Your pawrents and Haru shower you with "
               "love and kisses. Great job, hero! 🐾")
     else:
@@ -814,7 +918,17 @@ def main():
     """
     Drive the program.
     """
-    game()
+    at_terminal = sys.stdout.isatty()
+    hangman_mode = 'evil' if '--evil-hangman' in sys.argv[1:] else 'classic'
+    try:
+        with buffered_output():
+            if at_terminal:
+                with use_renderer(make_renderer()):
+                    run_sync(game(SAVE_DIRECTORY, RECORDING_DIRECTORY, hangman_mode))
+            else:
+                run_sync(game(SAVE_DIRECTORY, RECORDING_DIRECTORY, hangman_mode))
+    except (KeyboardInterrupt, EOFError):
+        print("\n💾 Goodbye! Any unfinished adventure has been saved. Come back soon!")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,6 @@
+from console import ask
+
+
 def is_alive(character: dict) -> bool:
     """
     Check a character's heart stat.
@@ -94,7 +97,7 @@ def use_kibble(character: dict) -> None:
         print("❌ You don't have any Kibble.")
 
 
-def get_item_choice(character: dict) -> bool:
+async def get_item_choice(character: dict) -> bool:
     """
     In order to use an item from the character's inventory, get the user's choice.
 
@@ -109,8 +112,8 @@ def get_item_choice(character: dict) -> bool:
     :return: True if the user inputs 'q'
     """
     while True:
-        item_use = (input("Which item would you like to use? (Enter the item number or type 'q' to quit): ")
-                    .strip().lower())
+        item_use = (await ask("Which item would you like to use? (Enter the item number or type 'q' to quit): ",
+                              'item')).strip().lower()
         if item_use in ['1', 'hp potion']:
             use_hp_potion(character)
         elif item_use in ['2', 'kibble']:
@@ -152,8 +155,7 @@ def display_stats(character: dict) -> None:
     :precondition: 'Skill' must have 'Basic Attack' sub-key
     :postcondition: print the current status of the character, including stats and basic attack
     """
-    max_exp = character['Stat']['Max Exp']['Level 1'] if character['Stat']['Level'] == 1 else (
-        character)['Stat']['Max Exp']['Level 2']
+    max_exp = character['Stat']['Max Exp'][f"Level {character['Stat']['Level']}"]
     print(
         "\n📊 Your Stats:\n"
         "--------------------------------------------------------\n"
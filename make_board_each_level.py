@@ -1,3 +1,7 @@
+from content import load_content
+from renderer import current_renderer, render_board
+
+
 def add_border_walls(grid: list[list[str]], grid_size: int) -> list[list[str]]:
     """
     Add border walls to a grid.
@@ -49,12 +53,26 @@ def fill_spaces(grid: list[list[str]], grid_size: int) -> None:
                 grid[row][col] = '.'
 
 
+def make_level_grid(level: int) -> list[list[str]]:
+    """
+    Build the grid of a level from the board the content pack gives it.
+
+    :param level: a positive integer
+    :precondition: level must be a key of the "Boards" of the content pack
+    :postcondition: leave the content pack unchanged
+    :return: a new grid with one list of cells for each row of the board
+    :raises KeyError: if the content pack has no board for level
+
+    >>> make_level_grid(1)[0]
+    ['#', '#', '#', '#', '#', '#', '#', '#', '#', '#']
+    """
+    return [list(row) for row in load_content()["Boards"][level]]
+
+
 def make_board_lv3() -> list[list[str]]:
     """
-    Build a 10x10 grid and add specific walls with the '#' and special mark '!'.
+    Build the 10x10 grid of level 3, with its dots, walls('#'), and special mark '!' from the content pack.
 
-    :preconditions: initialize grid size as 10
-    :preconditions: initialize the grid as a 2D list of size 10x10
     :postconditions: fill the grid with dots('.'), walls('#'), and a mark('!')
     :return: the grid with dots, walls, and a mark
 
@@ -62,28 +80,13 @@ def make_board_lv3() -> list[list[str]]:
     >>> '!' == grid_mark[4][4]
     True
     """
-    grid_size = 10
-    grid = [[' ' for _ in range(grid_size)] for _ in range(grid_size)]
-    add_border_walls(grid, grid_size)
-    walls = [
-        (3, 1), (3, 5),
-        (3, 2), (3, 3), (3, 4),
-        (4, 5), (5, 5), (6, 5),
-        (7, 3), (7, 4), (7, 5)
-    ]
-    for (row, col) in walls:
-        grid[row][col] = '#'
-    grid[4][4] = "!"
-    fill_spaces(grid, grid_size)
-    return grid
+    return make_level_grid(3)
 
 
 def make_board_lv2() -> list[list[str]]:
     """
-    Build a 10x10 grid and add specific walls with the '#' and special mark '!'.
+    Build the 10x10 grid of level 2, with its dots, walls('#'), and special mark '!' from the content pack.
 
-    :preconditions: initialize grid size as 10
-    :preconditions: initialize the grid as a 2D list of size 10x10
     :postconditions: fill the grid with dots('.'), walls('#'), and a mark('!')
     :return: the grid with dots, walls, and a mark
 
@@ -91,29 +94,13 @@ def make_board_lv2() -> list[list[str]]:
     >>> '!' == grid_mark[4][8]
     True
     """
-    grid_size = 10
-    grid = [[' ' for _ in range(grid_size)] for _ in range(grid_size)]
-    add_border_walls(grid, grid_size)
-    walls = [
-        (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7), (1, 8),
-        (2, 2), (2, 3), (2, 4), (3, 2), (3, 3), (3, 4), (4, 3),
-        (4, 4), (5, 3), (5, 4), (8, 1), (8, 2), (8, 3), (8, 4),
-        (8, 5), (8, 6), (8, 7), (8, 8), (7, 8), (6, 8), (7, 7),
-        (6, 7), (6, 8), (6, 9), (5, 8), (5, 7), (4, 7)
-    ]
-    for (row, col) in walls:
-        grid[row][col] = '#'
-    grid[4][8] = "!"
-    fill_spaces(grid, grid_size)
-    return grid
+    return make_level_grid(2)
 
 
 def make_board_lv1() -> list[list[str]]:
     """
-    Build a 10x10 grid and add specific walls with the '#' and special mark '!'.
+    Build the 10x10 grid of level 1, with its dots, walls('#'), and special mark '!' from the content pack.
 
-    :preconditions: initialize grid size as 10
-    :preconditions: initialize the grid as a 2D list of size 10x10
     :postconditions: fill the grid with dots('.'), walls('#'), and a mark('!')
     :return: the grid with dots, walls, and a mark
 
@@ -121,28 +108,18 @@ def make_board_lv1() -> list[list[str]]:
     >>> '!' == grid_mark[7][1]
     True
     """
-    grid_size = 10
-    grid = [[' ' for _ in range(grid_size)] for _ in range(grid_size)]
-    add_border_walls(grid, grid_size)
-    walls = [
-        (1, 8), (3, 7), (4, 7), (5, 7), (2, 1), (2, 2), (2, 3), (2, 4), (2, 5), (2, 6), (8, 8),
-        (7, 8), (8, 7), (7, 7), (5, 6), (5, 5), (5, 4), (5, 3), (5, 2), (5, 1), (6, 5), (6, 4),
-        (7, 5), (7, 4), (6, 1), (6, 2), (6, 3), (3, 1), (3, 2), (3, 3), (3, 4), (3, 5), (3, 6),
-        (4, 1), (4, 2), (4, 3), (4, 4), (4, 5), (4, 6)
-    ]
-    for (row, col) in walls:
-        grid[row][col] = '#'
-    grid[7][1] = "!"
-    fill_spaces(grid, grid_size)
-    return grid
+    return make_level_grid(1)
 
 
 def display_grid(grid: list[list[str]]) -> None:
     """
     Show a 2D grid.
 
-    :param grid: a list representing the grid
-    :precondition: grid must be a list of lists
+    Inside use_renderer, the grid is drawn by the session's renderer, which only sends what changed since the last
+    grid it drew.
+
+    :param grid: a list representing the grid, or a board.Board, which is turned into text in one piece
+    :precondition: grid must be a list of lists or a board.Board
     :postcondition: print the grid as 2D visual
 
     >>> grid_1 = [['.']]
@@ -154,5 +131,11 @@ def display_grid(grid: list[list[str]]) -> None:
     . . .
     # . #
     """
-    for row in grid:
-        print(' '.join(row))
+    renderer = current_renderer()
+    if renderer is None and hasattr(grid, 'render'):
+        print(grid.render())
+    elif renderer is None:
+        for row in grid:
+            print(' '.join(row))
+    else:
+        print(render_board(renderer, grid), end='')
@@ -0,0 +1,211 @@
+import sys
+import time
+
+import numpy as np
+
+from board import Board, BoardTemplate
+from make_board_each_level import display_grid
+from rng import current_rng
+
+MIN_SIZE = 5
+MAX_SIZE = 2000
+START = (1, 1)
+GOAL = ord('!')
+OPEN = ord('.')
+CLOSED = ord('#')
+
+
+def chances(rng: np.random.Generator, shape, chance: float) -> np.ndarray:
+    """
+    Flip a biased coin for every entry of an array.
+
+    The coins are drawn a byte at a time, so the chance is rounded to a multiple of 1/256, which is plenty for laying
+    out walls and four times faster than drawing floats.
+
+    :param rng: a numpy random Generator
+    :param shape: an integer or a tuple of integers, the shape of the array
+    :param chance: a float from 0.0 to 1.0
+    :return: an array of booleans of the given shape, each True with the given chance
+
+    >>> chances(np.random.default_rng(1), (2, 3), 1.0).all(), chances(np.random.default_rng(1), 4, 0.0).any()
+    (np.True_, np.False_)
+    """
+    return rng.integers(0, 256, shape, dtype=np.uint8) < round(chance * 256)
+
+
+def carve_rooms(rows: int, cols: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Join a grid of rooms into one maze with the sidewinder algorithm, every row of rooms at once.
+
+    Every row of rooms is cut into runs joined east to west, and each run after the first row opens north from at
+    least one of its rooms, so every room is joined to the first row, which is one run. Rather than visiting the runs
+    one at a time, each room opens north by chance, and the runs that were left closed are found from a running count
+    of the rooms opened and opened at their last room.
+
+    :param rows: a positive integer number of rows of rooms
+    :param cols: a positive integer number of columns of rooms
+    :param rng: a numpy random Generator
+    :return: two arrays of booleans with one entry for each room, telling whether the room opens east and whether it
+    opens north
+
+    >>> east, north = carve_rooms(3, 4, np.random.default_rng(1))
+    >>> east[0].tolist(), north[0].tolist(), east[:, -1].tolist()
+    ([True, True, True, False], [False, False, False, False], [False, False, False])
+    """
+    east = chances(rng, (rows, cols), 0.5)
+    east[0] = True
+    east[:, -1] = False
+    north = chances(rng, (rows, cols), 0.25)
+    run_ends = np.flatnonzero(~east.ravel())
+    opened = np.cumsum(north.ravel(), dtype=np.int32)[run_ends]
+    north.ravel()[run_ends[np.diff(opened, prepend=0) == 0]] = True
+    north[0] = False
+    return east, north
+
+
+def open_more(east: np.ndarray, north: np.ndarray, openness: float, rng: np.random.Generator) -> None:
+    """
+    Knock down some of the walls left between rooms, so that there is more than one way around the maze.
+
+    Knocking a wall down only joins two rooms that are already joined some other way, so it never cuts a room off.
+
+    :param east: an array made by carve_rooms
+    :param north: an array made by carve_rooms, of the same shape as east
+    :param openness: a float from 0.0 to 1.0, the chance that a wall between two rooms is knocked down
+    :param rng: a numpy random Generator
+    :postcondition: keep the rooms of the last column closed to the east and the rooms of the first row closed to the
+    north, so that the edge of the board stays walled off
+
+    >>> east, north = np.zeros((2, 2), dtype=bool), np.zeros((2, 2), dtype=bool)
+    >>> open_more(east, north, 1.0, np.random.default_rng(1))
+    >>> east.astype(int).tolist(), north.astype(int).tolist()
+    ([[1, 0], [1, 0]], [[0, 0], [1, 1]])
+    """
+    rows, cols = east.shape
+    east[:, :-1] |= chances(rng, (rows, cols - 1), openness)
+    north[1:] |= chances(rng, (rows - 1, cols), openness)
+
+
+def open_cells(size: int, east: np.ndarray, north: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Lay the rooms of a maze out on a square board, with a wall between every two rooms that are not joined.
+
+    Room (i, j) is the cell (2i + 1, 2j + 1), so the cells on the edge of the board stay walls, as add_border_walls
+    would leave them. On a board of even size, the second last row and column hold no rooms, and about half of their
+    cells that lie beside an open cell are opened too.
+
+    :param size: an integer from MIN_SIZE to MAX_SIZE
+    :param east: an array made by carve_rooms, with (size - 1) // 2 rows and columns
+    :param north: an array made by carve_rooms, of the same shape as east
+    :param rng: a numpy random Generator
+    :return: a size by size array of booleans that are True for the cells that are not walls
+
+    >>> east, north = np.array([[True, False], [False, False]]), np.array([[False, False], [True, False]])
+    >>> open_cells(5, east, north, np.random.default_rng(1)).astype(int)
+    array([[0, 0, 0, 0, 0],
+           [0, 1, 1, 1, 0],
+           [0, 1, 0, 0, 0],
+           [0, 1, 0, 1, 0],
+           [0, 0, 0, 0, 0]])
+    """
+    rows, cols = east.shape
+    cells = np.zeros((size, size), dtype=bool)
+    cells[1:2 * rows:2, 1:2 * cols:2] = True
+    cells[1:2 * rows:2, 2:2 * cols + 1:2] = east
+    cells[0:2 * rows - 1:2, 1:2 * cols:2] |= north
+    if not size % 2:
+        cells[size - 2, 1:size - 2] = cells[size - 3, 1:size - 2] & chances(rng, size - 3, 0.5)
+        cells[1:size - 2, size - 2] = cells[1:size - 2, size - 3] & chances(rng, size - 3, 0.5)
+    return cells
+
+
+def place_goal(size: int, rng: np.random.Generator) -> tuple[int, int]:
+    """
+    Pick the goal cell among the rooms in the half of the board away from the start.
+
+    :param size: an integer from MIN_SIZE to MAX_SIZE
+    :param rng: a numpy random Generator
+    :return: the row and column of a room (i, j) with i + j at least the number of rooms in a row less one, which
+    is never the room of START
+
+    >>> place_goal(5, np.random.default_rng(1))
+    (1, 3)
+    """
+    last = (size - 1) // 2 - 1
+    i, j = (int(number) for number in rng.integers(0, last + 1, 2))
+    if i + j < last:
+        i, j = last - i, last - j
+    return 2 * i + 1, 2 * j + 1
+
+
+def generate_template(size: int, seed: int | None = None, openness: float = 0.1) -> BoardTemplate:
+    """
+    Generate the layout of a square board with walls, a start cell, and a goal '!' that can be reached from it.
+
+    The board is a maze carved by carve_rooms, so every open cell is joined to every other one by construction and no
+    search is needed to check that the goal can be reached. The whole board is built with array operations, so even a
+    board of MAX_SIZE by MAX_SIZE takes milliseconds.
+
+    :param size: an integer from MIN_SIZE to MAX_SIZE, the number of rows and of columns
+    :param seed: an integer seeding the layout, or None to draw the seed from the current session's random numbers
+    :param openness: a float from 0.0 to 1.0, the chance that a wall between two rooms is knocked down to make loops
+    :postcondition: wall off the edge of the board as add_border_walls would
+    :postcondition: leave START, where make_character_location puts the character, open
+    :return: a BoardTemplate, the same for the same size, seed, and openness
+    :raises ValueError: if size is not from MIN_SIZE to MAX_SIZE
+
+    >>> template = generate_template(7, seed=1510)
+    >>> template.instantiate().to_lists() == generate_template(7, seed=1510).instantiate().to_lists()
+    True
+    >>> template.cells[:7], chr(template.cells[7 + 1]), template.cells.count(b'!')
+    (b'#######', '.', 1)
+    """
+    if not MIN_SIZE <= size <= MAX_SIZE:
+        raise ValueError(f"A generated board must be from {MIN_SIZE} to {MAX_SIZE} cells wide, not {size}.")
+    rng = np.random.default_rng(current_rng().getrandbits(64) if seed is None else seed)
+    rooms = (size - 1) // 2
+    east, north = carve_rooms(rooms, rooms, rng)
+    open_more(east, north, openness, rng)
+    cells = open_cells(size, east, north, rng)
+    layout = cells.view(np.uint8) * np.uint8(OPEN - CLOSED) + np.uint8(CLOSED)
+    layout[place_goal(size, rng)] = GOAL
+    passable = np.packbits(cells.ravel(), bitorder='little')
+    return BoardTemplate(size, size, layout.tobytes(), passable.tobytes())
+
+
+def generate_board(size: int, seed: int | None = None, openness: float = 0.1) -> Board:
+    """
+    Generate a new board with walls, a start cell, and a goal '!' that can be reached from it.
+
+    :param size: an integer from MIN_SIZE to MAX_SIZE, the number of rows and of columns
+    :param seed: an integer seeding the layout, or None to draw the seed from the current session's random numbers
+    :param openness: a float from 0.0 to 1.0, the chance that a wall between two rooms is knocked down to make loops
+    :return: a new Board with the layout of generate_template and no player
+    :raises ValueError: if size is not from MIN_SIZE to MAX_SIZE
+
+    >>> display_grid(generate_board(5, seed=1))
+    # # # # #
+    # . . . #
+    # . # # #
+    # . . ! #
+    # # # # #
+    """
+    return generate_template(size, seed, openness).instantiate()
+
+
+def main():
+    """
+    Drive the program.
+    """
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 21
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    start = time.perf_counter()
+    board = generate_board(size, seed)
+    seconds = time.perf_counter() - start
+    if size <= 60:
+        display_grid(board)
+    print(f"Generated a {size}x{size} board in {seconds * 1000:.1f} milliseconds.")
+
+
+if __name__ == '__main__':
+    main()
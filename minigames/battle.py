@@ -1,10 +1,14 @@
-import random
-import time
+from rng import current_rng
+from content import load_content
+from console import ask, pause, run_sync
 from helpers import is_alive, display_stats, display_skills, display_inventory, get_item_choice, lose_heart
+from minigames.enemy_registry import current_registry, encounter_templates
 import warnings
 
 warnings.filterwarnings("ignore")
 
+SKILL_USAGE_LIMIT = 5
+
 
 def show_current_hp(hp: int, original_hp: int, name: str) -> bool:
     """
@@ -75,13 +79,15 @@ def display_attack_description(enemy_name: str) -> None:
     if len(enemy_name) == 0:
         raise ValueError("Enemy name cannot be empty! Ensure you give the enemy a proper name.")
     else:
-        print(random.choice(attack_descriptions).replace("enemy", enemy_name))
+        print(current_rng().choice(attack_descriptions).replace("enemy", enemy_name))
 
 
 def configure_enemy_stat() -> dict[str, dict[str, tuple[int, int]]]:
     """
     Configure the HP, basic attack damage, and skil damage ranges for enemies at each level.
 
+    The ranges come from the content pack, so a tier can be added or rebalanced without changing the code.
+
     :postcondition: return a dictionary containing ranges of HP, basic attack, and skill damage for different enemy
     levels
     :return: a dictionary
@@ -104,13 +110,7 @@ def configure_enemy_stat() -> dict[str, dict[str, tuple[int, int]]]:
                       'Level 4': (75, 100),
                       'Boss': (130, 250)}}
      """
-    level = ["Level 1", "Level 2", "Level 3", "Level 4", "Boss"]
-    hp_range = [(80, 100), (101, 200), (201, 300), (301, 400), (500, 600)]
-    attack_dmg = [(5, 10), (15, 30), (35, 50), (60, 90), (100, 250)]
-    skill_dmg = [(10, 25), (26, 45), (46, 70), (75, 100), (130, 250)]
-    return {"HP Range": {level: hp_range for level, hp_range in zip(level, hp_range)},
-            "Basic Attack": {level: damage_range for level, damage_range in zip(level, attack_dmg)},
-            "Skill Damage": {level: damage_range for level, damage_range in zip(level, skill_dmg)}}
+    return {stat: dict(tiers) for stat, tiers in load_content()["Enemy Stats"].items()}
 
 
 def make_enemies(
@@ -155,207 +155,44 @@ def make_enemies(
         "Icon": icon,
         "Description": description,
         "Level": level,
-        "HP": random.randint(*hp_range),
+        "HP": current_rng().randint(*hp_range),
         "Attack":
             {
-                f"{skill_name}": random.randint(*skill_damage),
-                "Basic Attack": random.randint(*basic_attack)
+                f"{skill_name}": current_rng().randint(*skill_damage),
+                "Basic Attack": current_rng().randint(*basic_attack)
             }
     }
 
 
-def choose_enemy_based_on_level(character: dict, enemy_stat: dict, boss_fight: bool) -> tuple:
+def choose_enemy_based_on_level(character: dict, boss_fight: bool, registry: dict | None = None) -> tuple:
     """
     Return an enemy based on character level and whether the battle is a boss fight.
 
-    When multiple enemies exist for a certain level, an enemy will be randomly chosen.
+    When multiple enemies exist for a certain level, an enemy will be randomly chosen. Only the chosen enemy is
+    created, from its template in the registry, so an encounter costs the same however many enemies there are.
 
     :param character: a well-formed character dictionary
-    :param enemy_stat: a dictionary containing ranges of HP, basic attack, and skill damage for different enemy
-    levels
     :param boss_fight: a boolean
+    :param registry: a dictionary created by minigames.enemy_registry.make_enemy_registry, or None to use the
+    registry of the loaded content pack
     :precondition: character must be a dictionary containing a "Stat" key with "Level" information
-    :precondition: enemy_stat must be a dictionary with "HP Range", "Basic Attack", and "Skill Damage" for each enemy
-    level
     :precondition: boss_fight must be True or False indicating if this battle is against the boss
+    :precondition: the registry must hold at least one enemy for the character's level
     :postcondition: return an appropriate enemy based on character level and boss fight condition
     :return: a tuple containing an enemy dictionary and a copy of that enemy as a dictionary
 
-    >>> character_dict = {
-    ...     'Stat': {
-    ...         'HP': 250,
-    ...         'Current HP': 250,
-    ...         'Level': 1,
-    ...         'Exp': 0,
-    ...         'Max Exp': {
-    ...             'Level 1': 1000,
-    ...             'Level 2': 1300,
-    ...             'Level 3': 1500
-    ...         },
-    ...         'Heart': 10,
-    ...         'Max Heart': 10,
-    ...         'Hunger': 10,
-    ...         'Max Hunger': 10
-    ...     },
-    ...     'Skill': {
-    ...         'Basic Attack': 22,
-    ...         'Current Skills': {
-    ...             'Bark': {
-    ...                 'Damage': 24,
-    ...                 'Description': 'A loud bark that stuns the enemy'
-    ...             }
-    ...         }
-    ...     },
-    ...     'Inventory': {
-    ...         'Key': 0,
-    ...         'HP Potion': 0,
-    ...         'Kibble': 0
-    ...     }
-    ... }
-    >>> enemy_stats = {
-    ...     'HP Range': {
-    ...         'Level 1': (80, 100),
-    ...         'Level 2': (101, 200),
-    ...         'Level 3': (201, 300),
-    ...         'Level 4': (301, 400),
-    ...         'Boss': (500, 600)
-    ...     },
-    ...     'Basic Attack': {
-    ...         'Level 1': (5, 10),
-    ...         'Level 2': (15, 30),
-    ...         'Level 3': (35, 50),
-    ...         'Level 4': (60, 90),
-    ...         'Boss': (100, 250)
-    ...     },
-    ...     'Skill Damage': {
-    ...         'Level 1': (10, 25),
-    ...         'Level 2': (26, 45),
-    ...         'Level 3': (46, 70),
-    ...         'Level 4': (75, 100),
-    ...         'Boss': (130, 250)
-    ...     }
-    ... }
-    >>> choose_enemy_based_on_level(character_dict, enemy_stats, False) # doctest: +SKIP
-    ({'Name': 'Spider', 'Icon': '🕷️', 'Description': 'Moving slowly in the shadows with its sticky webs.', 'Level': '2',
-      'HP': 139, 'Attack': {'Web Trap': 45, 'Basic Attack': 17}},
-     {'Name': 'Spider', 'Icon': '🕷️', 'Description': 'Moving slowly in the shadows with its sticky webs.', 'Level': '2',
-      'HP': 139, 'Attack': {'Web Trap': 45, 'Basic Attack': 17}})
-    >>> character_dict = {
-    ...     'Stat': {
-    ...         'HP': 900,
-    ...         'Current HP': 900,
-    ...         'Level': 3,
-    ...         'Exp': 0,
-    ...         'Max Exp': {
-    ...             'Level 1': 1000,
-    ...             'Level 2': 1300,
-    ...             'Level 3': 1500
-    ...         },
-    ...         'Heart': 10,
-    ...         'Max Heart': 10,
-    ...         'Hunger': 10,
-    ...         'Max Hunger': 10
-    ...     },
-    ...     'Skill': {
-    ...         'Basic Attack': 22,
-    ...         'Current Skills': {
-    ...             'Bark': {
-    ...                 'Damage': 70,
-    ...                 'Description': 'A loud bark that stuns the enemy'
-    ...             }
-    ...         }
-    ...     },
-    ...     'Inventory': {
-    ...         'Key': 0,
-    ...         'HP Potion': 0,
-    ...         'Kibble': 0
-    ...     }
-    ... }
-    >>> choose_enemy_based_on_level(character_dict, enemy_stats, True) # doctest: +SKIP
-    ({'Name': 'Majestic Fluffy BunBun', 'Icon': '🐰',
-      'Description': 'An old and tattered bunny plushie, once loved but now abandoned in the attic. '
-                     'Majestic Fluffy BunBun believes he is the noble protector of all the forgotten treasures here.',
-      'Level': '10', 'HP': 600, 'Attack': {'Cuddle Crush': 228, 'Basic Attack': 180}},
-     {'Name': 'Majestic Fluffy BunBun', 'Icon': '🐰',
-      'Description': 'An old and tattered bunny plushie, once loved but now abandoned in the attic. '
-                     'Majestic Fluffy BunBun believes he is the noble protector of all the forgotten treasures here.',
-      'Level': '10', 'HP': 600, 'Attack': {'Cuddle Crush': 228, 'Basic Attack': 180}})
+    >>> enemy, enemy_copy = choose_enemy_based_on_level({'Stat': {'Level': 3}}, True)
+    >>> enemy['Name'], enemy == enemy_copy, enemy is enemy_copy
+    ('Majestic Fluffy BunBun', True, False)
+    >>> choose_enemy_based_on_level({'Stat': {'Level': 1}}, False)[0]['Name'] in ('Mouse', 'Spider')
+    True
     """
-    enemies = []
-    if character["Stat"]["Level"] == 1:
-        # Low Level Mobs (Underground)
-        mouse = make_enemies('Mouse',
-                             '🐭',
-                             "A tiny mouse nibbling on a piece of cheese. It looks harmless, "
-                             "but don't let your guard down!",
-                             1,
-                             enemy_stat["HP Range"]["Level 1"],
-                             enemy_stat["Basic Attack"]["Level 1"],
-                             enemy_stat["Skill Damage"]["Level 1"],
-                             'Nibble'
-                             )
-        spider = make_enemies('Spider',
-                              '🕷️',
-                              'Moving slowly in the shadows with its sticky webs.',
-                              2,
-                              enemy_stat["HP Range"]["Level 2"],
-                              enemy_stat["Basic Attack"]["Level 2"],
-                              enemy_stat["Skill Damage"]["Level 2"],
-                              'Web Trap')
-
-        enemies = [mouse, spider]
-    elif character["Stat"]["Level"] == 2:
-        # Mid-Level Mobs (Ground Level)
-        robotic_vacuum = make_enemies('Robotic Vacuum',
-                                      '🤖',
-                                      'Going zoom zoom, sucking up everything in its path.',
-                                      2,
-                                      enemy_stat["HP Range"]["Level 2"],
-                                      enemy_stat["Basic Attack"]["Level 2"],
-                                      enemy_stat["Skill Damage"]["Level 2"],
-                                      'Suction')
-        guard_cat = make_enemies('Guard Cat',
-                                 '🐱',
-                                 'A fierce feline guarding the living room.',
-                                 3,
-                                 enemy_stat["HP Range"]["Level 3"],
-                                 enemy_stat["Basic Attack"]["Level 3"],
-                                 enemy_stat["Skill Damage"]["Level 3"],
-                                 'Hiss')
-
-        enemies = [robotic_vacuum, guard_cat]
-    elif boss_fight:
-        boss = make_enemies('Majestic Fluffy BunBun',
-                            '🐰',
-                            'An old and tattered bunny plushie, once loved but now abandoned in the attic. '
-                            'Majestic Fluffy BunBun believes he is the noble protector of all the forgotten treasures '
-                            'here.',
-                            10,
-                            enemy_stat["HP Range"]["Boss"],
-                            enemy_stat["Basic Attack"]["Boss"],
-                            enemy_stat["Skill Damage"]["Boss"],
-                            'Cuddle Crush')
-        enemies = [boss]
-    elif character["Stat"]["Level"] == 3 and not boss_fight:
-        # High Level Mobs (Upper Level - Attic)
-        giant_moth = make_enemies('Giant Moth',
-                                  '🪰',
-                                  'Every time it flaps its wings, dust comes off.',
-                                  3,
-                                  enemy_stat["HP Range"]["Level 3"],
-                                  enemy_stat["Basic Attack"]["Level 3"],
-                                  enemy_stat["Skill Damage"]["Level 3"],
-                                  'Wing Flap')
-        ghost = make_enemies('Ghost',
-                             '👻',
-                             'A forgotten spirit, floating around silently.',
-                             4,
-                             enemy_stat["HP Range"]["Level 4"],
-                             enemy_stat["Basic Attack"]["Level 4"],
-                             enemy_stat["Skill Damage"]["Level 4"],
-                             'Chill Touch')
-        enemies = [giant_moth, ghost]
-    enemy = random.choice(enemies)
+    templates = encounter_templates(current_registry() if registry is None else registry,
+                                    character["Stat"]["Level"], boss_fight)
+    template = current_rng().choice(templates)
+    enemy = make_enemies(template["Name"], template["Icon"], template["Description"], template["Level"],
+                         template["HP Range"], template["Basic Attack"], template["Skill Damage"],
+                         template["Skill Name"])
     return enemy, enemy.copy()
 
 
@@ -426,19 +263,18 @@ def display_enemy_info(enemy: dict) -> None:
           "------------------------------------------------------\n")
 
 
-def battle(character: dict, boss_fight: bool = False) -> tuple[dict, bool]:
+async def battle(character: dict, boss_fight: bool = False) -> tuple[dict, bool]:
     """
     Drive the battle.
     """
-    enemy_stat = configure_enemy_stat()
-    enemy, enemy_copy = choose_enemy_based_on_level(character, enemy_stat, boss_fight)
+    enemy, enemy_copy = choose_enemy_based_on_level(character, boss_fight)
     display_enemy_info(enemy)
-    total_skill_use, skill_usage_limit, current_skill_usage = 5, 5, 0
+    total_skill_use, skill_usage_limit, current_skill_usage = SKILL_USAGE_LIMIT, SKILL_USAGE_LIMIT, 0
     in_battle, has_won = True, False
 
     while is_alive(character) and enemy_copy["HP"] > 0 and in_battle:
         while not has_won:
-            user_choice = input(
+            user_choice = (await ask(
                 "What is your next move?\n"
                 "--------------------------------------------------------\n"
                 " 1: 🗡️  Attack     - Attack with basic attack\n"
@@ -447,8 +283,8 @@ def battle(character: dict, boss_fight: bool = False) -> tuple[dict, bool]:
                 " 4: 📊  Stats      - View your current condition\n"
                 " 5: 🎒  Inventory  - Use an item from your inventory\n"
                 "--------------------------------------------------------\n"
-                "Enter the number of your choice: "
-            ).strip().lower()
+                "Enter the number of your choice: ", 'battle'
+            )).strip().lower()
             if user_choice == "1":
                 try:
                     display_attack_description(enemy['Name'])
@@ -467,7 +303,7 @@ def battle(character: dict, boss_fight: bool = False) -> tuple[dict, bool]:
                         print(f"In each battle, you are allowed a total of {total_skill_use} skill uses.")
                         display_skill_uses(current_skill_usage, skill_usage_limit)
                         display_skills(character)
-                        skill_choice = input("Choose skill you would like to use:").strip()
+                        skill_choice = (await ask("Choose skill you would like to use:", 'skill')).strip()
                         try:
                             display_attack_description(enemy['Name'])
                         except ValueError as error:
@@ -500,7 +336,7 @@ def battle(character: dict, boss_fight: bool = False) -> tuple[dict, bool]:
                 continue
             elif user_choice == "5":
                 display_inventory(character)
-                do_break = get_item_choice(character)
+                do_break = await get_item_choice(character)
                 if do_break:
                     break
             else:
@@ -508,8 +344,8 @@ def battle(character: dict, boss_fight: bool = False) -> tuple[dict, bool]:
                 continue
 
             if enemy_copy["HP"] > 0:
-                time.sleep(1.5)
-                enemy_skill = random.choice(list(enemy_copy['Attack'].items()))
+                await pause(1.5)
+                enemy_skill = current_rng().choice(list(enemy_copy['Attack'].items()))
                 character["Stat"]["Current HP"] -= enemy_skill[1]
                 print(f"😣 Ouch! {enemy["Name"]} fought back!")
                 print(f"{enemy["Name"]} used {enemy_skill[0]} on you!")
@@ -558,7 +394,7 @@ def main():
             'Kibble': 0
         }
     }
-    battle(character)
+    run_sync(battle(character))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,161 @@
+import numpy as np
+
+from minigames.battle import SKILL_USAGE_LIMIT, configure_enemy_stat
+
+POLICIES = ('basic attack', 'skills first')
+
+
+def tier_spec(enemy_stat: dict, tier: str) -> dict[str, tuple[int, int]]:
+    """
+    Describe the enemies of one tier by the ranges their stats are rolled from.
+
+    :param enemy_stat: a dictionary containing ranges of HP, basic attack, and skill damage for different enemy levels
+    :param tier: a string naming the enemy level, such as 'Level 1' or 'Boss'
+    :precondition: enemy_stat must be a dictionary like the one returned by configure_enemy_stat
+    :precondition: tier must be a key of each range dictionary in enemy_stat
+    :postcondition: collect the HP, basic attack, and skill damage ranges of the tier
+    :return: an enemy spec dictionary with "HP", "Basic Attack", and "Skill Damage" as keys and ranges as values
+
+    >>> tier_spec(configure_enemy_stat(), 'Boss')
+    {'HP': (500, 600), 'Basic Attack': (100, 250), 'Skill Damage': (130, 250)}
+    """
+    return {
+        "HP": enemy_stat["HP Range"][tier],
+        "Basic Attack": enemy_stat["Basic Attack"][tier],
+        "Skill Damage": enemy_stat["Skill Damage"][tier]
+    }
+
+
+def enemy_spec(enemy: dict) -> dict[str, tuple[int, int]]:
+    """
+    Describe an enemy that has already been rolled as an enemy spec.
+
+    :param enemy: a well-formed enemy dictionary
+    :precondition: enemy must be a dictionary like the one returned by make_enemies, with an "HP" key and an "Attack"
+    key holding its skill and its 'Basic Attack'
+    :postcondition: turn each stat of the enemy into a range holding only that value
+    :return: an enemy spec dictionary with "HP", "Basic Attack", and "Skill Damage" as keys and ranges as values
+
+    >>> enemy_spec({'Name': 'Mouse', 'HP': 90, 'Attack': {'Nibble': 13, 'Basic Attack': 8}})
+    {'HP': (90, 90), 'Basic Attack': (8, 8), 'Skill Damage': (13, 13)}
+    """
+    basic_attack = enemy['Attack']['Basic Attack']
+    skill_damage = next(damage for attack, damage in enemy['Attack'].items() if attack != 'Basic Attack')
+    return {
+        "HP": (enemy['HP'], enemy['HP']),
+        "Basic Attack": (basic_attack, basic_attack),
+        "Skill Damage": (skill_damage, skill_damage)
+    }
+
+
+def character_arrays(characters: list[dict]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Collect the stats a battle depends on from a list of characters.
+
+    :param characters: a list of well-formed character dictionaries
+    :precondition: each character must have 'Skill' with 'Basic Attack' and at least one skill in 'Current Skills',
+    and 'Stat' with 'Current HP'
+    :postcondition: take each character's basic attack, the damage of its strongest skill, and its current HP
+    :return: a tuple of three integer arrays holding basic attacks, skill damages, and current HPs
+
+    >>> character = {'Stat': {'Current HP': 250}, 'Skill': {'Basic Attack': 22, 'Current Skills': {
+    ...     'Bark': {'Damage': 24}, 'Bite': {'Damage': 57}}}}
+    >>> [array.tolist() for array in character_arrays([character])]
+    [[22], [57], [250]]
+    """
+    basic_attack = np.array([character['Skill']['Basic Attack'] for character in characters], dtype=np.int64)
+    skill_damage = np.array([max(skill['Damage'] for skill in character['Skill']['Current Skills'].values())
+                             for character in characters], dtype=np.int64)
+    current_hp = np.array([character['Stat']['Current HP'] for character in characters], dtype=np.int64)
+    return basic_attack, skill_damage, current_hp
+
+
+def simulate_battles(basic_attack, skill_damage, current_hp, spec: dict, policy: str = 'skills first',
+                     seed: int | None = None, max_turns: int = 1000) -> dict:
+    """
+    Fight many battles at once, one turn of every battle at a time.
+
+    Each battle follows the rules of battle(): the player strikes first, and every enemy that survives a strike hits
+    back with its skill or its basic attack, chosen with equal chances. A new enemy is rolled from the spec for every
+    battle. The player never flees nor uses items, and either always uses its basic attack ('basic attack') or uses
+    its skill until the skill usage limit is reached ('skills first').
+
+    :param basic_attack: an integer or an array of integers holding the player's basic attack damage
+    :param skill_damage: an integer or an array of integers holding the player's skill damage
+    :param current_hp: an integer or an array of integers holding the player's HP at the start of the battle
+    :param spec: an enemy spec dictionary with "HP", "Basic Attack", and "Skill Damage" ranges
+    :param policy: a string, either 'basic attack' or 'skills first'
+    :param seed: an integer seeding the random numbers, or None for fresh randomness
+    :param max_turns: the maximum number of player turns in a battle
+    :precondition: basic_attack, skill_damage, and current_hp must broadcast to one shape
+    :precondition: current_hp must hold positive integers
+    :precondition: spec must be a dictionary like the ones returned by tier_spec or enemy_spec
+    :postcondition: fight one battle for each element of the broadcast arrays
+    :postcondition: stop a battle that lasts for max_turns turns, and count it as not won
+    :return: a dictionary with "Won", "Turns", and "HP Remaining" arrays, one element per battle, and the share of
+    battles won as "Win Probability"
+    :raises ValueError: if policy is neither 'basic attack' nor 'skills first'
+
+    >>> results = simulate_battles(30, 25, 250, tier_spec(configure_enemy_stat(), 'Level 1'), seed=1)
+    >>> float(results['Win Probability'])
+    1.0
+    >>> results = simulate_battles([10, 30], 25, 250, enemy_spec({'HP': 90, 'Attack': {'Nibble': 10,
+    ...     'Basic Attack': 10}}), policy='basic attack')
+    >>> results['Turns'].tolist(), results['HP Remaining'].tolist()
+    ([9, 3], [170, 230])
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy '{policy}'. Choose one of {', '.join(POLICIES)}.")
+    rng = np.random.default_rng(seed)
+    basic_attack, skill_damage, player_hp = (
+        array.ravel() for array in np.broadcast_arrays(*(np.asarray(stat, dtype=np.int64)
+                                                         for stat in (basic_attack, skill_damage, current_hp))))
+    player_hp = player_hp.copy()
+    count = player_hp.size
+    enemy_hp = rng.integers(*spec["HP"], size=count, endpoint=True)
+    enemy_basic_attack = rng.integers(*spec["Basic Attack"], size=count, endpoint=True)
+    enemy_skill_damage = rng.integers(*spec["Skill Damage"], size=count, endpoint=True)
+    won = np.zeros(count, dtype=bool)
+    turns = np.zeros(count, dtype=np.int64)
+
+    fighting = np.arange(count)
+    for turn in range(1, max_turns + 1):
+        if fighting.size == 0:
+            break
+        uses_skill = policy == 'skills first' and turn <= SKILL_USAGE_LIMIT
+        enemy_hp[fighting] -= (skill_damage if uses_skill else basic_attack)[fighting]
+        turns[fighting] = turn
+        defeated = enemy_hp[fighting] <= 0
+        won[fighting[defeated]] = True
+        fighting = fighting[~defeated]
+
+        uses_enemy_skill = rng.integers(0, 2, size=fighting.size, dtype=bool)
+        player_hp[fighting] -= np.where(uses_enemy_skill, enemy_skill_damage[fighting], enemy_basic_attack[fighting])
+        fighting = fighting[player_hp[fighting] > 0]
+
+    return {
+        "Won": won,
+        "Turns": turns,
+        "HP Remaining": np.maximum(player_hp, 0),
+        "Win Probability": won.mean()
+    }
+
+
+def main():
+    """
+    Drive the program.
+    """
+    enemy_stat = configure_enemy_stat()
+    fights = 1_000_000
+    rng = np.random.default_rng(1510)
+    basic_attack = rng.integers(10, 30, size=fights, endpoint=True)
+    skill_damage = rng.integers(20, 30, size=fights, endpoint=True)
+    for tier in enemy_stat["HP Range"]:
+        for policy in POLICIES:
+            results = simulate_battles(basic_attack, skill_damage, 250, tier_spec(enemy_stat, tier), policy, seed=1)
+            print(f"New character vs {tier:<8} ({policy:<12}): win {results['Win Probability']:6.1%}, "
+                  f"{results['Turns'].mean():5.1f} turns, {results['HP Remaining'].mean():6.1f} HP left")
+
+
+if __name__ == '__main__':
+    main()
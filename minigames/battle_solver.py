@@ -0,0 +1,173 @@
+from collections import Counter
+from functools import lru_cache
+
+from minigames.battle import SKILL_USAGE_LIMIT, configure_enemy_stat
+
+POLICIES = ('basic attack', 'skills first')
+
+
+def turns_to_defeat(enemy_hp: int, basic_attack: int, skill_damage: int, policy: str) -> int:
+    """
+    Count the player turns needed to bring an enemy's HP down to zero.
+
+    :param enemy_hp: a positive integer representing the enemy's HP
+    :param basic_attack: a positive integer representing the player's basic attack damage
+    :param skill_damage: a non-negative integer representing the player's skill damage
+    :param policy: a string, either 'basic attack' or 'skills first'
+    :precondition: enemy_hp and basic_attack must be positive integers
+    :postcondition: use the skill for the first turns, up to the skill usage limit, if policy is 'skills first'
+    :return: the number of player turns as a positive integer
+
+    >>> turns_to_defeat(90, 30, 25, 'basic attack')
+    3
+    >>> turns_to_defeat(90, 30, 25, 'skills first')
+    4
+    >>> turns_to_defeat(300, 10, 50, 'skills first')
+    10
+    """
+    if policy == 'skills first':
+        skill_total = skill_damage * SKILL_USAGE_LIMIT
+        if enemy_hp <= skill_total:
+            return -(-enemy_hp // skill_damage)
+        return SKILL_USAGE_LIMIT + -(-(enemy_hp - skill_total) // basic_attack)
+    return -(-enemy_hp // basic_attack)
+
+
+def fight_outcomes(current_hp: int, enemy_basic_attack: int, enemy_skill_damage: int, flee_below: int,
+                   turns: int) -> list[tuple[float, float, float]]:
+    """
+    Follow the player's HP through the enemy's counterattacks, turn by turn.
+
+    Every enemy counterattack is the enemy's skill or its basic attack with equal chances, so the distribution of the
+    player's HP after each counterattack is the previous distribution convolved with those two damages. Players whose
+    HP drops to zero or less are dead, and those whose HP is at or below flee_below at the start of a turn flee.
+
+    :param current_hp: a positive integer representing the player's HP when the battle starts
+    :param enemy_basic_attack: a non-negative integer representing the enemy's basic attack damage
+    :param enemy_skill_damage: a non-negative integer representing the enemy's skill damage
+    :param flee_below: an integer; the player flees when its HP is at or below this value
+    :param turns: the number of player turns to follow
+    :precondition: turns must be a positive integer
+    :postcondition: compute the outcome of the battle for every number of turns the enemy could survive
+    :return: a list whose element k - 1 holds the chances to (win, flee, die) if the player needs k turns to defeat
+    the enemy
+
+    >>> fight_outcomes(100, 60, 60, 0, 2)
+    [(1.0, 0.0, 0.0), (1.0, 0.0, 0.0)]
+    >>> fight_outcomes(100, 60, 30, 0, 3)
+    [(1.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.75, 0.0, 0.25)]
+    >>> fight_outcomes(100, 60, 30, 50, 3)
+    [(1.0, 0.0, 0.0), (0.5, 0.5, 0.0), (0.0, 1.0, 0.0)]
+    """
+    alive = {current_hp: 1.0}
+    fled = died = 0.0
+    outcomes = []
+    for _ in range(turns):
+        for hp in [hp for hp in alive if hp <= flee_below]:
+            fled += alive.pop(hp)
+        outcomes.append((sum(alive.values(), 0.0), fled, died))
+        after_counterattack = Counter()
+        for hp, chance in alive.items():
+            for damage in (enemy_basic_attack, enemy_skill_damage):
+                if hp - damage <= 0:
+                    died += chance / 2
+                else:
+                    after_counterattack[hp - damage] += chance / 2
+        alive = after_counterattack
+    return outcomes
+
+
+@lru_cache(maxsize=4096)
+def solve_battle(basic_attack: int, skill_damage: int, current_hp: int, hp_range: tuple[int, int],
+                 attack_range: tuple[int, int], skill_range: tuple[int, int], policy: str = 'skills first',
+                 flee_below: int = 0) -> tuple[float, float, float]:
+    """
+    Compute the exact chances to win, flee, and die in a battle against a randomly rolled enemy.
+
+    The enemy's HP, basic attack, and skill damage are each rolled uniformly from their ranges, as make_enemies does.
+    Enemy HPs only matter through the number of turns the player needs to defeat them, and the counterattacks only
+    through the pair of enemy damages, so each pair is solved once for every number of turns and weighted by its
+    chance. Results are cached, so asking again for the same battle is a dictionary lookup.
+
+    :param basic_attack: a positive integer representing the player's basic attack damage
+    :param skill_damage: a non-negative integer representing the damage of the skill the player uses
+    :param current_hp: a positive integer representing the player's HP when the battle starts
+    :param hp_range: a tuple representing the minimum and maximum HP of the enemy
+    :param attack_range: a tuple representing the minimum and maximum basic attack damage of the enemy
+    :param skill_range: a tuple representing the minimum and maximum skill damage of the enemy
+    :param policy: a string, either 'basic attack' or 'skills first'
+    :param flee_below: an integer; the player flees when its HP is at or below this value at the start of its turn
+    :precondition: every range must hold non-negative integers with the minimum first
+    :postcondition: compute the chances without sampling any battle
+    :return: a tuple of the chances to win, flee, and die, which add up to one
+    :raises ValueError: if policy is neither 'basic attack' nor 'skills first'
+
+    >>> [round(chance, 4) for chance in solve_battle(30, 25, 250, (80, 100), (5, 10), (10, 25))]
+    [1.0, 0.0, 0.0]
+    >>> [round(chance, 4) for chance in solve_battle(20, 25, 250, (101, 200), (15, 30), (26, 45), 'basic attack')]
+    [0.801, 0.0, 0.199]
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy '{policy}'. Choose one of {', '.join(POLICIES)}.")
+    turns_chances = Counter(turns_to_defeat(enemy_hp, basic_attack, skill_damage, policy)
+                            for enemy_hp in range(hp_range[0], hp_range[1] + 1))
+    hp_count = hp_range[1] - hp_range[0] + 1
+    most_turns = max(turns_chances)
+    damage_pairs = Counter()
+    for enemy_basic_attack in range(attack_range[0], attack_range[1] + 1):
+        for enemy_skill_damage in range(skill_range[0], skill_range[1] + 1):
+            damage_pairs[tuple(sorted((enemy_basic_attack, enemy_skill_damage)))] += 1
+    pair_count = (attack_range[1] - attack_range[0] + 1) * (skill_range[1] - skill_range[0] + 1)
+
+    win = flee = death = 0.0
+    for (lower_damage, higher_damage), pairs in damage_pairs.items():
+        outcomes = fight_outcomes(current_hp, lower_damage, higher_damage, flee_below, most_turns)
+        for turns, enemies in turns_chances.items():
+            win += outcomes[turns - 1][0] * pairs * enemies
+            flee += outcomes[turns - 1][1] * pairs * enemies
+            death += outcomes[turns - 1][2] * pairs * enemies
+    enemy_count = pair_count * hp_count
+    return win / enemy_count, flee / enemy_count, death / enemy_count
+
+
+def battle_odds(character: dict, tier: str, policy: str = 'skills first', flee_below: int = 0) -> dict[str, float]:
+    """
+    Look up the chances of a character to win, flee, and die against an enemy tier.
+
+    :param character: a well-formed character dictionary
+    :param tier: a string naming the enemy level, such as 'Level 1' or 'Boss'
+    :param policy: a string, either 'basic attack' or 'skills first'
+    :param flee_below: an integer; the character flees when its HP is at or below this value at the start of its turn
+    :precondition: character must have 'Skill' with 'Basic Attack' and at least one skill in 'Current Skills', and
+    'Stat' with 'Current HP'
+    :precondition: tier must be one of the enemy levels of configure_enemy_stat
+    :postcondition: assume the character uses its strongest skill when it uses a skill
+    :return: a dictionary with "Win", "Flee", and "Death" as keys and chances as values
+
+    >>> character = {'Stat': {'Current HP': 250}, 'Skill': {'Basic Attack': 30, 'Current Skills': {
+    ...     'Bark': {'Damage': 25}}}}
+    >>> {outcome: round(chance, 4) for outcome, chance in battle_odds(character, 'Level 1').items()}
+    {'Win': 1.0, 'Flee': 0.0, 'Death': 0.0}
+    """
+    enemy_stat = configure_enemy_stat()
+    skill_damage = max(skill['Damage'] for skill in character['Skill']['Current Skills'].values())
+    win, flee, death = solve_battle(character['Skill']['Basic Attack'], skill_damage, character['Stat']['Current HP'],
+                                    enemy_stat["HP Range"][tier], enemy_stat["Basic Attack"][tier],
+                                    enemy_stat["Skill Damage"][tier], policy, flee_below)
+    return {"Win": win, "Flee": flee, "Death": death}
+
+
+def main():
+    """
+    Drive the program.
+    """
+    character = {'Stat': {'Current HP': 250}, 'Skill': {'Basic Attack': 20, 'Current Skills': {
+        'Bark': {'Damage': 25}}}}
+    for tier in configure_enemy_stat()["HP Range"]:
+        odds = battle_odds(character, tier, flee_below=50)
+        print(f"New character vs {tier:<8}: win {odds['Win']:6.1%}, flee {odds['Flee']:6.1%}, "
+              f"die {odds['Death']:6.1%}")
+
+
+if __name__ == '__main__':
+    main()
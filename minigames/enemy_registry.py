@@ -0,0 +1,83 @@
+from content import load_content
+
+_registry_cache = {}
+
+
+def make_enemy_registry(templates, enemy_stat: dict) -> dict[tuple[int, bool], tuple[dict, ...]]:
+    """
+    Index enemy templates by the character level and kind of fight they appear in.
+
+    Each template is given the stat ranges of its tier once, here, so that an encounter only has to pick a template
+    and roll its stats.
+
+    :param templates: an iterable of template dictionaries with "Name", "Icon", "Description", "Level", "Tier",
+    "Skill Name", "Character Level", and "Boss" as keys, such as the "Enemies" of the content pack
+    :param enemy_stat: a dictionary containing ranges of HP, basic attack, and skill damage for different enemy
+    levels, like the one returned by minigames.battle.configure_enemy_stat
+    :precondition: the "Tier" of every template must be a key of each range dictionary in enemy_stat
+    :postcondition: leave templates unchanged
+    :return: a dictionary mapping (character level, boss fight) pairs to tuples of templates that also have
+    "HP Range", "Basic Attack", and "Skill Damage" as keys
+
+    >>> enemy_stat = {'HP Range': {'Level 1': (80, 100), 'Level 2': (101, 200)},
+    ...               'Basic Attack': {'Level 1': (5, 10), 'Level 2': (15, 30)},
+    ...               'Skill Damage': {'Level 1': (10, 25), 'Level 2': (26, 45)}}
+    >>> registry = make_enemy_registry(load_content()["Enemies"][:2], enemy_stat)
+    >>> [(template['Name'], template['HP Range']) for template in registry[(1, False)]]
+    [('Mouse', (80, 100)), ('Spider', (101, 200))]
+    """
+    registry = {}
+    for template in templates:
+        tier = template["Tier"]
+        entry = template | {
+            "HP Range": enemy_stat["HP Range"][tier],
+            "Basic Attack": enemy_stat["Basic Attack"][tier],
+            "Skill Damage": enemy_stat["Skill Damage"][tier]
+        }
+        registry.setdefault((template["Character Level"], template["Boss"]), []).append(entry)
+    return {key: tuple(entries) for key, entries in registry.items()}
+
+
+def encounter_templates(registry: dict, level: int, boss_fight: bool) -> tuple[dict, ...]:
+    """
+    Find the enemy templates a character may meet.
+
+    A boss fight at a level that has no boss is fought against the usual enemies of the level.
+
+    :param registry: a dictionary created by make_enemy_registry
+    :param level: a positive integer character level
+    :param boss_fight: a boolean
+    :return: a tuple of templates, empty if no enemy appears at the level
+
+    >>> registry = {(1, False): ('Mouse',), (3, False): ('Ghost',), (3, True): ('Majestic Fluffy BunBun',)}
+    >>> encounter_templates(registry, 3, True), encounter_templates(registry, 1, True)
+    (('Majestic Fluffy BunBun',), ('Mouse',))
+    >>> encounter_templates(registry, 4, False)
+    ()
+    """
+    if boss_fight and (level, True) in registry:
+        return registry[(level, True)]
+    return registry.get((level, False), ())
+
+
+def current_registry() -> dict[tuple[int, bool], tuple[dict, ...]]:
+    """
+    Get the enemy registry of the content pack as it is loaded now.
+
+    The registry is built the first time it is asked for and again only after content.reload_content has loaded a
+    changed pack, so the enemies always match the pack the rest of the game reads.
+
+    :postcondition: build the registry at most once for each loaded pack
+    :return: a dictionary created by make_enemy_registry from the "Enemies" and "Enemy Stats" of the content pack
+
+    >>> current_registry() is current_registry()
+    True
+    >>> [template['Name'] for template in current_registry()[(3, True)]]
+    ['Majestic Fluffy BunBun']
+    """
+    content = load_content()
+    loaded = _registry_cache.get('Loaded')
+    if loaded is None or loaded[0] is not content:
+        loaded = (content, make_enemy_registry(content["Enemies"], content["Enemy Stats"]))
+        _registry_cache['Loaded'] = loaded
+    return loaded[1]
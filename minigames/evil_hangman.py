@@ -0,0 +1,203 @@
+from functools import lru_cache
+
+import numpy as np
+
+from rng import current_rng
+
+from minigames.hangman import HIDDEN, play_hangman_round
+from minigames.hangman_art import LIVES
+from minigames.hangman_dictionary import letter_bit
+
+SMALL_PATTERNS = 16
+
+
+def pack_words(words: list[str]) -> np.ndarray:
+    """
+    Pack words of one length into an array of letter codes, one row for each position.
+
+    Every position is a contiguous row, so a letter can be compared against all the words at once, one row at a time.
+
+    :param words: a non-empty list of distinct strings of lowercase letters, all of the same length
+    :return: an array of unsigned bytes with one row for each position and one column for each word
+
+    >>> pack_words(['book', 'cook'])[0]
+    array([98, 99], dtype=uint8)
+    """
+    length = len(words[0])
+    codes = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8).reshape(len(words), length)
+    return np.ascontiguousarray(codes.T)
+
+
+def unpack_word(candidates: np.ndarray, number: int = 0) -> str:
+    """
+    Read a word back out of packed words.
+
+    :param candidates: an array made by pack_words
+    :param number: the column of the word, from 0 up to but not including the number of words
+    :return: the word as a string
+
+    >>> unpack_word(pack_words(['book', 'cook']), 1)
+    'cook'
+    """
+    return candidates[:, number].tobytes().decode('ascii')
+
+
+def key_type(length: int) -> type:
+    """
+    Pick the smallest unsigned integer type with a bit for every position of a word.
+
+    :param length: a positive integer number of letters, at most 64
+    :return: a numpy unsigned integer type
+
+    >>> key_type(6).__name__, key_type(12).__name__, key_type(40).__name__
+    ('uint8', 'uint16', 'uint64')
+    """
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if length <= np.iinfo(dtype).bits:
+            return dtype
+    return np.uint64
+
+
+@lru_cache(maxsize=64)
+def position_weights(length: int) -> np.ndarray:
+    """
+    Give each position of a word its bit in a pattern key.
+
+    The weights of a length are made once and shared by every round, so they must not be changed.
+
+    :param length: a positive integer number of letters, at most 64
+    :return: a column of powers of two, from 1 for the first position up, of the type picked by key_type
+
+    >>> position_weights(4).ravel()
+    array([1, 2, 4, 8], dtype=uint8)
+    """
+    return (np.uint64(1) << np.arange(length, dtype=np.uint64)).astype(key_type(length))[:, np.newaxis]
+
+
+def pattern_keys(candidates: np.ndarray, guess: str) -> np.ndarray:
+    """
+    Key every packed word by where a letter appears in it.
+
+    The letter is compared with every position of every word at once, and each word's hits are summed with the weight
+    of their position, so making the keys costs a few passes over the packed words and no loop in Python.
+
+    :param candidates: an array made by pack_words, for words of at most 64 letters
+    :param guess: a one-letter string
+    :return: an array of unsigned integers with one key for each word, whose bit i is set if the word has the letter
+    at position i
+
+    >>> pattern_keys(pack_words(['book', 'cook', 'tree']), 'o')
+    array([6, 6, 0], dtype=uint8)
+    """
+    length = candidates.shape[0]
+    hits = candidates == ord(guess)
+    return (hits * position_weights(length)).sum(axis=0, dtype=key_type(length))
+
+
+def largest_family(keys: np.ndarray, length: int) -> int:
+    """
+    Find the pattern shared by the most words.
+
+    Ties go to the pattern with the smallest key, so that a pattern revealing nothing wins every tie it is part of.
+
+    :param keys: a non-empty array made by pattern_keys
+    :param length: the number of letters in each word
+    :return: the key of the pattern as a non-negative integer
+
+    >>> largest_family(pattern_keys(pack_words(['book', 'cook', 'tree']), 'o'), 4)
+    6
+    >>> largest_family(pattern_keys(pack_words(['book', 'tree']), 'o'), 4)
+    0
+    """
+    if length <= SMALL_PATTERNS:
+        return int(np.bincount(keys, minlength=1 << length).argmax())
+    patterns, counts = np.unique(keys, return_counts=True)
+    return int(patterns[counts.argmax()])
+
+
+def make_evil_round(words: list[str]) -> dict:
+    """
+    Start a round of hangman whose word is not chosen until the guesses leave only one word possible.
+
+    :param words: a non-empty list of strings of lowercase letters, all of the same length and of at most 64 letters
+    :postcondition: pack the distinct words once, so that no guess has to look at the list again
+    :return: a round dictionary with "Word", "Candidates", "Display", "Hidden", "Lives", "Guessed", "Other Guesses",
+    and "Incorrect" as keys, like the ones created by minigames.hangman.make_hangman_round, except that "Hidden"
+    counts the blanks still hidden and "Word" is one of the words still possible
+
+    >>> evil_round = make_evil_round(['book', 'cook', 'book'])
+    >>> evil_round['Candidates'].shape, evil_round['Display'], evil_round['Hidden']
+    ((4, 2), ['_', '_', '_', '_'], 4)
+    """
+    candidates = pack_words(list(dict.fromkeys(words)))
+    return {
+        "Word": unpack_word(candidates),
+        "Candidates": candidates,
+        "Display": [HIDDEN] * candidates.shape[0],
+        "Hidden": candidates.shape[0],
+        "Lives": LIVES,
+        "Guessed": 0,
+        "Other Guesses": set(),
+        "Incorrect": []
+    }
+
+
+def guess_evil_letter(evil_round: dict, guess: str) -> str:
+    """
+    Check a guess against every word still possible, and keep the largest family of words the guess leaves possible.
+
+    The guess splits the words still possible by where the letter appears in them, with one pass over each position
+    of the packed words, and the largest part is kept. Guesses are remembered exactly as in
+    minigames.hangman.guess_letter.
+
+    :param evil_round: a round dictionary created by make_evil_round
+    :param guess: a string
+    :postcondition: keep only the words of the largest family, or of the family without the letter on a tie
+    :postcondition: reveal the guessed letter wherever it is in the words kept, if it is there and was not guessed
+    before
+    :postcondition: take a life if the guess is new and the words kept do not have it
+    :postcondition: leave the round unchanged if the guess was already made
+    :return: 'repeat' if the guess was already made, 'correct' if the words kept have it, or 'incorrect' otherwise
+
+    >>> evil_round = make_evil_round(['book', 'cook', 'cool', 'tree'])
+    >>> guess_evil_letter(evil_round, 'o'), guess_evil_letter(evil_round, 'o'), guess_evil_letter(evil_round, 'l')
+    ('correct', 'repeat', 'incorrect')
+    >>> ' '.join(evil_round['Display']), evil_round['Lives'], evil_round['Word']
+    ('_ o o _', 7, 'book')
+    """
+    bit = letter_bit(guess)
+    if bit:
+        if evil_round["Guessed"] & bit:
+            return 'repeat'
+        evil_round["Guessed"] |= bit
+    elif guess == HIDDEN or guess in evil_round["Other Guesses"]:
+        return 'repeat'
+    else:
+        evil_round["Other Guesses"].add(guess)
+        evil_round["Lives"] -= 1
+        return 'incorrect'
+    candidates = evil_round["Candidates"]
+    keys = pattern_keys(candidates, guess)
+    family = largest_family(keys, candidates.shape[0])
+    candidates = candidates.take(np.flatnonzero(keys == family), axis=1)
+    evil_round["Candidates"], evil_round["Word"] = candidates, unpack_word(candidates)
+    if not family:
+        evil_round["Lives"] -= 1
+        return 'incorrect'
+    for position in range(candidates.shape[0]):
+        if family >> position & 1:
+            evil_round["Display"][position] = guess
+            evil_round["Hidden"] -= 1
+    return 'correct'
+
+
+async def evil_hangman(word_list: list[str], character: dict) -> tuple[bool, dict]:
+    """
+    Drive the hangman game without settling on a word, so that every guess meets the largest family of words left.
+
+    The length of the word is that of a random word of the list, and every word of that length stays possible until
+    the guesses rule it out.
+    """
+    length = len(current_rng().choice(word_list))
+    evil_round = make_evil_round([word for word in word_list if len(word) == length])
+    return await play_hangman_round(evil_round, character, guess_evil_letter)
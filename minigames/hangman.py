@@ -1,45 +1,59 @@
-import random
+from functools import lru_cache
 
+from rng import current_rng
+
+from console import ask
+from content import load_content
 from helpers import lose_heart
-from minigames.hangman_art import stage
+from minigames.hangman_art import LIVES, STAGES
+from minigames.hangman_dictionary import DICTIONARY_PATH, letter_bit, level_words, make_dictionary
+from minigames.hangman_solver import calibrate_levels, solve_words
 import warnings
 warnings.filterwarnings("ignore")
 
+HIDDEN = '_'
+
 
 def lists_of_words() -> tuple[list[str], list[str], list[str]]:
     """
     Generate three lists of words categorized by their lengths.
 
+    The words come from the "Hangman Words" of the content pack, and every call returns new lists.
+
     :postconditions: return three lists based on the number of words
     :return: three lists of words
     """
-    word_4_list = [
-        "book", "tree", "blue", "love", "care", "hope", "door", "jump",
-        "play", "work", "fish", "swim", "ball", "hand", "cake", "sing",
-        "walk", "rain", "star", "wind", "read", "rock", "band", "ship",
-        "moon", "face", "line", "ride", "time", "life"
-    ]
-    word_5_list = [
-        "apple", "grape", "pearl", "chair", "table", "drink", "watch", "plant",
-        "beach", "smile", "light", "stone", "bread", "glass", "truck", "train",
-        "shoes", "knife", "piano", "candy", "house", "cloud", "music", "paint",
-        "dream", "flame", "brain", "spark", "bloom", "sweet"
-    ]
-    word_6_list = [
-        "garden", "silver", "branch", "butter", "turtle", "bridge", "rabbit", "pebble",
-        "button", "stream", "travel", "bottle", "winter", "flower", "basket", "orange",
-        "desert", "magnet", "planet", "frozen", "safety", "forest", "guitar", "friend",
-        "yellow", "ticket", "pencil", "bridge", "jungle", "school"
-    ]
+    word_4_list, word_5_list, word_6_list = (list(words) for words in load_content()["Hangman Words"])
     return word_4_list, word_5_list, word_6_list
 
 
-def check_character_level_hangman(character: dict, lists: list = lists_of_words()) -> list:
+def calibrate_words(words: list[str]) -> dict[int, list[str]]:
+    """
+    Share hangman words out between the three levels by how hard they are to guess.
+
+    :param words: a list of distinct strings of lowercase letters
+    :postcondition: play every word with the entropy solver of minigames.hangman_solver
+    :return: a dictionary mapping levels 1 to 3 to lists of words, from the easiest to the hardest
+
+    >>> calibrate_words(['book', 'cook', 'cool'])
+    {1: ['cook'], 2: ['book'], 3: ['cool']}
+    """
+    return calibrate_levels(words, solve_words(words))
+
+
+HANGMAN_DICTIONARY = make_dictionary(DICTIONARY_PATH, lists_of_words, calibrate_words)
+
+
+def check_character_level_hangman(character: dict, lists: list | None = None) -> list:
     """
     Determine the appropriate word list based on the character's level.
 
+    Without word lists, the words come from HANGMAN_DICTIONARY, which reads DICTIONARY_PATH the first time a word is
+    needed, or uses the words of lists_of_words if there is no such file, and gives each level the words the entropy
+    solver found easiest for the first level and hardest for the last.
+
     :param character: a dictionary including character stats including level
-    :param lists: a list of word lists
+    :param lists: a list of word lists, or None to use HANGMAN_DICTIONARY
     :precondition: character must be a dictionary with a 'Stat' key that contains a 'Level' key
     :postcondition: return a list of words appropriate for the character's level
     :return: A list of words
@@ -47,11 +61,13 @@ def check_character_level_hangman(character: dict, lists: list = lists_of_words(
     >>> character1 = {'Stat': {'Level': 1}}
     >>> words = lists_of_words()
     >>> check_character_level_hangman(character1, words)
-    ['garden', 'silver', 'branch', 'butter', 'turtle', 'bridge', 'rabbit', 'pebble', 'button', 'stream', 'travel', 'bottle', 'winter', 'flower', 'basket', 'orange', 'desert', 'magnet', 'planet', 'frozen', 'safety', 'forest', 'guitar', 'friend', 'yellow', 'ticket', 'pencil', 'bridge', 'jungle', 'school']
+    ['garden', 'silver', 'branch', 'butter', 'turtle', 'bridge', 'rabbit', 'pebble', 'button', 'stream', 'travel', 'bottle', 'winter', 'flower', 'basket', 'orange', 'desert', 'magnet', 'planet', 'frozen', 'safety', 'forest', 'guitar', 'friend', 'yellow', 'ticket', 'pencil', 'jungle', 'school']
     >>> character2 = {'Stat': {'Level': 3}}
     >>> check_character_level_hangman(character2, words)
     ['book', 'tree', 'blue', 'love', 'care', 'hope', 'door', 'jump', 'play', 'work', 'fish', 'swim', 'ball', 'hand', 'cake', 'sing', 'walk', 'rain', 'star', 'wind', 'read', 'rock', 'band', 'ship', 'moon', 'face', 'line', 'ride', 'time', 'life']
     """
+    if lists is None:
+        return level_words(HANGMAN_DICTIONARY, min(character['Stat']['Level'], 3))
     if character['Stat']['Level'] == 1:
         return lists[2]
     if character['Stat']['Level'] == 2:
@@ -99,44 +115,131 @@ def handle_incorrect_guess(guess: str, incorrect_guesses, remaining_lives: int)
     print("Incorrect answers: " + word_strike(incorrect_guesses))
 
 
-def hangman(word_list: list[str], character: dict) -> tuple[bool, dict]:
+@lru_cache(maxsize=4096)
+def letter_positions(word: str) -> dict[str, tuple[int, ...]]:
     """
-    Drive the hangman game.
+    Map each letter of a word to the positions it appears at.
+
+    The map of a word is built once and shared by every game that draws the word, so it must not be changed.
+
+    :param word: a non-empty string
+    :return: a dictionary mapping each distinct character of word to a tuple of its positions
+
+    >>> letter_positions('bridge')['b'], letter_positions('pebble')['b']
+    ((0,), (2, 3))
+    """
+    positions = {}
+    for position, letter in enumerate(word):
+        positions.setdefault(letter, []).append(position)
+    return {letter: tuple(places) for letter, places in positions.items()}
+
+
+def make_hangman_round(word: str) -> dict:
+    """
+    Start a round of hangman for a word.
+
+    :param word: a non-empty string to be guessed
+    :postcondition: hide every letter of the word
+    :return: a round dictionary with "Word", "Positions", "Display", "Hidden", "Lives", "Guessed", "Other Guesses", and
+    "Incorrect" as keys, where "Hidden" counts the distinct letters still hidden and "Guessed" is a 26-bit mask of
+    the letters guessed so far
+
+    >>> hangman_round = make_hangman_round('pebble')
+    >>> hangman_round['Display'], hangman_round['Hidden'], hangman_round['Lives'], hangman_round['Guessed']
+    (['_', '_', '_', '_', '_', '_'], 4, 8, 0)
+    """
+    positions = letter_positions(word)
+    return {
+        "Word": word,
+        "Positions": positions,
+        "Display": [HIDDEN] * len(word),
+        "Hidden": len(positions),
+        "Lives": LIVES,
+        "Guessed": 0,
+        "Other Guesses": set(),
+        "Incorrect": []
+    }
+
+
+def guess_letter(hangman_round: dict, guess: str) -> str:
+    """
+    Check a guess against the word of a round in constant time.
+
+    A guess of one letter from a to z is looked up in the round's mask of guessed letters and in the word's letter
+    positions. Any other guess is remembered by itself, and the blank shown for hidden letters counts as already
+    guessed, as it always has.
+
+    :param hangman_round: a round dictionary created by make_hangman_round
+    :param guess: a string
+    :postcondition: reveal the guessed letter wherever it is in the word, if it is there and was not guessed before
+    :postcondition: take a life if the guess is new and not in the word
+    :postcondition: leave the round unchanged if the guess was already made
+    :return: 'repeat' if the guess was already made, 'correct' if it is in the word, or 'incorrect' otherwise
+
+    >>> hangman_round = make_hangman_round('pebble')
+    >>> guess_letter(hangman_round, 'b'), guess_letter(hangman_round, 'b'), guess_letter(hangman_round, 'z')
+    ('correct', 'repeat', 'incorrect')
+    >>> ' '.join(hangman_round['Display']), hangman_round['Lives']
+    ('_ _ b b _ _', 7)
     """
-    chosen_word = random.choice(word_list)
-    word_length = len(chosen_word)
-    lives = 8
-    display = []
-    [display.append("_") for _ in range(word_length)]
-    print("Current lives: %d" % lives)
-    empty_incorrect = []
+    bit = letter_bit(guess)
+    if bit:
+        if hangman_round["Guessed"] & bit:
+            return 'repeat'
+        hangman_round["Guessed"] |= bit
+    elif guess == HIDDEN or guess in hangman_round["Other Guesses"]:
+        return 'repeat'
+    else:
+        hangman_round["Other Guesses"].add(guess)
+    places = hangman_round["Positions"].get(guess)
+    if places is None:
+        hangman_round["Lives"] -= 1
+        return 'incorrect'
+    for position in places:
+        hangman_round["Display"][position] = guess
+    hangman_round["Hidden"] -= 1
+    return 'correct'
+
+
+async def play_hangman_round(hangman_round: dict, character: dict, check_guess=guess_letter) -> tuple[bool, dict]:
+    """
+    Play a round of hangman until the word is guessed or the lives run out.
+
+    :param hangman_round: a round dictionary, such as one created by make_hangman_round
+    :param character: a dictionary including character stats
+    :param check_guess: a function that takes the round and a guess, updates the round, and returns 'repeat',
+    'correct', or 'incorrect', such as guess_letter
+    :postcondition: take a heart from the character if the lives run out
+    :return: a tuple of whether the word was guessed and the character
+    """
+    print("Current lives: %d" % hangman_round["Lives"])
     end_of_game = False
     while not end_of_game:
-        guess = input("Guess a letter: ").strip().lower()
-        if guess in display or guess in empty_incorrect:
+        guess = (await ask("Guess a letter: ", 'guess')).strip().lower()
+        outcome = check_guess(hangman_round, guess)
+        if outcome == 'repeat':
             print(f"You've already guessed '{guess}'")
             continue
 
-        correct_guess = False
-        for position, letter in enumerate(chosen_word):
-            if letter == guess:
-                display[position] = letter
-                correct_guess = True
-
-        if not correct_guess:
-            lives -= 1
-            handle_incorrect_guess(guess, empty_incorrect, lives)
-            if lives == 0:
+        if outcome == 'incorrect':
+            handle_incorrect_guess(guess, hangman_round["Incorrect"], hangman_round["Lives"])
+            if hangman_round["Lives"] == 0:
                 print("You lose.")
-                print(f"The word was: '{chosen_word}'")
+                print(f"The word was: '{hangman_round['Word']}'")
                 lose_heart(character)
                 break
 
-        print(f"{' '.join(display)}")
+        print(f"{' '.join(hangman_round['Display'])}")
 
-        if "_" not in display:
+        if hangman_round["Hidden"] == 0:
             end_of_game = True
             print("You win!")
-        stages = stage()
-        print(stages[lives])
+        print(STAGES[hangman_round["Lives"]])
     return end_of_game, character
+
+
+async def hangman(word_list: list[str], character: dict) -> tuple[bool, dict]:
+    """
+    Drive the hangman game.
+    """
+    return await play_hangman_round(make_hangman_round(current_rng().choice(word_list)), character)
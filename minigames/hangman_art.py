@@ -94,3 +94,7 @@ def stage() -> list[str]:
 =========
 ''']
     return stages
+
+
+STAGES = tuple(stage())
+LIVES = len(STAGES) - 1
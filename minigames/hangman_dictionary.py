@@ -0,0 +1,237 @@
+import hashlib
+import marshal
+import os
+import tempfile
+import threading
+
+DICTIONARY_PATH = 'words.txt'
+LEVEL_LENGTHS = {1: (6, 8), 2: (5, 5), 3: (4, 4)}
+LEVELS_CACHE_SUFFIX = '.levels'
+LEVELS_CACHE_MAGIC = b'BKGL'
+LEVELS_CACHE_VERSION = 1
+
+
+def letter_bit(guess: str) -> int:
+    """
+    Find the bit that stands for a letter in a mask of letters.
+
+    :param guess: a string
+    :return: a power of two from 1 for 'a' up to 2 ** 25 for 'z', or 0 if guess is not one letter from a to z
+
+    >>> letter_bit('a'), letter_bit('c'), letter_bit('ab'), letter_bit('_')
+    (1, 4, 0, 0)
+    """
+    if len(guess) == 1 and 'a' <= guess <= 'z':
+        return 1 << (ord(guess) - 97)
+    return 0
+
+
+def clean_words(words) -> list[str]:
+    """
+    Keep one copy of every usable hangman word.
+
+    :param words: an iterable of strings
+    :postcondition: lowercase the words and strip the whitespace around them
+    :postcondition: drop words that are empty or hold anything but the letters a to z
+    :postcondition: keep only the first copy of a word that appears more than once
+    :return: the words as a list of strings, in the order they first appeared
+
+    >>> clean_words(['bridge', 'Garden ', 'bridge', "don't", '', 'BRIDGE'])
+    ['bridge', 'garden']
+    """
+    cleaned = (word.strip().lower() for word in words)
+    return list(dict.fromkeys(word for word in cleaned if word.isascii() and word.isalpha()))
+
+
+def read_words(path: str) -> list[str]:
+    """
+    Read a word list file with one word on each line.
+
+    :param path: a string naming the word list file
+    :precondition: the file must hold UTF-8 text
+    :return: the usable words of the file as a list of strings, each only once
+    :raises FileNotFoundError: if there is no file at path
+    """
+    with open(path, encoding='utf-8') as file:
+        return clean_words(file)
+
+
+def index_words(words: list[str]) -> dict:
+    """
+    Index words by their length and by the hangman level they suit.
+
+    :param words: a list of distinct strings of lowercase letters
+    :postcondition: walk through the words once
+    :return: an index dictionary with "Words", "By Length", and "Levels" as keys, where "By Length" and "Levels" map
+    lengths and levels to lists of words
+
+    >>> index = index_words(['bridge', 'silent', 'apple', 'book'])
+    >>> index['By Length'][6], index['Levels'][2], index['Levels'][3]
+    (['bridge', 'silent'], ['apple'], ['book'])
+    """
+    by_length = {}
+    for word in words:
+        by_length.setdefault(len(word), []).append(word)
+    levels = {level: [word for length in range(shortest, longest + 1) for word in by_length.get(length, [])]
+              for level, (shortest, longest) in LEVEL_LENGTHS.items()}
+    return {"Words": words, "By Length": by_length, "Levels": levels}
+
+
+def words_digest(words: list[str], calibrate) -> bytes:
+    """
+    Hash a list of words together with the calibrate function that shares them out between levels.
+
+    :param words: a list of strings of lowercase letters
+    :param calibrate: a function, as passed to make_dictionary
+    :return: the SHA-256 hash as bytes
+
+    >>> words_digest(['book'], len) == words_digest(['book'], len), words_digest(['book'], len) == words_digest([], len)
+    (True, False)
+    """
+    name = f"{calibrate.__module__}.{calibrate.__qualname__}\n"
+    return hashlib.sha256(name.encode('utf-8') + '\n'.join(words).encode('ascii')).digest()
+
+
+def read_levels(cache_path: str, digest: bytes) -> dict[int, list[str]] | None:
+    """
+    Read the calibrated levels of a word list from a cache file, if the file was made from the same words.
+
+    :param cache_path: a string naming a levels cache file
+    :param digest: the hash of the words, as made by words_digest
+    :return: a dictionary mapping levels to lists of words, or None if there is no usable cache for the words
+    """
+    header = LEVELS_CACHE_MAGIC + bytes((LEVELS_CACHE_VERSION, marshal.version)) + digest
+    try:
+        with open(cache_path, 'rb') as file:
+            data = file.read()
+    except OSError:
+        return None
+    if not data.startswith(header):
+        return None
+    try:
+        levels = marshal.loads(data[len(header):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return levels if isinstance(levels, dict) else None
+
+
+def write_levels(cache_path: str, digest: bytes, levels: dict[int, list[str]]) -> None:
+    """
+    Write the calibrated levels of a word list to a cache file, so that no later process calibrates the same words.
+
+    :param cache_path: a string naming a levels cache file
+    :param digest: the hash of the words, as made by words_digest
+    :param levels: a dictionary mapping levels to lists of words
+    :postcondition: replace the cache file in one step through a temporary file of its own, so that no reader sees
+    half of it, even when several processes or threads write it at once
+    :postcondition: leave things as they are if the cache file cannot be written, since the cache only saves time
+    """
+    try:
+        file = tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(os.path.abspath(cache_path)), suffix='.tmp',
+                                           delete=False)
+    except OSError:
+        return
+    try:
+        with file:
+            file.write(LEVELS_CACHE_MAGIC + bytes((LEVELS_CACHE_VERSION, marshal.version)) + digest +
+                       marshal.dumps(levels))
+        os.replace(file.name, cache_path)
+    except OSError:
+        try:
+            os.remove(file.name)
+        except OSError:
+            pass
+
+
+def calibrated_levels(dictionary: dict, words: list[str], cache_path: str | None) -> dict[int, list[str]]:
+    """
+    Share words out between levels with the calibrate function of a dictionary, reusing a cached result if there is
+    one for the same words.
+
+    :param dictionary: a dictionary created by make_dictionary with a calibrate function
+    :param words: the list of words of the dictionary
+    :param cache_path: a string naming the levels cache file, or None to calibrate without a cache
+    :postcondition: write the cache file if it is missing or was made from other words
+    :return: a dictionary mapping levels to lists of words
+    """
+    calibrate = dictionary["Calibrate"]
+    if cache_path is None:
+        return calibrate(words)
+    digest = words_digest(words, calibrate)
+    levels = read_levels(cache_path, digest)
+    if levels is None:
+        levels = calibrate(words)
+        write_levels(cache_path, digest, levels)
+    return levels
+
+
+def make_dictionary(path: str | None = None, fallback=None, calibrate=None) -> dict:
+    """
+    Create a hangman dictionary that reads its words the first time they are needed.
+
+    :param path: a string naming a word list file, or None to only use the fallback words
+    :param fallback: a function returning an iterable of word lists to use when path is None or names no file, or
+    None for no fallback words
+    :param calibrate: a function that takes the list of words and returns a dictionary mapping each level to its list
+    of words, or None to give each level the words of the lengths in LEVEL_LENGTHS; its result for the words of the
+    file at path is cached next to the file, in path + LEVELS_CACHE_SUFFIX
+    :postcondition: read nothing yet, so that a dictionary of any size costs nothing until a word is picked
+    :return: a hangman dictionary with "Path", "Fallback", "Calibrate", "Lock", and "Index" as keys
+
+    >>> dictionary = make_dictionary('words.txt')
+    >>> dictionary['Path'], dictionary['Index']
+    ('words.txt', None)
+    """
+    return {"Path": path, "Fallback": fallback, "Calibrate": calibrate, "Lock": threading.Lock(), "Index": None}
+
+
+def load_dictionary(dictionary: dict) -> dict:
+    """
+    Read and index the words of a dictionary unless that was already done.
+
+    The words are read at most once per process, even when many sessions ask for them at the same time.
+
+    :param dictionary: a dictionary created by make_dictionary
+    :postcondition: read the word list file if it exists, or else the fallback words
+    :postcondition: share the words out between levels with the dictionary's calibrate function, if it has one, or
+    read them from the levels cache file when it was made from the same words
+    :return: the index dictionary of the words, as created by index_words
+
+    >>> load_dictionary(make_dictionary(None, lambda: [['Book', 'book', 'tree']]))['Words']
+    ['book', 'tree']
+    """
+    index = dictionary["Index"]
+    if index is None:
+        with dictionary["Lock"]:
+            index = dictionary["Index"]
+            if index is None:
+                path, fallback = dictionary["Path"], dictionary["Fallback"]
+                cache_path = None
+                if path is not None and os.path.exists(path):
+                    words = read_words(path)
+                    cache_path = path + LEVELS_CACHE_SUFFIX
+                else:
+                    words = clean_words(word for words in (fallback() if fallback else []) for word in words)
+                index = index_words(words)
+                if dictionary["Calibrate"] is not None:
+                    index["Levels"] = calibrated_levels(dictionary, words, cache_path)
+                dictionary["Index"] = index
+    return index
+
+
+def level_words(dictionary: dict, level: int) -> list[str]:
+    """
+    Find the words that suit a level.
+
+    Unless the dictionary was calibrated, longer words count as easier to guess, so the first level gets the longest
+    words.
+
+    :param dictionary: a dictionary created by make_dictionary
+    :param level: an integer from 1 to 3
+    :precondition: level must be a key of LEVEL_LENGTHS
+    :return: the words of the level as a list of strings shared by every session, which must not be changed
+
+    >>> level_words(make_dictionary(None, lambda: [['book', 'apple', 'garden']]), 1)
+    ['garden']
+    """
+    return load_dictionary(dictionary)["Levels"][level]
@@ -0,0 +1,311 @@
+import math
+import sys
+import time
+
+from minigames.hangman_art import LIVES
+from minigames.hangman_dictionary import DICTIONARY_PATH, letter_bit, read_words
+
+ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+SMALL_SET = 64
+
+
+def position_masks(word: str) -> dict[str, int]:
+    """
+    Mark the positions of each letter of a word as bits.
+
+    :param word: a string
+    :return: a dictionary mapping each distinct character of word to a positive integer whose bit i is set if the
+    character is at position i
+
+    >>> position_masks('pebble')
+    {'p': 1, 'e': 34, 'b': 12, 'l': 16}
+    """
+    masks = {}
+    for position, letter in enumerate(word):
+        masks[letter] = masks.get(letter, 0) | 1 << position
+    return masks
+
+
+def bitset(numbers: list[int], size: int) -> int:
+    """
+    Turn word numbers into a bitset.
+
+    :param numbers: a list of distinct integers from 0 up to but not including size
+    :param size: a non-negative integer
+    :return: a non-negative integer whose bit n is set for every n in numbers
+
+    >>> bitset([0, 2, 3], 4)
+    13
+    """
+    bits = bytearray((size + 7) // 8)
+    for number in numbers:
+        bits[number >> 3] |= 1 << (number & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def set_bits(candidates: int) -> list[int]:
+    """
+    List the numbers of the words in a bitset.
+
+    :param candidates: a non-negative integer
+    :return: the positions of the set bits of candidates, from the lowest up
+
+    >>> set_bits(13)
+    [0, 2, 3]
+    """
+    numbers = []
+    while candidates:
+        lowest = candidates & -candidates
+        numbers.append(lowest.bit_length() - 1)
+        candidates ^= lowest
+    return numbers
+
+
+def pattern_index(words: list[str]) -> dict:
+    """
+    Index words of one length by where each letter appears in them.
+
+    :param words: a list of distinct strings of lowercase letters, all of the same length
+    :return: an index dictionary with "Masks" and "Patterns" as keys, where "Masks" holds the position_masks of each
+    word and "Patterns" maps every letter of the alphabet to a dictionary that maps each position mask to the bitset
+    of the words with the letter at exactly those positions
+
+    >>> pattern_index(['book', 'cook', 'cool'])['Patterns']['c']
+    {1: 6, 0: 1}
+    """
+    masks = [position_masks(word) for word in words]
+    groups = {letter: {} for letter in ALPHABET}
+    for number, word_masks in enumerate(masks):
+        for letter, mask in word_masks.items():
+            groups[letter].setdefault(mask, []).append(number)
+    everyone = (1 << len(words)) - 1
+    patterns = {}
+    for letter, letter_groups in groups.items():
+        patterns[letter] = {mask: bitset(numbers, len(words)) for mask, numbers in letter_groups.items()}
+        missing = everyone
+        for members in patterns[letter].values():
+            missing ^= members
+        if missing:
+            patterns[letter][0] = missing
+    return {"Masks": masks, "Patterns": patterns}
+
+
+def information(counts: list[int], total: int) -> float:
+    """
+    Measure the expected information, in bits, of a guess that splits the candidates into parts of the given sizes.
+
+    :param counts: a list of positive integers adding up to total
+    :param total: a positive integer
+    :return: the entropy of the split as a non-negative float
+
+    >>> information([2, 2], 4)
+    1.0
+    >>> information([4], 4)
+    0.0
+    """
+    return math.log2(total) - sum(count * math.log2(count) for count in counts) / total
+
+
+def split_candidates(index: dict, candidates, letter: str) -> dict[int, object]:
+    """
+    Split the candidate words by where a letter appears in them.
+
+    Large candidate sets are bitsets and are split with one bitwise and per pattern. Small ones are lists of word
+    numbers and are split by looking at each word.
+
+    :param index: an index dictionary made by pattern_index
+    :param candidates: a bitset or a list of word numbers
+    :param letter: a one-character string
+    :return: a dictionary mapping each position mask to the non-empty part of the candidates with that pattern, in the
+    same form as candidates
+    """
+    if isinstance(candidates, int):
+        parts = {mask: candidates & members for mask, members in index["Patterns"][letter].items()}
+        return {mask: part for mask, part in parts.items() if part}
+    parts = {}
+    for number in candidates:
+        parts.setdefault(index["Masks"][number].get(letter, 0), []).append(number)
+    return parts
+
+
+def size(candidates) -> int:
+    """
+    Count the words in a bitset or a list of word numbers.
+
+    >>> size(13), size([0, 2, 3])
+    (3, 3)
+    """
+    return candidates.bit_count() if isinstance(candidates, int) else len(candidates)
+
+
+def letter_counts(index: dict, candidates: list[int]) -> dict[str, dict[int, list[int]]]:
+    """
+    Split a small list of candidate words by every letter that appears in them, in one pass over the words.
+
+    :param index: an index dictionary made by pattern_index
+    :param candidates: a list of word numbers
+    :return: a dictionary mapping each letter found in the candidates to a dictionary that maps each non-zero position
+    mask to the word numbers with the letter at exactly those positions; the words without the letter are left out
+
+    >>> letter_counts(pattern_index(['book', 'cook', 'cool']), [1, 2])['k']
+    {8: [1]}
+    """
+    splits = {}
+    for number in candidates:
+        for letter, mask in index["Masks"][number].items():
+            splits.setdefault(letter, {}).setdefault(mask, []).append(number)
+    return splits
+
+
+def best_guess(index: dict, candidates, guessed: int) -> tuple[str, dict]:
+    """
+    Pick the letter whose answer is expected to tell the most about which candidate is the word.
+
+    Ties go to the letter most likely to be in the word, then to the first in the alphabet.
+
+    :param index: an index dictionary made by pattern_index
+    :param candidates: a bitset or a list of word numbers holding at least two words
+    :param guessed: a mask of the letters already guessed, as made by letter_bit
+    :return: the letter and the split of the candidates it makes, as returned by split_candidates
+
+    >>> best_guess(pattern_index(['book', 'cook', 'cool']), 7, 0)
+    ('c', {1: 6, 0: 1})
+    >>> best_guess(pattern_index(['book', 'cook', 'cool']), [0, 1, 2], 0)
+    ('c', {0: [0], 1: [1, 2]})
+    """
+    total = size(candidates)
+    if isinstance(candidates, int):
+        splits = {letter: split_candidates(index, candidates, letter) for letter in ALPHABET
+                  if not guessed & letter_bit(letter)}
+    else:
+        splits = letter_counts(index, candidates)
+    best = None
+    for letter in sorted(splits):
+        parts = splits[letter]
+        counts = [size(part) for mask, part in parts.items() if mask]
+        hits = sum(counts)
+        if hits < total:
+            counts.append(total - hits)
+        if len(counts) < 2:
+            continue
+        score = (information(counts, total), hits)
+        if best is None or score > best[0]:
+            best = (score, letter)
+    letter = best[1]
+    return letter, split_candidates(index, candidates, letter)
+
+
+def solve_words(words: list[str]) -> dict[str, dict]:
+    """
+    Play hangman for every word of a dictionary with a solver that knows the dictionary but not the word.
+
+    At every guess, the solver picks the letter that maximises the expected information about the word among the
+    words still possible, and keeps guessing after running out of lives so that every word gets a full count. Words
+    of one length share one decision tree, which is walked once, so every word costs only the guesses that tell it
+    apart.
+
+    :param words: a list of strings of lowercase letters
+    :postcondition: play each distinct word once
+    :return: a dictionary mapping each word to a result dictionary with "Guesses", "Wrong Guesses", and "Loses" as
+    keys, where "Loses" tells whether the wrong guesses used up all the lives of minigames.hangman.hangman
+
+    >>> solve_words(['book', 'cook', 'cool'])['cook']
+    {'Guesses': 3, 'Wrong Guesses': 0, 'Loses': False}
+    """
+    results = {}
+    by_length = {}
+    for word in dict.fromkeys(words):
+        by_length.setdefault(len(word), []).append(word)
+    for group in by_length.values():
+        index = pattern_index(group)
+        stack = [((1 << len(group)) - 1, 0, 0, 0)]
+        while stack:
+            candidates, guessed, guesses, wrong = stack.pop()
+            if isinstance(candidates, int) and candidates.bit_count() <= SMALL_SET:
+                candidates = set_bits(candidates)
+            if size(candidates) == 1:
+                number = candidates[0]
+                word = group[number]
+                hidden = sum(1 for letter in index["Masks"][number] if not guessed & letter_bit(letter))
+                results[word] = {"Guesses": guesses + hidden, "Wrong Guesses": wrong, "Loses": wrong >= LIVES}
+                continue
+            letter, parts = best_guess(index, candidates, guessed)
+            for mask, part in parts.items():
+                stack.append((part, guessed | letter_bit(letter), guesses + 1, wrong + (mask == 0)))
+    return results
+
+
+def difficulty(result: dict) -> tuple[bool, int, int]:
+    """
+    Rank a solved word; a word that sorts later is harder.
+
+    :param result: a result dictionary made by solve_words
+    :return: a tuple that sorts words by whether the solver lost, then by its wrong guesses, then by all its guesses
+
+    >>> difficulty({'Guesses': 7, 'Wrong Guesses': 2, 'Loses': False})
+    (False, 2, 7)
+    """
+    return result["Loses"], result["Wrong Guesses"], result["Guesses"]
+
+
+def calibrate_levels(words: list[str], results: dict[str, dict], levels: int = 3) -> dict[int, list[str]]:
+    """
+    Share words out between levels by how hard the solver found them.
+
+    The first level gets the easiest words and the last level the hardest, in equal shares. Words equally hard keep
+    the order they had in words.
+
+    :param words: a list of distinct strings
+    :param results: a dictionary of solver results for every word, as made by solve_words
+    :param levels: a positive integer number of levels
+    :return: a dictionary mapping each level, from 1 up to levels, to its list of words
+
+    >>> results = solve_words(['book', 'cook', 'cool'])
+    >>> calibrate_levels(['book', 'cook', 'cool'], results)
+    {1: ['cook'], 2: ['book'], 3: ['cool']}
+    """
+    ranked = sorted(words, key=lambda word: difficulty(results[word]))
+    share = -(-len(ranked) // levels)
+    return {level: ranked[(level - 1) * share:level * share] for level in range(1, levels + 1)}
+
+
+def level_report(levels: dict[int, list[str]], results: dict[str, dict]) -> dict[int, dict]:
+    """
+    Summarize how hard the solver found the words of each level.
+
+    :param levels: a dictionary mapping levels to lists of words
+    :param results: a dictionary of solver results for every word, as made by solve_words
+    :return: a dictionary mapping each level to a dictionary with "Words", "Guesses", and "Loss Chance" as keys,
+    where "Guesses" is the average number of guesses and "Loss Chance" the share of words the solver lost
+
+    >>> results = solve_words(['book', 'cook', 'cool'])
+    >>> level_report({1: ['book', 'cook']}, results)
+    {1: {'Words': 2, 'Guesses': 3.5, 'Loss Chance': 0.0}}
+    """
+    report = {}
+    for level, level_words in levels.items():
+        count = max(len(level_words), 1)
+        report[level] = {
+            "Words": len(level_words),
+            "Guesses": sum(results[word]["Guesses"] for word in level_words) / count,
+            "Loss Chance": sum(results[word]["Loses"] for word in level_words) / count
+        }
+    return report
+
+
+def main():
+    """
+    Drive the program.
+    """
+    words = read_words(sys.argv[1] if len(sys.argv) > 1 else DICTIONARY_PATH)
+    start = time.perf_counter()
+    results = solve_words(words)
+    seconds = time.perf_counter() - start
+    print(f"Solved {len(results)} words in {seconds:.2f} seconds.")
+    for level, summary in level_report(calibrate_levels(words, results), results).items():
+        print(f"Level {level}: {summary['Words']} words, {summary['Guesses']:.1f} guesses on average, "
+              f"{summary['Loss Chance']:.1%} lost")
+
+
+if __name__ == '__main__':
+    main()
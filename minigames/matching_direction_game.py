@@ -1,7 +1,10 @@
-import random
-import time
+from rng import current_rng
+from console import ask, pause
 from helpers import lose_heart
 
+DIRECTIONS = ['A', 'D', 'S', 'W']
+COUNTDOWN = 5
+
 
 def check_character_level_matching_game(character: dict) -> int:
     """
@@ -30,34 +33,129 @@ def check_character_level_matching_game(character: dict) -> int:
         return matching_count
 
 
-def play_game(level: int, character: dict) -> tuple[bool, dict]:
+def make_memory_round(level: int) -> dict:
+    """
+    Start a round of the memory game with a new random sequence of directions.
+
+    :param level: a positive integer number of directions to memorize
+    :postcondition: draw the directions from the session's generator
+    :return: a round dictionary with "Sequence" and "Matched" as keys, where "Sequence" is the list of directions and
+    "Matched" counts the directions the player has entered correctly so far
+
+    >>> memory_round = make_memory_round(120)
+    >>> len(memory_round['Sequence']), memory_round['Matched']
+    (120, 0)
+    """
+    return {"Sequence": current_rng().choices(DIRECTIONS, k=level), "Matched": 0}
+
+
+def check_direction(memory_round: dict, answer: str) -> str:
+    """
+    Check one entered direction against the next direction of the sequence, as soon as it is entered.
+
+    :param memory_round: a round dictionary created by make_memory_round
+    :param answer: a string entered by the player
+    :precondition: the round must not be over
+    :postcondition: count the direction as matched if it is the right one, ignoring its case
+    :return: 'complete' if it was the last direction of the sequence, 'correct' if more are to come, or 'wrong'
+
+    >>> memory_round = {'Sequence': ['A', 'D'], 'Matched': 0}
+    >>> check_direction(memory_round, 'a'), check_direction(memory_round, 'D')
+    ('correct', 'complete')
+    >>> check_direction({'Sequence': ['A', 'D'], 'Matched': 0}, 'w')
+    'wrong'
+    """
+    if answer.upper() != memory_round["Sequence"][memory_round["Matched"]]:
+        return 'wrong'
+    memory_round["Matched"] += 1
+    return 'complete' if memory_round["Matched"] == len(memory_round["Sequence"]) else 'correct'
+
+
+def show_sequence(memory_round: dict) -> None:
+    """
+    Print the sequence of directions to memorize.
+
+    :param memory_round: a round dictionary created by make_memory_round
+    :postcondition: print the sequence of directions
+
+    >>> show_sequence({'Sequence': ['A', 'D'], 'Matched': 0})
+    Memorize the given directions:
+    ['A', 'D']
+    """
+    print("Memorize the given directions:")
+    print(memory_round["Sequence"])
+
+
+def hide_sequence() -> None:
+    """
+    Push the sequence off the screen and ask for the answer.
+
+    :postcondition: print enough blank lines to hide the sequence, then the request for the answer
+    """
+    print("\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n")
+    print("Enter the answer")
+
+
+def direction_prompt(memory_round: dict) -> str:
+    """
+    Make the prompt for the next direction of a round.
+
+    :param memory_round: a round dictionary created by make_memory_round
+    :return: the prompt as a string
+
+    >>> direction_prompt({'Sequence': ['A', 'D'], 'Matched': 1})
+    '2 direction: '
+    """
+    return f"{memory_round['Matched'] + 1} direction: "
+
+
+def finish_memory_round(memory_round: dict, outcome: str, character: dict) -> tuple[bool, dict]:
+    """
+    Tell the player how the round ended.
+
+    :param memory_round: a round dictionary created by make_memory_round
+    :param outcome: 'complete' or 'wrong', as returned by check_direction for the last direction entered
+    :param character: a dictionary including the character's status, which includes 'Heart' as key in 'Stat'
+    :postcondition: print whether the player won, and the sequence if they did not
+    :postcondition: take a heart from the character if the player did not win
+    :return: a True or False through result of game and the updated character dictionary
+    """
+    if outcome == 'complete':
+        print("Correct!")
+        return True, character
+    print("Wrong!")
+    print("The answer was ", memory_round["Sequence"])
+    lose_heart(character)
+    return False, character
+
+
+async def play_game(level: int, character: dict) -> tuple[bool, dict]:
     """
     Play a direction game where the player memorize and input a sequence of directions ('A', 'D', 'S', 'W').
 
+    Each direction is checked as soon as it is entered, and the game ends at the first wrong one. The countdown is
+    measured by the session's clock, so a session on a virtual clock never waits for it. In a remote session, the
+    countdown and every answer are awaited on the event loop, so no thread is held while the player memorizes or
+    answers.
+
     :param level: an integer representing the number of directions to memorize
     :param character: a dictionary including the character's status, which includes 'Heart' as key in 'Stat'
     :precondition: level must be a positive integer
     :precondition: character must be a dictionary containing a nested dictionary under key 'Stat' with 'Heart' as a key
     :postcondition: print the sequence of directions to memorize
     :postcondition: get user input and convert to uppercase to compare with the sequence of directions
+    :postcondition: stop asking for directions at the first wrong one
     :postcondition: return a boolean indicating success or failure, and the updated character's heart
     :return: a True or False through result of game and the updated character dictionary
     """
-    strings = random.choices(['A', 'D', 'S', 'W'], k=level)
-    print("Memorize the given directions:")
-    print(strings)
-    for count in range(5):
-        time.sleep(1)
-        print(5 - count)
-    print("\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n")
-    print("Enter the answer")
-    user_inputs = [input(f"{number+1} direction: ") for number in range(len(strings))]
-    upper_inputs = [user_input.upper() for user_input in user_inputs]
-    if upper_inputs == strings:
-        print("Correct!")
-        return True, character
-    else:
-        print("Wrong!")
-        print("The answer was ", strings)
-        lose_heart(character)
-        return False, character
+    memory_round = make_memory_round(level)
+    show_sequence(memory_round)
+    for count in range(COUNTDOWN):
+        await pause(1)
+        print(COUNTDOWN - count)
+    hide_sequence()
+    outcome = 'correct'
+    while outcome == 'correct':
+        outcome = check_direction(memory_round, await ask(direction_prompt(memory_round), 'memory'))
+    return finish_memory_round(memory_round, outcome, character)
+
@@ -0,0 +1,158 @@
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+
+from board import PLAYER, Board, BoardTemplate, level_template
+
+MOVES = {'w': (-1, 0), 'a': (0, -1), 's': (1, 0), 'd': (0, 1)}
+GOAL = b'!'
+NO_DIRECTION = ord(' ')
+
+
+@dataclass(frozen=True, slots=True)
+class DistanceField:
+    """
+    The number of steps from every cell of a board layout to its goal, and the way to go from each cell.
+
+    A field is worked out once per layout and goal by distance_field, so asking how far the goal is, or which way to
+    go, is one lookup however large the board is.
+
+    >>> field = distance_field(Board.from_lists([['#', '#', '#'], ['#', '.', '!'], ['#', '#', '#']]).freeze(), (1, 2))
+    >>> field.steps_to_goal(1, 1), field.next_direction(1, 1), field.next_direction(1, 2)
+    (1, 'd', None)
+    """
+    width: int
+    steps: array
+    toward: bytes
+
+    def steps_to_goal(self, row: int, col: int) -> int:
+        """
+        Count the steps of a shortest walk from a cell to the goal.
+
+        :param row: a row index inside the board
+        :param col: a column index inside the board
+        :return: the number of steps as a non-negative integer, or -1 if the goal cannot be reached from the cell
+        """
+        return self.steps[row * self.width + col]
+
+    def next_direction(self, row: int, col: int) -> str | None:
+        """
+        Find the first direction of a shortest walk from a cell to the goal.
+
+        When more than one direction starts a shortest walk, the first of them in MOVES is taken, which is the one a
+        breadth-first search from the cell trying the directions in that order would take.
+
+        :param row: a row index inside the board
+        :param col: a column index inside the board
+        :return: one of 'w', 'a', 's', 'd', or None if the goal cannot be reached from the cell or is already reached
+        """
+        direction = self.toward[row * self.width + col]
+        return None if direction == NO_DIRECTION else chr(direction)
+
+
+@lru_cache(maxsize=32)
+def distance_field(template: BoardTemplate, goal: tuple[int, int]) -> DistanceField:
+    """
+    Work out how far every cell of a board layout is from a goal cell, searching breadth-first from the goal once.
+
+    :param template: a BoardTemplate, such as one made by board.level_template or map_generator.generate_template
+    :param goal: a tuple (row, col) inside the board
+    :precondition: the goal cell must not be a wall
+    :postcondition: search each layout and goal once per process, so every later call returns the same field
+    :return: a DistanceField of the layout
+
+    >>> template = Board.from_lists([['.', '.', '#'], ['.', '#', '!'], ['.', '.', '.']]).freeze()
+    >>> list(distance_field(template, (1, 2)).steps)
+    [5, 6, -1, 4, -1, 0, 3, 2, 1]
+    """
+    height, width, passable = template.height, template.width, template.passable
+    size = height * width
+    steps = array('i', [-1]) * size
+    start = goal[0] * width + goal[1]
+    steps[start] = 0
+    queue = deque([start])
+    while queue:
+        index = queue.popleft()
+        distance = steps[index] + 1
+        col = index % width
+        for neighbour in (index - width if index >= width else -1, index - 1 if col else -1,
+                          index + width if index + width < size else -1, index + 1 if col + 1 < width else -1):
+            if neighbour >= 0 and steps[neighbour] < 0 and passable[neighbour >> 3] >> (neighbour & 7) & 1:
+                steps[neighbour] = distance
+                queue.append(neighbour)
+    toward = bytearray(b' ' * size)
+    for index in range(size):
+        closer = steps[index] - 1
+        if closer < 0:
+            continue
+        row, col = divmod(index, width)
+        for direction, (row_step, col_step) in MOVES.items():
+            next_row, next_col = row + row_step, col + col_step
+            if 0 <= next_row < height and 0 <= next_col < width and steps[next_row * width + next_col] == closer:
+                toward[index] = ord(direction)
+                break
+    return DistanceField(width, steps, bytes(toward))
+
+
+def find_goal(template: BoardTemplate) -> tuple[int, int] | None:
+    """
+    Find the goal '!' of a board layout.
+
+    :param template: a BoardTemplate
+    :return: the (row, col) of the first '!' of the layout, or None if it has none
+
+    >>> find_goal(level_template(1)), find_goal(Board.from_lists([['.']]).freeze())
+    ((7, 1), None)
+    """
+    index = template.cells.find(GOAL)
+    return None if index < 0 else divmod(index, template.width)
+
+
+@lru_cache(maxsize=None)
+def level_goal(level: int) -> tuple[int, int] | None:
+    """
+    Find the goal '!' of a level, looking for it only the first time it is asked for.
+
+    :param level: a positive integer
+    :precondition: level must be a key of the "Boards" of the content pack
+    :return: the (row, col) of the goal on the level's board, or None if the board has none
+
+    >>> level_goal(1), level_goal(2), level_goal(3)
+    ((7, 1), (4, 8), (4, 4))
+    """
+    return find_goal(level_template(level))
+
+
+@lru_cache(maxsize=None)
+def level_distances(level: int) -> DistanceField:
+    """
+    Get the distance field to the goal '!' of a level, working it out only the first time it is asked for.
+
+    :param level: a positive integer
+    :precondition: level must be a key of the "Boards" of the content pack, and its board must have a '!'
+    :return: the DistanceField of the level's layout and goal
+
+    >>> level_distances(1).steps_to_goal(1, 1), level_distances(1).next_direction(1, 1)
+    (22, 'd')
+    """
+    return distance_field(level_template(level), level_goal(level))
+
+
+def find_player(grid) -> tuple[int, int] | None:
+    """
+    Find the character on a grid.
+
+    :param grid: a Board, or a list of lists of strings
+    :return: the (row, col) of '🐶', or None if the grid has no character
+
+    >>> find_player([['#', '#'], ['.', '🐶']])
+    (1, 1)
+    """
+    if isinstance(grid, Board):
+        return grid.player
+    for row, cells in enumerate(grid):
+        for col, cell in enumerate(cells):
+            if cell == PLAYER:
+                return row, col
+    return None
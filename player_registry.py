@@ -0,0 +1,186 @@
+import os
+import sqlite3
+import sys
+import threading
+
+REGISTRY_PATH = 'players.db'
+LEGACY_PATH = 'players.txt'
+
+_shared_registries = {}
+_shared_registries_lock = threading.Lock()
+
+
+def open_registry(path: str | None = None, legacy_path: str | None = None,
+                  check_same_thread: bool = True) -> sqlite3.Connection:
+    """
+    Open the player registry, creating it if it does not exist yet.
+
+    The registry is an SQLite database in write-ahead logging mode, so many sessions can look players up while
+    another one registers a new player. Names are the primary key of the players table, so a lookup is an index search
+    rather than a scan of every name. The first time the registry is created, the players of an existing players.txt
+    are imported into it. The write lock is only taken when the players table has to be created.
+
+    :param path: a string naming the registry file, or None for REGISTRY_PATH
+    :param legacy_path: a string naming a players.txt to import into a new registry, or None for LEGACY_PATH
+    :param check_same_thread: False to let the connection be used from threads other than the one that opened it
+    :postcondition: create the players table if it does not exist
+    :postcondition: import the players of legacy_path if the registry was just created and legacy_path exists
+    :return: an open sqlite3.Connection to the registry
+
+    >>> registry = open_registry(':memory:', os.devnull)
+    >>> registry.execute('PRAGMA table_info(players)').fetchall()[0][1]
+    'name'
+    >>> registry.close()
+    """
+    path = REGISTRY_PATH if path is None else path
+    legacy_path = LEGACY_PATH if legacy_path is None else legacy_path
+    registry = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=check_same_thread)
+    registry.execute('PRAGMA journal_mode=WAL')
+    registry.execute('PRAGMA synchronous=NORMAL')
+    if registry.execute("SELECT name FROM sqlite_master WHERE name = 'players'").fetchone() is not None:
+        return registry
+    registry.execute('BEGIN IMMEDIATE')
+    try:
+        is_new = registry.execute("SELECT name FROM sqlite_master WHERE name = 'players'").fetchone() is None
+        registry.execute('CREATE TABLE IF NOT EXISTS players (name TEXT PRIMARY KEY) WITHOUT ROWID')
+        if is_new and os.path.exists(legacy_path):
+            insert_names(registry, read_players_file(legacy_path))
+    except BaseException:
+        registry.execute('ROLLBACK')
+        registry.close()
+        raise
+    registry.execute('COMMIT')
+    return registry
+
+
+def shared_registry(path: str | None = None) -> tuple[sqlite3.Connection, threading.Lock]:
+    """
+    Get the connection to the player registry that every session of this process shares.
+
+    The connection is opened and configured by open_registry the first time it is asked for, so a login after that
+    costs no connection, no PRAGMA, and no transaction of its own.
+
+    :param path: a string naming the registry file, or None for REGISTRY_PATH
+    :postcondition: open at most one connection for each registry file
+    :return: a tuple of the connection and a lock that must be held while the connection is used
+
+    >>> shared_registry(':memory:')[0] is shared_registry(':memory:')[0]
+    True
+    """
+    path = REGISTRY_PATH if path is None else path
+    shared = _shared_registries.get(path)
+    if shared is None:
+        with _shared_registries_lock:
+            shared = _shared_registries.get(path)
+            if shared is None:
+                shared = (open_registry(path, check_same_thread=False), threading.Lock())
+                _shared_registries[path] = shared
+    return shared
+
+
+def close_shared_registries() -> None:
+    """
+    Close every connection opened by shared_registry, so that the next one asked for is opened again.
+
+    >>> close_shared_registries()
+    >>> len(_shared_registries)
+    0
+    """
+    with _shared_registries_lock:
+        for registry, _ in _shared_registries.values():
+            registry.close()
+        _shared_registries.clear()
+
+
+def read_players_file(path: str) -> list[str]:
+    """
+    Read the names in a players.txt file.
+
+    :param path: a string naming a players.txt file
+    :precondition: the file must hold one name per line, as check_user used to write it
+    :postcondition: keep spaces in names and drop only the line endings
+    :return: the names as a list of strings, in the order of the file
+    """
+    with open(path, encoding='utf-8') as players:
+        return [line.rstrip('\n') for line in players]
+
+
+def insert_names(registry: sqlite3.Connection, names) -> int:
+    """
+    Add names to the registry, skipping those already in it.
+
+    :param registry: an open connection created by open_registry
+    :param names: an iterable of strings
+    :postcondition: every name in names is in the registry
+    :return: the number of names that were not in the registry before
+
+    >>> registry = open_registry(':memory:', os.devnull)
+    >>> insert_names(registry, ['Heather', 'Young Bin', 'Heather'])
+    2
+    >>> registry.close()
+    """
+    before = registry.total_changes
+    registry.executemany('INSERT OR IGNORE INTO players (name) VALUES (?)', ((name,) for name in names))
+    return registry.total_changes - before
+
+
+def register_player(registry: sqlite3.Connection, name: str) -> bool:
+    """
+    Add a player to the registry unless they are already in it.
+
+    A returning player is found by a plain lookup, which takes no write lock. Only a name that is not in the registry
+    yet is inserted, and that insert ignores a name added in the meantime, so two sessions registering the same name
+    at once can never both see it as new.
+
+    :param registry: an open connection created by open_registry
+    :param name: a string representing a player's name
+    :postcondition: name is in the registry
+    :return: True if the player is new, False if they were already registered
+
+    >>> registry = open_registry(':memory:', os.devnull)
+    >>> register_player(registry, 'Heather'), register_player(registry, 'Heather')
+    (True, False)
+    >>> registry.close()
+    """
+    if registry.execute('SELECT 1 FROM players WHERE name = ?', (name,)).fetchone() is not None:
+        return False
+    return registry.execute('INSERT INTO players (name) VALUES (?) ON CONFLICT DO NOTHING', (name,)).rowcount == 1
+
+
+def import_players_file(registry: sqlite3.Connection, path: str = LEGACY_PATH) -> int:
+    """
+    Import the players of a players.txt file into the registry in one transaction.
+
+    :param registry: an open connection created by open_registry
+    :param path: a string naming a players.txt file
+    :precondition: the file must exist
+    :postcondition: every name in the file is in the registry
+    :return: the number of players that were not in the registry before
+    """
+    names = read_players_file(path)
+    registry.execute('BEGIN IMMEDIATE')
+    try:
+        imported = insert_names(registry, names)
+    except BaseException:
+        registry.execute('ROLLBACK')
+        raise
+    registry.execute('COMMIT')
+    return imported
+
+
+def main():
+    """
+    Drive the program.
+    """
+    legacy_path = sys.argv[1] if len(sys.argv) > 1 else LEGACY_PATH
+    registry = open_registry(sys.argv[2] if len(sys.argv) > 2 else None, os.devnull)
+    try:
+        imported = import_players_file(registry, legacy_path)
+        total = registry.execute('SELECT COUNT(*) FROM players').fetchone()[0]
+    finally:
+        registry.close()
+    print(f"Imported {imported} new player(s) from {legacy_path}. The registry now holds {total} player(s).")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+import base64
+import hashlib
+import json
+import os
+import tempfile
+
+RECORDING_VERSION = 1
+RECORDING_DIRECTORY = 'recordings'
+
+
+def new_seed() -> int:
+    """
+    Pick a seed for the random numbers of a new session.
+
+    :postcondition: draw the seed from the operating system, so that it never depends on any generator's state
+    :return: a non-negative integer smaller than 2 ** 63
+
+    >>> 0 <= new_seed() < 2 ** 63
+    True
+    """
+    return int.from_bytes(os.urandom(8), 'big') >> 1
+
+
+def fingerprint(snapshot: bytes) -> str:
+    """
+    Summarize a session snapshot in a short string that changes whenever anything in the session changes.
+
+    :param snapshot: bytes written by snapshot.dump_session
+    :return: the fingerprint as a string of hexadecimal digits
+
+    >>> fingerprint(b'BKGS')
+    '341d52ec5c7c6acc948c6ff2310e640e'
+    """
+    return hashlib.sha256(snapshot).hexdigest()[:32]
+
+
+def make_recording(snapshot: bytes, seed: int, hangman_mode: str = 'classic') -> dict:
+    """
+    Start the recording of a session.
+
+    A recording holds what a replay needs to play the session again exactly as it was played: the session it
+    started from, the seed of its random numbers, and every answer given to its prompts. It also holds the number of
+    turns played and the fingerprint of the session after the last of them, so that a replay can tell whether it
+    ended where the session did, and the hangman mode it was played in.
+
+    :param snapshot: bytes written by snapshot.dump_session for the session before its first recorded turn
+    :param seed: the integer the session's generator was seeded with just before the first recorded turn
+    :param hangman_mode: the session's "Hangman Mode", 'classic' or 'evil'
+    :postcondition: record no turns yet
+    :return: a recording dictionary with "Version", "Seed", "Hangman Mode", "Start", "Answers", "Turns", and
+    "Final State" as keys
+
+    >>> recording = make_recording(b'BKGS', 1510)
+    >>> recording['Seed'], recording['Start'], recording['Answers'], recording['Turns']
+    (1510, 'QktHUw==', [], 0)
+    """
+    return {
+        "Version": RECORDING_VERSION,
+        "Seed": seed,
+        "Hangman Mode": hangman_mode,
+        "Start": base64.b64encode(snapshot).decode('ascii'),
+        "Answers": [],
+        "Turns": 0,
+        "Final State": fingerprint(snapshot)
+    }
+
+
+def mark_turn(recording: dict, answers: list, snapshot: bytes) -> None:
+    """
+    Add a complete turn to a recording.
+
+    :param recording: a recording dictionary created by make_recording
+    :param answers: a list of the [topic, answer] pairs given during the turn
+    :param snapshot: bytes written by snapshot.dump_session at the end of the turn
+    :postcondition: move the answers of the turn into the recording and empty answers
+    :postcondition: count the turn and remember the fingerprint of the session after it
+
+    >>> recording, answers = make_recording(b'BKGS', 1510), [['direction', 'w']]
+    >>> mark_turn(recording, answers, b'BKGS')
+    >>> recording['Answers'], recording['Turns'], answers
+    ([['direction', 'w']], 1, [])
+    """
+    recording["Answers"] += answers
+    answers.clear()
+    recording["Turns"] += 1
+    recording["Final State"] = fingerprint(snapshot)
+
+
+def start_snapshot(recording: dict) -> bytes:
+    """
+    Find the snapshot of the session a recording starts from.
+
+    :param recording: a recording dictionary created by make_recording
+    :return: the snapshot as bytes
+
+    >>> start_snapshot(make_recording(b'BKGS', 1510))
+    b'BKGS'
+    """
+    return base64.b64decode(recording["Start"])
+
+
+def recording_path(directory: str, user_name: str, seed: int) -> str:
+    """
+    Name the file a session is recorded to.
+
+    :param directory: a string naming the directory recordings are kept in
+    :param user_name: a string representing a player's name
+    :param seed: the integer seed of the session
+    :return: the path of the recording as a string
+
+    >>> recording_path('recordings', 'Heather', 1510)
+    'recordings/ed14016728b28383-00000000000005e6.json'
+    """
+    return os.path.join(directory, f'{hashlib.sha256(user_name.encode()).hexdigest()[:16]}-{seed:016x}.json')
+
+
+def write_recording(path: str, recording: dict) -> None:
+    """
+    Write a recording to a file, replacing any earlier one in a single step.
+
+    :param path: a string naming the recording file
+    :param recording: a recording dictionary created by make_recording
+    :postcondition: create the directory of path if it does not exist
+    :postcondition: never leave a half-written recording behind, even if the process stops while writing
+    :postcondition: write through a temporary file of its own, so that sessions of one process recording at the same
+    time never write into each other's temporary file
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, suffix='.tmp',
+                                     delete=False) as recording_file:
+        json.dump(recording, recording_file, ensure_ascii=False, separators=(',', ':'))
+    os.replace(recording_file.name, path)
+
+
+def read_recording(path: str) -> dict:
+    """
+    Read a recording from a file.
+
+    :param path: a string naming a file written by write_recording
+    :return: the recording dictionary
+    :raises ValueError: if the file is not a recording this version of the game can replay
+    """
+    with open(path, encoding='utf-8') as recording_file:
+        recording = json.load(recording_file)
+    if not isinstance(recording, dict) or recording.get("Version") != RECORDING_VERSION:
+        raise ValueError(f"{path} is not a version {RECORDING_VERSION} recording.")
+    return recording
@@ -0,0 +1,122 @@
+import shutil
+import unicodedata
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+CLEAR_SCREEN = '\x1b[2J\x1b[H'
+SAVE_CURSOR = '\x1b7'
+RESTORE_CURSOR = '\x1b8'
+CLEAR_TO_END_OF_LINE = '\x1b[K'
+RESET_SCROLL_REGION = '\x1b[r'
+
+_renderer = ContextVar('renderer', default=None)
+
+
+def display_width(text: str) -> int:
+    """
+    Count the terminal columns a string takes up.
+
+    :param text: a string
+    :postcondition: count wide characters, such as emoji, as two columns
+    :return: the number of columns as a non-negative integer
+
+    >>> display_width('# . #')
+    5
+    >>> display_width('# 🐶 #')
+    6
+    """
+    return sum(2 if unicodedata.east_asian_width(character) in 'WF' else 1 for character in text)
+
+
+def make_renderer(measure=shutil.get_terminal_size) -> dict:
+    """
+    Create a renderer that keeps the board pinned at the top of the terminal and redraws only what changes.
+
+    :param measure: a function that returns the size of the player's terminal as a (columns, lines) pair
+    :precondition: measure must be callable without arguments
+    :postcondition: start with nothing on the screen, so the first board is drawn in full
+    :return: a renderer dictionary with "Measure", "Terminal Size", and "Shown" as keys
+
+    >>> renderer = make_renderer(lambda: (80, 24))
+    >>> renderer['Terminal Size'], renderer['Shown']
+    (None, None)
+    """
+    return {"Measure": measure, "Terminal Size": None, "Shown": None}
+
+
+def render_board(renderer: dict, grid) -> str:
+    """
+    Work out the text that brings the player's screen up to date with a board.
+
+    The first board, any board of a different height, and any board drawn after the terminal was resized are drawn in
+    full at the top of the screen, and the lines below the board are made a scrolling region so that the rest of the
+    game's text scrolls underneath it. After that, only the changed part of each changed row is sent, as a cursor move
+    followed by the new glyphs. When the board does not fit above a few lines of text, every board is printed in full
+    as display_grid always did.
+
+    :param renderer: a renderer dictionary created by make_renderer
+    :param grid: a list of lists of strings, or a Board
+    :precondition: every cell of grid must be a single character
+    :postcondition: remember the rows and terminal size the returned text leaves on the screen
+    :return: the text to print, without a trailing newline added by print
+
+    >>> renderer = make_renderer(lambda: (80, 24))
+    >>> first = render_board(renderer, [['#', '.', '#'], ['.', '🐶', '.']])
+    >>> first.startswith(CLEAR_SCREEN)
+    True
+    >>> render_board(renderer, [['#', '.', '#'], ['.', '.', '🐶']])
+    '\\x1b7\\x1b[2;3H. 🐶\\x1b[K\\x1b8'
+    >>> render_board(renderer, [['#', '.', '#'], ['.', '.', '🐶']])
+    ''
+    """
+    rows = [' '.join(row) for row in grid]
+    columns, lines = renderer["Measure"]()
+    fits = len(rows) + 2 < lines and all(display_width(row) <= columns for row in rows)
+    if not fits:
+        renderer["Terminal Size"], renderer["Shown"] = (columns, lines), None
+        return ''.join(f'{row}\n' for row in rows)
+    if renderer["Shown"] is None or renderer["Terminal Size"] != (columns, lines) or len(rows) != len(
+            renderer["Shown"]):
+        renderer["Terminal Size"], renderer["Shown"] = (columns, lines), rows
+        return (CLEAR_SCREEN + '\n'.join(rows) + f'\x1b[{len(rows) + 2};{lines}r\x1b[{lines};1H')
+
+    changes = []
+    for row_number, (shown_row, row) in enumerate(zip(renderer["Shown"], rows), start=1):
+        if shown_row != row:
+            first = next((index for index, (shown, new) in enumerate(zip(shown_row, row)) if shown != new),
+                         min(len(shown_row), len(row)))
+            column = display_width(row[:first]) + 1
+            changes.append(f'\x1b[{row_number};{column}H{row[first:]}{CLEAR_TO_END_OF_LINE}')
+    renderer["Shown"] = rows
+    return SAVE_CURSOR + ''.join(changes) + RESTORE_CURSOR if changes else ''
+
+
+@contextmanager
+def use_renderer(renderer: dict):
+    """
+    Run the enclosed code with every board drawn by display_grid going through the given renderer.
+
+    :param renderer: a renderer dictionary created by make_renderer
+    :precondition: everything printed inside the block must go to the terminal the renderer measures
+    :postcondition: give the whole screen back to scrolling text when the block ends, if a board was pinned
+    """
+    token = _renderer.set(renderer)
+    try:
+        yield renderer
+    finally:
+        _renderer.reset(token)
+        if renderer["Shown"] is not None:
+            print(RESET_SCROLL_REGION, end='')
+            renderer["Shown"] = None
+
+
+def current_renderer() -> dict | None:
+    """
+    Find the renderer of the current session.
+
+    :return: the renderer dictionary installed by use_renderer, or None if boards are printed in full
+
+    >>> current_renderer() is None
+    True
+    """
+    return _renderer.get()
@@ -0,0 +1,98 @@
+import glob
+import os
+import sys
+import time
+
+from console import headless, run_sync
+from game import take_turn
+from rng import make_rng, use_rng
+from recording import RECORDING_DIRECTORY, fingerprint, read_recording, start_snapshot
+from snapshot import dump_session, load_session
+
+
+class ReplayDiverged(Exception):
+    """
+    Raised when a replayed session asks for something its recording has no answer for.
+    """
+
+
+def replay_recording(recording: dict, output=None) -> dict:
+    """
+    Play a recorded session again, as fast as the game logic allows.
+
+    The session is rebuilt from the snapshot it started from, in the hangman mode it was played in, its generator is
+    seeded with the recorded seed, and every prompt is answered with the recorded answer, without a terminal and
+    without waiting for any pause.
+
+    :param recording: a recording dictionary created by recording.make_recording
+    :param output: a writable text stream for everything the replay prints, or None to discard it
+    :precondition: recording must have been made by this version of the game
+    :postcondition: play as many turns as the recording holds
+    :return: a dictionary with "Turns", "Answers", and "Matches" as keys, where "Matches" tells whether the session
+    ended in the state it was recorded in
+    :raises ReplayDiverged: if the replay asks a different question than the recording answered, runs out of recorded
+    answers, or leaves some of them unused
+    """
+    session = load_session(start_snapshot(recording))
+    session['Hangman Mode'] = recording.get("Hangman Mode", 'classic')
+    answers = iter(recording["Answers"])
+
+    def answer(_, topic):
+        recorded_topic, reply = next(answers, (None, None))
+        if recorded_topic != topic:
+            raise ReplayDiverged(f"The replay asked for a {topic} answer, but the recording has "
+                                 f"{'no more answers' if recorded_topic is None else f'a {recorded_topic} answer'}.")
+        return reply
+
+    with use_rng(make_rng(recording["Seed"])), headless(answer, output=output):
+        for _ in range(recording["Turns"]):
+            run_sync(take_turn(session))
+    if next(answers, None) is not None:
+        raise ReplayDiverged("The replay ended before using every recorded answer.")
+    return {
+        "Turns": recording["Turns"],
+        "Answers": len(recording["Answers"]),
+        "Matches": fingerprint(dump_session(session)) == recording["Final State"]
+    }
+
+
+def replay_files(paths: list[str]) -> dict:
+    """
+    Replay recordings from files and time them, to check them all and to measure how fast turns are played.
+
+    :param paths: a list of strings naming files written by recording.write_recording
+    :postcondition: replay every recording once
+    :return: a dictionary with "Recordings", "Turns", "Answers", "Mismatches", and "Seconds" as keys, where
+    "Mismatches" lists the paths of the recordings that diverged or did not end in their recorded state
+    """
+    total = {"Recordings": 0, "Turns": 0, "Answers": 0, "Mismatches": [], "Seconds": 0.0}
+    for path in paths:
+        recording = read_recording(path)
+        start = time.perf_counter()
+        try:
+            result = replay_recording(recording)
+        except ReplayDiverged:
+            result = {"Turns": 0, "Answers": 0, "Matches": False}
+        total["Seconds"] += time.perf_counter() - start
+        total["Recordings"] += 1
+        total["Turns"] += result["Turns"]
+        total["Answers"] += result["Answers"]
+        if not result["Matches"]:
+            total["Mismatches"].append(path)
+    return total
+
+
+def main():
+    """
+    Drive the program.
+    """
+    paths = sys.argv[1:] or sorted(glob.glob(os.path.join(RECORDING_DIRECTORY, '*.json')))
+    total = replay_files(paths)
+    print(f"Replayed {total['Recordings']} recording(s): {total['Turns']} turns and {total['Answers']} answers in "
+          f"{total['Seconds']:.3f} seconds ({total['Turns'] / max(total['Seconds'], 1e-9):.0f} turns per second).")
+    for path in total["Mismatches"]:
+        print(f"❌ {path} did not replay to its recorded state.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import hashlib
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_rng = ContextVar('rng', default=None)
+
+
+def make_rng(seed: int | None = None) -> random.Random:
+    """
+    Create a random number generator of its own for a session.
+
+    :param seed: an integer seed, or None to seed the generator from the operating system
+    :postcondition: share no state with the random module or with any other generator
+    :return: a random.Random
+
+    >>> make_rng(1510).randint(1, 100) == make_rng(1510).randint(1, 100)
+    True
+    """
+    return random.Random(seed)
+
+
+def stream_seed(seed: int, stream: str) -> int:
+    """
+    Split a seed into the seeds of independent streams of random numbers.
+
+    The seed of a stream depends only on the seed and the stream's name, so what is drawn from one stream never
+    changes what is drawn from another, however the streams are spread over threads or processes.
+
+    :param seed: an integer seed
+    :param stream: a string naming the stream, such as 'game' or 'policy'
+    :return: the seed of the stream as a non-negative integer smaller than 2 ** 63
+
+    >>> stream_seed(1510, 'game') == stream_seed(1510, 'game')
+    True
+    >>> stream_seed(1510, 'game') == stream_seed(1510, 'policy')
+    False
+    """
+    return int.from_bytes(hashlib.sha256(f'{seed}/{stream}'.encode()).digest()[:8], 'big') >> 1
+
+
+def current_rng():
+    """
+    Find the random number generator of the current session.
+
+    :return: the generator installed by use_rng, or the random module itself outside any session that has one
+
+    >>> current_rng() is random
+    True
+    """
+    rng = _rng.get()
+    return random if rng is None else rng
+
+
+@contextmanager
+def use_rng(rng):
+    """
+    Run the enclosed code with every random number of the game drawn from the given generator.
+
+    :param rng: a random.Random, such as one created by make_rng, or the random module itself
+    :postcondition: leave the random module and the generators of other sessions untouched
+    :postcondition: restore the previous generator when the block ends
+
+    >>> with use_rng(make_rng(1510)):
+    ...     first = current_rng().random()
+    >>> first == make_rng(1510).random()
+    True
+    """
+    token = _rng.set(rng)
+    try:
+        yield rng
+    finally:
+        _rng.reset(token)
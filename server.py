@@ -0,0 +1,240 @@
+import asyncio
+import sys
+from functools import partial
+
+from clock import make_clock
+from console import BufferedOutput, SessionOutput, remote
+from renderer import make_renderer, use_renderer
+from snapshot import SAVE_DIRECTORY
+from recording import RECORDING_DIRECTORY
+from game import game
+
+MAX_LINE_LENGTH = 1024
+
+
+class Disconnected(Exception):
+    """
+    Raised inside a session when its player has left.
+    """
+
+
+class RemoteOutput(BufferedOutput):
+    """
+    A writable text stream that collects what a session prints and sends it to the player's connection on flush.
+    """
+
+    def __init__(self, connection: dict):
+        """
+        Initialize the stream.
+
+        :param connection: a connection dictionary created by make_connection
+        """
+        super().__init__(connection["Writer"])
+        self.connection = connection
+
+    def send(self, text: str) -> None:
+        """
+        Send the text to the player in one write, with telnet line endings.
+        """
+        self.connection["Writer"].write(text.replace('\n', '\r\n').encode())
+
+
+def make_server_state(max_sessions: int = 10000, clock_mode: str = 'real', idle_timeout: float | None = 900,
+                      terminal_size: tuple[int, int] | None = None,
+                      save_directory: str | None = SAVE_DIRECTORY,
+                      recording_directory: str | None = RECORDING_DIRECTORY) -> dict:
+    """
+    Create the shared state of a game server.
+
+    Every session is a task on the server's event loop, so a session waiting for its player or its clock holds no
+    thread, and every connected player can play at once.
+
+    :param max_sessions: a positive integer; connections beyond this many sessions are turned away
+    :param clock_mode: a string naming the clock mode every session uses, one of 'real', 'scaled', or 'virtual'
+    :param idle_timeout: the seconds a player may take to answer a prompt before being disconnected, or None for no
+    limit
+    :param terminal_size: the (columns, lines) of the players' terminals, to pin the board at the top of the screen
+    and send only what changes on it, or None to print every board in full
+    :param save_directory: a string naming the directory that the games of players who leave or stay idle are saved
+    in, to be resumed when they come back under the same name, or None to never save
+    :param recording_directory: a string naming the directory every session is recorded in, or None to never record
+    :precondition: max_sessions must be a positive integer
+    :return: a server state dictionary with "Max Sessions", "Sessions", "Clock Mode", "Idle Timeout", "Terminal Size",
+    "Save Directory", "Recording Directory", "Writes", and "Sends" as keys; "Writes" counts the writes sessions made
+    to their output and "Sends" the writes that reached the network
+
+    >>> state = make_server_state(2, 'virtual', None)
+    >>> state['Max Sessions'], state['Sessions'], state['Clock Mode'], state['Idle Timeout']
+    (2, 0, 'virtual', None)
+    """
+    return {
+        "Max Sessions": max_sessions,
+        "Sessions": 0,
+        "Clock Mode": clock_mode,
+        "Idle Timeout": idle_timeout,
+        "Terminal Size": terminal_size,
+        "Save Directory": save_directory,
+        "Recording Directory": recording_directory,
+        "Writes": 0,
+        "Sends": 0
+    }
+
+
+def make_connection(reader, writer, idle_timeout: float | None) -> dict:
+    """
+    Bundle what a session needs to talk to its player.
+
+    :param reader: an asyncio.StreamReader for the player's input
+    :param writer: an asyncio.StreamWriter for the player's output
+    :param idle_timeout: the seconds a player may take to answer a prompt, or None for no limit
+    :postcondition: create an output stream for the session
+    :return: a connection dictionary with "Reader", "Writer", "Idle Timeout", and "Output" as keys
+    """
+    connection = {"Reader": reader, "Writer": writer, "Idle Timeout": idle_timeout}
+    connection["Output"] = RemoteOutput(connection)
+    return connection
+
+
+async def read_answer(connection: dict) -> str:
+    """
+    Wait for the player to send one line.
+
+    :param connection: a connection dictionary created by make_connection
+    :precondition: must run on the event loop that owns the connection
+    :postcondition: wait until everything sent so far has been taken by the network
+    :return: the line the player sent, without its line ending
+    :raises Disconnected: if the player closes the connection, sends a line that is too long, or stays idle for
+    longer than the idle timeout
+    """
+    try:
+        await connection["Writer"].drain()
+        line = await asyncio.wait_for(connection["Reader"].readline(), connection["Idle Timeout"])
+    except (ConnectionError, TimeoutError, ValueError) as error:
+        raise Disconnected from error
+    if not line:
+        raise Disconnected
+    return line.decode(errors='replace').rstrip('\r\n')
+
+
+async def prompt_player(connection: dict, prompt: str) -> str:
+    """
+    Show a prompt to the player and wait for their answer.
+
+    :param connection: a connection dictionary created by make_connection
+    :param prompt: a string shown to the player
+    :precondition: must run on the event loop that owns the connection
+    :postcondition: send everything the session printed, followed by the prompt
+    :return: the answer as a string
+    :raises Disconnected: if the player leaves instead of answering
+    """
+    connection["Output"].write(prompt)
+    connection["Output"].flush()
+    return await read_answer(connection)
+
+
+async def play_remote_game(connection: dict, clock_mode: str, terminal_size: tuple[int, int] | None = None,
+                     save_directory: str | None = None, recording_directory: str | None = None) -> None:
+    """
+    Play one game with a remote player.
+
+    :param connection: a connection dictionary created by make_connection
+    :param clock_mode: a string naming the clock mode of the session, one of 'real', 'scaled', or 'virtual'
+    :param terminal_size: the (columns, lines) of the player's terminal, or None to print every board in full
+    :param save_directory: a string naming the directory to save the game in if the player leaves, or None
+    :param recording_directory: a string naming the directory to record the game in, or None
+    :precondition: must run in a task of the event loop that owns the connection
+    :precondition: sys.stdout must be a SessionOutput
+    :postcondition: play the game until it ends or the player leaves
+    :postcondition: send everything the session printed to the player
+    """
+    with remote(lambda prompt, topic: prompt_player(connection, prompt), connection["Output"],
+                make_clock(clock_mode)):
+        try:
+            if terminal_size is None:
+                await game(save_directory, recording_directory)
+            else:
+                with use_renderer(make_renderer(lambda: terminal_size)):
+                    await game(save_directory, recording_directory)
+        except Disconnected:
+            pass
+        finally:
+            connection["Output"].flush()
+
+
+async def serve_player(state: dict, reader, writer) -> None:
+    """
+    Serve one connection from its first byte to its last.
+
+    :param state: a server state dictionary created by make_server_state
+    :param reader: an asyncio.StreamReader for the player's input
+    :param writer: an asyncio.StreamWriter for the player's output
+    :postcondition: turn the player away if the server already has as many sessions as it may
+    :postcondition: otherwise play a game with the player in this task
+    :postcondition: close the connection when the game ends
+    """
+    if state["Sessions"] >= state["Max Sessions"]:
+        writer.write("The server is full. Please try again later.\r\n".encode())
+    else:
+        state["Sessions"] += 1
+        connection = make_connection(reader, writer, state["Idle Timeout"])
+        try:
+            await play_remote_game(connection, state["Clock Mode"], state["Terminal Size"], state["Save Directory"],
+                                   state["Recording Directory"])
+        finally:
+            state["Sessions"] -= 1
+            state["Writes"] += connection["Output"].writes
+            state["Sends"] += connection["Output"].flushes
+    try:
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+    except ConnectionError:
+        pass
+
+
+async def start_server(state: dict, host: str = '127.0.0.1', port: int = 0):
+    """
+    Start accepting players over TCP.
+
+    Every connection plays its own game, in a telnet-style line mode: the server sends text and prompts, and the
+    player answers with one line per prompt.
+
+    :param state: a server state dictionary created by make_server_state
+    :param host: a string naming the interface to listen on
+    :param port: a non-negative integer naming the port to listen on, or 0 to pick a free one
+    :precondition: must run on an event loop
+    :postcondition: replace sys.stdout with a SessionOutput, so that every session prints to its own player
+    :return: the asyncio.Server that accepts the connections
+    """
+    if not isinstance(sys.stdout, SessionOutput):
+        sys.stdout = SessionOutput(sys.stdout)
+    return await asyncio.start_server(partial(serve_player, state), host, port, limit=MAX_LINE_LENGTH)
+
+
+async def serve_forever(host: str, port: int) -> None:
+    """
+    Run a game server until it is interrupted.
+
+    :param host: a string naming the interface to listen on
+    :param port: a non-negative integer naming the port to listen on
+    """
+    server = await start_server(make_server_state(), host, port)
+    for sock in server.sockets:
+        print("🐾 Serving BaekGu on %s:%d" % sock.getsockname()[:2], file=sys.__stdout__)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    """
+    Drive the program.
+    """
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 2323
+    try:
+        asyncio.run(serve_forever('0.0.0.0', port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,450 @@
+import ast
+import re
+import string
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+
+from console import headless, run_sync
+from content import final_level
+from game import make_session, take_turn
+from helpers import is_alive
+from minigames.battle import SKILL_USAGE_LIMIT
+from minigames.hangman import check_character_level_hangman
+from pathfinding import MOVES, level_distances
+from rng import current_rng, make_rng, stream_seed, use_rng
+
+LETTERS_BY_FREQUENCY = 'etaoinsrhldcumfpgwybvkxjqz'
+BATTLE_TOPICS = ('battle', 'skill', 'item')
+HANGMAN_PATTERN = re.compile(r'^[a-z_](?: [a-z_]){3,}$', re.MULTILINE)
+MEMORY_SEQUENCE = re.compile(r'^Memorize the given directions:\n(\[.*\])$', re.MULTILINE)
+
+
+class PlayerScreen:
+    """
+    A writable text stream that keeps what the game printed since the player last answered, as a screen would show it.
+    """
+    __slots__ = ('output', 'chunks', 'write')
+
+    def __init__(self, output=None):
+        """
+        Initialize the screen.
+
+        Without an output to pass the text on to, writing is a bare list append, so keeping the screen costs the game
+        next to nothing.
+
+        :param output: a writable text stream to pass everything written on to, or None to keep it only on the screen
+        """
+        self.output = output
+        self.chunks = []
+        self.write = self.chunks.append if output is None else self.write_through
+
+    def write_through(self, text: str) -> int:
+        """
+        Keep the text until the screen is next read, and pass it on to the output.
+        """
+        self.chunks.append(text)
+        return self.output.write(text)
+
+    def flush(self) -> None:
+        """
+        Flush the stream the text is passed on to, if there is one.
+        """
+        if self.output is not None:
+            self.output.flush()
+
+    def read(self) -> str:
+        """
+        Take everything written since the screen was last read.
+
+        >>> screen = PlayerScreen()
+        >>> print('hello', file=screen)
+        >>> screen.read(), screen.read()
+        ('hello\\n', '')
+        """
+        text = ''.join(self.chunks)
+        self.chunks.clear()
+        return text
+
+
+def is_ready_for_goal(character: dict) -> bool:
+    """
+    Check whether the character has everything needed to clear its current level at the goal cell.
+
+    :param character: a well-formed character dictionary
+    :precondition: character must have 'Stat' with 'Level', 'Exp', and 'Max Exp', and 'Inventory' with 'Key'
+    :postcondition: decide whether walking to the goal cell would clear the level or start the boss fight
+    :return: True if the character has enough Exp, and a key when one is needed, which is on every level but the last
+
+    >>> max_exp = {'Level 1': 1000, 'Level 2': 1300, 'Level 3': 1500}
+    >>> is_ready_for_goal({'Stat': {'Level': 1, 'Exp': 1000, 'Max Exp': max_exp}, 'Inventory': {'Key': 1}})
+    True
+    >>> is_ready_for_goal({'Stat': {'Level': 2, 'Exp': 1300, 'Max Exp': max_exp}, 'Inventory': {'Key': 0}})
+    False
+    >>> is_ready_for_goal({'Stat': {'Level': 3, 'Exp': 1500, 'Max Exp': max_exp}, 'Inventory': {'Key': 0}})
+    True
+    """
+    level = character['Stat']['Level']
+    has_exp = character['Stat']['Exp'] >= character['Stat']['Max Exp'][f'Level {level}']
+    return has_exp and (level == final_level() or character['Inventory']['Key'] >= 1)
+
+
+def random_policy(topic: str, session: dict, memory: dict) -> str:
+    """
+    Answer a prompt the way a player mashing keys would.
+
+    :param topic: a string naming the kind of question being asked
+    :param session: a session dictionary created by make_session
+    :param memory: a dictionary the policy may use to remember things between prompts
+    :precondition: topic must be one of the topics passed to console.ask
+    :postcondition: pick a random answer that the game accepts for the topic
+    :postcondition: remember the letters already guessed in the current hangman game
+    :return: the answer as a string
+
+    >>> random_policy('item', {}, {})
+    'q'
+    >>> random_policy('direction', {}, {}) in 'wasd'
+    True
+    """
+    if topic == 'direction':
+        return current_rng().choice('wasd')
+    elif topic == 'battle':
+        return current_rng().choice(['1', '2'])
+    elif topic == 'skill':
+        return current_rng().choice(list(session['Character']['Skill']['Current Skills']))
+    elif topic == 'guess':
+        if memory.get('Last Topic') != 'guess':
+            memory['Guessed'] = set()
+        letter = current_rng().choice([letter for letter in string.ascii_lowercase if letter not in memory['Guessed']])
+        memory['Guessed'].add(letter)
+        return letter
+    elif topic == 'memory':
+        return current_rng().choice('ADSW')
+    elif topic == 'item':
+        return 'q'
+    elif topic == 'menu':
+        return '1'
+    return ''
+
+
+def fitting_words(words: list[str], screen: str, guessed: set[str]) -> list[str]:
+    """
+    Keep the hangman words that still fit what the screen shows.
+
+    A word fits when it is as long as the last pattern of letters and blanks on the screen, has the shown letters
+    where they are shown, and has none of the guessed letters under a blank. Before any pattern is shown, every word
+    fits.
+
+    :param words: a list of strings of lowercase letters the hidden word may be one of
+    :param screen: a string of what the game printed since the last guess
+    :param guessed: a set of the letters already guessed in the round
+    :return: the words that fit as a new list, in the order of words
+
+    >>> fitting_words(['book', 'cook', 'cool', 'tree'], '_ o o _\\n', {'o', 'l'})
+    ['book', 'cook']
+    """
+    patterns = HANGMAN_PATTERN.findall(screen)
+    if not patterns:
+        return list(words)
+    pattern = patterns[-1].split(' ')
+    return [word for word in words if len(word) == len(pattern) and
+            all(shown == letter if shown != '_' else letter not in guessed for shown, letter in zip(pattern, word))]
+
+
+def hangman_letter(words: list[str], guessed: set[str]) -> str:
+    """
+    Pick the letter found in the most of the words that may be hidden, guessing the letters most common in English
+    first when that is a tie.
+
+    :param words: a list of strings of lowercase letters
+    :param guessed: a set of the letters already guessed in the round
+    :precondition: guessed must not hold every letter from a to z
+    :return: a letter from a to z that is not in guessed
+
+    >>> hangman_letter(['book', 'cook'], {'o'}), hangman_letter([], {'e'})
+    ('k', 't')
+    """
+    counts = Counter(letter for word in words for letter in set(word))
+    return max((letter for letter in LETTERS_BY_FREQUENCY if letter not in guessed), key=lambda letter: counts[letter])
+
+
+def greedy_policy(topic: str, session: dict, memory: dict) -> str:
+    """
+    Answer a prompt the way a sensible player would.
+
+    The player wanders around the board to meet challengers until it can clear the level, then walks straight to the
+    goal, reading each step from the level's cached distance field instead of searching the board. In battle it uses
+    its strongest skill while uses remain and drinks an HP potion when its HP is low. Like a player reading the
+    screen, it guesses the hangman letter found in the most of the level's words that still fit the revealed letters,
+    and repeats the memory game's sequence as it was shown.
+
+    :param topic: a string naming the kind of question being asked
+    :param session: a session dictionary created by make_session
+    :param memory: a dictionary the policy may use to remember things between prompts, with what the game printed
+    since the last prompt under "Screen" if play_headless is playing
+    :precondition: topic must be one of the topics passed to console.ask
+    :postcondition: pick an answer that the game accepts for the topic
+    :postcondition: remember the skill uses of the current battle, the letters guessed and the words still possible in
+    the current hangman game, and the sequence of the current memory game
+    :return: the answer as a string
+
+    >>> session = {'Character': {'Stat': {'Level': 3}}}
+    >>> greedy_policy('guess', session, {'Screen': '_ _ _ _\\n'}) in 'abcdefghijklmnopqrstuvwxyz'
+    True
+    >>> greedy_policy('memory', session, {'Screen': "Memorize the given directions:\\n['S', 'W']\\n"})
+    'S'
+    """
+    if topic == 'direction':
+        character = session['Character']
+        level = character['Stat']['Level']
+        if is_ready_for_goal(character):
+            direction = level_distances(level).next_direction(*session['Location'])
+            if direction is not None:
+                return direction
+        row, col = session['Location']
+        board = session['Grid']
+        return current_rng().choice([direction for direction, (row_step, col_step) in MOVES.items()
+                                     if board.is_passable(row + row_step, col + col_step)])
+    elif topic in BATTLE_TOPICS:
+        if memory.get('Last Topic') not in BATTLE_TOPICS:
+            memory['Skill Uses'] = 0
+        stat, inventory = session['Character']['Stat'], session['Character']['Inventory']
+        needs_potion = stat['Current HP'] * 3 <= stat['HP'] and inventory['HP Potion'] > 0
+        if topic == 'item':
+            return '1' if needs_potion else 'q'
+        elif topic == 'skill':
+            memory['Skill Uses'] += 1
+            skills = session['Character']['Skill']['Current Skills']
+            return max(skills, key=lambda skill: skills[skill]['Damage'])
+        elif needs_potion:
+            return '5'
+        return '2' if memory['Skill Uses'] < SKILL_USAGE_LIMIT else '1'
+    elif topic == 'guess':
+        if memory.get('Last Topic') != 'guess':
+            memory['Guessed'] = set()
+            memory['Candidates'] = check_character_level_hangman(session['Character'])
+        memory['Candidates'] = fitting_words(memory['Candidates'], memory.get('Screen', ''), memory['Guessed'])
+        letter = hangman_letter(memory['Candidates'], memory['Guessed'])
+        memory['Guessed'].add(letter)
+        return letter
+    elif topic == 'memory':
+        if memory.get('Last Topic') != 'memory':
+            shown = MEMORY_SEQUENCE.findall(memory.get('Screen', ''))
+            memory['Sequence'] = ast.literal_eval(shown[-1]) if shown else []
+            memory['Matched'] = 0
+        sequence, matched = memory['Sequence'], memory['Matched']
+        memory['Matched'] += 1
+        return sequence[matched] if matched < len(sequence) else current_rng().choice('ADSW')
+    elif topic == 'menu':
+        return '1'
+    return ''
+
+
+def play_headless(policy=greedy_policy, seed: int | None = None, max_turns: int = 10000, output=None) -> dict:
+    """
+    Play one complete game without a terminal, answering every prompt with a policy.
+
+    Nothing is printed unless an output is given, and no pause is waited for, so a playthrough only costs the time of
+    the game logic. What the game printed since the last prompt is handed to the policy under the "Screen" key of
+    its memory, as a player would read it off the screen. The game and the policy draw their random numbers from
+    separate streams split from the seed, so a change to how often a policy rolls the dice never changes what the game
+    rolls.
+
+    :param policy: a function that takes a topic, a session dictionary, and a memory dictionary and returns an answer
+    :param seed: an integer to seed the playthrough's generators with, or None to use the current generator
+    :param max_turns: the maximum number of turns to play before giving up
+    :param output: a writable text stream for everything the game prints, or None to discard it
+    :precondition: policy must answer every topic asked by the game with an answer the game accepts
+    :precondition: max_turns must be a positive integer
+    :postcondition: play turns until the character wins, runs out of Hearts, or max_turns is reached
+    :return: a dictionary with "Won", "Turns", "Hearts Lost", "Steps Per Level" and "Encounters" as keys
+
+    >>> result = play_headless(seed=1510)
+    >>> sorted(result)
+    ['Encounters', 'Hearts Lost', 'Steps Per Level', 'Turns', 'Won']
+    >>> result == play_headless(seed=1510)
+    True
+    """
+    game_rng = current_rng() if seed is None else make_rng(stream_seed(seed, 'game'))
+    policy_rng = current_rng() if seed is None else make_rng(stream_seed(seed, 'policy'))
+    memory = {}
+    screen = PlayerScreen(output)
+
+    def answer(_, topic):
+        memory['Screen'] = screen.read()
+        with use_rng(policy_rng):
+            reply = policy(topic, session, memory)
+        memory['Last Topic'] = topic
+        return reply
+
+    result = {
+        "Won": False,
+        "Turns": 0,
+        "Hearts Lost": 0,
+        "Steps Per Level": dict.fromkeys(range(1, final_level() + 1), 0),
+        "Encounters": {'battle': 0, 'hangman': 0, 'memory game': 0}
+    }
+    with use_rng(game_rng), headless(answer, output=screen):
+        session = make_session()
+        character = session['Character']
+        while is_alive(character) and not session['Achieved Goal'] and result['Turns'] < max_turns:
+            result['Steps Per Level'][character.level] += 1
+            challenge = run_sync(take_turn(session))
+            if challenge is not None:
+                result['Encounters'][challenge] += 1
+            result['Turns'] += 1
+    result['Won'] = session['Achieved Goal']
+    result['Hearts Lost'] = character.max_heart - character.heart
+    return result
+
+
+def playthrough_seed(seed: int, index: int) -> int:
+    """
+    Derive the seed of one playthrough of a simulation.
+
+    Every playthrough gets its own seed from the simulation seed and its index alone, so a simulation gives the same
+    results however its playthroughs are split between worker processes.
+
+    :param seed: a non-negative integer seeding the whole simulation
+    :param index: a non-negative integer smaller than 2 ** 32 numbering the playthrough
+    :precondition: seed and index must be non-negative integers
+    :postcondition: give different playthroughs of different simulations different seeds
+    :return: the seed of the playthrough as an integer
+
+    >>> playthrough_seed(0, 5)
+    5
+    >>> playthrough_seed(1, 5)
+    4294967301
+    """
+    return (seed << 32) | index
+
+
+def combine_tallies(tallies: list[dict]) -> dict:
+    """
+    Add up tallies of playthroughs.
+
+    :param tallies: a list of tally dictionaries
+    :precondition: every tally must have "Playthroughs", "Wins", "Hearts Lost", "Steps Per Level", and "Encounters"
+    keys, where "Steps Per Level" and "Encounters" are dictionaries of integers, and "Steps Per Level" has a key for
+    each level of the content pack
+    :postcondition: add up each key of the tallies, and each sub key of the nested dictionaries
+    :return: a tally dictionary of all the playthroughs
+
+    >>> first = {'Playthroughs': 1, 'Wins': 1, 'Hearts Lost': 2, 'Steps Per Level': {1: 10, 2: 5, 3: 1},
+    ...          'Encounters': {'battle': 2, 'hangman': 1, 'memory game': 0}}
+    >>> second = {'Playthroughs': 1, 'Wins': 0, 'Hearts Lost': 10, 'Steps Per Level': {1: 40, 2: 0, 3: 0},
+    ...           'Encounters': {'battle': 3, 'hangman': 0, 'memory game': 4}}
+    >>> combine_tallies([first, second]) # doctest: +NORMALIZE_WHITESPACE
+    {'Playthroughs': 2, 'Wins': 1, 'Hearts Lost': 12, 'Steps Per Level': {1: 50, 2: 5, 3: 1},
+    'Encounters': {'battle': 5, 'hangman': 1, 'memory game': 4}}
+    """
+    total = {
+        "Playthroughs": 0,
+        "Wins": 0,
+        "Hearts Lost": 0,
+        "Steps Per Level": dict.fromkeys(range(1, final_level() + 1), 0),
+        "Encounters": {'battle': 0, 'hangman': 0, 'memory game': 0}
+    }
+    for tally in tallies:
+        for key in ["Playthroughs", "Wins", "Hearts Lost"]:
+            total[key] += tally[key]
+        for key in ["Steps Per Level", "Encounters"]:
+            for sub_key, count in tally[key].items():
+                total[key][sub_key] += count
+    return total
+
+
+def play_chunk(policy, seed: int, start: int, stop: int) -> dict:
+    """
+    Play a chunk of the playthroughs of a simulation and tally them.
+
+    :param policy: a function that takes a topic, a session dictionary, and a memory dictionary and returns an answer
+    :param seed: a non-negative integer seeding the whole simulation
+    :param start: the index of the first playthrough of the chunk
+    :param stop: the index after the last playthrough of the chunk
+    :precondition: policy must be a module level function so that it can be sent to another process
+    :precondition: start and stop must be integers where 0 <= start <= stop
+    :postcondition: play the playthroughs numbered from start up to but not including stop
+    :return: a tally dictionary of the chunk
+
+    >>> play_chunk(greedy_policy, 0, 3, 5)['Playthroughs']
+    2
+    """
+    tallies = []
+    for index in range(start, stop):
+        result = play_headless(policy, playthrough_seed(seed, index))
+        tallies.append({
+            "Playthroughs": 1,
+            "Wins": int(result['Won']),
+            "Hearts Lost": result['Hearts Lost'],
+            "Steps Per Level": result['Steps Per Level'],
+            "Encounters": result['Encounters']
+        })
+    return combine_tallies(tallies)
+
+
+def simulate(count: int, seed: int = 0, policy=greedy_policy, workers: int | None = None,
+             chunk_size: int | None = None) -> dict:
+    """
+    Play many seeded headless playthroughs across processes and summarize them.
+
+    The playthroughs are split into chunks that worker processes play and tally on their own, so only one small tally
+    per chunk travels back to this process. Each playthrough is seeded from the simulation seed and its own index, so
+    the summary only depends on count, seed, and policy.
+
+    :param count: the number of playthroughs to play
+    :param seed: a non-negative integer seeding the whole simulation
+    :param policy: a function that takes a topic, a session dictionary, and a memory dictionary and returns an answer
+    :param workers: the number of worker processes, or None to use one for each CPU core
+    :param chunk_size: the number of playthroughs given to a worker at a time, or None to pick one from count and
+    workers
+    :precondition: count must be a positive integer
+    :precondition: policy must be a module level function so that it can be sent to another process
+    :precondition: workers and chunk_size must be positive integers or None
+    :postcondition: play count playthroughs, in this process if workers is 1
+    :return: a dictionary with "Playthroughs", "Win Rate", "Hearts Lost", "Steps Per Level", and "Encounters" as
+    keys, where hearts lost and steps per level are averages over the playthroughs and encounters are totals
+
+    >>> summary = simulate(4, seed=1510, workers=1)
+    >>> summary == simulate(4, seed=1510, workers=2, chunk_size=1)
+    True
+    >>> summary['Playthroughs']
+    4
+    """
+    workers = workers or cpu_count() or 1
+    chunk_size = chunk_size or max(1, count // (workers * 8))
+    starts = range(0, count, chunk_size)
+    stops = [min(start + chunk_size, count) for start in starts]
+    policies, seeds = [policy] * len(starts), [seed] * len(starts)
+    if workers == 1:
+        tallies = list(map(play_chunk, policies, seeds, starts, stops))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            tallies = list(executor.map(play_chunk, policies, seeds, starts, stops))
+
+    total = combine_tallies(tallies)
+    return {
+        "Playthroughs": total['Playthroughs'],
+        "Win Rate": total['Wins'] / total['Playthroughs'],
+        "Hearts Lost": total['Hearts Lost'] / total['Playthroughs'],
+        "Steps Per Level": {level: steps / total['Playthroughs'] for level, steps in total['Steps Per Level'].items()},
+        "Encounters": total['Encounters']
+    }
+
+
+def main():
+    """
+    Drive the program.
+    """
+    summary = simulate(1000)
+    print(f"Played {summary['Playthroughs']} headless playthroughs.\n"
+          f"Win rate          : {summary['Win Rate']:.1%}\n"
+          f"Hearts lost       : {summary['Hearts Lost']:.2f}\n"
+          "Steps per level   : " + ", ".join(f"Level {level} {steps:.1f}"
+                                            for level, steps in summary['Steps Per Level'].items()) + "\n"
+          "Encounters        : " + ", ".join(f"{challenge} {count}"
+                                            for challenge, count in summary['Encounters'].items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+import hashlib
+import os
+import struct
+import tempfile
+
+from board import Board
+from character import ITEMS, Character
+
+MAGIC = b'BKGS'
+SNAPSHOT_VERSION = 1
+HEADER = struct.Struct('<4sH')
+STATS = struct.Struct('<9i')
+INVENTORY = struct.Struct(f'<{len(ITEMS)}i')
+COORDINATES = struct.Struct('<ii')
+SIZE = struct.Struct('<II')
+LENGTH = struct.Struct('<H')
+COUNT = struct.Struct('<B')
+DAMAGE = struct.Struct('<i')
+FLAG = struct.Struct('<?')
+STAT_NAMES = ('hp', 'current_hp', 'level', 'exp', 'heart', 'max_heart', 'hunger', 'max_hunger', 'basic_attack')
+SAVE_DIRECTORY = 'saves'
+
+
+def pack_string(text: str) -> bytes:
+    """
+    Encode a string with its length in front.
+
+    >>> pack_string('Bark')
+    b'\\x04\\x00Bark'
+    """
+    encoded = text.encode()
+    return LENGTH.pack(len(encoded)) + encoded
+
+
+def unpack_string(data: bytes, offset: int) -> tuple[str, int]:
+    """
+    Decode a string written by pack_string.
+
+    :return: the string and the offset just after it
+
+    >>> unpack_string(b'\\x04\\x00Bark', 0)
+    ('Bark', 6)
+    """
+    (length,) = LENGTH.unpack_from(data, offset)
+    offset += LENGTH.size
+    if offset + length > len(data):
+        raise ValueError("The snapshot ends in the middle of a string.")
+    return data[offset:offset + length].decode(), offset + length
+
+
+def pack_skills(skills: dict) -> bytes:
+    """
+    Encode a dictionary of skills, each with a damage and a description.
+
+    >>> unpack_skills(pack_skills({'Bark': {'Damage': 25, 'Description': 'A loud bark'}}), 0)[0]
+    {'Bark': {'Damage': 25, 'Description': 'A loud bark'}}
+    """
+    parts = [COUNT.pack(len(skills))]
+    for name, skill in skills.items():
+        parts += [pack_string(name), DAMAGE.pack(skill['Damage']), pack_string(skill['Description'])]
+    return b''.join(parts)
+
+
+def unpack_skills(data: bytes, offset: int) -> tuple[dict, int]:
+    """
+    Decode a dictionary of skills written by pack_skills.
+
+    :return: the skills and the offset just after them
+    """
+    (count,) = COUNT.unpack_from(data, offset)
+    offset += COUNT.size
+    skills = {}
+    for _ in range(count):
+        name, offset = unpack_string(data, offset)
+        (damage,) = DAMAGE.unpack_from(data, offset)
+        description, offset = unpack_string(data, offset + DAMAGE.size)
+        skills[name] = {"Damage": damage, "Description": description}
+    return skills, offset
+
+
+def dump_session(session: dict) -> bytes:
+    """
+    Turn a session into a compact binary snapshot.
+
+    The snapshot starts with a magic number and a format version, followed by the skill set, the character, the
+    board, the character's location, the cell under the character, and whether the goal was achieved.
+
+    :param session: a session dictionary
+    :precondition: session must be shaped like the dictionary make_session returns
+    :postcondition: leave the session unchanged
+    :return: the snapshot as bytes
+
+    >>> from game import make_session
+    >>> snapshot = dump_session(make_session())
+    >>> snapshot[:4], len(snapshot) < 1024
+    (b'BKGS', True)
+    """
+    character, grid = session['Character'], session['Grid']
+    if not isinstance(character, Character):
+        character = Character.from_dict(character)
+    if not isinstance(grid, Board):
+        grid = Board.from_lists(grid)
+    skill_set = session['Skill Set']
+    parts = [HEADER.pack(MAGIC, SNAPSHOT_VERSION), COUNT.pack(len(skill_set))]
+    for level, skills in skill_set.items():
+        parts += [pack_string(level), pack_skills(skills)]
+    parts += [STATS.pack(*(getattr(character, name) for name in STAT_NAMES)), INVENTORY.pack(*character.inventory),
+              pack_skills(character.current_skills), SIZE.pack(grid.height, grid.width), bytes(grid.cells),
+              bytes(grid.passable), COORDINATES.pack(*(grid.player or (-1, -1))),
+              COORDINATES.pack(*session['Location']), pack_string(session['Previous Cell']),
+              FLAG.pack(session['Achieved Goal'])]
+    return b''.join(parts)
+
+
+def load_session(data: bytes) -> dict:
+    """
+    Rebuild a session from a binary snapshot.
+
+    :param data: bytes written by dump_session
+    :postcondition: share no objects with any other session
+    :return: a session dictionary like the one make_session returns
+    :raises ValueError: if data is not a snapshot, was written by an unknown version of the format, or is cut short
+
+    >>> from game import make_session
+    >>> session = make_session()
+    >>> load_session(dump_session(session))['Skill Set'] == session['Skill Set']
+    True
+    >>> load_session(b'not a snapshot')
+    Traceback (most recent call last):
+        ...
+    ValueError: This is not a BaekGu session snapshot.
+    """
+    try:
+        magic, version = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("This is not a BaekGu session snapshot.")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Snapshot version {version} is not supported. This game reads version "
+                             f"{SNAPSHOT_VERSION}.")
+        offset = HEADER.size
+        (level_count,) = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        skill_set = {}
+        for _ in range(level_count):
+            level, offset = unpack_string(data, offset)
+            skill_set[level], offset = unpack_skills(data, offset)
+        stats = STATS.unpack_from(data, offset)
+        offset += STATS.size
+        inventory = list(INVENTORY.unpack_from(data, offset))
+        current_skills, offset = unpack_skills(data, offset + INVENTORY.size)
+        height, width = SIZE.unpack_from(data, offset)
+        offset += SIZE.size
+        cell_count, bitmap_size = height * width, -(-height * width // 8)
+        cells = bytearray(data[offset:offset + cell_count])
+        passable = bytearray(data[offset + cell_count:offset + cell_count + bitmap_size])
+        offset += cell_count + bitmap_size
+        if len(cells) != cell_count or len(passable) != bitmap_size:
+            raise ValueError("The snapshot is cut short.")
+        player = COORDINATES.unpack_from(data, offset)
+        location = COORDINATES.unpack_from(data, offset + COORDINATES.size)
+        previous_cell, offset = unpack_string(data, offset + 2 * COORDINATES.size)
+        (achieved_goal,) = FLAG.unpack_from(data, offset)
+    except struct.error as error:
+        raise ValueError("The snapshot is cut short.") from error
+    return {
+        "Grid": Board(height, width, cells, passable, None if player == (-1, -1) else player),
+        "Location": location,
+        "Previous Cell": previous_cell,
+        "Skill Set": skill_set,
+        "Character": Character(**dict(zip(STAT_NAMES, stats)), current_skills=current_skills, inventory=inventory),
+        "Achieved Goal": achieved_goal
+    }
+
+
+def save_path(directory: str, user_name: str) -> str:
+    """
+    Name the file a player's session is saved to.
+
+    The file is named after a hash of the player's name, so any name makes a safe file name.
+
+    :param directory: a string naming the directory saves are kept in
+    :param user_name: a string representing a player's name
+    :return: the path of the player's save file as a string
+
+    >>> save_path('saves', 'Heather')
+    'saves/ed14016728b28383f3cf1a26cdee7343.sav'
+    """
+    return os.path.join(directory, hashlib.sha256(user_name.encode()).hexdigest()[:32] + '.sav')
+
+
+def write_snapshot(path: str, snapshot: bytes) -> None:
+    """
+    Write a snapshot to a file, replacing any earlier one in a single step.
+
+    :param path: a string naming the save file
+    :param snapshot: bytes written by dump_session
+    :postcondition: create the directory of path if it does not exist
+    :postcondition: never leave a half-written save file behind, even if the process stops while writing
+    :postcondition: write through a temporary file of its own, so that sessions saving at the same time in the threads
+    of one process never write into each other's temporary file
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile('wb', dir=directory, suffix='.tmp', delete=False) as save_file:
+        save_file.write(snapshot)
+    os.replace(save_file.name, path)
+
+
+def read_snapshot(path: str) -> dict | None:
+    """
+    Load the session saved in a file.
+
+    :param path: a string naming the save file
+    :return: the saved session dictionary, or None if there is no save file
+    :raises ValueError: if the file is not a snapshot this version of the game can read
+    """
+    try:
+        with open(path, 'rb') as save_file:
+            return load_session(save_file.read())
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,30 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from console import ask, headless, run_sync
+
+
+class TestAsk(TestCase):
+
+    @patch('builtins.input', return_value='3')
+    def test_ask_uses_input_at_terminal(self, mock_input):
+        actual = run_sync(ask("Enter the number of your choice: ", 'menu'))
+        expected = '3'
+        self.assertEqual(actual, expected)
+        mock_input.assert_called_once_with("Enter the number of your choice: ")
+
+    @patch('builtins.input')
+    def test_ask_uses_prompt_handler_when_headless(self, mock_input):
+        with headless(lambda prompt, topic: f'{topic}:{prompt}'):
+            actual = run_sync(ask("Guess a letter: ", 'guess'))
+        expected = 'guess:Guess a letter: '
+        self.assertEqual(actual, expected)
+        mock_input.assert_not_called()
+
+    @patch('builtins.input', return_value='w')
+    def test_ask_uses_input_again_after_headless(self, _):
+        with headless(lambda prompt, topic: 'q'):
+            pass
+        actual = run_sync(ask("Enter the direction you wish to travel (W/A/S/D): ", 'direction'))
+        expected = 'w'
+        self.assertEqual(actual, expected)
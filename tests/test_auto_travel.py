@@ -0,0 +1,61 @@
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from board import make_level_board
+from game import auto_travel, get_user_choice
+from console import run_sync
+
+
+class TestAutoTravel(TestCase):
+
+    def setUp(self):
+        self.character = {'Stat': {'Level': 1, 'Hunger': 10}, 'Skill': {}, 'Inventory': {}}
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_auto_travel_from_start(self, mock_output):
+        board = make_level_board(1)
+        board[1][1] = '🐶'
+        actual = auto_travel(self.character, board)
+        self.assertEqual(actual, 'd')
+        self.assertEqual(mock_output.getvalue(), "🧭 The goal is 22 step(s) away. You head right.\n")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_auto_travel_list_grid(self, mock_output):
+        grid = make_level_board(3).to_lists()
+        grid[4][3] = '🐶'
+        self.character['Stat']['Level'] = 3
+        actual = auto_travel(self.character, grid)
+        self.assertEqual(actual, 'd')
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_auto_travel_at_goal(self, mock_output):
+        board = make_level_board(1)
+        board[7][1] = '🐶'
+        actual = auto_travel(self.character, board)
+        self.assertIsNone(actual)
+        self.assertEqual(mock_output.getvalue(), "🧭 You are already at the goal.\n")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_auto_travel_without_character(self, mock_output):
+        actual = auto_travel(self.character, make_level_board(1))
+        self.assertIsNone(actual)
+        self.assertEqual(mock_output.getvalue(), "🧭 You can't find a way to the goal from here.\n")
+
+    @patch('builtins.input', side_effect=['7'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_auto_travel_from_menu(self, mock_output, _):
+        board = make_level_board(2)
+        board[1][1] = '🐶'
+        self.character['Stat']['Level'] = 2
+        direction, character = run_sync(get_user_choice(self.character, board))
+        self.assertEqual((direction, character), ('s', self.character))
+        self.assertIn("🧭 The goal is", mock_output.getvalue())
+
+    @patch('builtins.input', side_effect=['7', '1', 'w'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_auto_travel_from_menu_at_goal(self, mock_output, _):
+        board = make_level_board(1)
+        board[7][1] = '🐶'
+        direction, _ = run_sync(get_user_choice(self.character, board))
+        self.assertEqual(direction, 'w')
@@ -0,0 +1,89 @@
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from board import Board
+from game import make_character_location, move_character_valid_move
+from make_board_each_level import display_grid, make_board_lv1
+
+
+class TestBoard(TestCase):
+
+    def test_board_round_trips_grid(self):
+        grid = make_board_lv1()
+        actual = Board.from_lists(grid).to_lists()
+        self.assertEqual(actual, grid)
+
+    def test_board_passability_matches_walls(self):
+        grid = make_board_lv1()
+        board = Board.from_lists(grid)
+        actual = [[board.is_passable(row, col) for col in range(10)] for row in range(10)]
+        expected = [[cell != '#' for cell in row] for row in grid]
+        self.assertEqual(actual, expected)
+
+    def test_board_keeps_player_out_of_cells(self):
+        board = Board.from_lists(make_board_lv1())
+        make_character_location(board)
+        actual = (board.player, board[1][1], chr(board.cells[11]))
+        expected = ((1, 1), '🐶', '.')
+        self.assertEqual(actual, expected)
+
+    def test_board_overwriting_player_removes_it(self):
+        board = Board.from_lists(make_board_lv1())
+        board[1][1] = '🐶'
+        board[1][1] = '.'
+        self.assertIsNone(board.player)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_board_moves_like_grid(self, _):
+        grid = make_board_lv1()
+        board = Board.from_lists(grid)
+        character = {'Stat': {'Hunger': 10}}
+        grid_location, grid_previous = make_character_location(grid)
+        board_location, board_previous = make_character_location(board)
+        for direction in ['d', 'w', 'd', 's', 'd']:
+            grid_location, grid_previous, _, _ = move_character_valid_move(
+                grid, grid_location, direction, grid_previous, character)
+            board_location, board_previous, _, _ = move_character_valid_move(
+                board, board_location, direction, board_previous, character)
+        self.assertEqual((board_location, board_previous), (grid_location, grid_previous))
+        self.assertEqual(board.to_lists(), grid)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_board_move_reads_passability_bitmap(self, _):
+        board = Board.from_lists([['🐶', '.', '.']])
+        board.passable[0] &= ~0b10
+        actual = move_character_valid_move(board, (0, 0), 'd', '.', {'Stat': {'Hunger': 10}})
+        expected = ((0, 0), '.', {'Stat': {'Hunger': 10}}, False)
+        self.assertEqual(actual, expected)
+        self.assertEqual((board.player, bytes(board.cells)), ((0, 0), b'...'))
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_board_displays_like_grid(self, mock_output):
+        grid = make_board_lv1()
+        make_character_location(grid)
+        display_grid(grid)
+        expected = mock_output.getvalue()
+        mock_output.seek(0)
+        mock_output.truncate()
+        display_grid(Board.from_lists(grid))
+        actual = mock_output.getvalue()
+        self.assertEqual(actual, expected)
+
+    def test_board_rejects_wide_characters(self):
+        board = Board.from_lists(make_board_lv1())
+        with self.assertRaises(ValueError):
+            board[1][1] = '🐱'
+
+    def test_board_cell_out_of_range(self):
+        board = Board.from_lists(make_board_lv1())
+        with self.assertRaises(IndexError):
+            _ = board[10][0]
+        with self.assertRaises(IndexError):
+            _ = board[0][10]
+
+    def test_board_large_without_per_cell_objects(self):
+        board = Board.from_lists([['.'] * 2000])
+        actual = (len(board.cells), len(board.passable))
+        expected = (2000, 250)
+        self.assertEqual(actual, expected)
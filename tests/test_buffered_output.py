@@ -0,0 +1,51 @@
+import sys
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from console import BufferedOutput, ask, buffered_output, headless, pause, run_sync
+
+
+class TestBufferedOutput(TestCase):
+
+    def test_buffered_output_holds_text_until_flush(self):
+        stream = MagicMock()
+        output = BufferedOutput(stream)
+        print("You moved one step up.", file=output)
+        print("Everything seems quiet.", file=output)
+        stream.write.assert_not_called()
+        output.flush()
+        stream.write.assert_called_once_with("You moved one step up.\nEverything seems quiet.\n")
+
+    def test_buffered_output_empty_flush_writes_nothing(self):
+        stream = MagicMock()
+        BufferedOutput(stream).flush()
+        stream.write.assert_not_called()
+
+    @patch('time.sleep')
+    def test_buffered_output_flushed_by_pause(self, _):
+        stream = MagicMock()
+        with headless(lambda prompt, topic: '', output=BufferedOutput(stream)):
+            print("💤 You are going to sleep for 10 second(s) to regain energy.")
+            print("Zzz...")
+            run_sync(pause(10))
+        stream.write.assert_called_once_with("💤 You are going to sleep for 10 second(s) to regain energy.\nZzz...\n")
+
+    @patch('builtins.input', side_effect=lambda prompt: sys.stdout.flush() or '1')
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_buffered_output_one_write_before_prompt(self, mock_output, _):
+        with buffered_output() as output:
+            print("# # #")
+            print("# 🐶 #")
+            print("# # #")
+            answer = run_sync(ask("Enter the number of your choice: ", 'menu'))
+            self.assertEqual(output.flushes, 1)
+        self.assertEqual(answer, '1')
+        self.assertEqual(mock_output.getvalue(), "# # #\n# 🐶 #\n# # #\n")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_buffered_output_flushes_and_restores_on_exit(self, mock_output):
+        with buffered_output():
+            print("Game over!")
+        self.assertIs(sys.stdout, mock_output)
+        self.assertEqual(mock_output.getvalue(), "Game over!\n")
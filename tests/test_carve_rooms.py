@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+import numpy as np
+
+from map_generator import carve_rooms
+
+
+def joined_rooms(east: np.ndarray, north: np.ndarray) -> int:
+    rows, cols = east.shape
+    parent = list(range(rows * cols))
+
+    def find(room):
+        while parent[room] != room:
+            parent[room] = parent[parent[room]]
+            room = parent[room]
+        return room
+
+    for row in range(rows):
+        for col in range(cols):
+            if east[row, col]:
+                parent[find(row * cols + col)] = find(row * cols + col + 1)
+            if north[row, col]:
+                parent[find(row * cols + col)] = find((row - 1) * cols + col)
+    return len({find(room) for room in range(rows * cols)})
+
+
+class TestCarveRooms(TestCase):
+
+    def test_carve_rooms_joins_every_room(self):
+        for seed in range(10):
+            east, north = carve_rooms(20, 30, np.random.default_rng(seed))
+            self.assertEqual(joined_rooms(east, north), 1, seed)
+
+    def test_carve_rooms_first_row_is_one_run(self):
+        east, north = carve_rooms(4, 5, np.random.default_rng(1))
+        actual = (east[0].tolist(), north[0].any())
+        expected = ([True, True, True, True, False], False)
+        self.assertEqual(actual, expected)
+
+    def test_carve_rooms_last_column_closed_to_the_east(self):
+        east, _ = carve_rooms(50, 50, np.random.default_rng(2))
+        self.assertFalse(east[:, -1].any())
+
+    def test_carve_rooms_every_run_opens_north(self):
+        east, north = carve_rooms(50, 50, np.random.default_rng(3))
+        for row in range(1, 50):
+            run_open = False
+            for col in range(50):
+                run_open |= bool(north[row, col])
+                if not east[row, col]:
+                    self.assertTrue(run_open, (row, col))
+                    run_open = False
+
+    def test_carve_rooms_single_room(self):
+        east, north = carve_rooms(1, 1, np.random.default_rng(4))
+        self.assertEqual((east.tolist(), north.tolist()), ([[False]], [[False]]))
@@ -0,0 +1,76 @@
+from dataclasses import replace
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from character import Character
+from game import make_character
+from helpers import display_stats
+
+
+class TestCharacter(TestCase):
+
+    def setUp(self):
+        self.skill_set = {'Level 1': {'Bark': {'Damage': 25, 'Description': 'A loud bark that stuns the enemy'}}}
+
+    def test_character_round_trips_character_dictionary(self):
+        character = make_character(self.skill_set)
+        actual = Character.from_dict(character).to_dict()
+        self.assertEqual(actual, character)
+
+    def test_character_stat_view_writes_slots(self):
+        character = Character.from_dict(make_character(self.skill_set))
+        character['Stat']['Current HP'] -= 100
+        character['Stat']['Exp'] += 300
+        actual = (character.current_hp, character.exp)
+        expected = (150, 300)
+        self.assertEqual(actual, expected)
+
+    def test_character_inventory_view_writes_counters(self):
+        character = Character.from_dict(make_character(self.skill_set))
+        character['Inventory']['HP Potion'] += 2
+        character['Inventory']['Key'] = 1
+        actual = character.inventory
+        expected = [1, 2, 0]
+        self.assertEqual(actual, expected)
+
+    def test_character_views_compare_like_dictionaries(self):
+        character = make_character(self.skill_set)
+        actual = Character.from_dict(character)
+        self.assertEqual(actual['Stat'], character['Stat'])
+        self.assertEqual(actual['Skill'], character['Skill'])
+        self.assertEqual(actual['Inventory'], character['Inventory'])
+
+    def test_character_unknown_section(self):
+        with self.assertRaises(KeyError):
+            _ = Character()['Stats']
+
+    def test_character_unknown_item(self):
+        with self.assertRaises(KeyError):
+            _ = Character()['Inventory']['Bone']
+
+    def test_character_max_exp_cannot_change(self):
+        with self.assertRaises(TypeError):
+            Character()['Stat']['Max Exp'] = {}
+
+    def test_character_views_made_once(self):
+        character = Character.from_dict(make_character(self.skill_set))
+        views = [character[section] for section in ('Stat', 'Skill', 'Inventory')]
+        actual = [character[section] for section in ('Stat', 'Skill', 'Inventory')]
+        self.assertEqual([view is cached for view, cached in zip(views, actual)], [True, True, True])
+        self.assertEqual(character, replace(character))
+
+    def test_character_has_no_instance_dictionary(self):
+        with self.assertRaises(AttributeError):
+            Character().speed = 3
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_character_works_with_helpers(self, mock_output):
+        character = make_character(self.skill_set)
+        display_stats(character)
+        expected = mock_output.getvalue()
+        mock_output.seek(0)
+        mock_output.truncate()
+        display_stats(Character.from_dict(character))
+        actual = mock_output.getvalue()
+        self.assertEqual(actual, expected)
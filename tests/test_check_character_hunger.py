@@ -3,6 +3,7 @@ from unittest import TestCase
 from unittest.mock import patch
 
 from game import check_character_hunger
+from console import run_sync
 
 
 class TestCheckCharacterHunger(TestCase):
@@ -10,7 +11,7 @@ class TestCheckCharacterHunger(TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_check_character_hunger_zero_hunger(self, mock_output):
         character = {"Stat": {"Hunger": 0, "Max Hunger": 10}}
-        check_character_hunger(character)
+        run_sync(check_character_hunger(character))
         print_result = mock_output.getvalue()
         expected_result = ("⚠️⚠️⚠️ Oops! You have run out of energy. It's a nap time, Baekgu ⚠️⚠️⚠️\n"
                            "\n💤 You are going to sleep for 20 second(s) to regain energy."
@@ -39,36 +40,36 @@ class TestCheckCharacterHunger(TestCase):
 
     def test_check_character_hunger_moderate_hunger(self):
         character = {"Stat": {"Hunger": 5, "Max Hunger": 10}}
-        actual = check_character_hunger(character)
+        actual = run_sync(check_character_hunger(character))
         expected = {'Stat': {'Hunger': 5, 'Max Hunger': 10}}
         self.assertEqual(actual, expected)
 
     def test_check_character_hunger_full_hunger(self):
         character = {"Stat": {"Hunger": 10, "Max Hunger": 10}}
-        actual = check_character_hunger(character)
+        actual = run_sync(check_character_hunger(character))
         expected = {'Stat': {'Hunger': 10, 'Max Hunger': 10}}
         self.assertEqual(actual, expected)
 
     def test_check_character_hunger_excessive_hunger(self):
         character = {"Stat": {"Hunger": 15, "Max Hunger": 10}}
-        actual = check_character_hunger(character)
+        actual = run_sync(check_character_hunger(character))
         expected = {'Stat': {'Hunger': 15, 'Max Hunger': 10}}
         self.assertEqual(actual, expected)
 
     def test_check_character_hunger_invalid_hunger(self):
         character = {"Stat": {"Hunger": 'a', "Max Hunger": 10}}
-        actual = check_character_hunger(character)
+        actual = run_sync(check_character_hunger(character))
         expected = {'Stat': {'Hunger': 'a', 'Max Hunger': 10}}
         self.assertEqual(actual, expected)
 
     def test_check_character_hunger_negative_hunger(self):
         character = {"Stat": {"Hunger": -5, "Max Hunger": 10}}
-        actual = check_character_hunger(character)
+        actual = run_sync(check_character_hunger(character))
         expected = {'Stat': {'Hunger': -5, 'Max Hunger': 10}}
         self.assertEqual(actual, expected)
 
     def test_check_character_hunger_fully_restored_hunger_after_sleep(self):
         character = {"Stat": {"Hunger": 0, "Max Hunger": 10}}
-        actual = check_character_hunger(character)
+        actual = run_sync(check_character_hunger(character))
         expected = {'Stat': {'Hunger': 10, 'Max Hunger': 10}}
         self.assertEqual(actual, expected)
@@ -1,5 +1,6 @@
 from unittest import TestCase
 from minigames.hangman import check_character_level_hangman, lists_of_words
+from minigames.hangman_solver import difficulty, solve_words
 
 
 class Test(TestCase):
@@ -9,7 +10,7 @@ class Test(TestCase):
         actual = check_character_level_hangman(character, lists)
         expected = ["garden", "silver", "branch", "butter", "turtle", "bridge", "rabbit", "pebble", "button", "stream",
                     "travel", "bottle", "winter", "flower", "basket", "orange", "desert", "magnet", "planet", "frozen",
-                    "safety", "forest", "guitar", "friend", "yellow", "ticket", "pencil", "bridge", "jungle", "school"]
+                    "safety", "forest", "guitar", "friend", "yellow", "ticket", "pencil", "jungle", "school"]
         self.assertEqual(actual, expected)
 
     def test_check_character_level_hangman_level_3(self):
@@ -20,3 +21,17 @@ class Test(TestCase):
                     "ball", "hand", "cake", "sing", "walk", "rain", "star", "wind", "read", "rock", "band", "ship",
                     "moon", "face", "line", "ride", "time", "life"]
         self.assertEqual(actual, expected)
+
+    def test_check_character_level_hangman_default_dictionary(self):
+        levels = [check_character_level_hangman({'Stat': {'Level': level}}) for level in (1, 2, 3)]
+        actual = sorted(word for words in levels for word in words)
+        expected = sorted(set(word for words in lists_of_words() for word in words))
+        self.assertEqual(actual, expected)
+
+    def test_check_character_level_hangman_default_dictionary_gets_harder(self):
+        results = solve_words(sorted(set(word for words in lists_of_words() for word in words)))
+        levels = [check_character_level_hangman({'Stat': {'Level': level}}) for level in (1, 2, 3)]
+        hardest = [max(difficulty(results[word]) for word in words) for words in levels]
+        easiest = [min(difficulty(results[word]) for word in words) for words in levels]
+        self.assertLessEqual(hardest[0], easiest[1])
+        self.assertLessEqual(hardest[1], easiest[2])
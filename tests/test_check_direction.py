@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+from minigames.matching_direction_game import check_direction
+
+
+class TestCheckDirection(TestCase):
+
+    def setUp(self):
+        self.memory_round = {'Sequence': ['A', 'D', 'S'], 'Matched': 0}
+
+    def test_check_direction_correct(self):
+        actual = check_direction(self.memory_round, 'A')
+        self.assertEqual(actual, 'correct')
+        self.assertEqual(self.memory_round['Matched'], 1)
+
+    def test_check_direction_ignores_case(self):
+        actual = check_direction(self.memory_round, 'a')
+        self.assertEqual(actual, 'correct')
+
+    def test_check_direction_wrong_keeps_count(self):
+        check_direction(self.memory_round, 'A')
+        actual = check_direction(self.memory_round, 'W')
+        self.assertEqual(actual, 'wrong')
+        self.assertEqual(self.memory_round['Matched'], 1)
+
+    def test_check_direction_complete(self):
+        actual = [check_direction(self.memory_round, answer) for answer in 'ADS']
+        expected = ['correct', 'correct', 'complete']
+        self.assertEqual(actual, expected)
+
+    def test_check_direction_more_than_one_letter(self):
+        actual = check_direction(self.memory_round, 'AD')
+        self.assertEqual(actual, 'wrong')
@@ -0,0 +1,117 @@
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+from board import level_template
+from content import load_content
+from game import check_final_goal
+from console import run_sync
+from pathfinding import level_distances, level_goal
+
+
+def clear_level_caches():
+    for cached in (level_template, level_goal, level_distances):
+        cached.cache_clear()
+
+
+class Test(TestCase):
+    def use_pack(self, change):
+        content = load_content()
+        pack = content | {key: dict(content[key]) for key in ('Skills', 'Boards', 'Levels', 'Max Exp')}
+        change(pack)
+        clear_level_caches()
+        self.addCleanup(clear_level_caches)
+        for target in ('content.load_content', 'make_board_each_level.load_content'):
+            patcher = patch(target, return_value=pack)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @patch('game.battle')
+    def test_character_fights_final_boss(self, mock_battle):
+        character = {
+            'Stat': {
+                'Level': 3,
+                'Exp': 100,
+                'Max Exp': {'Level 3': 100}
+            }
+        }
+        mock_battle.return_value = (character, True)
+        result = run_sync(check_final_goal((4, 4), character))
+        self.assertTrue(result)
+
+    @patch('game.battle')
+    def test_character_not_fights_wrong_location(self, mock_battle):
+        character = {
+            'Stat': {
+                'Level': 3,
+                'Exp': 100,
+                'Max Exp': {'Level 3': 100}
+            }
+        }
+        result = run_sync(check_final_goal((3, 3), character))
+        self.assertFalse(result)
+        mock_battle.assert_not_called()
+
+    @patch('game.battle')
+    def test_character_not_fights_insufficient_exp(self, mock_battle):
+        character = {
+            'Stat': {
+                'Level': 3,
+                'Exp': 50,
+                'Max Exp': {'Level 3': 100}
+            }
+        }
+        result = run_sync(check_final_goal((4, 4), character))
+        self.assertFalse(result)
+        mock_battle.assert_not_called()
+
+    @patch('game.battle')
+    def test_character_not_fights_wrong_level(self, mock_battle):
+        character = {
+            'Stat': {
+                'Level': 2,
+                'Exp': 100,
+                'Max Exp': {'Level 3': 100}
+            }
+        }
+        result = run_sync(check_final_goal((4, 4), character))
+        self.assertFalse(result)
+        mock_battle.assert_not_called()
+
+    @patch('sys.stdout', new_callable=StringIO)
+    @patch('game.battle')
+    def test_character_fights_at_moved_goal(self, mock_battle, _):
+        rows = ['##########', '#........#', '#........#', '######...#', '#....#...#', '#....#...#', '#....#...#',
+                '#..###...#', '#......!.#', '##########']
+        self.use_pack(lambda pack: pack['Boards'].update({3: tuple(rows)}))
+        character = {
+            'Stat': {
+                'Level': 3,
+                'Exp': 100,
+                'Max Exp': {'Level 3': 100}
+            }
+        }
+        mock_battle.return_value = (character, False)
+        actual = (run_sync(check_final_goal((4, 4), character)), run_sync(check_final_goal((8, 7), character)))
+        self.assertEqual(actual, (None, False))
+        mock_battle.assert_called_once_with(character, True)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    @patch('game.battle')
+    def test_character_fights_on_last_level_of_pack(self, mock_battle, _):
+        def add_level(pack):
+            pack['Boards'][4] = ('#####', '#...#', '#.#!#', '#####')
+            pack['Levels'][4] = {'Max Exp': 1800, 'HP Gain': 300, 'Description': 'THE ROOF'}
+            pack['Max Exp']['Level 4'] = 1800
+        self.use_pack(add_level)
+        character = {
+            'Stat': {
+                'Level': 3,
+                'Exp': 1800,
+                'Max Exp': {'Level 3': 1500, 'Level 4': 1800}
+            }
+        }
+        mock_battle.return_value = (character, True)
+        at_third = run_sync(check_final_goal((4, 4), character))
+        character['Stat']['Level'] = 4
+        at_fourth = run_sync(check_final_goal((2, 3), character))
+        self.assertEqual((at_third, at_fourth), (None, True))
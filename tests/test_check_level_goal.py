@@ -0,0 +1,154 @@
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from board import level_template
+from content import load_content
+from game import check_level_goal
+from pathfinding import level_distances, level_goal
+
+
+def clear_level_caches():
+    for cached in (level_template, level_goal, level_distances):
+        cached.cache_clear()
+
+
+class Test(TestCase):
+    def use_pack(self, change):
+        content = load_content()
+        pack = content | {key: dict(content[key]) for key in ('Skills', 'Boards', 'Levels', 'Max Exp')}
+        change(pack)
+        clear_level_caches()
+        self.addCleanup(clear_level_caches)
+        for target in ('content.load_content', 'make_board_each_level.load_content'):
+            patcher = patch(target, return_value=pack)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_check_level_goal_meets_requirements(self):
+        character = {
+            'Inventory': {'Key': 3},
+            'Stat': {
+                'Level': 1,
+                'Exp': 1350,
+                'Max Exp': {'Level 1': 1000, 'Level 2': 1300, 'Level 3': 1500}
+            }
+        }
+        actual = check_level_goal((7, 1), character)
+        expected = True
+        self.assertEqual(actual, expected)
+
+    def test_check_level_goal_second_level_meets_requirements(self):
+        character = {
+            'Inventory': {'Key': 3},
+            'Stat': {
+                'Level': 2,
+                'Exp': 1350,
+                'Max Exp': {'Level 1': 1000, 'Level 2': 1300, 'Level 3': 1500}
+            }
+        }
+        actual = check_level_goal((4, 8), character)
+        expected = True
+        self.assertEqual(actual, expected)
+
+    def test_check_level_goal_wrong_location(self):
+        character = {
+            'Inventory': {'Key': 3},
+            'Stat': {
+                'Level': 1,
+                'Exp': 1350,
+                'Max Exp': {'Level 1': 1000, 'Level 2': 1300, 'Level 3': 1500}
+            }
+        }
+        actual = check_level_goal((6, 1), character)
+        expected = None
+        self.assertEqual(actual, expected)
+
+    def test_check_level_goal_missing_key(self):
+        character = {
+            'Inventory': {'Key': 0},
+            'Stat': {
+                'Level': 1,
+                'Exp': 1350,
+                'Max Exp': {'Level 1': 1000, 'Level 2': 1300, 'Level 3': 1500}
+            }
+        }
+        actual = check_level_goal((7, 1), character)
+        expected = None
+        self.assertEqual(actual, expected)
+
+    def test_check_level_goal_insufficient_exp(self):
+        character = {
+            'Inventory': {'Key': 3},
+            'Stat': {
+                'Level': 2,
+                'Exp': 1200,
+                'Max Exp': {'Level 1': 1000, 'Level 2': 1300, 'Level 3': 1500}
+            }
+        }
+        actual = check_level_goal((4, 8), character)
+        expected = None
+        self.assertEqual(actual, expected)
+
+    def test_check_level_goal_goal_of_another_level(self):
+        character = {
+            'Inventory': {'Key': 3},
+            'Stat': {
+                'Level': 2,
+                'Exp': 1350,
+                'Max Exp': {'Level 1': 1000, 'Level 2': 1300, 'Level 3': 1500}
+            }
+        }
+        actual = check_level_goal((7, 1), character)
+        expected = None
+        self.assertEqual(actual, expected)
+
+    def test_check_level_goal_final_level_is_not_cleared(self):
+        character = {
+            'Inventory': {'Key': 3},
+            'Stat': {
+                'Level': 3,
+                'Exp': 1500,
+                'Max Exp': {'Level 1': 1000, 'Level 2': 1300, 'Level 3': 1500}
+            }
+        }
+        actual = check_level_goal((4, 4), character)
+        expected = None
+        self.assertEqual(actual, expected)
+
+    def test_check_level_goal_moved_goal(self):
+        rows = ['##########', '#.......##', '#######..#', '########.#', '########.#', '########.#', '######...#',
+                '#...##.###', '#.....!###', '##########']
+        self.use_pack(lambda pack: pack['Boards'].update({1: tuple(rows)}))
+        character = {
+            'Inventory': {'Key': 1},
+            'Stat': {
+                'Level': 1,
+                'Exp': 1000,
+                'Max Exp': {'Level 1': 1000, 'Level 2': 1300, 'Level 3': 1500}
+            }
+        }
+        with patch('sys.stdout', new_callable=StringIO):
+            actual = (check_level_goal((7, 1), character), check_level_goal((8, 6), character))
+        expected = (None, True)
+        self.assertEqual(actual, expected)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_check_level_goal_fourth_level(self, mock_output):
+        def add_level(pack):
+            pack['Boards'][4] = ('#####', '#...#', '#.#!#', '#####')
+            pack['Levels'][4] = {'Max Exp': 1800, 'HP Gain': 300, 'Description': 'THE ROOF'}
+            pack['Max Exp']['Level 4'] = 1800
+            pack['Skills']['Level 4'] = pack['Skills']['Level 3']
+        self.use_pack(add_level)
+        character = {
+            'Inventory': {'Key': 1},
+            'Stat': {
+                'Level': 3,
+                'Exp': 1500,
+                'Max Exp': {'Level 1': 1000, 'Level 2': 1300, 'Level 3': 1500, 'Level 4': 1800}
+            }
+        }
+        actual = check_level_goal((4, 4), character)
+        self.assertTrue(actual)
+        self.assertEqual(mock_output.getvalue(), '⬆️⬆️⬆️ Level UP ⬆️⬆️⬆️\n3rd Level clear! You are moving to Level 4.\n')
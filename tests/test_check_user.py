@@ -1,36 +1,81 @@
+import os
+import tempfile
 from io import StringIO
 from unittest import TestCase
-from unittest.mock import patch, mock_open
+from unittest.mock import patch
 
 from game import check_user
+from player_registry import close_shared_registries, open_registry
 
 
 class TestCheckUser(TestCase):
 
-    @patch('builtins.open', new_callable=mock_open, read_data="")
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.registry_path = os.path.join(self.directory.name, 'players.db')
+        self.legacy_path = os.path.join(self.directory.name, 'players.txt')
+        self.patches = [patch('player_registry.REGISTRY_PATH', self.registry_path),
+                        patch('player_registry.LEGACY_PATH', self.legacy_path)]
+        for registry_patch in self.patches:
+            registry_patch.start()
+
+    def tearDown(self):
+        close_shared_registries()
+        for registry_patch in self.patches:
+            registry_patch.stop()
+        self.directory.cleanup()
+
+    def write_players_file(self, read_data):
+        with open(self.legacy_path, 'w') as players:
+            players.write(read_data)
+
     @patch('sys.stdout', new_callable=StringIO)
-    def test_check_user_new_user_message(self, mock_output, _):
+    def test_check_user_new_user_message(self, mock_output):
+        self.write_players_file("")
         check_user('sleepy')
         print_result = mock_output.getvalue()
         expected_result = '✅ New user is created!\n'
         self.assertEqual(print_result, expected_result)
 
-    @patch('builtins.open', new_callable=mock_open, read_data="Heather")
     @patch('sys.stdout', new_callable=StringIO)
-    def test_check_user_returning_user_message(self, mock_output, _):
+    def test_check_user_returning_user_message(self, mock_output):
+        self.write_players_file("Heather")
         check_user('Heather')
         print_result = mock_output.getvalue()
         expected_result = "You're already a player! Welcome back, Heather!\n"
         self.assertEqual(print_result, expected_result)
 
-    @patch('builtins.open', new_callable=mock_open, read_data="")
+    @patch('sys.stdout', new_callable=StringIO)
     def test_check_user_is_new_user(self, _):
+        self.write_players_file("")
         actual = check_user('Newbie')
         expected = False
         self.assertEqual(actual, expected)
 
-    @patch('builtins.open', new_callable=mock_open, read_data="Heather")
+    @patch('sys.stdout', new_callable=StringIO)
     def test_check_user_is_returning_user(self, _):
+        self.write_players_file("Heather")
         actual = check_user('Heather')
         expected = True
         self.assertEqual(actual, expected)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_check_user_remembers_new_user(self, _):
+        check_user('Young Bin')
+        actual = check_user('Young Bin')
+        expected = True
+        self.assertEqual(actual, expected)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_check_user_imports_every_line(self, _):
+        self.write_players_file("Heather\nYoung Bin\n     ")
+        actual = [check_user(name) for name in ['Heather', 'Young Bin', '     ', 'Young']]
+        expected = [True, True, True, False]
+        self.assertEqual(actual, expected)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_check_user_opens_registry_once(self, _):
+        with patch('player_registry.open_registry', wraps=open_registry) as mock_open_registry:
+            actual = [check_user(name) for name in ['Haru', 'Baekgu', 'Haru']]
+        self.assertEqual(actual, [False, False, True])
+        mock_open_registry.assert_called_once()
@@ -0,0 +1,42 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from content import load_content
+from minigames.battle import choose_enemy_based_on_level, configure_enemy_stat, make_enemies
+from minigames.enemy_registry import make_enemy_registry
+
+
+class TestChooseEnemyBasedOnLevel(TestCase):
+
+    @patch('random.randint', side_effect=[90, 13, 8])
+    @patch('random.choice', side_effect=lambda templates: templates[0])
+    def test_choose_enemy_based_on_level_rolls_chosen_enemy(self, _, __):
+        enemy, enemy_copy = choose_enemy_based_on_level({'Stat': {'Level': 1}}, False)
+        expected = {'Name': 'Mouse', 'Icon': '🐭',
+                    'Description': "A tiny mouse nibbling on a piece of cheese. It looks harmless, "
+                                   "but don't let your guard down!",
+                    'Level': 1, 'HP': 90, 'Attack': {'Nibble': 13, 'Basic Attack': 8}}
+        self.assertEqual(enemy, expected)
+        self.assertEqual(enemy_copy, expected)
+        self.assertIsNot(enemy, enemy_copy)
+
+    def test_choose_enemy_based_on_level_boss_fight(self):
+        enemy, _ = choose_enemy_based_on_level({'Stat': {'Level': 3}}, True)
+        self.assertEqual(enemy['Name'], 'Majestic Fluffy BunBun')
+        self.assertTrue(500 <= enemy['HP'] <= 600)
+
+    def test_choose_enemy_based_on_level_boss_fight_without_boss(self):
+        enemy, _ = choose_enemy_based_on_level({'Stat': {'Level': 2}}, True)
+        self.assertIn(enemy['Name'], ('Robotic Vacuum', 'Guard Cat'))
+
+    def test_choose_enemy_based_on_level_no_boss_at_level_3(self):
+        enemy, _ = choose_enemy_based_on_level({'Stat': {'Level': 3}}, False)
+        self.assertIn(enemy['Name'], ('Giant Moth', 'Ghost'))
+
+    @patch('minigames.battle.make_enemies', wraps=make_enemies)
+    def test_choose_enemy_based_on_level_rolls_only_one_enemy(self, mock_make_enemies):
+        templates = [load_content()["Enemies"][0] | {"Name": f"Mouse {number}"} for number in range(500)]
+        registry = make_enemy_registry(templates, configure_enemy_stat())
+        enemy, _ = choose_enemy_based_on_level({'Stat': {'Level': 1}}, False, registry)
+        mock_make_enemies.assert_called_once()
+        self.assertTrue(enemy['Name'].startswith('Mouse '))
@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+from simulation import combine_tallies
+
+
+class TestCombineTallies(TestCase):
+
+    def test_combine_tallies_empty(self):
+        actual = combine_tallies([])
+        expected = {'Playthroughs': 0, 'Wins': 0, 'Hearts Lost': 0, 'Steps Per Level': {1: 0, 2: 0, 3: 0},
+                    'Encounters': {'battle': 0, 'hangman': 0, 'memory game': 0}}
+        self.assertEqual(actual, expected)
+
+    def test_combine_tallies_adds_nested_counts(self):
+        tally = {'Playthroughs': 3, 'Wins': 1, 'Hearts Lost': 14, 'Steps Per Level': {1: 90, 2: 30, 3: 12},
+                 'Encounters': {'battle': 9, 'hangman': 8, 'memory game': 7}}
+        actual = combine_tallies([tally, tally])
+        expected = {'Playthroughs': 6, 'Wins': 2, 'Hearts Lost': 28, 'Steps Per Level': {1: 180, 2: 60, 3: 24},
+                    'Encounters': {'battle': 18, 'hangman': 16, 'memory game': 14}}
+        self.assertEqual(actual, expected)
+
+    def test_combine_tallies_does_not_change_tallies(self):
+        tally = {'Playthroughs': 1, 'Wins': 0, 'Hearts Lost': 10, 'Steps Per Level': {1: 5, 2: 0, 3: 0},
+                 'Encounters': {'battle': 1, 'hangman': 0, 'memory game': 2}}
+        combine_tallies([tally, tally])
+        self.assertEqual(tally['Steps Per Level'], {1: 5, 2: 0, 3: 0})
@@ -0,0 +1,20 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from content import load_content
+from minigames.enemy_registry import current_registry
+
+
+class TestCurrentRegistry(TestCase):
+
+    def test_current_registry_built_once(self):
+        self.assertIs(current_registry(), current_registry())
+
+    def test_current_registry_follows_reloaded_content(self):
+        content = load_content()
+        reloaded = content | {"Enemies": tuple(enemy | {"Name": f"New {enemy['Name']}"}
+                                               for enemy in content["Enemies"])}
+        with patch('minigames.enemy_registry.load_content', return_value=reloaded):
+            actual = [template['Name'] for template in current_registry()[(1, False)]]
+        self.assertEqual(actual, ['New Mouse', 'New Spider'])
+        self.assertEqual([template['Name'] for template in current_registry()[(1, False)]], ['Mouse', 'Spider'])
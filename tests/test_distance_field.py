@@ -0,0 +1,80 @@
+from collections import deque
+from unittest import TestCase
+
+from board import Board, level_template
+from map_generator import START, generate_template
+from pathfinding import MOVES, distance_field, find_goal, level_distances
+
+
+def next_direction_towards(grid: list[list[str]], start: tuple[int, int], goal: tuple[int, int]) -> str | None:
+    first_steps = {start: None}
+    queue = deque([start])
+    while queue:
+        row, col = queue.popleft()
+        if (row, col) == goal:
+            return first_steps[goal]
+        for direction, (row_step, col_step) in MOVES.items():
+            neighbour = (row + row_step, col + col_step)
+            if neighbour not in first_steps and grid[neighbour[0]][neighbour[1]] != '#':
+                first_steps[neighbour] = first_steps[(row, col)] or direction
+                queue.append(neighbour)
+    return None
+
+
+class TestDistanceField(TestCase):
+
+    def test_distance_field_matches_search_on_every_level(self):
+        for level, goal in ((1, (7, 1)), (2, (4, 8)), (3, (4, 4))):
+            grid = level_template(level).instantiate().to_lists()
+            field = level_distances(level)
+            for row in range(len(grid)):
+                for col in range(len(grid[row])):
+                    if grid[row][col] != '#':
+                        actual = field.next_direction(row, col)
+                        expected = next_direction_towards(grid, (row, col), goal)
+                        self.assertEqual(actual, expected, (level, row, col))
+
+    def test_distance_field_steps_follow_directions(self):
+        moves = {'w': (-1, 0), 'a': (0, -1), 's': (1, 0), 'd': (0, 1)}
+        field = level_distances(2)
+        row, col = 1, 1
+        steps = field.steps_to_goal(row, col)
+        walked = 0
+        while (direction := field.next_direction(row, col)) is not None:
+            row, col = row + moves[direction][0], col + moves[direction][1]
+            walked += 1
+        self.assertEqual((row, col, walked), (4, 8, steps))
+
+    def test_distance_field_goal_and_walls(self):
+        field = level_distances(3)
+        actual = (field.steps_to_goal(4, 4), field.next_direction(4, 4), field.steps_to_goal(0, 0),
+                  field.next_direction(0, 0))
+        expected = (0, None, -1, None)
+        self.assertEqual(actual, expected)
+
+    def test_distance_field_unreachable_cell(self):
+        template = Board.from_lists([['.', '#', '.'], ['#', '#', '!']]).freeze()
+        field = distance_field(template, (1, 2))
+        actual = (field.steps_to_goal(0, 0), field.next_direction(0, 0), field.steps_to_goal(0, 2))
+        expected = (-1, None, 1)
+        self.assertEqual(actual, expected)
+
+    def test_distance_field_board_without_border_walls(self):
+        template = Board.from_lists([['.', '.'], ['!', '.']]).freeze()
+        field = distance_field(template, (1, 0))
+        actual = [field.steps_to_goal(row, col) for row in range(2) for col in range(2)]
+        self.assertEqual(actual, [1, 2, 0, 1])
+
+    def test_distance_field_worked_out_once_per_layout(self):
+        self.assertIs(level_distances(1), level_distances(1))
+        template = level_template(1)
+        self.assertIs(distance_field(template, (7, 1)), distance_field(template, (7, 1)))
+
+    def test_distance_field_generated_board(self):
+        template = generate_template(61, 1510)
+        field = distance_field(template, find_goal(template))
+        self.assertGreater(field.steps_to_goal(*START), 0)
+        self.assertIsNotNone(field.next_direction(*START))
+
+    def test_find_goal_without_goal(self):
+        self.assertIsNone(find_goal(Board.from_lists([['#', '.']]).freeze()))
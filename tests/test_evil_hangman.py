@@ -0,0 +1,42 @@
+import io
+from unittest import TestCase
+from unittest.mock import patch
+
+from minigames.evil_hangman import evil_hangman
+from minigames.hangman_art import STAGES
+from console import run_sync
+
+
+class TestEvilHangman(TestCase):
+
+    def setUp(self):
+        self.character = {'Stat': {'Heart': 3, 'Current HP': 10, 'HP': 20}}
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('builtins.input', side_effect=['o', 'O', 'l', 'k', 'c', 'b'])
+    @patch('random.choice', return_value='cook')
+    def test_evil_hangman_win(self, _, __, mock_output):
+        actual = run_sync(evil_hangman(['book', 'cook', 'cool', 'garden'], self.character))
+        expected = (True, self.character)
+        self.assertEqual(actual, expected)
+        output = mock_output.getvalue()
+        self.assertIn("You've already guessed 'o'", output)
+        self.assertIn("b o o k\nYou win!\n" + STAGES[6], output)
+        self.assertEqual(self.character['Stat']['Heart'], 3)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('builtins.input', side_effect=list('acdefghi'))
+    @patch('random.choice', return_value='book')
+    def test_evil_hangman_lose(self, _, __, mock_output):
+        actual = run_sync(evil_hangman(['book', 'tree', 'garden'], self.character))
+        expected = (False, self.character)
+        self.assertEqual(actual, expected)
+        self.assertIn("You lose.\nThe word was: 'book'", mock_output.getvalue())
+        self.assertEqual(self.character['Stat']['Heart'], 2)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('builtins.input', side_effect=list('garden'))
+    @patch('random.choice', return_value='garden')
+    def test_evil_hangman_word_length(self, _, __, mock_output):
+        run_sync(evil_hangman(['book', 'tree', 'garden'], self.character))
+        self.assertIn("g a r d e n\nYou win!", mock_output.getvalue())
@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+from minigames.battle_solver import fight_outcomes
+
+
+class TestFightOutcomes(TestCase):
+
+    def test_fight_outcomes_one_per_turn(self):
+        actual = len(fight_outcomes(250, 10, 20, 0, 7))
+        expected = 7
+        self.assertEqual(actual, expected)
+
+    def test_fight_outcomes_first_turn_always_won(self):
+        actual = fight_outcomes(250, 300, 300, 0, 1)
+        expected = [(1.0, 0.0, 0.0)]
+        self.assertEqual(actual, expected)
+
+    def test_fight_outcomes_certain_death(self):
+        actual = fight_outcomes(250, 300, 300, 0, 2)[1]
+        expected = (0.0, 0.0, 1.0)
+        self.assertEqual(actual, expected)
+
+    def test_fight_outcomes_half_death(self):
+        actual = fight_outcomes(250, 300, 100, 0, 2)[1]
+        expected = (0.5, 0.0, 0.5)
+        self.assertEqual(actual, expected)
+
+    def test_fight_outcomes_flee_at_threshold(self):
+        actual = fight_outcomes(250, 150, 150, 100, 2)[1]
+        expected = (0.0, 1.0, 0.0)
+        self.assertEqual(actual, expected)
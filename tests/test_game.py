@@ -0,0 +1,37 @@
+import os
+import tempfile
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from game import game
+from snapshot import save_path
+from console import run_sync
+
+
+def reach_goal(session):
+    session['Achieved Goal'] = True
+
+
+class TestGame(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = save_path(self.directory.name, 'Haru')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @patch('game.take_turn', side_effect=reach_goal)
+    @patch('game.check_user', return_value=True)
+    @patch('builtins.input', return_value='Haru')
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_game_starts_over_when_save_cannot_be_read(self, mock_output, _, __, ___):
+        with open(self.path, 'wb') as save_file:
+            save_file.write(b'not a snapshot')
+        run_sync(game(self.directory.name))
+        self.assertIn("⚠️ Your saved adventure could not be read, so a new one begins.", mock_output.getvalue())
+        self.assertIn("Congratulations!", mock_output.getvalue())
+        self.assertFalse(os.path.exists(self.path))
+        with open(self.path + '.bak', 'rb') as backup:
+            self.assertEqual(backup.read(), b'not a snapshot')
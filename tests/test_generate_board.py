@@ -0,0 +1,94 @@
+import time
+from collections import deque
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from board import Board
+from make_board_each_level import add_border_walls, display_grid
+from map_generator import MAX_SIZE, START, generate_board, generate_template
+from rng import make_rng, use_rng
+
+
+def reachable_cells(board: Board) -> set[tuple[int, int]]:
+    seen = {START}
+    queue = deque([START])
+    while queue:
+        row, col = queue.popleft()
+        for next_row, next_col in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if (next_row, next_col) not in seen and board.is_passable(next_row, next_col):
+                seen.add((next_row, next_col))
+                queue.append((next_row, next_col))
+    return seen
+
+
+def open_cells(board: Board) -> set[tuple[int, int]]:
+    return {(row, col) for row in range(board.height) for col in range(board.width) if board.is_passable(row, col)}
+
+
+class TestGenerateBoard(TestCase):
+
+    def test_generate_board_every_open_cell_is_reachable(self):
+        for size in (5, 6, 10, 11, 40, 101):
+            for seed in range(5):
+                board = generate_board(size, seed)
+                self.assertEqual(reachable_cells(board), open_cells(board), (size, seed))
+
+    def test_generate_board_goal_is_reachable(self):
+        for seed in range(20):
+            board = generate_board(10, seed)
+            goal = divmod(bytes(board.cells).index(b'!'), board.width)
+            self.assertIn(goal, reachable_cells(board))
+
+    def test_generate_board_one_goal_away_from_start(self):
+        board = generate_board(51, 7)
+        row, col = divmod(bytes(board.cells).index(b'!'), board.width)
+        self.assertEqual(bytes(board.cells).count(b'!'), 1)
+        self.assertGreaterEqual(row + col, 51 - 3)
+
+    def test_generate_board_start_is_open(self):
+        board = generate_board(8, 3)
+        actual = (board[1][1], board.is_passable(*START))
+        expected = ('.', True)
+        self.assertEqual(actual, expected)
+
+    def test_generate_board_keeps_border_walls(self):
+        grid = generate_board(12, 5).to_lists()
+        expected = [row[:] for row in grid]
+        self.assertEqual(add_border_walls(grid, 12), expected)
+
+    def test_generate_board_same_seed_same_board(self):
+        actual = generate_board(30, 1510).to_lists()
+        expected = generate_board(30, 1510).to_lists()
+        self.assertEqual(actual, expected)
+
+    def test_generate_board_without_seed_uses_session_random_numbers(self):
+        with use_rng(make_rng(1510)):
+            actual = generate_board(30).to_lists()
+        with use_rng(make_rng(1510)):
+            expected = generate_board(30).to_lists()
+        self.assertEqual(actual, expected)
+
+    def test_generate_board_matches_from_lists(self):
+        board = generate_board(9, 2)
+        actual = Board.from_lists(board.to_lists())
+        self.assertEqual((actual.cells, actual.passable), (board.cells, board.passable))
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_generate_board_display(self, mock_output):
+        display_grid(generate_board(5, 1))
+        expected = "# # # # #\n# . . . #\n# . # # #\n# . . ! #\n# # # # #\n"
+        self.assertEqual(mock_output.getvalue(), expected)
+
+    def test_generate_board_size_out_of_range(self):
+        for size in (4, MAX_SIZE + 1):
+            with self.assertRaises(ValueError):
+                generate_board(size, 1)
+
+    def test_generate_template_largest_board_is_fast(self):
+        generate_template(MAX_SIZE, 1)
+        start = time.perf_counter()
+        template = generate_template(MAX_SIZE, 2)
+        seconds = time.perf_counter() - start
+        self.assertEqual(len(template.cells), MAX_SIZE * MAX_SIZE)
+        self.assertLess(seconds, 0.5)
@@ -3,6 +3,7 @@ from unittest import TestCase
 from unittest.mock import patch
 
 from game import get_user_choice
+from console import run_sync
 
 
 class TestGetUserChoice(TestCase):
@@ -22,7 +23,7 @@ class TestGetUserChoice(TestCase):
                 ['#', '#', '#', '#', '#', '#', '#', '#', '.', '#'], ['#', '#', '#', '#', '#', '#', '#', '#', '.', '#'],
                 ['#', '#', '#', '#', '#', '#', '.', '.', '.', '#'], ['#', '!', '.', '.', '#', '#', '.', '#', '#', '#'],
                 ['#', '.', '.', '.', '.', '.', '.', '#', '#', '#'], ['#', '#', '#', '#', '#', '#', '#', '#', '#', '#']]
-        get_user_choice(character, grid)
+        run_sync(get_user_choice(character, grid))
         print_result = mock_output.getvalue()
         expected_result = """
 # # # # # # # # # #
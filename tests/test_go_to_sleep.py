@@ -3,6 +3,7 @@ from unittest import TestCase
 from unittest.mock import patch
 
 from game import go_to_sleep
+from console import run_sync
 
 
 class TestGoToSleep(TestCase):
@@ -12,7 +13,7 @@ class TestGoToSleep(TestCase):
             "Hunger": 1,
             "Max Hunger": 10
         }}
-        go_to_sleep(character, 10)
+        run_sync(go_to_sleep(character, 10))
         actual = character["Stat"]["Hunger"]
         expected = 10
         self.assertEqual(actual, expected)
@@ -22,7 +23,7 @@ class TestGoToSleep(TestCase):
             "Hunger": 10,
             "Max Hunger": 10
         }}
-        go_to_sleep(character, 10)
+        run_sync(go_to_sleep(character, 10))
         actual = character["Stat"]["Hunger"]
         expected = 10
         self.assertEqual(actual, expected)
@@ -33,7 +34,7 @@ class TestGoToSleep(TestCase):
             "Hunger": 10,
             "Max Hunger": 10
         }}
-        go_to_sleep(character, 5)
+        run_sync(go_to_sleep(character, 5))
         print_result = mock_output.getvalue()
         expected_result = ('\n💤 You are going to sleep for 5 second(s) to regain energy.'
                            '\n1 sec'
@@ -50,7 +51,7 @@ class TestGoToSleep(TestCase):
             "Hunger": 10,
             "Max Hunger": 10
         }}
-        go_to_sleep(character, 1)
+        run_sync(go_to_sleep(character, 1))
         print_result = mock_output.getvalue()
         expected_result = ('\n💤 You are going to sleep for 1 second(s) to regain energy.'
                            '\n1 sec'
@@ -0,0 +1,81 @@
+from unittest import TestCase
+
+from game import make_session
+from minigames.battle import SKILL_USAGE_LIMIT
+from simulation import greedy_policy
+
+
+class TestGreedyPolicy(TestCase):
+
+    def test_greedy_policy_menu_moves(self):
+        actual = greedy_policy('menu', make_session(), {})
+        expected = '1'
+        self.assertEqual(actual, expected)
+
+    def test_greedy_policy_walks_to_goal_when_ready(self):
+        session = make_session()
+        session['Character']['Stat']['Exp'] = 1000
+        session['Character']['Inventory']['Key'] = 1
+        actual = greedy_policy('direction', session, {})
+        expected = 'd'
+        self.assertEqual(actual, expected)
+
+    def test_greedy_policy_never_walks_into_wall(self):
+        session = make_session()
+        for _ in range(20):
+            self.assertEqual(greedy_policy('direction', session, {}), 'd')
+
+    def test_greedy_policy_uses_skills_first(self):
+        memory = {'Last Topic': 'direction'}
+        actual = greedy_policy('battle', make_session(), memory)
+        expected = '2'
+        self.assertEqual(actual, expected)
+
+    def test_greedy_policy_basic_attack_after_skill_limit(self):
+        memory = {'Last Topic': 'skill', 'Skill Uses': SKILL_USAGE_LIMIT}
+        actual = greedy_policy('battle', make_session(), memory)
+        expected = '1'
+        self.assertEqual(actual, expected)
+
+    def test_greedy_policy_drinks_potion_when_hp_low(self):
+        session = make_session()
+        session['Character']['Stat']['Current HP'] = 50
+        session['Character']['Inventory']['HP Potion'] = 1
+        memory = {'Last Topic': 'battle', 'Skill Uses': 0}
+        actual = (greedy_policy('battle', session, memory), greedy_policy('item', session, memory))
+        expected = ('5', '1')
+        self.assertEqual(actual, expected)
+
+    def test_greedy_policy_strongest_skill(self):
+        session = make_session()
+        session['Character']['Skill']['Current Skills'] = {'Bark': {'Damage': 25}, 'Bite': {'Damage': 56}}
+        actual = greedy_policy('skill', session, {'Last Topic': 'battle', 'Skill Uses': 0})
+        expected = 'Bite'
+        self.assertEqual(actual, expected)
+
+    def test_greedy_policy_guesses_new_letters(self):
+        session = make_session()
+        memory = {}
+        guesses = []
+        for _ in range(3):
+            guesses.append(greedy_policy('guess', session, memory))
+            memory['Last Topic'] = 'guess'
+        self.assertEqual(len(set(guesses)), 3)
+
+    def test_greedy_policy_guesses_from_revealed_letters(self):
+        session = make_session()
+        session['Character']['Stat']['Level'] = 3
+        memory = {'Last Topic': 'guess', 'Guessed': {'o', 'e', 'a', 'i', 'u'}, 'Candidates': ['book', 'cook', 'tree'],
+                  'Screen': "_ o o _\n"}
+        actual = greedy_policy('guess', session, memory)
+        expected = 'k'
+        self.assertEqual(actual, expected)
+        self.assertEqual(memory['Candidates'], ['book', 'cook'])
+
+    def test_greedy_policy_repeats_memory_sequence(self):
+        memory = {'Screen': "Memorize the given directions:\n['W', 'A', 'S']\n5\n4\n"}
+        answers = []
+        for _ in range(3):
+            answers.append(greedy_policy('memory', make_session(), memory))
+            memory['Last Topic'] = 'memory'
+        self.assertEqual(answers, ['W', 'A', 'S'])
@@ -0,0 +1,67 @@
+import random
+import string
+import time
+from unittest import TestCase
+
+from minigames.evil_hangman import guess_evil_letter, make_evil_round
+
+
+class TestGuessEvilLetter(TestCase):
+
+    def setUp(self):
+        self.evil_round = make_evil_round(['book', 'cook', 'cool', 'tree', 'free'])
+
+    def test_guess_evil_letter_keeps_the_largest_family(self):
+        actual = guess_evil_letter(self.evil_round, 'o')
+        self.assertEqual(actual, 'correct')
+        self.assertEqual(self.evil_round['Display'], ['_', 'o', 'o', '_'])
+        self.assertEqual(self.evil_round['Hidden'], 2)
+        self.assertEqual(self.evil_round['Candidates'].shape, (4, 3))
+
+    def test_guess_evil_letter_dodges_a_letter_on_a_tie(self):
+        evil_round = make_evil_round(['book', 'tree'])
+        actual = guess_evil_letter(evil_round, 'o')
+        self.assertEqual(actual, 'incorrect')
+        self.assertEqual(evil_round['Lives'], 7)
+        self.assertEqual(evil_round['Word'], 'tree')
+
+    def test_guess_evil_letter_settles_on_the_last_word(self):
+        for guess in 'oklc':
+            guess_evil_letter(self.evil_round, guess)
+        self.assertEqual(self.evil_round['Word'], 'book')
+        self.assertEqual(self.evil_round['Candidates'].shape, (4, 1))
+
+    def test_guess_evil_letter_repeated_guess(self):
+        guess_evil_letter(self.evil_round, 'z')
+        actual = guess_evil_letter(self.evil_round, 'z')
+        self.assertEqual(actual, 'repeat')
+        self.assertEqual(self.evil_round['Lives'], 7)
+
+    def test_guess_evil_letter_more_than_one_letter(self):
+        first = guess_evil_letter(self.evil_round, 'oo')
+        second = guess_evil_letter(self.evil_round, 'oo')
+        self.assertEqual((first, second), ('incorrect', 'repeat'))
+        self.assertEqual(self.evil_round['Candidates'].shape, (4, 5))
+
+    def test_guess_evil_letter_blank_counts_as_guessed(self):
+        actual = guess_evil_letter(self.evil_round, '_')
+        self.assertEqual(actual, 'repeat')
+        self.assertEqual(self.evil_round['Lives'], 8)
+
+    def test_guess_evil_letter_long_words(self):
+        evil_round = make_evil_round(['abcdefghijklmnopqrstu', 'bbcdefghijklmnopqrstu', 'cbcdefghijklmnopqrstu'])
+        actual = guess_evil_letter(evil_round, 'u')
+        self.assertEqual(actual, 'correct')
+        self.assertEqual(evil_round['Display'][20], 'u')
+        self.assertEqual(evil_round['Candidates'].shape, (21, 3))
+
+    def test_guess_evil_letter_fast_with_large_lists(self):
+        rng = random.Random(1510)
+        words = list(dict.fromkeys(''.join(rng.choices(string.ascii_lowercase, k=6)) for _ in range(60000)))[:50000]
+        evil_round = make_evil_round(words)
+        start = time.perf_counter()
+        for guess in string.ascii_lowercase:
+            guess_evil_letter(evil_round, guess)
+        seconds = time.perf_counter() - start
+        self.assertLess(seconds / len(string.ascii_lowercase), 0.001)
+        self.assertEqual(evil_round['Hidden'], 0)
@@ -0,0 +1,57 @@
+from unittest import TestCase
+
+from minigames.hangman import guess_letter, make_hangman_round
+
+
+class TestGuessLetter(TestCase):
+
+    def setUp(self):
+        self.hangman_round = make_hangman_round('pebble')
+
+    def test_guess_letter_correct_reveals_every_position(self):
+        actual = guess_letter(self.hangman_round, 'b')
+        self.assertEqual(actual, 'correct')
+        self.assertEqual(self.hangman_round['Display'], ['_', '_', 'b', 'b', '_', '_'])
+        self.assertEqual(self.hangman_round['Hidden'], 3)
+        self.assertEqual(self.hangman_round['Lives'], 8)
+
+    def test_guess_letter_incorrect_takes_a_life(self):
+        actual = guess_letter(self.hangman_round, 'z')
+        self.assertEqual(actual, 'incorrect')
+        self.assertEqual(self.hangman_round['Lives'], 7)
+        self.assertEqual(self.hangman_round['Display'], ['_'] * 6)
+
+    def test_guess_letter_repeated_correct_guess(self):
+        guess_letter(self.hangman_round, 'e')
+        actual = guess_letter(self.hangman_round, 'e')
+        self.assertEqual(actual, 'repeat')
+        self.assertEqual(self.hangman_round['Hidden'], 3)
+
+    def test_guess_letter_repeated_incorrect_guess(self):
+        guess_letter(self.hangman_round, 'z')
+        actual = guess_letter(self.hangman_round, 'z')
+        self.assertEqual(actual, 'repeat')
+        self.assertEqual(self.hangman_round['Lives'], 7)
+
+    def test_guess_letter_marks_guessed_letters_in_mask(self):
+        guess_letter(self.hangman_round, 'a')
+        guess_letter(self.hangman_round, 'c')
+        actual = self.hangman_round['Guessed']
+        expected = 0b101
+        self.assertEqual(actual, expected)
+
+    def test_guess_letter_more_than_one_letter(self):
+        first = guess_letter(self.hangman_round, 'pe')
+        second = guess_letter(self.hangman_round, 'pe')
+        self.assertEqual((first, second), ('incorrect', 'repeat'))
+        self.assertEqual(self.hangman_round['Lives'], 7)
+
+    def test_guess_letter_blank_counts_as_guessed(self):
+        actual = guess_letter(self.hangman_round, '_')
+        self.assertEqual(actual, 'repeat')
+
+    def test_guess_letter_reveals_whole_word(self):
+        for letter in 'pebl':
+            guess_letter(self.hangman_round, letter)
+        self.assertEqual(self.hangman_round['Hidden'], 0)
+        self.assertEqual(''.join(self.hangman_round['Display']), 'pebble')
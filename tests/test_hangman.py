@@ -0,0 +1,33 @@
+import io
+from unittest import TestCase
+from unittest.mock import patch
+
+from minigames.hangman import hangman
+from minigames.hangman_art import STAGES
+from console import run_sync
+
+
+class TestHangman(TestCase):
+
+    def setUp(self):
+        self.character = {'Stat': {'Heart': 3, 'Current HP': 10, 'HP': 20}}
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('builtins.input', side_effect=['b', 'B', 'x', 'o', 'k'])
+    def test_hangman_win(self, _, mock_output):
+        actual = run_sync(hangman(['book'], self.character))
+        expected = (True, self.character)
+        self.assertEqual(actual, expected)
+        output = mock_output.getvalue()
+        self.assertIn("You've already guessed 'b'", output)
+        self.assertIn("b o o k\nYou win!\n" + STAGES[7], output)
+        self.assertEqual(self.character['Stat']['Heart'], 3)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('builtins.input', side_effect=list('acdefghi'))
+    def test_hangman_lose(self, _, mock_output):
+        actual = run_sync(hangman(['book'], self.character))
+        expected = (False, self.character)
+        self.assertEqual(actual, expected)
+        self.assertIn("You lose.\nThe word was: 'book'", mock_output.getvalue())
+        self.assertEqual(self.character['Stat']['Heart'], 2)
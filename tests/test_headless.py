@@ -0,0 +1,83 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from threading import Barrier
+from unittest import TestCase
+from unittest.mock import patch
+
+from console import headless, pause, run_sync
+
+
+class TestHeadless(TestCase):
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_headless_discards_output(self, mock_output):
+        with headless(lambda prompt, topic: ''):
+            print("You moved one step up. Everything seems quiet.")
+        actual = mock_output.getvalue()
+        expected = ''
+        self.assertEqual(actual, expected)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_headless_restores_output(self, mock_output):
+        with headless(lambda prompt, topic: ''):
+            pass
+        print("Back at the terminal")
+        actual = mock_output.getvalue()
+        expected = 'Back at the terminal\n'
+        self.assertEqual(actual, expected)
+
+    def test_headless_restores_output_after_error(self):
+        original_stdout = sys.stdout
+        with self.assertRaises(ValueError):
+            with headless(lambda prompt, topic: ''):
+                raise ValueError("Enemy name cannot be empty!")
+        self.assertIs(sys.stdout, original_stdout)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_headless_blocks_on_threads_print_to_their_own_output(self, mock_output):
+        barrier = Barrier(2)
+
+        def play(name):
+            output = StringIO()
+            with headless(lambda prompt, topic: '', output=output):
+                barrier.wait()
+                print(name)
+                barrier.wait()
+            return output.getvalue()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            actual = list(executor.map(play, ['Haru', 'Nabi']))
+        self.assertEqual(actual, ['Haru\n', 'Nabi\n'])
+        self.assertIs(sys.stdout, mock_output)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_headless_single_block_prints_straight_to_its_output(self, mock_output):
+        output = StringIO()
+        with headless(lambda prompt, topic: '', output=output):
+            actual = sys.stdout
+            print('Haru')
+        self.assertIs(actual, output)
+        self.assertEqual((output.getvalue(), mock_output.getvalue()), ('Haru\n', ''))
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_headless_nested_block_prints_to_its_own_output(self, mock_output):
+        outer, inner = StringIO(), StringIO()
+        with headless(lambda prompt, topic: '', output=outer):
+            print('Haru')
+            with headless(lambda prompt, topic: '', output=inner):
+                print('Nabi')
+            print('Baekgu')
+        self.assertEqual((outer.getvalue(), inner.getvalue()), ('Haru\nBaekgu\n', 'Nabi\n'))
+        self.assertIs(sys.stdout, mock_output)
+
+    @patch('time.sleep')
+    def test_headless_skips_pause(self, mock_sleep):
+        with headless(lambda prompt, topic: ''):
+            run_sync(pause(20))
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    def test_pause_sleeps_at_terminal(self, mock_sleep):
+        run_sync(pause(1.5))
+        mock_sleep.assert_called_once_with(1.5)
@@ -16,7 +16,7 @@ class Test(TestCase):
         actual = words[2]
         expected = ["garden", "silver", "branch", "butter", "turtle", "bridge", "rabbit", "pebble", "button", "stream",
                     "travel", "bottle", "winter", "flower", "basket", "orange", "desert", "magnet", "planet", "frozen",
-                    "safety", "forest", "guitar", "friend", "yellow", "ticket", "pencil", "bridge", "jungle", "school"]
+                    "safety", "forest", "guitar", "friend", "yellow", "ticket", "pencil", "jungle", "school"]
         self.assertEqual(actual, expected)
 
 
@@ -0,0 +1,146 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from board import level_template
+from content import CONTENT_PATH, clear_content, load_content, reload_content
+from pathfinding import level_distances, level_goal
+
+
+def add_level(pack, level, rows):
+    pack['Boards'][str(level)] = rows
+    pack['Levels'][str(level)] = {"Max Exp": 1500, "HP Gain": 250, "Description": f"FLOOR {level}"}
+    pack['Skills'][f"Level {level}"] = pack['Skills']["Level 3"]
+    pack['Enemies'].append(pack['Enemies'][0] | {"Character Level": level})
+
+
+class TestLoadContent(TestCase):
+
+    def setUp(self):
+        clear_content()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'content.json')
+        self.cache_path = self.path + '.cache'
+        shutil.copyfile(CONTENT_PATH, self.path)
+
+    def tearDown(self):
+        clear_content()
+        self.directory.cleanup()
+
+    def rewrite(self, change):
+        with open(self.path, encoding='utf-8') as file:
+            pack = json.load(file)
+        change(pack)
+        with open(self.path, 'w', encoding='utf-8') as file:
+            json.dump(pack, file)
+        status = os.stat(self.path)
+        os.utime(self.path, ns=(status.st_atime_ns, status.st_mtime_ns + 1_000_000_000))
+
+    def test_load_content_compiles_ranges_and_boards(self):
+        content = load_content(self.path)
+        self.assertEqual(content['Skills']['Level 1'][0]['Damage'], (20, 30))
+        self.assertEqual(content['Enemy Stats']['HP Range']['Boss'], (500, 600))
+        self.assertEqual(content['Boards'][3][4], '#...!#...#')
+
+    def test_load_content_writes_cache(self):
+        load_content(self.path)
+        self.assertTrue(os.path.exists(self.cache_path))
+
+    def test_load_content_uses_cache_without_parsing(self):
+        expected = load_content(self.path)
+        clear_content()
+        with patch('json.loads') as mock_loads:
+            actual = load_content(self.path)
+        mock_loads.assert_not_called()
+        self.assertEqual(actual, expected)
+
+    def test_load_content_shares_one_copy(self):
+        actual = load_content(self.path)
+        expected = load_content(self.path)
+        self.assertIs(actual, expected)
+
+    def test_load_content_recompiles_changed_pack_on_reload(self):
+        before = load_content(self.path)['Rewards']['Exp']
+        self.rewrite(lambda pack: pack['Rewards'].update({"Exp": [10, 20]}))
+        unchanged = load_content(self.path)['Rewards']['Exp']
+        reload_content()
+        actual = (before, unchanged, load_content(self.path)['Rewards']['Exp'])
+        expected = (before, before, (10, 20))
+        self.assertEqual(actual, expected)
+
+    def test_load_content_cached_lookup_makes_no_system_call(self):
+        load_content(self.path)
+        with patch('os.stat') as mock_stat, patch('builtins.open') as mock_open:
+            for _ in range(100):
+                load_content(self.path)
+        mock_stat.assert_not_called()
+        mock_open.assert_not_called()
+
+    def test_load_content_reload_keeps_unchanged_pack(self):
+        expected = load_content(self.path)
+        reload_content()
+        actual = load_content(self.path)
+        self.assertIs(actual, expected)
+
+    def test_load_content_reload_forgets_level_layouts_of_changed_pack(self):
+        load_content(self.path)
+        level_goal(1)
+        self.rewrite(lambda pack: pack['Rewards'].update({"Exp": [10, 20]}))
+        reload_content()
+        actual = [cached.cache_info().currsize for cached in (level_template, level_goal, level_distances)]
+        self.assertEqual(actual, [0, 0, 0])
+
+    def test_load_content_reload_keeps_pack_when_changed_pack_is_invalid(self):
+        expected = load_content(self.path)
+        self.rewrite(lambda pack: pack.pop('Rewards'))
+        with self.assertRaises(ValueError):
+            reload_content()
+        actual = load_content(self.path)
+        self.assertIs(actual, expected)
+
+    def test_load_content_ignores_stale_cache(self):
+        load_content(self.path)
+        clear_content()
+        self.rewrite(lambda pack: add_level(pack, 4, ['####', '#.!#', '####']))
+        actual = load_content(self.path)['Boards'][4]
+        expected = ('####', '#.!#', '####')
+        self.assertEqual(actual, expected)
+
+    def test_load_content_ignores_broken_cache(self):
+        with open(self.cache_path, 'wb') as file:
+            file.write(b'BKGC not a cache')
+        actual = load_content(self.path)['Rewards']['Exp']
+        expected = (200, 400)
+        self.assertEqual(actual, expected)
+
+    def test_load_content_without_writable_cache(self):
+        cache_path = os.path.join(self.directory.name, 'missing', 'content.json.cache')
+        actual = load_content(self.path, cache_path)['Rewards']['Exp']
+        expected = (200, 400)
+        self.assertEqual(actual, expected)
+        self.assertFalse(os.path.exists(cache_path))
+
+    def test_load_content_invalid_pack(self):
+        self.rewrite(lambda pack: pack['Skills']['Level 1'][0].update({"Damage": [30, 20]}))
+        with self.assertRaises(ValueError):
+            load_content(self.path)
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_load_content_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            load_content(os.path.join(self.directory.name, 'missing.json'))
+
+    def test_load_content_cached_large_pack_is_fast(self):
+        rows = ['#' * 200] + ['#' + '.' * 198 + '#'] * 197 + ['#' + '.' * 197 + '!#'] + ['#' * 200]
+        self.rewrite(lambda pack: [add_level(pack, level, rows) for level in range(4, 54)])
+        load_content(self.path)
+        clear_content()
+        start = time.perf_counter()
+        content = load_content(self.path)
+        seconds = time.perf_counter() - start
+        self.assertEqual(len(content['Boards']), 53)
+        self.assertLess(seconds, 0.05)
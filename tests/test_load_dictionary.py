@@ -0,0 +1,89 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from minigames.hangman import lists_of_words
+from minigames.hangman_dictionary import LEVELS_CACHE_SUFFIX, load_dictionary, make_dictionary
+
+
+def counting_calibrate(levels: dict) -> tuple:
+    calls = []
+
+    def calibrate(words):
+        calls.append(words)
+        return levels
+    return calibrate, calls
+
+
+class TestLoadDictionary(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'words.txt')
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write("Bridge\nbridge\ngarden\napple\nbook\ncafé\nwell-known\n\nlisten\nsilent\nbook\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_dictionary_dedupes_and_cleans(self):
+        actual = load_dictionary(make_dictionary(self.path))['Words']
+        expected = ['bridge', 'garden', 'apple', 'book', 'listen', 'silent']
+        self.assertEqual(actual, expected)
+
+    def test_load_dictionary_levels(self):
+        actual = load_dictionary(make_dictionary(self.path))['Levels']
+        expected = {1: ['bridge', 'garden', 'listen', 'silent'], 2: ['apple'], 3: ['book']}
+        self.assertEqual(actual, expected)
+
+    def test_load_dictionary_is_lazy(self):
+        with patch('builtins.open') as mock_open:
+            make_dictionary(self.path)
+        mock_open.assert_not_called()
+
+    def test_load_dictionary_reads_file_once(self):
+        dictionary = make_dictionary(self.path)
+        load_dictionary(dictionary)
+        with patch('builtins.open') as mock_open:
+            actual = load_dictionary(dictionary)
+        mock_open.assert_not_called()
+        self.assertIs(actual, dictionary['Index'])
+
+    def test_load_dictionary_fallback_when_file_is_missing(self):
+        dictionary = make_dictionary(os.path.join(self.directory.name, 'missing.txt'), lists_of_words)
+        actual = load_dictionary(dictionary)['Words'].count('bridge')
+        expected = 1
+        self.assertEqual(actual, expected)
+
+    def test_load_dictionary_large_word_list(self):
+        with open(self.path, 'w', encoding='utf-8') as file:
+            for number in range(120000):
+                word = ''.join(chr(97 + int(digit)) for digit in str(number))
+                file.write(f"{word}\n{word}\n")
+        index = load_dictionary(make_dictionary(self.path))
+        self.assertEqual(len(index['Words']), 120000)
+        self.assertEqual(sum(len(words) for words in index['By Length'].values()), 120000)
+
+    def test_load_dictionary_calibrates_once_per_word_list(self):
+        levels = {1: ['garden'], 2: ['apple'], 3: ['book']}
+        calibrate, calls = counting_calibrate(levels)
+        first = load_dictionary(make_dictionary(self.path, calibrate=calibrate))['Levels']
+        second = load_dictionary(make_dictionary(self.path, calibrate=calibrate))['Levels']
+        self.assertEqual((first, second, len(calls)), (levels, levels, 1))
+        self.assertTrue(os.path.exists(self.path + LEVELS_CACHE_SUFFIX))
+
+    def test_load_dictionary_recalibrates_changed_word_list(self):
+        calibrate, calls = counting_calibrate({1: [], 2: [], 3: ['book']})
+        load_dictionary(make_dictionary(self.path, calibrate=calibrate))
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write("tree\n")
+        load_dictionary(make_dictionary(self.path, calibrate=calibrate))
+        self.assertEqual(len(calls), 2)
+
+    def test_load_dictionary_ignores_corrupt_levels_cache(self):
+        with open(self.path + LEVELS_CACHE_SUFFIX, 'wb') as file:
+            file.write(b'BKGL garbage')
+        calibrate, calls = counting_calibrate({1: [], 2: [], 3: ['book']})
+        actual = load_dictionary(make_dictionary(self.path, calibrate=calibrate))['Levels']
+        self.assertEqual((actual, len(calls)), ({1: [], 2: [], 3: ['book']}, 1))
@@ -0,0 +1,60 @@
+import struct
+from unittest import TestCase
+
+from game import make_session
+from snapshot import dump_session, load_session
+
+
+class TestLoadSession(TestCase):
+
+    def setUp(self):
+        self.session = make_session()
+        self.session['Character']['Stat']['Current HP'] = 120
+        self.session['Character']['Inventory']['Kibble'] = 2
+        self.session['Grid'][1][1] = '.'
+        self.session['Grid'][1][2] = '🐶'
+        self.session['Location'] = (1, 2)
+
+    def test_load_session_round_trip(self):
+        actual = load_session(dump_session(self.session))
+        self.assertEqual(actual['Character'], self.session['Character'])
+        self.assertEqual(actual['Grid'], self.session['Grid'])
+        self.assertEqual(actual['Skill Set'], self.session['Skill Set'])
+        self.assertEqual(actual['Location'], (1, 2))
+        self.assertEqual(actual['Previous Cell'], self.session['Previous Cell'])
+        self.assertEqual(actual['Achieved Goal'], False)
+
+    def test_load_session_shares_nothing(self):
+        loaded = load_session(dump_session(self.session))
+        loaded['Character']['Stat']['Current HP'] = 1
+        loaded['Grid'][1][1] = '#'
+        self.assertEqual(self.session['Character']['Stat']['Current HP'], 120)
+        self.assertEqual(self.session['Grid'][1][1], '.')
+
+    def test_load_session_keeps_player_on_board(self):
+        loaded = load_session(dump_session(self.session))
+        actual = (loaded['Grid'].player, loaded['Grid'][1][2])
+        expected = ((1, 2), '🐶')
+        self.assertEqual(actual, expected)
+
+    def test_load_session_accepts_dictionaries(self):
+        self.session['Character'] = self.session['Character'].to_dict()
+        self.session['Grid'] = self.session['Grid'].to_lists()
+        actual = load_session(dump_session(self.session))
+        self.assertEqual(actual['Character'].to_dict(), self.session['Character'])
+        self.assertEqual(actual['Grid'].to_lists(), self.session['Grid'])
+
+    def test_load_session_not_a_snapshot(self):
+        with self.assertRaises(ValueError):
+            load_session(b'players.txt')
+
+    def test_load_session_unknown_version(self):
+        snapshot = dump_session(self.session)
+        with self.assertRaises(ValueError):
+            load_session(snapshot[:4] + struct.pack('<H', 99) + snapshot[6:])
+
+    def test_load_session_cut_short(self):
+        snapshot = dump_session(self.session)
+        for length in (3, 10, 100, len(snapshot) - 1):
+            with self.assertRaises(ValueError):
+                load_session(snapshot[:length])
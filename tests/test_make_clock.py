@@ -0,0 +1,29 @@
+from unittest import TestCase
+
+from clock import make_clock
+
+
+class TestMakeClock(TestCase):
+
+    def test_make_clock_default_is_real(self):
+        actual = make_clock()
+        expected = {'Mode': 'real', 'Speed': 1, 'Game Time': 0}
+        self.assertEqual(actual, expected)
+
+    def test_make_clock_scaled_keeps_speed(self):
+        actual = make_clock('scaled', 10)
+        expected = {'Mode': 'scaled', 'Speed': 10, 'Game Time': 0}
+        self.assertEqual(actual, expected)
+
+    def test_make_clock_virtual_ignores_speed(self):
+        actual = make_clock('virtual', 10)
+        expected = {'Mode': 'virtual', 'Speed': 1, 'Game Time': 0}
+        self.assertEqual(actual, expected)
+
+    def test_make_clock_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            make_clock('fast')
+
+    def test_make_clock_scaled_zero_speed(self):
+        with self.assertRaises(ValueError):
+            make_clock('scaled', 0)
@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+from minigames.battle import configure_enemy_stat
+from content import load_content
+from minigames.enemy_registry import make_enemy_registry
+
+
+class TestMakeEnemyRegistry(TestCase):
+
+    def setUp(self):
+        self.registry = make_enemy_registry(load_content()["Enemies"], configure_enemy_stat())
+
+    def test_make_enemy_registry_keys(self):
+        actual = sorted(self.registry)
+        expected = [(1, False), (2, False), (3, False), (3, True)]
+        self.assertEqual(actual, expected)
+
+    def test_make_enemy_registry_level_names(self):
+        actual = {key: [template['Name'] for template in templates] for key, templates in self.registry.items()}
+        expected = {(1, False): ['Mouse', 'Spider'], (2, False): ['Robotic Vacuum', 'Guard Cat'],
+                    (3, False): ['Giant Moth', 'Ghost'], (3, True): ['Majestic Fluffy BunBun']}
+        self.assertEqual(actual, expected)
+
+    def test_make_enemy_registry_tier_ranges(self):
+        ghost = self.registry[(3, False)][1]
+        actual = (ghost['HP Range'], ghost['Basic Attack'], ghost['Skill Damage'])
+        expected = ((301, 400), (60, 90), (75, 100))
+        self.assertEqual(actual, expected)
+
+    def test_make_enemy_registry_leaves_templates_unchanged(self):
+        self.assertNotIn('HP Range', load_content()["Enemies"][0])
+
+    def test_make_enemy_registry_many_templates(self):
+        templates = [load_content()["Enemies"][0] | {"Name": f"Mouse {number}"} for number in range(500)]
+        registry = make_enemy_registry(templates, configure_enemy_stat())
+        self.assertEqual(len(registry[(1, False)]), 500)
@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from board import level_template, make_level_board
+from make_board_each_level import make_board_lv1, make_board_lv2, make_board_lv3
+
+
+class TestMakeLevelBoard(TestCase):
+
+    def test_make_level_board_matches_builders(self):
+        actual = [make_level_board(level).to_lists() for level in (1, 2, 3)]
+        expected = [make_board_lv1(), make_board_lv2(), make_board_lv3()]
+        self.assertEqual(actual, expected)
+
+    def test_make_level_board_returns_new_boards(self):
+        first_board = make_level_board(3)
+        first_board[1][1] = '🐶'
+        first_board[2][2] = '#'
+        second_board = make_level_board(3)
+        actual = (second_board.player, second_board[2][2], second_board.is_passable(2, 2))
+        expected = (None, '.', True)
+        self.assertEqual(actual, expected)
+
+    def test_make_level_board_template_is_immutable(self):
+        template = level_template(1)
+        with self.assertRaises(AttributeError):
+            template.cells = b''
+        with self.assertRaises(TypeError):
+            template.cells[0] = 0
+
+    def test_make_level_board_unknown_level(self):
+        with self.assertRaises(KeyError):
+            make_level_board(4)
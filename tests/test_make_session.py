@@ -0,0 +1,28 @@
+from unittest import TestCase
+
+from game import make_session
+
+
+class TestMakeSession(TestCase):
+
+    def test_make_session_keys(self):
+        actual = list(make_session())
+        expected = ["Grid", "Location", "Previous Cell", "Skill Set", "Character", "Achieved Goal"]
+        self.assertEqual(actual, expected)
+
+    def test_make_session_character_placed_on_level_1_board(self):
+        session = make_session()
+        actual = (session['Location'], session['Previous Cell'], session['Grid'][1][1], session['Grid'][7][1])
+        expected = ((1, 1), '.', '🐶', '!')
+        self.assertEqual(actual, expected)
+
+    def test_make_session_character_has_level_1_skills(self):
+        session = make_session()
+        actual = session['Character']['Skill']['Current Skills']
+        expected = session['Skill Set']['Level 1']
+        self.assertEqual(actual, expected)
+
+    def test_make_session_goal_not_achieved(self):
+        actual = make_session()['Achieved Goal']
+        expected = False
+        self.assertEqual(actual, expected)
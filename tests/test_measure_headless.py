@@ -0,0 +1,17 @@
+from unittest import TestCase
+
+from benchmark import measure_headless
+
+
+class TestMeasureHeadless(TestCase):
+
+    def test_measure_headless_buffered_writes_less(self):
+        line_by_line = measure_headless(buffered=False, playthroughs=2, seed=3)
+        buffered = measure_headless(buffered=True, playthroughs=2, seed=3)
+        self.assertEqual(buffered['Bytes'], line_by_line['Bytes'])
+        self.assertEqual(buffered['Turns'], line_by_line['Turns'])
+        self.assertLess(buffered['Writes'] * 3, line_by_line['Writes'])
+
+    def test_measure_headless_buffered_writes_about_once_per_prompt(self):
+        buffered = measure_headless(buffered=True, playthroughs=2, seed=3)
+        self.assertLessEqual(buffered['Writes'], buffered['Prompts'] * 2)
@@ -1,5 +1,11 @@
+import asyncio
+import time
+from io import StringIO
 from unittest import TestCase
 from unittest.mock import patch
+
+from clock import make_clock
+from console import SessionOutput, remote, run_sync, use_clock
 from minigames.matching_direction_game import play_game
 
 
@@ -9,7 +15,7 @@ class Test(TestCase):
     def test_play_game_success_boolean(self, _, __):
         character = {'Stat': {'Heart': 1}}
         level = 4
-        actual, updated_character = play_game(level, character)
+        actual, updated_character = run_sync(play_game(level, character))
         expected = True
         self.assertEqual(actual, expected)
 
@@ -18,7 +24,7 @@ class Test(TestCase):
     def test_play_game_success_save_heart(self, _, __):
         character = {'Stat': {'Heart': 1}}
         level = 4
-        result, actual = play_game(level, character)
+        result, actual = run_sync(play_game(level, character))
         expected = {'Stat': {'Heart': 1}}
         self.assertEqual(actual, expected)
 
@@ -27,7 +33,7 @@ class Test(TestCase):
     def test_play_game_failure_boolean(self, _, __):
         character = {'Stat': {'Heart': 3, 'Current HP': 30, 'HP': 100}}
         level = 4
-        actual, updated_character = play_game(level, character)
+        actual, updated_character = run_sync(play_game(level, character))
         expected = False
         self.assertEqual(actual, expected)
 
@@ -36,6 +42,48 @@ class Test(TestCase):
     def test_play_game_failure_reduce_heart(self, _, __):
         character = {'Stat': {'Heart': 3, 'Current HP': 30, 'HP': 100}}
         level = 4
-        result, actual = play_game(level, character)
+        result, actual = run_sync(play_game(level, character))
         expected = {'Stat': {'Heart': 2, 'Current HP': 100, 'HP': 100}}
         self.assertEqual(actual, expected)
+
+    @patch('builtins.input', side_effect=['A', 'S'])
+    @patch('random.choices', return_value=['A', 'D', 'S', 'W'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_play_game_stops_at_first_mistake(self, _, __, mock_input):
+        character = {'Stat': {'Heart': 3, 'Current HP': 30, 'HP': 100}}
+        with use_clock(make_clock('virtual')):
+            actual, _ = run_sync(play_game(4, character))
+        self.assertFalse(actual)
+        self.assertEqual(mock_input.call_count, 2)
+
+    @patch('time.sleep')
+    @patch('random.choices', return_value=['W'] * 120)
+    @patch('builtins.input', side_effect=['w'] * 120)
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_play_game_long_sequence_on_virtual_clock(self, _, __, ___, mock_sleep):
+        clock = make_clock('virtual')
+        with use_clock(clock):
+            actual, _ = run_sync(play_game(120, {'Stat': {'Heart': 1}}))
+        self.assertTrue(actual)
+        self.assertEqual(clock['Game Time'], 5)
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    @patch('sys.stdout', new_callable=lambda: SessionOutput(StringIO()))
+    def test_play_game_remote_countdowns_share_one_thread(self, _, mock_sleep):
+        async def answer(prompt, topic):
+            return 'x'
+
+        async def play():
+            with remote(answer, StringIO(), make_clock('scaled', 100)):
+                return await play_game(5, {'Stat': {'Heart': 3, 'Current HP': 1, 'HP': 1}})
+
+        async def play_side_by_side():
+            return await asyncio.gather(*(play() for _ in range(100)))
+
+        start = time.perf_counter()
+        results = asyncio.run(play_side_by_side())
+        seconds = time.perf_counter() - start
+        self.assertEqual([has_won for has_won, _ in results], [False] * 100)
+        self.assertLess(seconds, 1)
+        mock_sleep.assert_not_called()
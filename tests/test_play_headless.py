@@ -0,0 +1,56 @@
+import sys
+from unittest import TestCase
+from unittest.mock import patch
+
+from content import load_content
+from simulation import play_headless, random_policy
+
+
+class TestPlayHeadless(TestCase):
+
+    def test_play_headless_result_keys(self):
+        actual = sorted(play_headless(seed=1))
+        expected = ['Encounters', 'Hearts Lost', 'Steps Per Level', 'Turns', 'Won']
+        self.assertEqual(actual, expected)
+
+    def test_play_headless_same_seed_same_result(self):
+        actual = play_headless(seed=42)
+        expected = play_headless(seed=42)
+        self.assertEqual(actual, expected)
+
+    def test_play_headless_game_ends(self):
+        result = play_headless(random_policy, seed=7)
+        self.assertTrue(result['Won'] or result['Hearts Lost'] == 10)
+
+    def test_play_headless_steps_add_up_to_turns(self):
+        result = play_headless(seed=3)
+        actual = sum(result['Steps Per Level'].values())
+        expected = result['Turns']
+        self.assertEqual(actual, expected)
+
+    def test_play_headless_counts_steps_on_every_level_of_pack(self):
+        content = load_content()
+        pack = content | {key: dict(content[key]) for key in ('Skills', 'Boards', 'Levels', 'Max Exp')}
+        pack['Boards'][4] = ('#####', '#...#', '#.#!#', '#####')
+        pack['Levels'][4] = {'Max Exp': 1800, 'HP Gain': 300, 'Description': 'THE ROOF'}
+        pack['Max Exp']['Level 4'] = 1800
+        pack['Skills']['Level 4'] = pack['Skills']['Level 3']
+        with patch('content.load_content', return_value=pack), patch('game.load_content', return_value=pack):
+            result = play_headless(seed=3, max_turns=5)
+        actual = result['Steps Per Level']
+        expected = {1: 5, 2: 0, 3: 0, 4: 0}
+        self.assertEqual(actual, expected)
+
+    def test_play_headless_stops_at_max_turns(self):
+        actual = play_headless(seed=5, max_turns=3)['Turns']
+        expected = 3
+        self.assertEqual(actual, expected)
+
+    @patch('builtins.input')
+    @patch('time.sleep')
+    def test_play_headless_never_waits_or_prompts(self, mock_sleep, mock_input):
+        original_stdout = sys.stdout
+        play_headless(seed=11)
+        mock_sleep.assert_not_called()
+        mock_input.assert_not_called()
+        self.assertIs(sys.stdout, original_stdout)
@@ -0,0 +1,75 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from assets import clear_assets, read_text_asset, reload_assets
+
+
+class TestReadTextAsset(TestCase):
+
+    def setUp(self):
+        clear_assets()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'help.txt')
+        with open(self.path, 'w') as file:
+            file.write("Use W/A/S/D to move.   \nPress 6 for help.\n")
+
+    def tearDown(self):
+        clear_assets()
+        self.directory.cleanup()
+
+    def test_read_text_asset_lines(self):
+        actual = read_text_asset(self.path)
+        expected = ('Use W/A/S/D to move.', 'Press 6 for help.')
+        self.assertEqual(actual, expected)
+
+    def test_read_text_asset_reads_file_once(self):
+        read_text_asset(self.path)
+        with patch('builtins.open') as mock_open:
+            for _ in range(100):
+                read_text_asset(self.path)
+        mock_open.assert_not_called()
+
+    def test_read_text_asset_cached_lookup_makes_no_system_call(self):
+        read_text_asset(self.path)
+        with patch('os.stat') as mock_stat:
+            for _ in range(100):
+                read_text_asset(self.path)
+        mock_stat.assert_not_called()
+
+    def test_read_text_asset_shares_one_copy(self):
+        actual = read_text_asset(self.path)
+        expected = read_text_asset(self.path)
+        self.assertIs(actual, expected)
+
+    def test_read_text_asset_reads_changed_file_on_reload(self):
+        read_text_asset(self.path)
+        with open(self.path, 'w') as file:
+            file.write("Press 6 for help.\n")
+        status = os.stat(self.path)
+        os.utime(self.path, ns=(status.st_atime_ns, status.st_mtime_ns + 1_000_000_000))
+        before = read_text_asset(self.path)
+        reload_assets()
+        actual = (before, read_text_asset(self.path))
+        expected = (('Use W/A/S/D to move.', 'Press 6 for help.'), ('Press 6 for help.',))
+        self.assertEqual(actual, expected)
+
+    def test_read_text_asset_reload_keeps_unchanged_file(self):
+        expected = read_text_asset(self.path)
+        reload_assets()
+        with patch('builtins.open') as mock_open:
+            actual = read_text_asset(self.path)
+        mock_open.assert_not_called()
+        self.assertIs(actual, expected)
+
+    def test_read_text_asset_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            read_text_asset(os.path.join(self.directory.name, 'missing.txt'))
+
+    def test_read_text_asset_file_removed(self):
+        read_text_asset(self.path)
+        os.remove(self.path)
+        reload_assets()
+        with self.assertRaises(FileNotFoundError):
+            read_text_asset(self.path)
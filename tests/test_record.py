@@ -0,0 +1,32 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from console import ask, headless, record, run_sync
+
+
+class TestRecord(TestCase):
+
+    def test_record_headless_answers(self):
+        recorded = []
+        with headless(lambda prompt, topic: {'direction': 'w', 'battle': '2'}[topic]), record(recorded):
+            run_sync(ask("Enter the direction you wish to travel (W/A/S/D): ", 'direction'))
+            run_sync(ask("Enter the number of your choice: ", 'battle'))
+        expected = [['direction', 'w'], ['battle', '2']]
+        self.assertEqual(recorded, expected)
+
+    @patch('builtins.input', return_value='e')
+    def test_record_terminal_answers(self, _):
+        recorded = []
+        with record(recorded):
+            run_sync(ask("Guess a letter: ", 'guess'))
+        expected = [['guess', 'e']]
+        self.assertEqual(recorded, expected)
+
+    @patch('builtins.input', return_value='e')
+    def test_record_stops_after_block(self, _):
+        recorded = []
+        with record(recorded):
+            pass
+        run_sync(ask("Guess a letter: ", 'guess'))
+        expected = []
+        self.assertEqual(recorded, expected)
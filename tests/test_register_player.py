@@ -0,0 +1,65 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase
+
+from player_registry import import_players_file, open_registry, register_player
+
+
+class TestRegisterPlayer(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.registry_path = os.path.join(self.directory.name, 'players.db')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_register_player_new_then_returning(self):
+        registry = open_registry(self.registry_path, os.devnull)
+        actual = (register_player(registry, 'Heather'), register_player(registry, 'Heather'))
+        registry.close()
+        expected = (True, False)
+        self.assertEqual(actual, expected)
+
+    def test_register_player_returning_player_only_reads(self):
+        registry = open_registry(self.registry_path, os.devnull)
+        register_player(registry, 'Heather')
+        statements = []
+        registry.set_trace_callback(statements.append)
+        actual = register_player(registry, 'Heather')
+        registry.close()
+        self.assertEqual((actual, [statement.split()[0] for statement in statements]), (False, ['SELECT']))
+
+    def test_register_player_uses_write_ahead_log(self):
+        registry = open_registry(self.registry_path, os.devnull)
+        actual = registry.execute('PRAGMA journal_mode').fetchone()[0]
+        registry.close()
+        self.assertEqual(actual, 'wal')
+
+    def test_register_player_concurrent_sessions_register_once(self):
+        open_registry(self.registry_path, os.devnull).close()
+        results = []
+
+        def register():
+            registry = open_registry(self.registry_path, os.devnull)
+            results.append(register_player(registry, 'Baekgu'))
+            registry.close()
+
+        threads = [threading.Thread(target=register) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(results), [False] * 7 + [True])
+
+    def test_register_player_import_players_file(self):
+        legacy_path = os.path.join(self.directory.name, 'players.txt')
+        with open(legacy_path, 'w') as players:
+            players.write("Heather\nYoung Bin\nHeather")
+        registry = open_registry(self.registry_path, os.devnull)
+        imported = import_players_file(registry, legacy_path)
+        actual = (imported, register_player(registry, 'Young Bin'), register_player(registry, 'Haru'))
+        registry.close()
+        expected = (2, False, True)
+        self.assertEqual(actual, expected)
@@ -0,0 +1,86 @@
+import asyncio
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from clock import make_clock
+from console import SessionOutput, ask, pause, remote, run_sync
+
+
+async def answer_with_topic(prompt, topic):
+    return f'{topic}!'
+
+
+async def answer_nothing(prompt, topic):
+    return ''
+
+
+class TestRemote(TestCase):
+
+    def test_remote_answers_prompts(self):
+        async def play():
+            with remote(answer_with_topic, StringIO(), make_clock('virtual')):
+                return await ask("Enter the number of your choice: ", 'menu')
+
+        actual = asyncio.run(play())
+        expected = 'menu!'
+        self.assertEqual(actual, expected)
+
+    @patch('time.sleep')
+    def test_remote_uses_clock(self, mock_sleep):
+        clock = make_clock('virtual')
+
+        async def play():
+            with remote(answer_nothing, StringIO(), clock):
+                await pause(1.5)
+
+        asyncio.run(play())
+        mock_sleep.assert_not_called()
+        self.assertEqual(clock['Game Time'], 1.5)
+
+    @patch('time.sleep')
+    def test_remote_pauses_wait_on_event_loop(self, mock_sleep):
+        async def play():
+            with remote(answer_nothing, StringIO(), make_clock('real')):
+                await pause(0.2)
+
+        async def play_side_by_side():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await asyncio.gather(*(play() for _ in range(50)))
+            return loop.time() - start
+
+        seconds = asyncio.run(play_side_by_side())
+        mock_sleep.assert_not_called()
+        self.assertLess(seconds, 2)
+
+    def test_remote_cannot_run_without_event_loop(self):
+        with remote(answer_nothing, StringIO(), make_clock('real')):
+            with self.assertRaises(RuntimeError):
+                run_sync(pause(1))
+
+    @patch('sys.stdout', new_callable=lambda: SessionOutput(StringIO()))
+    def test_remote_prints_to_session_output(self, mock_output):
+        output = StringIO()
+        with remote(answer_nothing, output, make_clock('virtual')):
+            print("You moved one step up.")
+        print("Back at the terminal")
+        self.assertEqual(output.getvalue(), "You moved one step up.\n")
+        self.assertEqual(mock_output.terminal.getvalue(), "Back at the terminal\n")
+
+    @patch('sys.stdout', new_callable=lambda: SessionOutput(StringIO()))
+    def test_remote_sessions_on_one_event_loop_stay_apart(self, _):
+        outputs = [StringIO(), StringIO()]
+
+        async def play(output, name):
+            with remote(answer_nothing, output, make_clock('virtual')):
+                for _ in range(100):
+                    print(name)
+                    await pause(0)
+
+        async def play_side_by_side():
+            await asyncio.gather(*(play(output, name) for output, name in zip(outputs, ['Haru', 'Baekgu'])))
+
+        asyncio.run(play_side_by_side())
+        self.assertEqual(outputs[0].getvalue(), "Haru\n" * 100)
+        self.assertEqual(outputs[1].getvalue(), "Baekgu\n" * 100)
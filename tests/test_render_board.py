@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+from board import make_level_board
+from renderer import CLEAR_SCREEN, make_renderer, render_board
+
+
+class TestRenderBoard(TestCase):
+
+    def setUp(self):
+        self.terminal_size = (80, 24)
+        self.renderer = make_renderer(lambda: self.terminal_size)
+        self.board = make_level_board(1)
+        self.board[1][1] = '🐶'
+
+    def test_render_board_first_draw_is_full(self):
+        actual = render_board(self.renderer, self.board)
+        expected = CLEAR_SCREEN + '\n'.join(' '.join(row) for row in self.board) + '\x1b[12;24r\x1b[24;1H'
+        self.assertEqual(actual, expected)
+
+    def test_render_board_unchanged_sends_nothing(self):
+        render_board(self.renderer, self.board)
+        actual = render_board(self.renderer, self.board)
+        expected = ''
+        self.assertEqual(actual, expected)
+
+    def test_render_board_sends_only_changed_cells(self):
+        render_board(self.renderer, self.board)
+        self.board[1][1] = '.'
+        self.board[1][2] = '🐶'
+        actual = render_board(self.renderer, self.board)
+        expected = '\x1b7\x1b[2;3H. 🐶 . . . . . # #\x1b[K\x1b8'
+        self.assertEqual(actual, expected)
+
+    def test_render_board_moves_past_wide_player(self):
+        render_board(self.renderer, self.board)
+        self.board[1][6] = '!'
+        actual = render_board(self.renderer, self.board)
+        expected = '\x1b7\x1b[2;14H! . # #\x1b[K\x1b8'
+        self.assertEqual(actual, expected)
+
+    def test_render_board_redraws_after_resize(self):
+        render_board(self.renderer, self.board)
+        self.terminal_size = (100, 40)
+        actual = render_board(self.renderer, self.board)
+        self.assertTrue(actual.startswith(CLEAR_SCREEN))
+        self.assertTrue(actual.endswith('\x1b[12;40r\x1b[40;1H'))
+
+    def test_render_board_prints_in_full_when_terminal_too_small(self):
+        self.terminal_size = (80, 10)
+        render_board(self.renderer, self.board)
+        actual = render_board(self.renderer, self.board)
+        expected = ''.join(' '.join(row) + '\n' for row in self.board)
+        self.assertEqual(actual, expected)
+
+    def test_render_board_cuts_bytes_per_move(self):
+        full = render_board(self.renderer, self.board)
+        self.board[1][1] = '.'
+        self.board[2][1] = '🐶'
+        self.board[2][1] = '.'
+        self.board[1][1] = '🐶'
+        render_board(self.renderer, self.board)
+        moves = render_board(self.renderer, self.board)
+        self.assertLess(len(moves.encode()) * 10, len(full.encode()))
@@ -0,0 +1,92 @@
+import glob
+import itertools
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from console import headless, run_sync
+from game import game
+from recording import read_recording
+from replay import ReplayDiverged, replay_recording
+
+ANSWERS = {'name': 'Heather', 'battle': '1', 'item': 'q', 'memory': 'A', 'continue': '', 'skill': 'Bark',
+           'menu': '1'}
+
+
+def record_game(directory: str, prompts: int, hangman_mode: str = 'classic') -> dict:
+    directions, letters = itertools.cycle('wasd'), itertools.cycle('etaoinshrdlucmfpgwybvkxjqz')
+    asked = itertools.count(1)
+
+    def answer(_, topic):
+        if next(asked) > prompts:
+            raise KeyboardInterrupt
+        if topic == 'direction':
+            return next(directions)
+        if topic == 'guess':
+            return next(letters)
+        return ANSWERS[topic]
+
+    with patch('game.check_user', return_value=True), headless(answer):
+        try:
+            run_sync(game(None, directory, hangman_mode))
+        except KeyboardInterrupt:
+            pass
+    return read_recording(glob.glob(os.path.join(directory, '*.json'))[0])
+
+
+class TestReplayRecording(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.recording = record_game(self.directory.name, 300)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_replay_recording_matches(self):
+        actual = replay_recording(self.recording)
+        expected = {"Turns": self.recording["Turns"], "Answers": len(self.recording["Answers"]), "Matches": True}
+        self.assertEqual(actual, expected)
+
+    def test_replay_recording_keeps_only_complete_turns(self):
+        self.assertGreater(self.recording["Turns"], 0)
+        self.assertLess(len(self.recording["Answers"]), 300)
+
+    def test_replay_recording_evil_hangman_mode(self):
+        recording = record_game(self.directory.name + '/evil', 300, 'evil')
+        self.assertEqual(recording["Hangman Mode"], 'evil')
+        self.assertTrue(replay_recording(recording)["Matches"])
+
+    def test_replay_recording_notices_a_different_end(self):
+        self.recording["Final State"] = '0' * 32
+        actual = replay_recording(self.recording)["Matches"]
+        self.assertFalse(actual)
+
+    def test_replay_recording_notices_a_different_seed(self):
+        self.recording["Seed"] += 1
+        try:
+            actual = replay_recording(self.recording)["Matches"]
+        except ReplayDiverged:
+            actual = False
+        self.assertFalse(actual)
+
+    def test_replay_recording_runs_out_of_answers(self):
+        self.recording["Answers"].pop()
+        with self.assertRaises(ReplayDiverged):
+            replay_recording(self.recording)
+
+    def test_replay_recording_leftover_answers(self):
+        self.recording["Turns"] -= 1
+        with self.assertRaises(ReplayDiverged):
+            replay_recording(self.recording)
+
+    def test_replay_recording_wrong_topic(self):
+        self.recording["Answers"][0] = ['guess', 'e']
+        with self.assertRaises(ReplayDiverged):
+            replay_recording(self.recording)
+
+    @patch('time.sleep')
+    def test_replay_recording_never_sleeps(self, mock_sleep):
+        replay_recording(self.recording)
+        mock_sleep.assert_not_called()
@@ -0,0 +1,141 @@
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from server import make_server_state, start_server
+
+NAME_PROMPT = b"What's your name? : "
+MENU_PROMPT = b"Enter the number of your choice: "
+
+
+def welcome_back(user_name):
+    print(f"Welcome back, {user_name}!")
+    return True
+
+
+class TestServePlayer(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.original_stdout = sys.stdout
+        self.save_directory = tempfile.TemporaryDirectory()
+        self.state = make_server_state(max_sessions=2, clock_mode='virtual', idle_timeout=5,
+                                       save_directory=self.save_directory.name, recording_directory=None)
+        self.server = await start_server(self.state)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+        sys.stdout = self.original_stdout
+        self.save_directory.cleanup()
+
+    async def connect(self):
+        return await asyncio.wait_for(asyncio.open_connection('127.0.0.1', self.port), 5)
+
+    async def wait_for_sessions(self, count):
+        for _ in range(500):
+            if self.state['Sessions'] == count:
+                return
+            await asyncio.sleep(0.01)
+        self.fail(f"Expected {count} sessions, found {self.state['Sessions']}")
+
+    async def test_serve_player_asks_for_name(self):
+        reader, writer = await self.connect()
+        greeting = await asyncio.wait_for(reader.readuntil(NAME_PROMPT), 5)
+        self.assertTrue(greeting.startswith(b"Hi, there!"))
+        writer.close()
+        await self.wait_for_sessions(0)
+
+    @patch('game.check_user', side_effect=welcome_back)
+    async def test_serve_player_keeps_sessions_apart(self, _):
+        first_reader, first_writer = await self.connect()
+        second_reader, second_writer = await self.connect()
+        await asyncio.wait_for(first_reader.readuntil(NAME_PROMPT), 5)
+        await asyncio.wait_for(second_reader.readuntil(NAME_PROMPT), 5)
+        first_writer.write(b"Haru\r\n")
+        second_writer.write(b"Baekgu\r\n")
+        first_output = await asyncio.wait_for(first_reader.readuntil(MENU_PROMPT), 5)
+        second_output = await asyncio.wait_for(second_reader.readuntil(MENU_PROMPT), 5)
+        self.assertIn("Welcome back, Haru!\r\n".encode(), first_output)
+        self.assertNotIn(b"Baekgu", first_output)
+        self.assertIn("Welcome back, Baekgu!\r\n".encode(), second_output)
+        self.assertNotIn(b"Haru", second_output)
+        first_writer.close()
+        second_writer.close()
+        await self.wait_for_sessions(0)
+
+    @patch('game.check_user', side_effect=welcome_back)
+    async def test_serve_player_answers_menu(self, _):
+        reader, writer = await self.connect()
+        await asyncio.wait_for(reader.readuntil(NAME_PROMPT), 5)
+        writer.write(b"Haru\n")
+        await asyncio.wait_for(reader.readuntil(MENU_PROMPT), 5)
+        writer.write(b"8\n")
+        output = await asyncio.wait_for(reader.readuntil(MENU_PROMPT), 5)
+        self.assertIn("❌ Invalid input. Please enter a valid choice (1-7).".encode(), output)
+        writer.close()
+        await self.wait_for_sessions(0)
+
+    async def test_serve_player_turns_away_when_full(self):
+        connections = [await self.connect() for _ in range(2)]
+        for reader, _ in connections:
+            await asyncio.wait_for(reader.readuntil(NAME_PROMPT), 5)
+        reader, writer = await self.connect()
+        actual = await asyncio.wait_for(reader.read(), 5)
+        expected = b"The server is full. Please try again later.\r\n"
+        self.assertEqual(actual, expected)
+        writer.close()
+        for _, connected_writer in connections:
+            connected_writer.close()
+        await self.wait_for_sessions(0)
+
+    @patch('game.check_user', side_effect=welcome_back)
+    async def test_serve_player_idle_sessions_hold_no_threads(self, _):
+        self.state['Max Sessions'] = 200
+        threads = threading.active_count()
+        connections = [await self.connect() for _ in range(200)]
+        for number, (reader, writer) in enumerate(connections):
+            await asyncio.wait_for(reader.readuntil(NAME_PROMPT), 5)
+            writer.write(f"Haru {number}\r\n".encode())
+        for reader, _ in connections:
+            await asyncio.wait_for(reader.readuntil(MENU_PROMPT), 5)
+        await self.wait_for_sessions(200)
+        self.assertLessEqual(threading.active_count(), threads)
+        for _, writer in connections:
+            writer.write(b"8\r\n")
+        for reader, _ in connections:
+            output = await asyncio.wait_for(reader.readuntil(MENU_PROMPT), 5)
+            self.assertIn("❌ Invalid input. Please enter a valid choice (1-7).".encode(), output)
+        for _, writer in connections:
+            writer.close()
+        await self.wait_for_sessions(0)
+
+    async def test_serve_player_ends_session_when_player_leaves(self):
+        reader, writer = await self.connect()
+        await asyncio.wait_for(reader.readuntil(NAME_PROMPT), 5)
+        await self.wait_for_sessions(1)
+        writer.close()
+        await self.wait_for_sessions(0)
+
+    @patch('game.check_user', side_effect=welcome_back)
+    async def test_serve_player_resumes_saved_game(self, _):
+        reader, writer = await self.connect()
+        await asyncio.wait_for(reader.readuntil(NAME_PROMPT), 5)
+        writer.write(b"Haru\r\n")
+        first_output = await asyncio.wait_for(reader.readuntil(MENU_PROMPT), 5)
+        writer.close()
+        await self.wait_for_sessions(0)
+        self.assertNotIn("Welcome back! Your adventure continues".encode(), first_output)
+        self.assertEqual(len(os.listdir(self.save_directory.name)), 1)
+
+        reader, writer = await self.connect()
+        await asyncio.wait_for(reader.readuntil(NAME_PROMPT), 5)
+        writer.write(b"Haru\r\n")
+        second_output = await asyncio.wait_for(reader.readuntil(MENU_PROMPT), 5)
+        writer.close()
+        await self.wait_for_sessions(0)
+        self.assertIn("Welcome back! Your adventure continues right where you left off.".encode(), second_output)
@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+from simulation import simulate, random_policy
+
+
+class TestSimulate(TestCase):
+
+    def test_simulate_keys(self):
+        actual = sorted(simulate(2, workers=1))
+        expected = ['Encounters', 'Hearts Lost', 'Playthroughs', 'Steps Per Level', 'Win Rate']
+        self.assertEqual(actual, expected)
+
+    def test_simulate_counts_every_playthrough(self):
+        actual = simulate(7, seed=3, workers=1, chunk_size=2)['Playthroughs']
+        expected = 7
+        self.assertEqual(actual, expected)
+
+    def test_simulate_same_seed_same_summary(self):
+        actual = simulate(5, seed=9, workers=1)
+        expected = simulate(5, seed=9, workers=1)
+        self.assertEqual(actual, expected)
+
+    def test_simulate_summary_does_not_depend_on_chunks(self):
+        actual = simulate(6, seed=4, workers=1, chunk_size=1)
+        expected = simulate(6, seed=4, workers=1, chunk_size=6)
+        self.assertEqual(actual, expected)
+
+    def test_simulate_summary_does_not_depend_on_workers(self):
+        actual = simulate(6, seed=2, policy=random_policy, workers=2, chunk_size=2)
+        expected = simulate(6, seed=2, policy=random_policy, workers=1)
+        self.assertEqual(actual, expected)
+
+    def test_simulate_win_rate_between_zero_and_one(self):
+        win_rate = simulate(5, workers=1)['Win Rate']
+        self.assertTrue(0 <= win_rate <= 1)
+
+    def test_simulate_greedy_policy_wins(self):
+        win_rate = simulate(20, seed=1, workers=1)['Win Rate']
+        self.assertGreater(win_rate, 0)
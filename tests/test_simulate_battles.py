@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+import numpy as np
+
+from minigames.battle import configure_enemy_stat
+from minigames.battle_simulator import simulate_battles, tier_spec, enemy_spec
+
+
+class TestSimulateBattles(TestCase):
+
+    def test_simulate_battles_one_result_per_fight(self):
+        results = simulate_battles(np.full(1000, 20), 25, 250, tier_spec(configure_enemy_stat(), 'Level 2'), seed=1)
+        actual = [results[key].shape for key in ["Won", "Turns", "HP Remaining"]]
+        expected = [(1000,), (1000,), (1000,)]
+        self.assertEqual(actual, expected)
+
+    def test_simulate_battles_basic_attack_turns_and_hp(self):
+        spec = enemy_spec({'HP': 100, 'Attack': {'Nibble': 10, 'Basic Attack': 10}})
+        results = simulate_battles(25, 50, 250, spec, policy='basic attack')
+        actual = (bool(results['Won'][0]), int(results['Turns'][0]), int(results['HP Remaining'][0]))
+        expected = (True, 4, 220)
+        self.assertEqual(actual, expected)
+
+    def test_simulate_battles_skills_first_uses_skill_until_limit(self):
+        spec = enemy_spec({'HP': 300, 'Attack': {'Nibble': 1, 'Basic Attack': 1}})
+        results = simulate_battles(10, 50, 250, spec, policy='skills first')
+        actual = int(results['Turns'][0])
+        expected = 10
+        self.assertEqual(actual, expected)
+
+    def test_simulate_battles_player_dies(self):
+        spec = enemy_spec({'HP': 600, 'Attack': {'Cuddle Crush': 200, 'Basic Attack': 200}})
+        results = simulate_battles(10, 10, 250, spec)
+        actual = (bool(results['Won'][0]), int(results['Turns'][0]), int(results['HP Remaining'][0]))
+        expected = (False, 2, 0)
+        self.assertEqual(actual, expected)
+
+    def test_simulate_battles_same_seed_same_results(self):
+        spec = tier_spec(configure_enemy_stat(), 'Level 2')
+        first = simulate_battles(np.arange(10, 30), 30, 250, spec, seed=7)
+        second = simulate_battles(np.arange(10, 30), 30, 250, spec, seed=7)
+        self.assertTrue(np.array_equal(first['HP Remaining'], second['HP Remaining']))
+
+    def test_simulate_battles_stops_at_max_turns(self):
+        spec = enemy_spec({'HP': 100, 'Attack': {'Nibble': 0, 'Basic Attack': 0}})
+        results = simulate_battles(0, 0, 250, spec, max_turns=50)
+        actual = (bool(results['Won'][0]), int(results['Turns'][0]))
+        expected = (False, 50)
+        self.assertEqual(actual, expected)
+
+    def test_simulate_battles_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            simulate_battles(10, 10, 250, tier_spec(configure_enemy_stat(), 'Level 1'), policy='flee')
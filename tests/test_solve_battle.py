@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+from minigames.battle_simulator import simulate_battles
+from minigames.battle_solver import solve_battle
+
+
+class TestSolveBattle(TestCase):
+
+    def test_solve_battle_chances_add_up_to_one(self):
+        actual = sum(solve_battle(15, 40, 450, (201, 300), (35, 50), (46, 70), 'skills first', 100))
+        expected = 1.0
+        self.assertAlmostEqual(actual, expected)
+
+    def test_solve_battle_always_win_against_weak_enemy(self):
+        win, flee, death = solve_battle(100, 100, 250, (80, 100), (5, 10), (10, 25))
+        self.assertAlmostEqual(win, 1.0)
+        self.assertEqual((flee, death), (0.0, 0.0))
+
+    def test_solve_battle_never_flee_without_threshold(self):
+        win, flee, death = solve_battle(20, 25, 250, (301, 400), (60, 90), (75, 100))
+        self.assertEqual(flee, 0.0)
+
+    def test_solve_battle_flee_instead_of_dying(self):
+        win, flee, death = solve_battle(10, 10, 250, (500, 600), (100, 100), (100, 100), 'basic attack', 100)
+        self.assertAlmostEqual(flee, 1.0)
+        self.assertEqual((win, death), (0.0, 0.0))
+
+    def test_solve_battle_fixed_enemy(self):
+        win, flee, death = solve_battle(50, 50, 100, (150, 150), (60, 60), (30, 30), 'basic attack')
+        self.assertAlmostEqual(win, 0.75)
+        self.assertAlmostEqual(death, 0.25)
+
+    def test_solve_battle_matches_simulated_battles(self):
+        spec = {'HP': (101, 200), 'Basic Attack': (15, 30), 'Skill Damage': (26, 45)}
+        simulated = simulate_battles([22] * 200000, 30, 250, spec, 'skills first', seed=1)['Win Probability']
+        win, _, _ = solve_battle(22, 30, 250, spec['HP'], spec['Basic Attack'], spec['Skill Damage'], 'skills first')
+        self.assertAlmostEqual(win, float(simulated), places=2)
+
+    def test_solve_battle_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            solve_battle(10, 10, 250, (80, 100), (5, 10), (10, 25), 'flee')
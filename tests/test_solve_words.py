@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from minigames.hangman_solver import best_guess, pattern_index, solve_words
+
+
+class TestSolveWords(TestCase):
+
+    def test_solve_words_plays_every_distinct_word(self):
+        words = ['book', 'cook', 'cool', 'book', 'apple', 'maple', 'ample']
+        actual = sorted(solve_words(words))
+        expected = ['ample', 'apple', 'book', 'cook', 'cool', 'maple']
+        self.assertEqual(actual, expected)
+
+    def test_solve_words_single_word_needs_only_its_letters(self):
+        actual = solve_words(['pebble'])['pebble']
+        expected = {'Guesses': 4, 'Wrong Guesses': 0, 'Loses': False}
+        self.assertEqual(actual, expected)
+
+    def test_solve_words_counts_wrong_guesses(self):
+        actual = solve_words(['book', 'cook', 'cool'])['book']
+        expected = {'Guesses': 4, 'Wrong Guesses': 1, 'Loses': False}
+        self.assertEqual(actual, expected)
+
+    def test_solve_words_loses_after_eight_wrong_guesses(self):
+        words = ['a' * 3 + letter for letter in 'bcdefghijklmnopqrstuvwxyz']
+        results = solve_words(words)
+        self.assertTrue(any(result['Loses'] for result in results.values()))
+        self.assertTrue(all(result['Loses'] == (result['Wrong Guesses'] >= 8) for result in results.values()))
+
+    def test_solve_words_bitsets_and_lists_agree(self):
+        words = [first + second + third for first in 'bcdfg' for second in 'aeiou' for third in 'lmnprst']
+        index = pattern_index(words)
+        every_word = (1 << len(words)) - 1
+        actual = best_guess(index, every_word, 0)[0]
+        expected = best_guess(index, list(range(len(words))), 0)[0]
+        self.assertEqual(actual, expected)
+
+    def test_solve_words_large_dictionary(self):
+        syllables = ['ba', 'ke', 'ti', 'ro', 'mu', 'sa', 'len', 'tor', 'pi', 'ga']
+        words = [first + second + third for first in syllables for second in syllables for third in syllables]
+        results = solve_words(words)
+        self.assertEqual(len(results), len(set(words)))
+        self.assertTrue(all(result['Guesses'] >= result['Wrong Guesses'] for result in results.values()))
@@ -0,0 +1,123 @@
+import os
+import subprocess
+import sys
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from board import level_template, make_level_board
+from content import load_content
+from game import make_session, take_turn
+from console import run_sync
+from pathfinding import level_distances, level_goal
+
+
+def clear_level_caches():
+    for cached in (level_template, level_goal, level_distances):
+        cached.cache_clear()
+
+
+class TestTakeTurn(TestCase):
+
+    @patch('game.check_probability', return_value=False)
+    @patch('builtins.input', side_effect=['1', 'd'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_take_turn_moves_character(self, _, __, ___):
+        session = make_session()
+        run_sync(take_turn(session))
+        actual = (session['Location'], session['Grid'][1][1], session['Grid'][1][2])
+        expected = ((1, 2), '.', '🐶')
+        self.assertEqual(actual, expected)
+
+    @patch('game.check_probability', return_value=False)
+    @patch('builtins.input', side_effect=['1', 'w'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_take_turn_invalid_move_keeps_location(self, _, __, ___):
+        session = make_session()
+        actual = run_sync(take_turn(session))
+        self.assertIsNone(actual)
+        self.assertEqual(session['Location'], (1, 1))
+        self.assertEqual(session['Character']['Stat']['Hunger'], 10)
+
+    @patch('game.check_probability', return_value=False)
+    @patch('builtins.input', side_effect=['1', 'd'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_take_turn_no_challenger(self, _, __, ___):
+        actual = run_sync(take_turn(make_session()))
+        self.assertIsNone(actual)
+
+    @patch('game.get_reward')
+    @patch('game.battle')
+    @patch('random.choice', return_value='battle')
+    @patch('game.check_probability', return_value=True)
+    @patch('builtins.input', side_effect=['1', 'd'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_take_turn_battle_challenger(self, _, __, ___, ____, mock_battle, mock_get_reward):
+        session = make_session()
+        mock_battle.return_value = (session['Character'], True)
+        actual = run_sync(take_turn(session))
+        expected = 'battle'
+        self.assertEqual(actual, expected)
+        mock_get_reward.assert_called_once_with(session['Character'])
+
+    @patch('game.hangman')
+    @patch('minigames.evil_hangman.evil_hangman')
+    @patch('random.choice', return_value='hangman')
+    @patch('game.check_probability', return_value=True)
+    @patch('builtins.input', side_effect=['1', 'd', ''])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_take_turn_evil_hangman_mode(self, _, __, ___, ____, mock_evil_hangman, mock_hangman):
+        session = make_session()
+        session['Hangman Mode'] = 'evil'
+        mock_evil_hangman.return_value = (False, session['Character'])
+        actual = run_sync(take_turn(session))
+        self.assertEqual(actual, 'hangman')
+        mock_evil_hangman.assert_called_once()
+        mock_hangman.assert_not_called()
+
+    @patch('game.check_probability', return_value=False)
+    @patch('builtins.input', side_effect=['1', 'a'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_take_turn_level_up_at_goal(self, _, __, ___):
+        session = make_session()
+        session['Grid'][1][1], session['Grid'][7][2] = '.', '🐶'
+        session['Location'] = (7, 2)
+        session['Character']['Stat']['Exp'] = 1000
+        session['Character']['Inventory']['Key'] = 1
+        run_sync(take_turn(session))
+        actual = (session['Character']['Stat']['Level'], session['Location'], session['Grid'][4][8])
+        expected = (2, (1, 1), '!')
+        self.assertEqual(actual, expected)
+
+    @patch('game.check_probability', return_value=False)
+    @patch('builtins.input', side_effect=['1', 'w'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_take_turn_level_up_to_fourth_level_of_pack(self, mock_output, _, __):
+        content = load_content()
+        pack = content | {key: dict(content[key]) for key in ('Skills', 'Boards', 'Levels', 'Max Exp')}
+        pack['Boards'][4] = ('#####', '#...#', '#.#!#', '#####')
+        pack['Levels'][4] = {'Max Exp': 1800, 'HP Gain': 300, 'Description': 'THE ROOF'}
+        pack['Max Exp']['Level 4'] = 1800
+        pack['Skills']['Level 4'] = pack['Skills']['Level 3']
+        clear_level_caches()
+        self.addCleanup(clear_level_caches)
+        with (patch('content.load_content', return_value=pack), patch('game.load_content', return_value=pack),
+              patch('make_board_each_level.load_content', return_value=pack)):
+            session = make_session()
+            character = session['Character']
+            character['Stat']['Level'], character['Stat']['Exp'], character['Inventory']['Key'] = 3, 1500, 1
+            session['Grid'] = make_level_board(3)
+            session['Grid'][5][4] = '🐶'
+            session['Location'] = (5, 4)
+            run_sync(take_turn(session))
+        actual = (character['Stat']['Level'], character['Stat']['HP'], session['Location'], session['Grid'][2][3])
+        expected = (4, 550, (1, 1), '!')
+        self.assertEqual(actual, expected)
+        self.assertIn('3rd Level clear! You are moving to Level 4.', mock_output.getvalue())
+        self.assertIn('THE ROOF', mock_output.getvalue())
+
+    def test_take_turn_game_and_server_import_without_numpy(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = "import sys; sys.modules['numpy'] = None; import game, server; print(game.make_session()['Location'])"
+        result = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, timeout=60)
+        self.assertEqual((result.returncode, result.stdout.strip()), (0, '(1, 1)'), result.stderr)
@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+from minigames.battle_solver import turns_to_defeat
+
+
+class TestTurnsToDefeat(TestCase):
+
+    def test_turns_to_defeat_basic_attack_exact(self):
+        actual = turns_to_defeat(90, 30, 100, 'basic attack')
+        expected = 3
+        self.assertEqual(actual, expected)
+
+    def test_turns_to_defeat_basic_attack_rounds_up(self):
+        actual = turns_to_defeat(91, 30, 100, 'basic attack')
+        expected = 4
+        self.assertEqual(actual, expected)
+
+    def test_turns_to_defeat_skills_within_limit(self):
+        actual = turns_to_defeat(120, 10, 25, 'skills first')
+        expected = 5
+        self.assertEqual(actual, expected)
+
+    def test_turns_to_defeat_skills_then_basic_attack(self):
+        actual = turns_to_defeat(126, 10, 25, 'skills first')
+        expected = 6
+        self.assertEqual(actual, expected)
@@ -0,0 +1,38 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from clock import make_clock
+from console import headless, pause, run_sync, use_clock
+
+
+class TestUseClock(TestCase):
+
+    @patch('time.sleep')
+    def test_use_clock_virtual_tracks_game_time(self, mock_sleep):
+        clock = make_clock('virtual')
+        with use_clock(clock):
+            run_sync(pause(10))
+            run_sync(pause(3))
+        mock_sleep.assert_not_called()
+        self.assertEqual(clock['Game Time'], 13)
+
+    @patch('time.sleep')
+    def test_use_clock_scaled(self, mock_sleep):
+        with use_clock(make_clock('scaled', 10)):
+            run_sync(pause(1.5))
+        mock_sleep.assert_called_once_with(0.15)
+
+    @patch('time.sleep')
+    def test_use_clock_restores_terminal_pause(self, mock_sleep):
+        with use_clock(make_clock('virtual')):
+            pass
+        run_sync(pause(1))
+        mock_sleep.assert_called_once_with(1)
+
+    @patch('time.sleep')
+    def test_headless_uses_given_clock(self, mock_sleep):
+        clock = make_clock('virtual')
+        with headless(lambda prompt, topic: '', clock):
+            run_sync(pause(20))
+        mock_sleep.assert_not_called()
+        self.assertEqual(clock['Game Time'], 20)
@@ -0,0 +1,29 @@
+import io
+from unittest import TestCase
+from unittest.mock import patch
+
+from make_board_each_level import display_grid
+from renderer import CLEAR_SCREEN, RESET_SCROLL_REGION, current_renderer, make_renderer, use_renderer
+
+
+class TestUseRenderer(TestCase):
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_use_renderer_draws_display_grid(self, mock_output):
+        grid = [['#', '.'], ['.', '🐶']]
+        with use_renderer(make_renderer(lambda: (80, 24))):
+            display_grid(grid)
+            display_grid(grid)
+        actual = mock_output.getvalue()
+        expected = CLEAR_SCREEN + '# .\n. 🐶' + '\x1b[4;24r\x1b[24;1H' + RESET_SCROLL_REGION
+        self.assertEqual(actual, expected)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_use_renderer_restores_plain_display(self, mock_output):
+        with use_renderer(make_renderer(lambda: (80, 24))):
+            self.assertIsNotNone(current_renderer())
+        self.assertIsNone(current_renderer())
+        display_grid([['#', '.']])
+        actual = mock_output.getvalue()
+        expected = '# .\n'
+        self.assertEqual(actual, expected)
@@ -0,0 +1,51 @@
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import patch
+
+from console import NullOutput
+from game import check_probability
+from rng import current_rng, make_rng, use_rng
+from simulation import play_headless
+
+
+class TestUseRng(TestCase):
+
+    def test_use_rng_draws_from_generator(self):
+        with use_rng(make_rng(1510)):
+            actual = [current_rng().randint(1, 100) for _ in range(5)]
+        expected_rng = make_rng(1510)
+        expected = [expected_rng.randint(1, 100) for _ in range(5)]
+        self.assertEqual(actual, expected)
+
+    def test_use_rng_leaves_random_module_alone(self):
+        random.seed(7)
+        expected = random.random()
+        random.seed(7)
+        with use_rng(make_rng(1510)):
+            check_probability(0.5)
+        actual = random.random()
+        self.assertEqual(actual, expected)
+
+    def test_use_rng_restores_previous_generator(self):
+        outer, inner = make_rng(1), make_rng(2)
+        with use_rng(outer):
+            with use_rng(inner):
+                pass
+            self.assertIs(current_rng(), outer)
+        self.assertIs(current_rng(), random)
+
+    @patch('random.random', return_value=0.1)
+    def test_use_rng_random_module_by_default(self, _):
+        actual = check_probability(0.25)
+        self.assertTrue(actual)
+
+    def test_use_rng_sessions_on_threads_do_not_interfere(self):
+        self.addCleanup(setattr, sys, 'stdout', sys.stdout)
+        output = NullOutput()
+        seeds = list(range(8))
+        expected = [play_headless(seed=seed, max_turns=200, output=output) for seed in seeds]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            actual = list(executor.map(lambda seed: play_headless(seed=seed, max_turns=200, output=output), seeds))
+        self.assertEqual(actual, expected)
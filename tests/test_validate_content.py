@@ -0,0 +1,143 @@
+import json
+from unittest import TestCase
+
+from content import CONTENT_PATH, validate_content
+
+
+class TestValidateContent(TestCase):
+
+    def setUp(self):
+        with open(CONTENT_PATH, encoding='utf-8') as file:
+            self.pack = json.load(file)
+
+    def assertInvalid(self, message):
+        with self.assertRaises(ValueError) as context:
+            validate_content(self.pack)
+        self.assertEqual(str(context.exception), message)
+
+    def test_validate_content_shipped_pack(self):
+        self.assertIsNone(validate_content(self.pack))
+
+    def test_validate_content_not_an_object(self):
+        self.pack = []
+        self.assertInvalid('content pack: expected an object, found list')
+
+    def test_validate_content_missing_section(self):
+        del self.pack['Rewards']
+        self.assertInvalid('content pack: missing Rewards')
+
+    def test_validate_content_reversed_skill_damage(self):
+        self.pack['Skills']['Level 1'][0]['Damage'] = [30, 20]
+        self.assertInvalid('Skills.Level 1[0].Damage: expected two whole numbers, low then high, found [30, 20]')
+
+    def test_validate_content_repeated_skill_name(self):
+        self.pack['Skills']['Level 2'][1]['Name'] = 'Scratch'
+        self.assertInvalid('Skills.Level 2: skill names must be distinct')
+
+    def test_validate_content_enemy_with_unknown_tier(self):
+        self.pack['Enemies'][0]['Tier'] = 'Level 9'
+        self.assertInvalid("Enemies[0].Tier: unknown tier 'Level 9'")
+
+    def test_validate_content_enemy_boss_is_not_a_boolean(self):
+        self.pack['Enemies'][0]['Boss'] = 0
+        self.assertInvalid('Enemies[0].Boss: expected bool, found int')
+
+    def test_validate_content_tier_missing_from_one_stat(self):
+        del self.pack['Enemy Stats']['Skill Damage']['Boss']
+        self.assertInvalid("Enemy Stats.Skill Damage: expected the tiers ['Boss', 'Level 1', 'Level 2', 'Level 3', "
+                           "'Level 4']")
+
+    def test_validate_content_ragged_board(self):
+        self.pack['Boards']['2'][5] = '#..#'
+        self.assertInvalid('Boards.2[5]: expected 10 cells, found 4')
+
+    def test_validate_content_board_with_unknown_cell(self):
+        self.pack['Boards']['1'][8] = '#....?.###'
+        self.assertInvalid("Boards.1[8]: unknown cells '?'")
+
+    def test_validate_content_board_blocks_start(self):
+        self.pack['Boards']['1'][1] = '##......##'
+        self.assertInvalid("Boards.1: the character starts in row 1 and column 1, which must be '.'")
+
+    def test_validate_content_board_with_open_edge(self):
+        self.pack['Boards']['2'][0] = '####.#####'
+        self.assertInvalid("Boards.2[0]: the edge of the board must be walls '#'")
+
+    def test_validate_content_board_with_open_side(self):
+        self.pack['Boards']['3'][5] = '#....#....'
+        self.assertInvalid("Boards.3[5]: the edge of the board must be walls '#'")
+
+    def test_validate_content_board_with_unreachable_goal(self):
+        self.pack['Boards']['1'][7] = '#!#.##.###'
+        self.pack['Boards']['1'][8] = '##.....###'
+        self.assertInvalid("Boards.1: the goal '!' cannot be reached from row 1 and column 1")
+
+    def test_validate_content_board_level_not_a_number(self):
+        self.pack['Boards']['attic'] = self.pack['Boards']['3']
+        self.assertInvalid('Boards.attic: expected a positive level number')
+
+    def add_level(self):
+        self.pack['Boards']['4'] = ['#####', '#...#', '#.#!#', '#####']
+        self.pack['Levels']['4'] = {'Max Exp': 1800, 'HP Gain': 300, 'Description': 'THE ROOF'}
+        self.pack['Skills']['Level 4'] = self.pack['Skills']['Level 3']
+        self.pack['Enemies'].append(self.pack['Enemies'][0] | {'Character Level': 4})
+
+    def test_validate_content_new_level(self):
+        self.add_level()
+        self.assertIsNone(validate_content(self.pack))
+
+    def test_validate_content_board_without_level(self):
+        self.add_level()
+        del self.pack['Levels']['4']
+        self.assertInvalid('Boards.4: no level 4 in Levels')
+
+    def test_validate_content_levels_with_gap(self):
+        self.add_level()
+        self.pack['Levels'] = {'1': self.pack['Levels']['1'], '2': self.pack['Levels']['2'],
+                               '4': self.pack['Levels']['4']}
+        self.assertInvalid('Levels.4: expected level 3, since levels are numbered 1, 2, 3, and so on')
+
+    def test_validate_content_level_without_max_exp(self):
+        del self.pack['Levels']['2']['Max Exp']
+        self.assertInvalid('Levels.2: missing Max Exp')
+
+    def test_validate_content_no_levels(self):
+        self.pack['Levels'] = {}
+        self.assertInvalid('Levels: expected at least one level')
+
+    def test_validate_content_word_with_capital_letter(self):
+        self.pack['Hangman Words'][1].append('Apple')
+        self.assertInvalid('Hangman Words[1]: expected a non-empty list of lowercase words')
+
+    def test_validate_content_drop_chance_above_one(self):
+        self.pack['Rewards']['Drops'][0]['Chance'] = 1.5
+        self.assertInvalid('Rewards.Drops[0].Chance: expected a chance from 0 to 1')
+
+    def test_validate_content_drop_unknown_section(self):
+        self.pack['Rewards']['Drops'][0]['Section'] = 'Pocket'
+        self.assertInvalid('Rewards.Drops[0].Section: expected one of Skill, Stat, Inventory')
+
+    def test_validate_content_drop_unknown_key(self):
+        self.pack['Rewards']['Drops'][1]['Key'] = 'Treat'
+        self.assertInvalid('Rewards.Drops[1].Key: expected one of Key, HP Potion, Kibble')
+
+    def test_validate_content_drop_raises_nested_stat(self):
+        self.pack['Rewards']['Drops'][2]['Key'] = 'Max Exp'
+        self.assertInvalid('Rewards.Drops[2].Key: expected one of HP, Current HP, Level, Exp, Heart, Max Heart, '
+                           'Hunger, Max Hunger')
+
+    def test_validate_content_missing_level_skills(self):
+        del self.pack['Skills']['Level 2']
+        self.assertInvalid('Skills: missing Level 2')
+
+    def test_validate_content_missing_level_board(self):
+        del self.pack['Boards']['3']
+        self.assertInvalid('Boards: missing 3')
+
+    def test_validate_content_level_without_enemies(self):
+        self.pack['Enemies'] = [enemy for enemy in self.pack['Enemies'] if enemy['Character Level'] != 2]
+        self.assertInvalid('Enemies: no enemy for character level 2')
+
+    def test_validate_content_board_with_two_goals(self):
+        self.pack['Boards']['1'][8] = '#....!.###'
+        self.assertInvalid("Boards.1: expected one goal '!', found 2")
@@ -0,0 +1,29 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from clock import make_clock, wait
+
+
+class TestWait(TestCase):
+
+    @patch('time.sleep')
+    def test_wait_real_sleeps_in_full(self, mock_sleep):
+        clock = make_clock('real')
+        wait(clock, 3)
+        mock_sleep.assert_called_once_with(3)
+        self.assertEqual(clock['Game Time'], 3)
+
+    @patch('time.sleep')
+    def test_wait_scaled_sleeps_less(self, mock_sleep):
+        clock = make_clock('scaled', 10)
+        wait(clock, 20)
+        mock_sleep.assert_called_once_with(2)
+        self.assertEqual(clock['Game Time'], 20)
+
+    @patch('time.sleep')
+    def test_wait_virtual_never_sleeps(self, mock_sleep):
+        clock = make_clock('virtual')
+        wait(clock, 10)
+        wait(clock, 1.5)
+        mock_sleep.assert_not_called()
+        self.assertEqual(clock['Game Time'], 11.5)
@@ -0,0 +1,31 @@
+import asyncio
+from unittest import TestCase
+from unittest.mock import patch
+
+from clock import make_clock, wait_async
+
+
+class TestWaitAsync(TestCase):
+
+    @patch('time.sleep')
+    def test_wait_async_real_never_blocks(self, mock_sleep):
+        clock = make_clock('real')
+        asyncio.run(wait_async(clock, 0.01))
+        mock_sleep.assert_not_called()
+        self.assertEqual(clock['Game Time'], 0.01)
+
+    def test_wait_async_scaled_waits_less(self):
+        clock = make_clock('scaled', 1000)
+        loop = asyncio.new_event_loop()
+        start = loop.time()
+        loop.run_until_complete(wait_async(clock, 20))
+        seconds = loop.time() - start
+        loop.close()
+        self.assertGreaterEqual(seconds, 0.015)
+        self.assertLess(seconds, 1)
+        self.assertEqual(clock['Game Time'], 20)
+
+    def test_wait_async_virtual_only_yields(self):
+        clock = make_clock('virtual')
+        asyncio.run(wait_async(clock, 3600))
+        self.assertEqual(clock['Game Time'], 3600)
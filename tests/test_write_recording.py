@@ -0,0 +1,40 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase
+
+from recording import make_recording, read_recording, write_recording
+
+
+class TestWriteRecording(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'recordings', 'haru.rec')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_write_recording_round_trip(self):
+        recording = make_recording(b'BKGS', 1510)
+        write_recording(self.path, recording)
+        self.assertEqual(read_recording(self.path), recording)
+
+    def test_write_recording_threads_of_one_process(self):
+        recordings = [make_recording(b'BKGS', seed) for seed in range(8)]
+        errors = []
+
+        def save(recording):
+            try:
+                for _ in range(20):
+                    write_recording(self.path, recording)
+            except OSError as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=save, args=(recording,)) for recording in recordings]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertIn(read_recording(self.path), recordings)
+        self.assertEqual((errors, os.listdir(os.path.dirname(self.path))), ([], ['haru.rec']))
@@ -0,0 +1,42 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase
+
+from game import make_session
+from snapshot import dump_session, read_snapshot, write_snapshot
+
+
+class TestWriteSnapshot(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'saves', 'haru.sav')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_write_snapshot_round_trip(self):
+        session = make_session()
+        write_snapshot(self.path, dump_session(session))
+        self.assertEqual(read_snapshot(self.path)['Character'], session['Character'])
+
+    def test_write_snapshot_threads_of_one_process(self):
+        snapshots = [dump_session(make_session()) for _ in range(8)]
+        errors = []
+
+        def save(snapshot):
+            try:
+                for _ in range(20):
+                    write_snapshot(self.path, snapshot)
+            except OSError as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=save, args=(snapshot,)) for snapshot in snapshots]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with open(self.path, 'rb') as save_file:
+            self.assertIn(save_file.read(), snapshots)
+        self.assertEqual((errors, os.listdir(os.path.dirname(self.path))), ([], ['haru.sav']))